@@ -0,0 +1,160 @@
+"""
+Child Result Aggregation: Streaming fold of child UOW results into the parent.
+
+When a BETA role decomposes a UOW into many children, Omega reconciliation
+would otherwise have to load every child and its attributes once Cerberus
+passes. Instead, each child's submitted results are folded into a single
+parent attribute as the child completes, so the parent's final state is
+ready in O(1) when the set closes.
+
+Configuration lives on the parent UOW in the reserved attribute
+``_child_aggregation`` (written by ChameleonEngine.decompose_uow):
+
+    {
+        "total_amount": {"reducer": "sum", "source": "amount"},
+        "processed": {"reducer": "count"},
+        "best_scores": {"reducer": "top_k", "source": "score", "k": 3},
+        "tags": {"reducer": "merge_dict", "source": "tags"},
+    }
+
+Folded results live in the reserved attribute ``_child_aggregate`` as
+``{output_name: reducer_state}``.
+
+Supported reducers:
+- count: Number of children folded (or children that set ``source``, if given)
+- sum: Sum of numeric ``source`` values (non-numeric values are skipped)
+- top_k: The ``k`` children with the highest ``source`` value (``order: asc`` for lowest)
+- merge_dict: Shallow merge of dict-valued ``source`` (later children win)
+
+Constitutional Reference: Article V.3 (Cerberus Synchronization), Article XVII (Atomic Traceability)
+"""
+
+from typing import Any, Callable, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Reserved parent attribute keys
+CHILD_AGGREGATION_SPEC_KEY = "_child_aggregation"
+CHILD_AGGREGATE_KEY = "_child_aggregate"
+
+
+def _is_number(value: Any) -> bool:
+    """True for int/float values (bool excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _reduce_count(state: Any, spec: Dict[str, Any], attributes: Dict[str, Any], child_id: str) -> Any:
+    source = spec.get("source")
+    if source is not None and source not in attributes:
+        return state
+    return (state or 0) + 1
+
+
+def _reduce_sum(state: Any, spec: Dict[str, Any], attributes: Dict[str, Any], child_id: str) -> Any:
+    value = attributes.get(spec["source"])
+    if not _is_number(value):
+        return state
+    return (state or 0) + value
+
+
+def _reduce_top_k(state: Any, spec: Dict[str, Any], attributes: Dict[str, Any], child_id: str) -> Any:
+    value = attributes.get(spec["source"])
+    if not _is_number(value):
+        return state
+    entries = list(state or [])
+    entries.append({"uow_id": child_id, "value": value})
+    entries.sort(key=lambda e: e["value"], reverse=spec.get("order", "desc") != "asc")
+    return entries[: int(spec.get("k", 10))]
+
+
+def _reduce_merge_dict(state: Any, spec: Dict[str, Any], attributes: Dict[str, Any], child_id: str) -> Any:
+    value = attributes.get(spec["source"])
+    if not isinstance(value, dict):
+        return state
+    merged = dict(state or {})
+    merged.update(value)
+    return merged
+
+
+class ChildResultAggregator:
+    """
+    Folds child UOW results into a parent aggregate, one child at a time.
+
+    The aggregator is stateless: reducer state is the JSON value stored in
+    the parent's ``_child_aggregate`` attribute, so folding a child only
+    requires the previous aggregate and that child's results.
+    """
+
+    REDUCERS: Dict[str, Callable[[Any, Dict[str, Any], Dict[str, Any], str], Any]] = {
+        "count": _reduce_count,
+        "sum": _reduce_sum,
+        "top_k": _reduce_top_k,
+        "merge_dict": _reduce_merge_dict,
+    }
+
+    # Reducers that read a child attribute and therefore need "source"
+    SOURCE_REQUIRED = {"sum", "top_k", "merge_dict"}
+
+    def __init__(self, spec: Dict[str, Dict[str, Any]]):
+        """
+        Initialize and validate an aggregation spec.
+
+        Args:
+            spec: Mapping of output name -> {"reducer": ..., "source": ..., ...}
+
+        Raises:
+            ValueError: If the spec is malformed or names an unknown reducer
+        """
+        if not isinstance(spec, dict) or not spec:
+            raise ValueError("Aggregation spec must be a non-empty dict")
+
+        for name, entry in spec.items():
+            if not isinstance(entry, dict):
+                raise ValueError(f"Aggregation '{name}' must be a dict")
+            reducer = entry.get("reducer")
+            if reducer not in self.REDUCERS:
+                raise ValueError(
+                    f"Unknown reducer '{reducer}' for aggregation '{name}'. "
+                    f"Must be one of {sorted(self.REDUCERS)}."
+                )
+            if reducer in self.SOURCE_REQUIRED and not entry.get("source"):
+                raise ValueError(f"Aggregation '{name}' ({reducer}) requires a 'source' key")
+            if reducer == "top_k" and int(entry.get("k", 10)) <= 0:
+                raise ValueError(f"Aggregation '{name}' (top_k) requires k > 0")
+
+        self.spec = spec
+
+    def initial_state(self) -> Dict[str, Any]:
+        """
+        Build the empty aggregate written to the parent at decomposition time.
+
+        Returns:
+            Dict of output name -> empty reducer state
+        """
+        empty = {"count": 0, "sum": 0, "top_k": [], "merge_dict": {}}
+        return {name: empty[entry["reducer"]] for name, entry in self.spec.items()}
+
+    def fold(
+        self,
+        aggregate: Optional[Dict[str, Any]],
+        child_attributes: Dict[str, Any],
+        child_uow_id: str,
+    ) -> Dict[str, Any]:
+        """
+        Fold one child's results into the aggregate.
+
+        Args:
+            aggregate: Current aggregate (None is treated as the initial state)
+            child_attributes: Attributes submitted by the completing child
+            child_uow_id: The child's UOW ID (recorded by top_k)
+
+        Returns:
+            New aggregate dict (the input is not mutated)
+        """
+        current = dict(aggregate) if aggregate else self.initial_state()
+        for name, entry in self.spec.items():
+            reducer = self.REDUCERS[entry["reducer"]]
+            current[name] = reducer(current.get(name), entry, child_attributes, child_uow_id)
+        return current
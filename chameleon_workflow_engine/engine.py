@@ -15,7 +15,7 @@ import uuid
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional, Tuple, List
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, func, update
 from sqlalchemy.orm import Session
 from dateutil.parser import isoparse
 
@@ -38,6 +38,11 @@ from database.models_instance import (
     UOW_Attributes,
     Local_Role_Attributes,
 )
+from database.persistence_service import (
+    UOWPersistenceService,
+    TelemetryEntry,
+    get_telemetry_buffer,
+)
 from database.enums import (
     RoleType,
     UOWStatus,
@@ -49,16 +54,31 @@ from chameleon_workflow_engine.dsl_evaluator import (
     DSLAttributeError,
     extract_policy_conditions_from_guardian,
 )
+from chameleon_workflow_engine.child_aggregation import (
+    ChildResultAggregator,
+    CHILD_AGGREGATION_SPEC_KEY,
+    CHILD_AGGREGATE_KEY,
+)
+from chameleon_workflow_engine.guard_batch import (
+    evaluate_guard_batch,
+    is_batchable,
+    required_attribute_keys,
+    to_columns,
+)
 from chameleon_workflow_engine.semantic_guard import (
     SemanticGuard,
     StateVerifier,
     evaluate_interaction_policy_with_guard,
 )
+from chameleon_workflow_engine.pilot_interface import get_frozen_instances
 
 # Well-known system actor ID for automated operations
 # This ensures consistent identity across all system-initiated operations
 SYSTEM_ACTOR_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 
+# Candidate UOWs screened per guard batch during checkout
+GUARD_BATCH_SIZE = 500
+
 # Logger for the engine
 logger = logging.getLogger(__name__)
 
@@ -551,6 +571,112 @@ class ChameleonEngine:
         else:
             raise ValueError(f"Unknown guard type: {guard_type}")
 
+    def _screen_candidates(
+        self,
+        session: Session,
+        candidate_uows: List[UnitsOfWork],
+        component_by_interaction: Dict[uuid.UUID, Local_Components],
+        guard_by_component: Dict[uuid.UUID, Local_Guardians],
+    ):
+        """
+        Evaluate checkout guards over candidate UOWs, GUARD_BATCH_SIZE at a time.
+
+        For batchable guards (see guard_batch.is_batchable) each batch needs
+        one attribute query, restricted to the keys the guards read, and one
+        column-oriented evaluation per guard. Other guards fall back to
+        _evaluate_guard per UOW. Batches are evaluated lazily, so checkout
+        stops screening once it has taken a candidate.
+
+        Args:
+            session: Database session
+            candidate_uows: PENDING UOWs in checkout order
+            component_by_interaction: INBOUND component per interaction_id
+            guard_by_component: Guard per component_id (absent = no guard)
+
+        Yields:
+            (uow, guard or None, guard_passed) in candidate order; UOWs
+            without a connecting component are skipped
+        """
+        for start in range(0, len(candidate_uows), GUARD_BATCH_SIZE):
+            batch = []
+            for uow in candidate_uows[start:start + GUARD_BATCH_SIZE]:
+                component = component_by_interaction.get(uow.current_interaction_id)
+                if component is None:
+                    # Should not happen, but skip if no component found
+                    continue
+                batch.append((uow, guard_by_component.get(component.component_id)))
+
+            passed = self._evaluate_guards_batch(session, batch)
+            for uow, guard in batch:
+                yield uow, guard, passed[uow.uow_id]
+
+    def _evaluate_guards_batch(
+        self,
+        session: Session,
+        batch: List[Tuple[UnitsOfWork, Optional[Local_Guardians]]],
+    ) -> Dict[uuid.UUID, bool]:
+        """
+        Evaluate each UOW's guard for one batch of candidates.
+
+        Returns:
+            Mapping of uow_id -> guard passed (True when the UOW has no guard)
+        """
+        passed: Dict[uuid.UUID, bool] = {}
+        groups: Dict[uuid.UUID, Tuple[Local_Guardians, List[UnitsOfWork]]] = {}
+        per_uow: List[Tuple[UnitsOfWork, Local_Guardians]] = []
+        for uow, guard in batch:
+            if guard is None:
+                passed[uow.uow_id] = True
+            elif is_batchable(guard.type, guard.attributes):
+                groups.setdefault(guard.guardian_id, (guard, []))[1].append(uow)
+            else:
+                per_uow.append((uow, guard))
+
+        if groups:
+            keys = set()
+            for guard, _ in groups.values():
+                keys |= required_attribute_keys(guard.type, guard.attributes)
+            attributes = UOWPersistenceService.resolve_attributes_batch(
+                session, [uow for _, uows in groups.values() for uow in uows], keys=keys
+            )
+            now = datetime.now(timezone.utc)
+            for guard, uows in groups.values():
+                try:
+                    outcomes = evaluate_guard_batch(
+                        guard.type,
+                        guard.attributes,
+                        to_columns([attributes[uow.uow_id] for uow in uows], keys),
+                        len(uows),
+                        now,
+                    )
+                except Exception as e:
+                    # Malformed configuration - reject the whole group
+                    logger.warning("Guard evaluation error for guard %s: %s", guard.name, str(e))
+                    outcomes = [False] * len(uows)
+                for uow, outcome in zip(uows, outcomes):
+                    if outcome is None:
+                        # Guard evaluation error - treat as rejection
+                        logger.warning(
+                            "Guard evaluation error for UOW %s: guard %s could not be evaluated",
+                            uow.uow_id,
+                            guard.name,
+                        )
+                    passed[uow.uow_id] = bool(outcome)
+
+        for uow, guard in per_uow:
+            uow_attributes, _ = UOWPersistenceService.resolve_attributes(session, uow)
+            try:
+                passed[uow.uow_id] = self._evaluate_guard(guard, uow, uow_attributes, session)
+            except Exception as e:
+                # Guard evaluation error - treat as rejection
+                passed[uow.uow_id] = False
+                logger.warning(
+                    "Guard evaluation error for UOW %s: %s",
+                    uow.uow_id,
+                    str(e),
+                )
+        return passed
+
     def _harvest_experience(
         self,
         session: Session,
@@ -720,6 +846,7 @@ class ChameleonEngine:
         parent_uow: UnitsOfWork,
         role: Local_Roles,
         child_count: int,
+        aggregation: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> List[uuid.UUID]:
         """
         Decompose a Base UOW into Child UOWs (BETA Role Decomposition).
@@ -730,16 +857,25 @@ class ChameleonEngine:
         Process:
         1. Validate decomposition strategy (HOMOGENEOUS/HETEROGENEOUS)
         2. Spawn child UOWs with parent_id FK
-        3. Copy Global Blueprint attributes (actor_id=NULL) from parent to children
-        4. Do NOT copy Personal Playbook (actor_id=specific)
+        3. Children inherit the parent's attributes copy-on-write: no rows are
+           copied, reads resolve through parent_id and a child only stores the
+           keys it overrides (see UOWPersistenceService.resolve_attributes).
+           Each child pins the parent's attribute versions as of decomposition,
+           excluding the engine's child-aggregation keys
+        4. Do NOT inherit Personal Playbook (actor_id=specific)
         5. Update parent's child_count field
         6. Place children in first outbound interaction
+        7. Optionally register a streaming child-result aggregation on the parent
+           (see chameleon_workflow_engine.child_aggregation)
         
         Args:
             session: Database session
             parent_uow: The Base UOW being decomposed
             role: The Local_Roles record (contains strategy)
             child_count: Number of children to create
+            aggregation: Optional spec of output name -> reducer config
+                (count, sum, top_k, merge_dict). Child results are folded into
+                the parent's _child_aggregate attribute as each child completes.
         
         Returns:
             List[UUID]: List of created child UOW IDs
@@ -769,22 +905,6 @@ class ChameleonEngine:
             .all()
         )
         
-        # Get current parent attributes (latest versions)
-        parent_attrs = (
-            session.query(UOW_Attributes)
-            .filter(UOW_Attributes.uow_id == parent_uow.uow_id)
-            .order_by(UOW_Attributes.version.desc())
-            .all()
-        )
-        
-        # Build latest parent attributes (skip Personal Playbook)
-        parent_attr_map = {}
-        attr_versions = {}
-        for attr in parent_attrs:
-            if attr.key not in parent_attr_map:
-                parent_attr_map[attr.key] = attr.value
-                attr_versions[attr.key] = attr.version
-        
         # Find first outbound interaction for children
         outbound_components = (
             session.query(Local_Components)
@@ -806,6 +926,14 @@ class ChameleonEngine:
         # Use first outbound component's interaction
         children_interaction_id = outbound_components[0].interaction_id
         
+        # Snapshot of the parent's own attribute versions the children inherit
+        _, parent_versions = UOWPersistenceService.resolve_attributes(session, parent_uow)
+        inherited_versions = {
+            key: version
+            for key, version in parent_versions.items()
+            if key not in (CHILD_AGGREGATION_SPEC_KEY, CHILD_AGGREGATE_KEY)
+        }
+        
         # Create child UOWs
         created_children = []
         for i in range(child_count):
@@ -819,25 +947,12 @@ class ChameleonEngine:
                 child_count=0,  # Children have no children (unless recursive)
                 finished_child_count=0,
                 last_heartbeat=None,
+                inherited_versions=inherited_versions,
             )
             session.add(child_uow)
-            session.flush()  # Get the UOW ID
             
-            # Copy Global Blueprint attributes to child
-            for attr in parent_attrs:
-                # Only copy Global Blueprint (no actor_id restrictions on UOW attributes)
-                # UOW_Attributes don't have actor_id, they're tied to the UOW itself
-                child_attr = UOW_Attributes(
-                    attribute_id=uuid.uuid4(),
-                    uow_id=child_uow.uow_id,
-                    instance_id=child_uow.instance_id,
-                    key=attr.key,
-                    value=attr.value,
-                    version=1,  # First version for child
-                    actor_id=SYSTEM_ACTOR_ID,  # System copies attributes
-                    reasoning=f"Inherited from parent UOW {parent_uow.uow_id} (Global Blueprint)",
-                )
-                session.add(child_attr)
+            # No attribute rows are written here: the child reads the parent's
+            # pinned snapshot through parent_id until it overrides a key
             
             created_children.append(child_uow.uow_id)
             logger.debug(
@@ -848,6 +963,26 @@ class ChameleonEngine:
         # Update parent's child_count
         parent_uow.child_count = child_count
         
+        # Register streaming aggregation: spec + empty aggregate on the parent
+        if aggregation:
+            aggregator = ChildResultAggregator(aggregation)
+            for key, value in (
+                (CHILD_AGGREGATION_SPEC_KEY, aggregation),
+                (CHILD_AGGREGATE_KEY, aggregator.initial_state()),
+            ):
+                session.add(
+                    UOW_Attributes(
+                        attribute_id=uuid.uuid4(),
+                        uow_id=parent_uow.uow_id,
+                        instance_id=parent_uow.instance_id,
+                        key=key,
+                        value=value,
+                        version=parent_versions.get(key, 0) + 1,
+                        actor_id=SYSTEM_ACTOR_ID,
+                        reasoning=f"Child aggregation registered at decomposition ({child_count} children)",
+                    )
+                )
+        
         session.flush()
         logger.info(
             f"Decomposed UOW {parent_uow.uow_id} into {child_count} children "
@@ -856,6 +991,144 @@ class ChameleonEngine:
         
         return created_children
 
+    def _record_child_completion(
+        self,
+        session: Session,
+        child_uow: UnitsOfWork,
+        failed: bool = False,
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Atomically count a settled child on its parent.
+        
+        Implements Article V.3 (Cerberus Synchronization) bookkeeping: the
+        increment is a single UPDATE evaluated by the database
+        (finished_child_count = finished_child_count + 1, or
+        failed_child_count for children failed via the Ate Path), so
+        concurrent children settling in parallel transactions cannot lose
+        updates. The post-increment counters are read back in the same
+        statement (RETURNING) where the dialect supports it.
+        
+        Args:
+            session: Database session (same transaction as the child's completion)
+            child_uow: The child UOW that just completed or failed
+            failed: Count a terminal failure instead of a completion
+        
+        Returns:
+            Tuple of (finished_child_count, failed_child_count, child_count)
+            after the increment, or None if the UOW has no parent or the
+            parent no longer exists
+        """
+        if child_uow.parent_id is None:
+            return None
+        
+        counter = UnitsOfWork.failed_child_count if failed else UnitsOfWork.finished_child_count
+        stmt = (
+            update(UnitsOfWork)
+            .where(UnitsOfWork.uow_id == child_uow.parent_id)
+            .values({counter: func.coalesce(counter, 0) + 1})
+            .execution_options(synchronize_session="fetch")
+        )
+        columns = (
+            UnitsOfWork.finished_child_count,
+            UnitsOfWork.failed_child_count,
+            UnitsOfWork.child_count,
+        )
+        
+        if session.get_bind().dialect.update_returning:
+            row = session.execute(stmt.returning(*columns)).first()
+        else:
+            session.execute(stmt)
+            row = (
+                session.query(*columns)
+                .filter(UnitsOfWork.uow_id == child_uow.parent_id)
+                .first()
+            )
+        
+        if row is None:
+            logger.warning(
+                f"Parent UOW {child_uow.parent_id} of child {child_uow.uow_id} not found; "
+                f"{counter.key} not incremented"
+            )
+            return None
+        
+        return row[0] or 0, row[1] or 0, row[2] or 0
+
+    def _fold_child_result(
+        self,
+        session: Session,
+        child_uow: UnitsOfWork,
+        result_attributes: Dict[str, Any],
+    ) -> None:
+        """
+        Fold a completing child's results into its parent's streaming aggregate.
+        
+        Must run after _record_child_completion in the same transaction: the
+        counter UPDATE holds the parent row lock, serialising concurrent
+        children so each fold reads the aggregate the previous one committed.
+        
+        Each fold appends a new version of the parent's _child_aggregate
+        attribute (Article XVII: attribute rows are never edited in place),
+        so resolve_attributes picks up the latest aggregate and the parent's
+        content hash (and digest cache) is refreshed in the same transaction
+        so the audit scanner sees no drift. Only the latest spec and
+        aggregate rows are read, so each fold costs the same however many
+        children came before it. The parent's reconciled state is ready
+        without loading any child when Cerberus passes.
+        
+        Args:
+            session: Database session
+            child_uow: The child UOW that just completed
+            result_attributes: The attributes the child submitted
+        """
+        if child_uow.parent_id is None:
+            return
+        
+        latest = {}
+        for key in (CHILD_AGGREGATION_SPEC_KEY, CHILD_AGGREGATE_KEY):
+            attr = (
+                session.query(UOW_Attributes)
+                .filter(
+                    and_(
+                        UOW_Attributes.uow_id == child_uow.parent_id,
+                        UOW_Attributes.key == key,
+                    )
+                )
+                .order_by(UOW_Attributes.version.desc())
+                .first()
+            )
+            if attr is not None:
+                latest[key] = attr
+        
+        spec_attr = latest.get(CHILD_AGGREGATION_SPEC_KEY)
+        if spec_attr is None:
+            return  # Parent did not register an aggregation
+        
+        aggregate_attr = latest.get(CHILD_AGGREGATE_KEY)
+        aggregator = ChildResultAggregator(spec_attr.value)
+        folded = aggregator.fold(
+            aggregate_attr.value if aggregate_attr else None,
+            result_attributes,
+            str(child_uow.uow_id),
+        )
+        
+        session.add(
+            UOW_Attributes(
+                attribute_id=uuid.uuid4(),
+                uow_id=child_uow.parent_id,
+                instance_id=child_uow.instance_id,
+                key=CHILD_AGGREGATE_KEY,
+                value=folded,
+                version=(aggregate_attr.version if aggregate_attr else 0) + 1,
+                actor_id=SYSTEM_ACTOR_ID,
+                reasoning=f"Folded result of child UOW {child_uow.uow_id}",
+            )
+        )
+        session.flush()
+        
+        parent_uow = session.get(UnitsOfWork, child_uow.parent_id)
+        if parent_uow is not None:
+            UOWPersistenceService.refresh_content_hash(session, parent_uow)
+
     def _evaluate_interaction_policy(
         self,
         session: Session,
@@ -896,20 +1169,8 @@ class ChameleonEngine:
             return None
         
         # Build UOW attribute namespace: latest versions of all attributes
-        latest_attrs = {}
-        attr_versions = {}
-        
-        all_attrs = (
-            session.query(UOW_Attributes)
-            .filter(UOW_Attributes.uow_id == uow.uow_id)
-            .order_by(UOW_Attributes.version.desc())
-            .all()
-        )
-        
-        for attr in all_attrs:
-            if attr.key not in latest_attrs:
-                latest_attrs[attr.key] = attr.value
-                attr_versions[attr.key] = attr.version
+        # (including keys inherited copy-on-write from the parent chain)
+        latest_attrs, attr_versions = UOWPersistenceService.resolve_attributes(session, uow)
         
         # Add reserved metadata to namespace
         eval_context = {
@@ -1331,7 +1592,12 @@ class ChameleonEngine:
                         condition=condition,
                         error=e,
                         uow_id=str(uow.uow_id),
-                        context=uow_attributes
+                        context=uow_attributes,
+                        trace={
+                            "instance_id": uow.instance_id,
+                            "role_id": role.role_id,
+                            "interaction_id": uow.current_interaction_id,
+                        },
                     )
                     logger.error(
                         f"DCI mutation error in guard {dci_guard.guardian_id}, "
@@ -1415,81 +1681,48 @@ class ChameleonEngine:
 
                 # Step 3: Find ALL PENDING UOWs in these interactions
                 # We need to iterate through candidates to evaluate guards
-                candidate_uows = (
-                    session.query(UnitsOfWork)
-                    .filter(
-                        and_(
-                            UnitsOfWork.current_interaction_id.in_(inbound_interaction_ids),
-                            UnitsOfWork.status == UOWStatus.PENDING.value,
-                        )
+                candidate_query = session.query(UnitsOfWork).filter(
+                    and_(
+                        UnitsOfWork.current_interaction_id.in_(inbound_interaction_ids),
+                        UnitsOfWork.status == UOWStatus.PENDING.value,
                     )
-                    .all()
                 )
+                # Instances halted by a Pilot kill switch hand out no work
+                frozen_instances = get_frozen_instances()
+                if frozen_instances:
+                    candidate_query = candidate_query.filter(
+                        UnitsOfWork.instance_id.notin_(frozen_instances)
+                    )
+                candidate_uows = candidate_query.all()
 
                 if not candidate_uows:
                     # No work available
                     return None
 
-                # Step 4: Evaluate guards for each candidate
-                for candidate_uow in candidate_uows:
-                    # Find the component connecting this interaction to the role
-                    component = None
-                    for comp in inbound_components:
-                        if comp.interaction_id == candidate_uow.current_interaction_id:
-                            component = comp
-                            break
-
-                    if not component:
-                        # Should not happen, but skip if no component found
-                        continue
-
-                    # Find the guard associated with this component
-                    guard = (
-                        session.query(Local_Guardians)
-                        .filter(Local_Guardians.component_id == component.component_id)
-                        .first()
-                    )
-
-                    # Retrieve UOW attributes for guard evaluation
-                    uow_attributes_raw = (
-                        session.query(UOW_Attributes)
-                        .filter(UOW_Attributes.uow_id == candidate_uow.uow_id)
-                        .all()
+                # Step 4: Evaluate guards for each candidate (in batches; the
+                # first candidate that passes is checked out)
+                component_by_interaction: Dict[uuid.UUID, Local_Components] = {}
+                for comp in inbound_components:
+                    component_by_interaction.setdefault(comp.interaction_id, comp)
+                guard_by_component: Dict[uuid.UUID, Local_Guardians] = {}
+                for guard in (
+                    session.query(Local_Guardians)
+                    .filter(
+                        Local_Guardians.component_id.in_(
+                            [comp.component_id for comp in inbound_components]
+                        )
                     )
+                    .all()
+                ):
+                    guard_by_component.setdefault(guard.component_id, guard)
 
-                    # Build attributes dictionary from the latest version of each key
-                    attributes_dict = {}
-                    for attr in uow_attributes_raw:
-                        # If multiple versions exist, we want the latest
-                        if (
-                            attr.key not in attributes_dict
-                            or attr.version > attributes_dict[attr.key]["version"]
-                        ):
-                            attributes_dict[attr.key] = {
-                                "value": attr.value,
-                                "version": attr.version,
-                            }
-
-                    # Simplify to just key-value pairs
-                    uow_attributes = {key: data["value"] for key, data in attributes_dict.items()}
-
-                    # Evaluate guard (if one exists)
-                    guard_passed = True
-                    if guard:
-                        try:
-                            guard_passed = self._evaluate_guard(
-                                guard, candidate_uow, uow_attributes, session
-                            )
-                        except Exception as e:
-                            # Guard evaluation error - treat as rejection
-                            guard_passed = False
-                            # Log the error for debugging
-                            logger.warning(
-                                "Guard evaluation error for UOW %s: %s",
-                                candidate_uow.uow_id,
-                                str(e),
-                            )
+                # Children failed by guard rejection settle their parent's set;
+                # child_set_completed is emitted only once the rejections commit
+                settled_children: List[Tuple[UnitsOfWork, Tuple[int, int, int]]] = []
 
+                for candidate_uow, guard, guard_passed in self._screen_candidates(
+                    session, candidate_uows, component_by_interaction, guard_by_component
+                ):
                     if not guard_passed:
                         # Guard rejected the UOW - route to Ate Path (Epsilon)
                         # Find the Epsilon role
@@ -1546,10 +1779,22 @@ class ChameleonEngine:
                                 session.add(error_attr)
                                 session.flush()
 
+                                child_counts = self._record_child_completion(
+                                    session, candidate_uow, failed=True
+                                )
+                                if child_counts is not None:
+                                    settled_children.append((candidate_uow, child_counts))
+
                         # Continue to next candidate
                         continue
 
                     # Guard passed (or no guard) - this UOW is valid
+                    # Retrieve UOW attributes (latest version of each key,
+                    # resolved through the parent chain)
+                    uow_attributes, _ = UOWPersistenceService.resolve_attributes(
+                        session, candidate_uow
+                    )
+
                     # Step 5: CHECK INTERACTION LIMIT (per UOW Lifecycle Specs)
                     # Before transitioning to ACTIVE, verify we haven't hit the ambiguity lock threshold
                     if (
@@ -1600,6 +1845,8 @@ class ChameleonEngine:
                         
                         # Commit and return None (no work available due to ambiguity lock)
                         session.commit()
+                        for child, child_counts in settled_children:
+                            self._maybe_emit_child_set_completed(child, *child_counts)
                         return None
                     
                     # Step 5.5: Apply Dynamic Context Injection (DCI) mutations
@@ -1629,23 +1876,18 @@ class ChameleonEngine:
 
                     session.flush()
 
-                    # TODO: Interaction logging disabled due to SQLite BigInteger autoincrement issue
-                    # This needs to be addressed in the schema for production use
-                    # Log the interaction
-                    # log_entry = Interaction_Logs(
-                    #     instance_id=candidate_uow.instance_id,
-                    #     uow_id=candidate_uow.uow_id,
-                    #     actor_id=actor_id,
-                    #     role_id=role_id,
-                    #     interaction_id=candidate_uow.current_interaction_id,
-                    #     timestamp=datetime.now(timezone.utc)
-                    # )
-                    # session.add(log_entry)
+                    # Log the interaction (written by the telemetry drainer once committed)
+                    log_entry = self._interaction_log_entry(
+                        candidate_uow, actor_id, role_id, "CHECKOUT"
+                    )
 
                     # Step 7: Build memory context for this actor + role
                     memory_context = self._build_memory_context(session, role_id, actor_id)
 
                     session.commit()
+                    self._record_interaction_logs([log_entry])
+                    for child, child_counts in settled_children:
+                        self._maybe_emit_child_set_completed(child, *child_counts)
 
                     return {
                         "uow_id": candidate_uow.uow_id,
@@ -1656,6 +1898,8 @@ class ChameleonEngine:
                 # If we get here, all candidates were rejected by guards
                 # Commit the rejections and return None
                 session.commit()
+                for child, child_counts in settled_children:
+                    self._maybe_emit_child_set_completed(child, *child_counts)
                 return None
 
             except Exception as e:
@@ -1721,18 +1965,12 @@ class ChameleonEngine:
                 # For now, we verify via status and trust the actor_id
 
                 # Step 2: Retrieve current attributes to calculate diff
-                current_attrs = (
-                    session.query(UOW_Attributes).filter(UOW_Attributes.uow_id == uow_id).all()
+                # current_state includes inherited keys so unchanged values are
+                # not re-written; version_map only covers keys this UOW owns
+                current_state, version_map = UOWPersistenceService.resolve_attributes(
+                    session, uow
                 )
 
-                # Build current state (latest version of each key)
-                current_state = {}
-                version_map = {}
-                for attr in current_attrs:
-                    if attr.key not in current_state or attr.version > version_map[attr.key]:
-                        current_state[attr.key] = attr.value
-                        version_map[attr.key] = attr.version
-
                 # Step 3: Atomic Versioning - Create new attribute records for changes
                 # Filter out reserved learning key - it should not be saved to UOW attributes
                 for key, new_value in result_attributes.items():
@@ -1840,19 +2078,22 @@ class ChameleonEngine:
                 uow.status = UOWStatus.COMPLETED.value
                 uow.last_heartbeat = None  # Release heartbeat
 
-                # TODO: Interaction logging disabled due to SQLite BigInteger autoincrement issue
-                # Log the interaction
-                # log_entry = Interaction_Logs(
-                #     instance_id=uow.instance_id,
-                #     uow_id=uow.uow_id,
-                #     actor_id=actor_id,
-                #     role_id=None,  # TODO: Should track which role completed it
-                #     interaction_id=uow.current_interaction_id,
-                #     timestamp=timestamp
-                # )
-                # session.add(log_entry)
+                # Step 4.1: Cerberus bookkeeping - atomically count this child as
+                # finished on its parent, in the same transaction as the completion
+                child_counts = self._record_child_completion(session, uow)
+                if child_counts is not None:
+                    self._fold_child_result(session, uow, result_attributes)
+
+                # Log the interaction (role is not tracked on submit)
+                log_entry = self._interaction_log_entry(uow, actor_id, None, "SUBMIT")
 
                 session.commit()
+                self._record_interaction_logs([log_entry])
+
+                # Step 5: Wake Omega reconciliation exactly once, when the last
+                # child of the set settles (only after the increment committed)
+                if child_counts is not None:
+                    self._maybe_emit_child_set_completed(uow, *child_counts)
 
                 return True
 
@@ -1860,6 +2101,91 @@ class ChameleonEngine:
                 session.rollback()
                 raise RuntimeError(f"Failed to submit work: {str(e)}") from e
 
+    @staticmethod
+    def _interaction_log_entry(
+        uow: UnitsOfWork,
+        actor_id: Optional[uuid.UUID],
+        role_id: Optional[uuid.UUID],
+        event: str,
+        **details: Any,
+    ) -> TelemetryEntry:
+        """
+        Build the Interaction_Logs entry for a UOW movement (Article XVII).
+        
+        Built while the UOW is still loaded, and recorded only after the
+        transaction commits, so rolled-back movements are never logged.
+        
+        Args:
+            uow: The UOW that moved (at its new interaction)
+            actor_id: The actor responsible (None for system events)
+            role_id: The active role context, if known
+            event: Movement name (CHECKOUT, SUBMIT, REPORT_FAILURE, ZOMBIE_DETECTED)
+            **details: Extra event details
+        """
+        return TelemetryEntry(
+            instance_id=uow.instance_id,
+            uow_id=uow.uow_id,
+            actor_id=actor_id,
+            role_id=role_id,
+            interaction_id=uow.current_interaction_id,
+            log_type="INTERACTION",
+            event_details={"event": event, "status": uow.status, **details},
+        )
+
+    @staticmethod
+    def _record_interaction_logs(entries: List[TelemetryEntry]) -> None:
+        """
+        Hand committed interaction log entries to the telemetry buffer.
+        
+        The buffer is drained in batches by the TelemetryDrainer, so logging
+        adds no database round trip to the calling transaction.
+        """
+        buffer = get_telemetry_buffer()
+        for entry in entries:
+            if not buffer.record(entry):
+                logger.warning(f"Telemetry buffer full; interaction log for UOW {entry.uow_id} dropped")
+
+    def _maybe_emit_child_set_completed(
+        self, child_uow: UnitsOfWork, finished: int, failed: int, expected: int
+    ) -> None:
+        """
+        Emit the child_set_completed event that wakes Omega reconciliation.
+        
+        Fires only when this child settled the set (finished + failed ==
+        child_count); each increment is counted exactly once, so exactly one
+        child sees the closing total. Emission failures are logged and
+        swallowed: the transition has already committed, and Omega can still
+        reconcile from the counters.
+        
+        Args:
+            child_uow: The child that just completed or failed
+            finished: Parent's finished_child_count after the increment
+            failed: Parent's failed_child_count after the increment
+            expected: Parent's child_count
+        """
+        if not expected or finished + failed != expected:
+            return
+        
+        from chameleon_workflow_engine.stream_broadcaster import emit
+        
+        try:
+            emit(
+                "child_set_completed",
+                {
+                    "parent_uow_id": str(child_uow.parent_id),
+                    "last_child_uow_id": str(child_uow.uow_id),
+                    "instance_id": str(child_uow.instance_id),
+                    "finished_child_count": finished,
+                    "failed_child_count": failed,
+                    "child_count": expected,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                },
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to emit child_set_completed for parent {child_uow.parent_id}: {e}"
+            )
+
     def report_failure(
         self, uow_id: uuid.UUID, actor_id: uuid.UUID, error_code: str, details: Optional[str] = None
     ) -> bool:
@@ -1959,24 +2285,30 @@ class ChameleonEngine:
                 uow.status = UOWStatus.FAILED.value
                 uow.last_heartbeat = None  # Release heartbeat
 
+                # Step 4.1: Cerberus bookkeeping - a failed child settles its
+                # slot in the parent's set just like a completed one
+                child_counts = self._record_child_completion(session, uow, failed=True)
+
                 # Step 5: Move to Ate interaction if found
                 if ate_interaction_id:
                     uow.current_interaction_id = ate_interaction_id
 
-                # TODO: Interaction logging disabled due to SQLite BigInteger autoincrement issue
                 # Log the interaction
-                # log_entry = Interaction_Logs(
-                #     instance_id=uow.instance_id,
-                #     uow_id=uow.uow_id,
-                #     actor_id=actor_id,
-                #     role_id=epsilon_role.role_id if epsilon_role else None,
-                #     interaction_id=uow.current_interaction_id,
-                #     timestamp=timestamp
-                # )
-                # session.add(log_entry)
+                log_entry = self._interaction_log_entry(
+                    uow,
+                    actor_id,
+                    epsilon_role.role_id if epsilon_role else None,
+                    "REPORT_FAILURE",
+                    error_code=error_code,
+                )
 
                 session.flush()
                 session.commit()
+                self._record_interaction_logs([log_entry])
+
+                # Step 6: Wake Omega if this failure settled the child set
+                if child_counts is not None:
+                    self._maybe_emit_child_set_completed(uow, *child_counts)
 
                 return True
 
@@ -2118,6 +2450,7 @@ class ChameleonEngine:
 
             logger.warning(f"Zombie Protocol: Found {len(zombies)} stale UOW(s)")
 
+            log_entries = []
             for zombie_uow in zombies:
                 logger.warning(
                     f"Zombie Protocol: Reclaiming Token - UOW {zombie_uow.uow_id}, "
@@ -2163,12 +2496,20 @@ class ChameleonEngine:
                 # Clear the heartbeat (release the lock)
                 zombie_uow.last_heartbeat = None
 
-                # Note: Logging to Interaction_Logs is skipped here to avoid SQLite autoincrement issues
-                # with BigInteger primary keys. In production with PostgreSQL, logging would work properly.
-                # The core zombie reclamation functionality (status update, routing, heartbeat clear) is intact.
+                # Log the Zombie Detection event (system event: no actor)
+                log_entries.append(
+                    self._interaction_log_entry(
+                        zombie_uow,
+                        None,
+                        tau_role.role_id if tau_role else None,
+                        "ZOMBIE_DETECTED",
+                        timeout_seconds=timeout_seconds,
+                    )
+                )
 
             # Commit the changes
             session.commit()
+            self._record_interaction_logs(log_entries)
 
             logger.info(f"Zombie Protocol: Reclaimed {len(zombies)} zombie tokens")
             return len(zombies)
@@ -0,0 +1,249 @@
+"""
+Batch Guard Evaluation: column-oriented guard checks over candidate UOWs.
+
+checkout_work may scan thousands of PENDING UOWs for one role. Evaluating
+the guard one UOW at a time repeats the configuration parsing, operator
+dispatch and (above all) the attribute resolution query for every
+candidate. This module evaluates a guard over a whole batch instead:
+
+1. required_attribute_keys() tells the caller which attribute keys the
+   guard reads, so only those are resolved (one query per batch).
+2. evaluate_guard_batch() takes a column-oriented view of the batch
+   ({key: [value per candidate]}) and returns one pass/fail per candidate.
+
+Semantics match ChameleonEngine._evaluate_guard exactly, including COMPOSITE
+short-circuiting: a step that would raise for a UOW is recorded as an error
+and, like the per-UOW path, rejects that UOW unless an earlier step already
+decided the outcome.
+
+Supported types: PASS_THRU, CRITERIA_GATE, TTL_CHECK, COMPOSITE (of
+supported steps), DIRECTIONAL_FILTER and CERBERUS. Other guards are not
+batchable (is_batchable() is False) and stay on the per-UOW path.
+
+Constitutional Reference: Article IX (Guard Behavior Specifications)
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Set
+import logging
+import operator
+
+from dateutil.parser import isoparse
+
+from database.enums import GuardianType
+
+logger = logging.getLogger(__name__)
+
+
+# Per-UOW outcome: True (pass), False (reject), None (evaluation error -> reject)
+GuardOutcome = Optional[bool]
+
+_CRITERIA_OPERATORS = {
+    "GT": operator.gt,
+    "LT": operator.lt,
+    "EQ": operator.eq,
+}
+
+# Guard types that never block a UOW during checkout
+_ALWAYS_PASS = {
+    GuardianType.PASS_THRU.value,
+    GuardianType.DIRECTIONAL_FILTER.value,
+    GuardianType.CERBERUS.value,
+}
+
+
+def is_batchable(guard_type: Optional[str], config: Optional[Dict[str, Any]]) -> bool:
+    """
+    Whether a guard can be evaluated by evaluate_guard_batch.
+
+    Args:
+        guard_type: Guardian type
+        config: Guardian attributes
+
+    Returns:
+        True for supported types (COMPOSITE only if every step is supported)
+    """
+    if guard_type in _ALWAYS_PASS:
+        return True
+    if guard_type in (GuardianType.CRITERIA_GATE.value, GuardianType.TTL_CHECK.value):
+        return True
+    if guard_type == GuardianType.COMPOSITE.value:
+        return all(
+            is_batchable(step.get("type"), step.get("config", {}))
+            for step in (config or {}).get("steps", [])
+        )
+    return False
+
+
+def required_attribute_keys(guard_type: Optional[str], config: Optional[Dict[str, Any]]) -> Set[str]:
+    """
+    Attribute keys a batchable guard reads.
+
+    Args:
+        guard_type: Guardian type
+        config: Guardian attributes
+
+    Returns:
+        Set of UOW attribute keys
+    """
+    config = config or {}
+    if guard_type == GuardianType.CRITERIA_GATE.value:
+        return {config["field"]} if config.get("field") else set()
+    if guard_type == GuardianType.TTL_CHECK.value:
+        return {config["reference_field"]} if config.get("reference_field") else set()
+    if guard_type == GuardianType.COMPOSITE.value:
+        keys: Set[str] = set()
+        for step in config.get("steps", []):
+            keys |= required_attribute_keys(step.get("type"), step.get("config", {}))
+        return keys
+    return set()
+
+
+def to_columns(rows: Sequence[Dict[str, Any]], keys: Set[str]) -> Dict[str, List[Any]]:
+    """
+    Build the column-oriented view of a batch of attribute dicts.
+
+    Args:
+        rows: Resolved attributes per candidate UOW
+        keys: Keys to extract
+
+    Returns:
+        {key: [value or None per candidate]}
+    """
+    return {key: [row.get(key) for row in rows] for key in keys}
+
+
+def evaluate_guard_batch(
+    guard_type: Optional[str],
+    config: Optional[Dict[str, Any]],
+    columns: Dict[str, List[Any]],
+    size: int,
+    now: Optional[datetime] = None,
+) -> List[GuardOutcome]:
+    """
+    Evaluate a batchable guard over a batch of candidates.
+
+    Args:
+        guard_type: Guardian type
+        config: Guardian attributes
+        columns: Column-oriented attributes (see to_columns)
+        size: Number of candidates in the batch
+        now: Reference time for TTL_CHECK (default: current UTC time)
+
+    Returns:
+        One outcome per candidate: True (pass), False (reject) or None
+        (evaluation error, which callers treat as a rejection)
+
+    Raises:
+        ValueError: If the guard is not batchable
+    """
+    config = config or {}
+
+    if guard_type in _ALWAYS_PASS:
+        return [True] * size
+
+    if guard_type == GuardianType.CRITERIA_GATE.value:
+        return _criteria_gate(config, columns, size)
+
+    if guard_type == GuardianType.TTL_CHECK.value:
+        return _ttl_check(config, columns, size, now or datetime.now(timezone.utc))
+
+    if guard_type == GuardianType.COMPOSITE.value:
+        return _composite(config, columns, size, now or datetime.now(timezone.utc))
+
+    raise ValueError(f"Guard type is not batchable: {guard_type}")
+
+
+def _criteria_gate(config: Dict[str, Any], columns: Dict[str, List[Any]], size: int) -> List[GuardOutcome]:
+    field = config.get("field")
+    op_name = config.get("operator")
+    threshold = config.get("threshold")
+
+    if not field or not op_name:
+        # Missing configuration - reject for safety
+        return [False] * size
+
+    values = columns.get(field, [None] * size)
+
+    if op_name == "IN":
+        if not isinstance(threshold, (list, tuple)):
+            return [False] * size
+        return [False if value is None else _safe(operator.contains, threshold, value) for value in values]
+
+    compare = _CRITERIA_OPERATORS.get(op_name)
+    if compare is None:
+        # Unknown operator - reject
+        return [False] * size
+    return [False if value is None else _safe(compare, value, threshold) for value in values]
+
+
+def _ttl_check(
+    config: Dict[str, Any], columns: Dict[str, List[Any]], size: int, now: datetime
+) -> List[GuardOutcome]:
+    reference_field = config.get("reference_field")
+    max_age_seconds = config.get("max_age_seconds")
+
+    if not reference_field or max_age_seconds is None:
+        return [False] * size
+
+    outcomes: List[GuardOutcome] = []
+    for value in columns.get(reference_field, [None] * size):
+        if isinstance(value, str):
+            try:
+                reference_time = isoparse(value)
+            except Exception:
+                outcomes.append(False)
+                continue
+        elif isinstance(value, datetime):
+            reference_time = value
+        else:
+            # Missing or unknown format - reject
+            outcomes.append(False)
+            continue
+
+        if reference_time.tzinfo is None:
+            reference_time = reference_time.replace(tzinfo=timezone.utc)
+        try:
+            outcomes.append((now - reference_time).total_seconds() <= max_age_seconds)
+        except Exception:
+            outcomes.append(False)
+    return outcomes
+
+
+def _composite(
+    config: Dict[str, Any], columns: Dict[str, List[Any]], size: int, now: datetime
+) -> List[GuardOutcome]:
+    logic = config.get("logic", "AND").upper()
+    steps = config.get("steps", [])
+
+    if not steps or logic not in ("AND", "OR"):
+        return [False] * size
+
+    # Per UOW, the first step that decides wins, as with short-circuit
+    # evaluation: AND stops at the first non-pass, OR at the first non-fail
+    undecided = True if logic == "AND" else False
+    outcomes: List[GuardOutcome] = [undecided] * size
+    open_rows = list(range(size))
+    for step in steps:
+        if not open_rows:
+            break
+        step_outcomes = evaluate_guard_batch(
+            step.get("type"), step.get("config", {}), columns, size, now
+        )
+        still_open = []
+        for row in open_rows:
+            result = step_outcomes[row]
+            if result is undecided:
+                still_open.append(row)
+            else:
+                outcomes[row] = result
+        open_rows = still_open
+    return outcomes
+
+
+def _safe(compare, left: Any, right: Any) -> GuardOutcome:
+    try:
+        return bool(compare(left, right))
+    except Exception:
+        # e.g. comparing a string attribute with a numeric threshold
+        return None
@@ -10,13 +10,17 @@ Provides:
 Constitutional Reference: Article XV (Pilot Sovereignty) - Real-time intervention management
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Set
 from datetime import datetime, timezone
 from enum import Enum
+import asyncio
 import logging
 import json
+import threading
 from dataclasses import dataclass, asdict, field
 
+from chameleon_workflow_engine.rbac import PilotRole
+
 logger = logging.getLogger(__name__)
 
 
@@ -184,6 +188,7 @@ class InterventionStore:
         
         self.requests[request_id] = request
         logger.info(f"Intervention request created: {request_id} (type={intervention_type})")
+        get_intervention_hub().publish_created(request)
         
         return request
 
@@ -191,6 +196,10 @@ class InterventionStore:
         """Get request by ID."""
         return self.requests.get(request_id)
 
+    def get_open_requests(self, request_ids: List[str]) -> List[InterventionRequest]:
+        """Get the requests among request_ids that are not yet resolved, in request_ids order."""
+        return [self.requests[rid] for rid in dict.fromkeys(request_ids) if rid in self.requests]
+
     def update_request(
         self,
         request_id: str,
@@ -219,6 +228,7 @@ class InterventionStore:
         request.action_reason = action_reason
         request.action_timestamp = datetime.now(timezone.utc).isoformat()
         
+        previous_assigned_to = request.assigned_to
         if assigned_to:
             request.assigned_to = assigned_to
         
@@ -229,12 +239,41 @@ class InterventionStore:
             self.history.append(request)
             del self.requests[request_id]
         
+        get_intervention_hub().publish_updated(request, previous_assigned_to)
         return request
 
+    def update_requests_bulk(
+        self,
+        request_ids: List[str],
+        status: InterventionStatus,
+        action_reason: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+    ) -> List[InterventionRequest]:
+        """
+        Update several requests with the same status change.
+        
+        Args:
+            request_ids: Request IDs (unknown or already resolved IDs are skipped)
+            status: New status
+            action_reason: Why pilot took action
+            assigned_to: Pilot ID (if assigning)
+        
+        Returns:
+            Updated InterventionRequest list, in request_ids order
+        """
+        updated = []
+        for request_id in dict.fromkeys(request_ids):
+            request = self.update_request(request_id, status, action_reason, assigned_to)
+            if request is not None:
+                updated.append(request)
+        return updated
+
     def get_pending_requests(
         self,
         pilot_id: Optional[str] = None,
         limit: int = 50,
+        offset: int = 0,
+        after: Optional[tuple] = None,
     ) -> List[InterventionRequest]:
         """
         Get pending intervention requests.
@@ -242,6 +281,9 @@ class InterventionStore:
         Args:
             pilot_id: Filter by assigned pilot (None = all)
             limit: Maximum results
+            offset: Results to skip (after the cursor, if any)
+            after: Optional (priority_rank, created_at, request_id) cursor;
+                   only requests strictly after it are returned
         
         Returns:
             List of pending InterventionRequest
@@ -256,14 +298,19 @@ class InterventionStore:
         
         # Sort by priority and age
         priority_order = {"critical": 0, "high": 1, "normal": 2, "low": 3}
-        requests.sort(
-            key=lambda r: (
+
+        def sort_key(r):
+            return (
                 priority_order.get(r.priority, 999),
-                r.created_at,
+                datetime.fromisoformat(r.created_at),
+                r.request_id,
             )
-        )
+
+        requests.sort(key=sort_key)
+        if after is not None:
+            requests = [r for r in requests if sort_key(r) > tuple(after)]
         
-        return requests[:limit]
+        return requests[offset:offset + limit]
 
     def get_metrics(self) -> DashboardMetrics:
         """
@@ -479,7 +526,7 @@ class WebSocketMessageHandler:
             return DashboardResponse.error(f"Server error: {str(e)}")
 
     def _handle_subscribe(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle subscribe message (for future streaming)."""
+        """Handle subscribe message (the WebSocket endpoint registers the InterventionHub subscription)."""
         pilot_id = payload.get("pilot_id")
         return {
             "success": True,
@@ -528,6 +575,322 @@ class WebSocketMessageHandler:
         return DashboardResponse.request_detail(request)
 
 
+# ============================================================================
+# Intervention Update Hub (server push)
+# ============================================================================
+
+# Fields sent in a status_changed delta (the rest of the request is unchanged)
+STATUS_DELTA_FIELDS = (
+    "request_id",
+    "uow_id",
+    "intervention_type",
+    "status",
+    "priority",
+    "assigned_to",
+    "required_role",
+    "updated_at",
+    "action_reason",
+    "action_timestamp",
+)
+
+# Fields sent in a request_removed delta (the request left a pilot's queue)
+REMOVED_DELTA_FIELDS = (
+    "request_id",
+    "intervention_type",
+    "priority",
+    "assigned_to",
+    "required_role",
+)
+
+# Pilot roles by authority; a role satisfies every required_role at or below it
+PILOT_ROLE_RANK = {PilotRole.VIEWER.value: 0, PilotRole.OPERATOR.value: 1, PilotRole.ADMIN.value: 2}
+
+
+class InterventionSubscription:
+    """
+    One WebSocket subscriber of the InterventionHub.
+
+    A pilot-filtered subscription sees the requests assigned to its pilot
+    plus unassigned ones its role can take (new work up for grabs). When a
+    request leaves that view (reassigned away, or claimed by another pilot)
+    it is sent a request_removed delta.
+
+    Pending deltas are coalesced by request_id (the newest state of a request
+    replaces an unsent older one; a new_request stays a new_request) and sent
+    as one "intervention_updates" message per burst. If more than
+    max_pending distinct requests are waiting, the subscriber is a slow
+    consumer: its backlog is discarded and a single "resync" message tells
+    the client to re-fetch with get_pending.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+        pilot_id: Optional[str] = None,
+        role: Optional[str] = None,
+        priorities: Optional[List[str]] = None,
+        intervention_types: Optional[List[str]] = None,
+        max_pending: int = 500,
+        coalesce_window_seconds: float = 0.05,
+        send_timeout_seconds: float = 5.0,
+    ):
+        """
+        Initialize subscription.
+
+        Args:
+            send: Coroutine function that delivers one JSON message
+            pilot_id: Only requests assigned to this pilot, or unassigned
+                      ones the pilot's role can take (None = all)
+            role: The pilot's PilotRole; unassigned requests are matched
+                  against their required_role (None = any required_role)
+            priorities: Only these priorities (None = all)
+            intervention_types: Only these intervention types (None = all)
+            max_pending: Distinct pending requests before the subscriber is resynced
+            coalesce_window_seconds: Time to gather a burst into one message
+            send_timeout_seconds: A send taking longer than this closes the subscription
+        """
+        self.send = send
+        self.pilot_id = pilot_id
+        self.role = role
+        self.priorities = set(priorities) if priorities else None
+        self.intervention_types = set(intervention_types) if intervention_types else None
+        self.max_pending = max_pending
+        self.coalesce_window_seconds = coalesce_window_seconds
+        self.send_timeout_seconds = send_timeout_seconds
+
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        self.resync_required = False
+        self.closed = False
+        self.messages_sent = 0
+        self.resyncs = 0
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def matches(self, delta: Dict[str, Any]) -> bool:
+        """Whether a delta passes this subscription's filters."""
+        data = delta["data"]
+        if self.pilot_id is None:
+            if delta["type"] == "request_removed":
+                return False  # Unfiltered views keep every request
+        elif not self._in_pilot_view(delta):
+            return False
+        if self.priorities is not None and data.get("priority") not in self.priorities:
+            return False
+        if self.intervention_types is not None and data.get("intervention_type") not in self.intervention_types:
+            return False
+        return True
+
+    def _in_pilot_view(self, delta: Dict[str, Any]) -> bool:
+        data = delta["data"]
+        if delta["type"] == "request_removed":
+            previous_assigned_to = data.get("previous_assigned_to")
+            if previous_assigned_to is None:
+                # Claimed out of the unassigned pool by another pilot
+                return data.get("assigned_to") != self.pilot_id and self._can_take(data)
+            return previous_assigned_to == self.pilot_id
+        assigned_to = data.get("assigned_to")
+        if assigned_to is None:
+            return self._can_take(data)
+        return assigned_to == self.pilot_id
+
+    def _can_take(self, data: Dict[str, Any]) -> bool:
+        if self.role is None:
+            return True
+        required = PILOT_ROLE_RANK.get(data.get("required_role"), PILOT_ROLE_RANK[PilotRole.ADMIN.value])
+        return PILOT_ROLE_RANK.get(self.role, -1) >= required
+
+    def offer(self, delta: Dict[str, Any]) -> None:
+        """Queue a delta (event loop thread only)."""
+        if self.closed or self.resync_required:
+            return
+        request_id = delta["data"]["request_id"]
+        previous = self.pending.get(request_id)
+        if delta["type"] == "request_removed" and previous is not None and previous["type"] == "new_request":
+            # Never delivered: the client need not hear about it at all
+            del self.pending[request_id]
+            return
+        if previous is not None and previous["type"] == "new_request":
+            # Not sent yet: the client still sees it as new, with the latest state
+            merged = dict(previous["data"])
+            merged.update(delta["data"])
+            delta = {"type": "new_request", "data": merged}
+        else:
+            # Re-insert so the newest change is delivered last
+            self.pending.pop(request_id, None)
+        self.pending[request_id] = delta
+
+        if len(self.pending) > self.max_pending:
+            self.pending.clear()
+            self.resync_required = True
+            self.resyncs += 1
+            logger.warning(
+                f"Slow dashboard subscriber (pilot_id={self.pilot_id}); dropping backlog, requesting resync"
+            )
+        self._wake.set()
+
+    def start(self) -> None:
+        """Start the sender task on the running event loop."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the sender task."""
+        self.closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while not self.closed:
+            await self._wake.wait()
+            # Let the rest of a burst arrive before sending
+            await asyncio.sleep(self.coalesce_window_seconds)
+            self._wake.clear()
+
+            if self.resync_required:
+                self.resync_required = False
+                message = {"type": "resync", "data": {"reason": "slow_consumer"}}
+            elif self.pending:
+                updates = list(self.pending.values())
+                self.pending = {}
+                message = {"type": "intervention_updates", "data": {"updates": updates}}
+            else:
+                continue
+
+            try:
+                await asyncio.wait_for(self.send(message), self.send_timeout_seconds)
+                self.messages_sent += 1
+            except Exception as e:
+                logger.warning(f"Closing dashboard subscription (pilot_id={self.pilot_id}): {e}")
+                self.closed = True
+
+
+class InterventionHub:
+    """
+    Fan-out of intervention create/update events to WebSocket subscribers.
+
+    Stores call publish_created/publish_updated from any thread; the delta is
+    built on the caller's thread and handed to the event loop that owns the
+    subscriptions. Subscriptions are registered per pilot_id so a delta for
+    an assigned request is only matched against subscribers of that pilot
+    and subscribers without a pilot filter; deltas for unassigned requests
+    go to every subscriber, whose role filter decides.
+    """
+
+    def __init__(self):
+        """Initialize empty hub."""
+        self._by_pilot: Dict[Optional[str], Set[InterventionSubscription]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of registered subscriptions."""
+        return sum(len(subs) for subs in self._by_pilot.values())
+
+    async def subscribe(
+        self,
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+        pilot_id: Optional[str] = None,
+        **options: Any,
+    ) -> InterventionSubscription:
+        """
+        Register a subscriber and start its sender task.
+
+        Args:
+            send: Coroutine function that delivers one JSON message
+            pilot_id: Only requests assigned to this pilot, or unassigned
+                      ones the pilot's role can take (None = all)
+            **options: Further InterventionSubscription arguments
+
+        Returns:
+            The subscription (pass it to unsubscribe on disconnect)
+        """
+        subscription = InterventionSubscription(send, pilot_id=pilot_id, **options)
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._by_pilot.setdefault(pilot_id, set()).add(subscription)
+        subscription.start()
+        return subscription
+
+    async def unsubscribe(self, subscription: InterventionSubscription) -> None:
+        """Remove a subscriber and stop its sender task."""
+        with self._lock:
+            subs = self._by_pilot.get(subscription.pilot_id)
+            if subs is not None:
+                subs.discard(subscription)
+                if not subs:
+                    del self._by_pilot[subscription.pilot_id]
+        await subscription.stop()
+
+    def publish_created(self, request: InterventionRequest) -> None:
+        """Push a new_request delta (full request) to matching subscribers."""
+        if self._by_pilot:
+            self._publish({"type": "new_request", "data": request.to_dict()})
+
+    def publish_updated(self, request: InterventionRequest, previous_assigned_to: Optional[str]) -> None:
+        """
+        Push a status_changed delta (changed fields only) to matching subscribers.
+
+        Args:
+            request: The request after the update
+            previous_assigned_to: Its assignee before the update; on a change
+                                  the previous pilot's view (or the other
+                                  pilots', if it was unassigned) gets a
+                                  request_removed delta
+        """
+        if self._by_pilot:
+            data = request.to_dict()
+            if previous_assigned_to != request.assigned_to:
+                removed = {key: data.get(key) for key in REMOVED_DELTA_FIELDS}
+                removed["previous_assigned_to"] = previous_assigned_to
+                self._publish({"type": "request_removed", "data": removed})
+            self._publish({
+                "type": "status_changed",
+                "data": {key: data.get(key) for key in STATUS_DELTA_FIELDS},
+            })
+
+    def _publish(self, delta: Dict[str, Any]) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._fan_out(delta)
+        else:
+            loop.call_soon_threadsafe(self._fan_out, delta)
+
+    def _fan_out(self, delta: Dict[str, Any]) -> None:
+        data = delta["data"]
+        owner = (
+            data.get("previous_assigned_to") if delta["type"] == "request_removed"
+            else data.get("assigned_to")
+        )
+        with self._lock:
+            if owner is None:
+                candidates = [s for subs in self._by_pilot.values() for s in subs]
+            else:
+                candidates = list(self._by_pilot.get(None, ()))
+                candidates.extend(self._by_pilot.get(owner, ()))
+        for subscription in candidates:
+            if subscription.matches(delta):
+                subscription.offer(delta)
+
+
+_global_intervention_hub = InterventionHub()
+
+
+def get_intervention_hub() -> InterventionHub:
+    """Get global intervention update hub."""
+    return _global_intervention_hub
+
+
 # ============================================================================
 # Example Usage
 # ============================================================================
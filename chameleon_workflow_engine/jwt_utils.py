@@ -10,15 +10,20 @@ Features:
 - Claim extraction (sub, role, exp)
 - Graceful error handling
 - Phase 2 RBAC foundation
+- Process-wide validator with a bounded cache of verified tokens (until
+  their exp) and a deny-list for revoked tokens
 
 Constitutional Reference: Article XV (Pilot Sovereignty)
 """
 
 import jwt
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any
-from functools import lru_cache
 
 from loguru import logger
 
@@ -31,6 +36,7 @@ class JWTConfig:
         secret_key: Optional[str] = None,
         algorithm: str = "HS256",
         expiration_minutes: int = 60,
+        cache_size: Optional[int] = None,
     ):
         """
         Initialize JWT configuration.
@@ -39,10 +45,16 @@ class JWTConfig:
             secret_key: JWT signing secret (defaults to JWT_SECRET_KEY env var)
             algorithm: JWT algorithm (HS256, RS256, etc.)
             expiration_minutes: Token lifetime in minutes
+            cache_size: Verified tokens kept by validate_pilot_token
+                (defaults to JWT_VALIDATION_CACHE_SIZE env var, else 1024; 0 disables)
         """
         self.secret_key = secret_key or os.getenv("JWT_SECRET_KEY", "dev-secret-key")
         self.algorithm = algorithm
         self.expiration_minutes = expiration_minutes
+        self.cache_size = (
+            cache_size if cache_size is not None
+            else int(os.getenv("JWT_VALIDATION_CACHE_SIZE", "1024"))
+        )
     
     def validate(self):
         """Validate configuration for production use."""
@@ -116,11 +128,26 @@ class PilotToken:
 
 
 class JWTValidator:
-    """JWT token parsing and validation."""
+    """
+    JWT token parsing and validation.
+    
+    validate_pilot_token() keeps a bounded LRU of tokens that passed
+    verification, keyed by the token's SHA-256 and dropped at the token's
+    exp, so a Pilot's repeated calls skip signature verification. Revoked
+    tokens go on a deny-list that is checked before the cache; entries
+    leave the deny-list once the token would have expired anyway.
+    """
     
     def __init__(self, config: JWTConfig):
         """Initialize with JWT configuration."""
         self.config = config
+
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, PilotToken]" = OrderedDict()
+        # token hash -> exp timestamp (None = until cleared)
+        self._denied: Dict[str, Optional[float]] = {}
+        self._hits = 0
+        self._misses = 0
     
     def decode_token(self, token: str) -> Dict[str, Any]:
         """
@@ -200,6 +227,104 @@ class JWTValidator:
             raw_claims=claims,
         )
     
+    def validate_pilot_token(self, token: str) -> PilotToken:
+        """
+        Parse a Pilot token, reusing an earlier verification when possible.
+        
+        Same result as parse_pilot_token(), but a token seen before (and not
+        yet expired) is served from the cache without re-verifying its
+        signature. Revoked tokens are rejected even when cached.
+        
+        Args:
+            token: JWT token string
+            
+        Returns:
+            PilotToken with extracted identity
+            
+        Raises:
+            InvalidTokenError: If token is invalid/expired/revoked
+            MissingClaimError: If required claims missing
+        """
+        key = _token_key(token)
+        now = time.time()
+
+        with self._lock:
+            if key in self._denied:
+                expires = self._denied[key]
+                if expires is None or expires > now:
+                    raise InvalidTokenError("Token has been revoked")
+                del self._denied[key]
+
+            cached = self._cache.get(key)
+            if cached is not None:
+                if cached.expires_at.timestamp() > now:
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return cached
+                del self._cache[key]
+            self._misses += 1
+
+        # Verify outside the lock; concurrent misses on one token are harmless
+        pilot_token = self.parse_pilot_token(token)
+
+        if self.config.cache_size > 0:
+            with self._lock:
+                if key not in self._denied:
+                    self._cache[key] = pilot_token
+                    self._cache.move_to_end(key)
+                    while len(self._cache) > self.config.cache_size:
+                        self._cache.popitem(last=False)
+        return pilot_token
+
+    def revoke_token(self, token: str, expires_at: Optional[datetime] = None) -> None:
+        """
+        Deny a token from now on, whether or not it is cached.
+        
+        Args:
+            token: JWT token string
+            expires_at: When the token expires anyway (deny-list entry is
+                dropped then); read from the token's exp claim if omitted
+        """
+        key = _token_key(token)
+        if expires_at is None:
+            try:
+                exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+            except jwt.PyJWTError:
+                exp = None
+        else:
+            exp = expires_at.timestamp()
+
+        with self._lock:
+            now = time.time()
+            # Keep the deny-list small: forget entries whose token has expired
+            for denied_key, denied_exp in list(self._denied.items()):
+                if denied_exp is not None and denied_exp <= now:
+                    del self._denied[denied_key]
+            self._denied[key] = exp
+            self._cache.pop(key, None)
+        logger.info("JWT token revoked")
+
+    def clear_cache(self) -> None:
+        """Forget all verified tokens (the deny-list is kept)."""
+        with self._lock:
+            self._cache.clear()
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Cache statistics.
+        
+        Returns:
+            Dict with hits, misses, size, max_size and denied
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._cache),
+                "max_size": self.config.cache_size,
+                "denied": len(self._denied),
+            }
+    
     def extract_bearer_token(self, auth_header: Optional[str]) -> str:
         """
         Extract token from 'Authorization: Bearer <token>' header.
@@ -226,9 +351,17 @@ class JWTValidator:
         return parts[1]
 
 
+def _token_key(token: str) -> str:
+    """Cache/deny-list key for a token (raw tokens are not kept)."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
 # Global JWT config (singleton)
 _jwt_config = None
 
+# Global JWT validator (singleton, shares the cache across requests)
+_jwt_validator = None
+
 
 def get_jwt_config() -> JWTConfig:
     """Get or initialize global JWT config."""
@@ -239,9 +372,34 @@ def get_jwt_config() -> JWTConfig:
 
 
 def set_jwt_config(config: JWTConfig):
-    """Set global JWT config (useful for testing)."""
-    global _jwt_config
+    """
+    Set global JWT config (useful for testing). Resets the global validator.
+    
+    The new validator starts with an empty cache but keeps the previous
+    validator's deny-list, so a config change never un-revokes a token.
+    """
+    global _jwt_config, _jwt_validator
+    previous = _jwt_validator
     _jwt_config = config
+    _jwt_validator = None
+    if previous is not None:
+        validator = get_jwt_validator()
+        with previous._lock:
+            validator._denied.update(previous._denied)
+
+
+def get_jwt_validator() -> JWTValidator:
+    """Get or initialize the global JWT validator (uses the global config)."""
+    global _jwt_validator
+    if _jwt_validator is None:
+        _jwt_validator = JWTValidator(get_jwt_config())
+    return _jwt_validator
+
+
+def set_jwt_validator(validator: Optional[JWTValidator]):
+    """Set global JWT validator (None = rebuild from config on next use)."""
+    global _jwt_validator
+    _jwt_validator = validator
 
 
 def create_token(
@@ -2,7 +2,9 @@
 PilotInterface: Human-in-the-loop intervention controls.
 
 Implements:
-- kill_switch(): Emergency pause all ACTIVE workflows in an instance
+- kill_switch(): Emergency pause all ACTIVE workflows in an instance (set-based),
+  optionally freezing the instance so checkout stops handing out its work
+- release_kill_switch(): Lift an instance freeze
 - submit_clarification(): Inject human guidance and reset interaction counter (breaks Ambiguity Lock)
 - waive_violation(): Single-actor Constitutional waiver with mandatory justification
 - resume_uow(): Resume from PENDING_PILOT_APPROVAL → ACTIVE
@@ -12,9 +14,10 @@ Constitutional Reference: Article XV (Pilot Management & Oversight) - Pilot has
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional, Set
 from uuid import UUID
 import logging
+import threading
 
 from database.uow_repository import UOWRepository
 from database.enums import UOWStatus
@@ -43,52 +46,51 @@ class PilotInterface:
         """
         self.repository = repository
 
-    def kill_switch(self, instance_id: UUID, reason: str, pilot_id: str) -> Dict[str, Any]:
+    def kill_switch(
+        self, instance_id: UUID, reason: str, pilot_id: str, freeze: bool = False
+    ) -> Dict[str, Any]:
         """
         Emergency pause: Transition all ACTIVE UOWs in instance to PAUSED.
         
         Constitutional Article XV: Pilot can halt all processing immediately.
         
+        The UOWs are paused set-wise by the repository (one UPDATE plus bulk
+        history rows) and one summary event is emitted. With freeze=True the
+        instance is first marked frozen in this process, so checkout stops
+        handing out its work before the UPDATE runs; the flag stays set (even
+        if pausing fails) until release_kill_switch().
+        
         Args:
             instance_id: Instance to pause
             reason: Human-readable reason for pause
             pilot_id: Pilot actor ID (for audit trail)
+            freeze: Also mark the instance frozen for checkout
         
         Returns:
             Dict with count of paused UOWs and success status
         """
         try:
-            # Find all ACTIVE UOWs in instance
-            active_uows = self.repository.find_by_status(
-                status=UOWStatus.ACTIVE.value,
-                instance_id=instance_id
-            )
-
-            paused_count = 0
-
-            for uow_dict in active_uows:
-                uow_id = UUID(uow_dict["uow_id"])
-
-                # Transition ACTIVE → PAUSED
-                # auto_increment=False: kill_switch is administrative, not interaction
-                self.repository.update_state(
-                    uow_id=uow_id,
-                    new_status=UOWStatus.PAUSED.value,
-                    payload={
-                        "kill_switch_reason": reason,
-                        "triggered_by": pilot_id,
-                    },
-                    auto_increment=False,  # Not an interaction
-                )
+            if freeze:
+                freeze_instance(instance_id)
 
-                paused_count += 1
+            # auto_increment semantics: kill_switch is administrative, not interaction
+            paused_count = self.repository.pause_active(
+                instance_id,
+                payload={
+                    "kill_switch_reason": reason,
+                    "triggered_by": pilot_id,
+                },
+            )
 
-                logger.info(f"Kill switch: Paused UOW {uow_id} (Pilot: {pilot_id})")
+            logger.info(
+                f"Kill switch: Paused {paused_count} UOWs in instance {instance_id} (Pilot: {pilot_id})"
+            )
 
             # Emit intervention event
             emit("kill_switch_activated", {
                 "instance_id": str(instance_id),
                 "paused_uows": paused_count,
+                "frozen": is_instance_frozen(instance_id),
                 "reason": reason,
                 "triggered_by": pilot_id,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -97,6 +99,7 @@ class PilotInterface:
             return {
                 "success": True,
                 "paused_uows": paused_count,
+                "frozen": is_instance_frozen(instance_id),
                 "message": f"Kill switch activated: {paused_count} UOWs paused",
             }
 
@@ -104,6 +107,35 @@ class PilotInterface:
             logger.error(f"Kill switch failed: {e}")
             raise PilotInterfaceError(f"Kill switch failed: {e}")
 
+    def release_kill_switch(self, instance_id: UUID, pilot_id: str) -> Dict[str, Any]:
+        """
+        Lift the checkout freeze set by kill_switch(freeze=True).
+        
+        Paused UOWs stay PAUSED; they are resumed individually.
+        
+        Args:
+            instance_id: Frozen instance
+            pilot_id: Pilot actor ID (for audit trail)
+        
+        Returns:
+            Dict with whether the instance was frozen
+        """
+        was_frozen = unfreeze_instance(instance_id)
+        logger.info(f"Kill switch released for instance {instance_id} (Pilot: {pilot_id})")
+
+        emit("kill_switch_released", {
+            "instance_id": str(instance_id),
+            "was_frozen": was_frozen,
+            "released_by": pilot_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        })
+
+        return {
+            "success": True,
+            "was_frozen": was_frozen,
+            "message": "Instance unfrozen" if was_frozen else "Instance was not frozen",
+        }
+
     def submit_clarification(
         self,
         uow_id: UUID,
@@ -393,6 +425,41 @@ class PilotInterface:
             raise PilotInterfaceError(f"Cancellation failed: {e}")
 
 
+# ============================================================================
+# Instance Freeze Flags
+# ============================================================================
+
+# Instances halted by kill_switch(freeze=True); in-memory, per process
+_frozen_instances: Set[UUID] = set()
+_frozen_lock = threading.Lock()
+
+
+def freeze_instance(instance_id: UUID) -> None:
+    """Mark an instance frozen: checkout hands out none of its UOWs."""
+    with _frozen_lock:
+        _frozen_instances.add(instance_id)
+
+
+def unfreeze_instance(instance_id: UUID) -> bool:
+    """Clear an instance's frozen flag; True if it was frozen."""
+    with _frozen_lock:
+        if instance_id not in _frozen_instances:
+            return False
+        _frozen_instances.discard(instance_id)
+        return True
+
+
+def is_instance_frozen(instance_id: UUID) -> bool:
+    """Check whether an instance is frozen."""
+    return instance_id in _frozen_instances
+
+
+def get_frozen_instances() -> FrozenSet[UUID]:
+    """Snapshot of the frozen instance IDs."""
+    with _frozen_lock:
+        return frozenset(_frozen_instances)
+
+
 # ============================================================================
 # Exceptions
 # ============================================================================
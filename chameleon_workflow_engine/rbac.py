@@ -43,6 +43,12 @@ ENDPOINT_PERMISSIONS = {
     
     # Cancel: OPERATOR+ (reject transitions)
     "/pilot/cancel": {PilotRole.ADMIN, PilotRole.OPERATOR},
+    
+    # Assign interventions: OPERATOR+ (triage the intervention queue)
+    "/pilot/assign": {PilotRole.ADMIN, PilotRole.OPERATOR},
+    
+    # Audit history (/api/history/...): VIEWER+ (read-only)
+    "/api/history": {PilotRole.ADMIN, PilotRole.OPERATOR, PilotRole.VIEWER},
 }
 
 
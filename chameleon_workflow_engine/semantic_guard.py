@@ -20,7 +20,8 @@ import hashlib
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Callable, Tuple
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Callable, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from loguru import logger
@@ -71,6 +72,13 @@ class ShadowLogger:
     """
     Captures evaluation errors without interrupting execution.
     Implements Silent Failure Protocol: errors are logged, next branch attempted.
+    
+    Entries live in a bounded deque (O(1) capture and FIFO eviction) with a
+    per-uow_id index, so per-UOW reads and clears never scan the whole log.
+    Cleared entries are tombstoned and skipped until they age out of the deque.
+    
+    Sinks (see add_sink) receive every captured entry, so errors can spill
+    to durable storage such as the telemetry pipeline instead of only memory.
     """
     
     def __init__(self, max_entries: int = 10000):
@@ -80,8 +88,28 @@ class ShadowLogger:
         Args:
             max_entries: Maximum log entries to keep in memory (FIFO eviction)
         """
-        self.logs: List[ShadowLogEntry] = []
         self.max_entries = max_entries
+        self.logs: Deque[ShadowLogEntry] = deque()
+        self._by_uow: Dict[Optional[str], Deque[ShadowLogEntry]] = {}
+        self._cleared: Set[int] = set()
+        self._sinks: List[Callable[[ShadowLogEntry, Dict[str, Any]], None]] = []
+    
+    def add_sink(self, sink: Callable[[ShadowLogEntry, Dict[str, Any]], None]) -> None:
+        """
+        Register a callable that receives each captured entry and its trace ids.
+        
+        Sink failures are swallowed (Silent Failure Protocol).
+        
+        Args:
+            sink: Callable(entry, trace)
+        """
+        if sink not in self._sinks:
+            self._sinks.append(sink)
+    
+    def remove_sink(self, sink: Callable[[ShadowLogEntry, Dict[str, Any]], None]) -> None:
+        """Unregister a sink added with add_sink."""
+        if sink in self._sinks:
+            self._sinks.remove(sink)
     
     def capture_error(
         self,
@@ -89,7 +117,8 @@ class ShadowLogger:
         condition: str,
         error: Exception,
         uow_id: Optional[str] = None,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        trace: Optional[Dict[str, Any]] = None
     ) -> ShadowLogEntry:
         """
         Capture an evaluation error to the shadow log.
@@ -100,6 +129,8 @@ class ShadowLogger:
             error: The exception that was raised
             uow_id: Optional UOW ID for traceability
             context: Variable context at time of error
+            trace: Optional identifiers for sinks (instance_id, role_id,
+                   interaction_id, actor_id)
         
         Returns:
             ShadowLogEntry that was recorded
@@ -114,11 +145,11 @@ class ShadowLogger:
             variable_context=context or {}
         )
         
-        self.logs.append(entry)
-        
         # FIFO eviction if exceeded max entries
-        if len(self.logs) > self.max_entries:
-            self.logs.pop(0)
+        if len(self.logs) >= self.max_entries:
+            self._evict_oldest()
+        self.logs.append(entry)
+        self._by_uow.setdefault(uow_id, deque()).append(entry)
         
         # Log to loguru for monitoring
         logger.warning(
@@ -129,6 +160,12 @@ class ShadowLogger:
             condition=condition
         )
         
+        for sink in self._sinks:
+            try:
+                sink(entry, trace or {})
+            except Exception as e:
+                logger.debug(f"Shadow log sink failed: {e}")
+        
         return entry
     
     def get_logs(self, uow_id: Optional[str] = None) -> List[ShadowLogEntry]:
@@ -142,8 +179,10 @@ class ShadowLogger:
             List of ShadowLogEntry records
         """
         if uow_id:
-            return [log for log in self.logs if log.uow_id == uow_id]
-        return self.logs
+            return list(self._by_uow.get(uow_id, ()))
+        if self._cleared:
+            return [log for log in self.logs if id(log) not in self._cleared]
+        return list(self.logs)
     
     def clear_logs(self, uow_id: Optional[str] = None) -> int:
         """
@@ -156,13 +195,27 @@ class ShadowLogger:
             Number of entries cleared
         """
         if uow_id:
-            initial_count = len(self.logs)
-            self.logs = [log for log in self.logs if log.uow_id != uow_id]
-            return initial_count - len(self.logs)
+            entries = self._by_uow.pop(uow_id, ())
+            # Tombstone; the deque drops them when they reach the front
+            self._cleared.update(id(entry) for entry in entries)
+            return len(entries)
         else:
-            count = len(self.logs)
+            count = len(self.logs) - len(self._cleared)
             self.logs.clear()
+            self._by_uow.clear()
+            self._cleared.clear()
             return count
+    
+    def _evict_oldest(self) -> None:
+        oldest = self.logs.popleft()
+        if id(oldest) in self._cleared:
+            self._cleared.discard(id(oldest))
+            return
+        # The oldest entry overall is also the oldest of its UOW
+        uow_entries = self._by_uow[oldest.uow_id]
+        uow_entries.popleft()
+        if not uow_entries:
+            del self._by_uow[oldest.uow_id]
 
 
 # Global shadow logger instance
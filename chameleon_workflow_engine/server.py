@@ -32,41 +32,94 @@ Example:
     uvicorn chameleon_workflow_engine.server:app --reload
 """
 
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Depends, Response, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from loguru import logger
 import asyncio
+import json
 import uuid
 from datetime import datetime, timezone, timedelta
-from sqlalchemy.orm import Session
-from database import DatabaseManager, UnitsOfWork
+from sqlalchemy.orm import Session, sessionmaker
+from database import DatabaseManager, UnitsOfWork, UOWRepositorySQLAlchemy
 from database.models_phase3 import Phase3DatabaseManager
 from database.intervention_store_sqlalchemy import InterventionStoreSQLAlchemy
+from database.persistence_service import (
+    GuardContext,
+    ViolationPacket,
+    UOWPersistenceService,
+    PILOT_CONTINUATION_KEY,
+    get_telemetry_buffer,
+    parse_sample_rates,
+    spill_shadow_log_to_telemetry,
+    start_telemetry_drainer,
+    stop_telemetry_drainer,
+)
 from chameleon_workflow_engine.engine import ChameleonEngine
+from chameleon_workflow_engine.stream_broadcaster import emit, get_broadcaster
+from chameleon_workflow_engine.stream_reader import RedisStreamReader, reader_for_broadcaster
 from chameleon_workflow_engine.pilot_interface import PilotInterface
+from chameleon_workflow_engine.semantic_guard import shadow_logger
 from chameleon_workflow_engine.interactive_dashboard import (
-    initialize_intervention_store, get_intervention_store, InterventionStatus
+    initialize_intervention_store, get_intervention_store, get_intervention_hub, InterventionStatus
 )
 from chameleon_workflow_engine.jwt_utils import (
-    JWTValidator, JWTConfig, PilotToken, InvalidTokenError, MissingTokenError
+    JWTError, PilotToken, InvalidTokenError, MissingTokenError, get_jwt_validator
+)
+from chameleon_workflow_engine.rbac import PilotAuthContext, InsufficientPermissionsError, RBACError
+from database.integrity_scanner import StateHashScanner
+from database.history_archive import (
+    HistoryArchive,
+    HistoryArchiver,
+    HistoryReader,
+    get_history_reader,
+    row_to_record,
+    set_history_reader,
+)
+from database.history_writer import HistoryWAL
+from common.config import (
+    TEMPLATE_DB_URL,
+    INSTANCE_DB_URL,
+    PHASE3_DB_URL,
+    STATE_HASH_AUDIT_INTERVAL_SECONDS,
+    STATE_HASH_AUDIT_CHECKPOINT,
+    STATE_HASH_AUDIT_CHUNK_SIZE,
+    STATE_HASH_AUDIT_WORKERS,
+    HISTORY_ARCHIVE_DIR,
+    HISTORY_ARCHIVE_INTERVAL_SECONDS,
+    HISTORY_ARCHIVE_MIN_AGE_DAYS,
+    HISTORY_WRITER_FLUSH_SIZE,
+    HISTORY_WAL_PATH,
+    HISTORY_WAL_DRAIN_INTERVAL_SECONDS,
+    TELEMETRY_FLUSH_INTERVAL_SECONDS,
+    TELEMETRY_MAX_RETRIES,
+    TELEMETRY_SAMPLE_RATES,
+    INTERVENTION_METRICS_MAX_AGE_SECONDS,
+    EVENT_MONITOR_ENABLED,
+    EVENT_MONITOR_GROUP,
+    PHASE3_DB_POOL_SIZE,
+    PHASE3_DB_MAX_OVERFLOW,
+    PHASE3_DB_POOL_TIMEOUT_SECONDS,
 )
-from chameleon_workflow_engine.rbac import PilotAuthContext, InsufficientPermissionsError
-from common.config import TEMPLATE_DB_URL, INSTANCE_DB_URL, PHASE3_DB_URL
 
 # Initialize database managers (will be configured on startup)
 db_manager: Optional[DatabaseManager] = None
 phase3_db_manager: Optional[Phase3DatabaseManager] = None
 
-# Background task handle
+# Background task handles
 zombie_sweeper_task: Optional[asyncio.Task] = None
+state_hash_audit_task: Optional[asyncio.Task] = None
+history_archive_task: Optional[asyncio.Task] = None
+history_wal_task: Optional[asyncio.Task] = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events"""
-    global db_manager, phase3_db_manager, zombie_sweeper_task
+    global db_manager, phase3_db_manager, zombie_sweeper_task, state_hash_audit_task
+    global history_archive_task, history_wal_task
 
     # Startup: Initialize databases and start background tasks
     logger.info(f"Connecting to Template DB: {TEMPLATE_DB_URL}")
@@ -86,24 +139,69 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Database schema already exists or error: {e}")
 
+    # Batch uow_history writes (optionally through a local write-ahead log)
+    if HISTORY_WRITER_FLUSH_SIZE > 0 or HISTORY_WAL_PATH:
+        db_manager.enable_history_writer(
+            flush_size=HISTORY_WRITER_FLUSH_SIZE or 500,
+            wal=HistoryWAL(HISTORY_WAL_PATH) if HISTORY_WAL_PATH else None,
+        )
+        logger.info(
+            f"History write-behind enabled (WAL: {HISTORY_WAL_PATH or 'off'})"
+        )
+
+    # History reads merge the archive with the live ledger
+    set_history_reader(HistoryReader(HistoryArchive(HISTORY_ARCHIVE_DIR)))
+
     # Initialize Phase 3 database (intervention persistence)
-    phase3_db_manager = Phase3DatabaseManager(database_url=PHASE3_DB_URL)
+    phase3_db_manager = Phase3DatabaseManager(
+        database_url=PHASE3_DB_URL,
+        pool_size=PHASE3_DB_POOL_SIZE,
+        max_overflow=PHASE3_DB_MAX_OVERFLOW,
+        pool_timeout=PHASE3_DB_POOL_TIMEOUT_SECONDS,
+    )
     try:
         phase3_db_manager.create_schema()
         logger.info(f"Phase 3 database initialized: {PHASE3_DB_URL}")
     except Exception as e:
         logger.warning(f"Phase 3 database schema already exists or error: {e}")
 
-    # Initialize intervention store with SQLAlchemy backend
-    session = phase3_db_manager.get_session()
-    intervention_store = InterventionStoreSQLAlchemy(session)
+    # Initialize intervention store with SQLAlchemy backend (one session per operation)
+    intervention_store = InterventionStoreSQLAlchemy(
+        phase3_db_manager.SessionLocal,
+        metrics_max_age_seconds=INTERVENTION_METRICS_MAX_AGE_SECONDS,
+    )
     initialize_intervention_store(intervention_store)
     logger.info("Intervention store initialized with SQLAlchemy backend")
 
+    # Start the telemetry drainer (persists buffered Interaction_Logs entries)
+    get_telemetry_buffer().set_sample_rates(parse_sample_rates(TELEMETRY_SAMPLE_RATES))
+    start_telemetry_drainer(
+        sessionmaker(bind=db_manager.instance_engine),
+        flush_interval_seconds=TELEMETRY_FLUSH_INTERVAL_SECONDS,
+        max_retries=TELEMETRY_MAX_RETRIES,
+    )
+    shadow_logger.add_sink(spill_shadow_log_to_telemetry)
+    logger.info("Telemetry drainer started")
+
     # Start zombie sweeper background task
     zombie_sweeper_task = asyncio.create_task(run_tau_zombie_sweeper())
     logger.info("Zombie Actor Sweeper task started")
 
+    # Start periodic state hash audit
+    if STATE_HASH_AUDIT_INTERVAL_SECONDS:
+        state_hash_audit_task = asyncio.create_task(run_state_hash_audit())
+        logger.info("State hash audit task started")
+
+    # Start periodic history archival
+    if HISTORY_ARCHIVE_INTERVAL_SECONDS:
+        history_archive_task = asyncio.create_task(run_history_archiver())
+        logger.info("History archival task started")
+
+    # Drain the history write-ahead log into uow_history
+    if db_manager.history_wal is not None:
+        history_wal_task = asyncio.create_task(run_history_wal_drainer())
+        logger.info("History WAL drainer task started")
+
     yield
 
     # Shutdown: Clean up background tasks
@@ -115,10 +213,48 @@ async def lifespan(app: FastAPI):
             pass
         logger.info("Zombie Actor Sweeper task stopped")
 
-    # Close database sessions
-    if session:
-        session.close()
-        logger.info("Phase 3 database session closed")
+    if state_hash_audit_task:
+        state_hash_audit_task.cancel()
+        try:
+            await state_hash_audit_task
+        except asyncio.CancelledError:
+            pass
+        logger.info("State hash audit task stopped")
+
+    if history_archive_task:
+        history_archive_task.cancel()
+        try:
+            await history_archive_task
+        except asyncio.CancelledError:
+            pass
+        logger.info("History archival task stopped")
+
+    if history_wal_task:
+        history_wal_task.cancel()
+        try:
+            await history_wal_task
+        except asyncio.CancelledError:
+            pass
+        # Final drain so committed transitions reach the history table
+        try:
+            drained = await asyncio.to_thread(
+                db_manager.history_wal.drain, sessionmaker(bind=db_manager.instance_engine)
+            )
+            logger.info(f"History WAL drainer stopped ({drained} rows drained)")
+        except Exception as e:
+            logger.error(f"Final history WAL drain failed (rows stay in the WAL): {e}")
+
+    # Flush remaining telemetry before the database goes away
+    shadow_logger.remove_sink(spill_shadow_log_to_telemetry)
+    flushed = await asyncio.to_thread(stop_telemetry_drainer)
+    logger.info(f"Telemetry drainer stopped ({flushed} entries flushed)")
+
+    # Write out events still queued in the broadcaster
+    await asyncio.to_thread(get_broadcaster().close)
+
+    # Close pooled Phase 3 connections
+    phase3_db_manager.engine.dispose()
+    logger.info("Phase 3 database connections closed")
 
 
 # Initialize FastAPI app with lifespan
@@ -276,6 +412,7 @@ class PilotKillSwitchRequest(BaseModel):
 
     instance_id: str
     reason: str
+    freeze: bool = False
 
 
 class PilotKillSwitchResponse(BaseModel):
@@ -284,6 +421,21 @@ class PilotKillSwitchResponse(BaseModel):
     success: bool
     message: str
     paused_uow_count: int
+    frozen: bool = False
+
+
+class PilotKillSwitchReleaseRequest(BaseModel):
+    """Model for lifting a kill switch freeze"""
+
+    instance_id: str
+
+
+class PilotKillSwitchReleaseResponse(BaseModel):
+    """Response for kill switch release"""
+
+    success: bool
+    message: str
+    was_frozen: bool
 
 
 class PilotClarificationRequest(BaseModel):
@@ -336,6 +488,27 @@ class PilotCancelResponse(BaseModel):
     new_status: str
 
 
+class PilotLogoutResponse(BaseModel):
+    """Response for Pilot logout"""
+
+    success: bool
+    message: str
+
+
+class BulkInterventionRequest(BaseModel):
+    """Model for a bulk approve/reject of intervention requests"""
+
+    request_ids: List[str]
+    action_reason: Optional[str] = None
+
+
+class BulkAssignInterventionRequest(BaseModel):
+    """Model for assigning intervention requests to a Pilot in bulk"""
+
+    request_ids: List[str]
+    pilot_id: str
+
+
 # In-memory storage (replace with database in production)
 workflows: Dict[str, dict] = {}
 
@@ -373,13 +546,12 @@ def get_current_pilot(request: Request) -> PilotAuthContext:
         # Extract Authorization header
         auth_header = request.headers.get("Authorization")
         
-        # Initialize JWT validator
-        jwt_config = JWTConfig()
-        validator = JWTValidator(jwt_config)
+        # Process-wide validator: tokens verified earlier skip signature checks
+        validator = get_jwt_validator()
         
         # Extract and parse token
         token = validator.extract_bearer_token(auth_header)
-        pilot_token: PilotToken = validator.parse_pilot_token(token)
+        pilot_token: PilotToken = validator.validate_pilot_token(token)
         
         # Create auth context
         auth_context = PilotAuthContext(
@@ -446,6 +618,21 @@ def require_pilot_permission(endpoint: str):
     return check_permission_impl
 
 
+class TauSweeperGuardContext(GuardContext):
+    """
+    Guard context for the Tau sweeper's own system transitions.
+
+    Only used in-process by run_tau_zombie_sweeper (never reachable from an
+    endpoint), to restore UOWs whose Pilot decision timed out.
+    """
+
+    def is_authorized(self, actor_id: Optional[uuid.UUID], uow_id: uuid.UUID) -> bool:
+        return True
+
+    def emit_violation(self, packet: ViolationPacket) -> None:
+        logger.warning(f"Guard violation during Tau sweep: {packet.to_dict()}")
+
+
 async def run_tau_zombie_sweeper():
     """
     Background task that continuously monitors for zombie actors.
@@ -457,6 +644,10 @@ async def run_tau_zombie_sweeper():
     When zombies are detected:
     - Updates status to 'FAILED'
     - Logs warning for reclaiming token
+
+    UOWs parked in PENDING_PILOT_APPROVAL longer than the Pilot decision
+    timeout are restored to their pre-park state and their intervention
+    requests marked EXPIRED.
     """
     logger.info("Zombie Actor Sweeper (TAU) starting...")
 
@@ -502,6 +693,23 @@ async def run_tau_zombie_sweeper():
                 else:
                     logger.debug("No zombie actors detected")
 
+            # Restore UOWs parked for a Pilot decision that never came
+            with db_manager.get_instance_session() as session:
+                expired = [
+                    (result["uow"].uow_id, result["uow"].status, result["intervention_request_id"])
+                    for result in UOWPersistenceService.expire_parked_uows(
+                        session, TauSweeperGuardContext()
+                    )
+                ]
+            for uow_id, status, request_id in expired:
+                logger.warning(f"Pilot decision timed out: UOW {uow_id} restored to {status}")
+                if request_id:
+                    get_intervention_store().update_request(
+                        request_id,
+                        InterventionStatus.EXPIRED,
+                        action_reason="No Pilot decision before timeout",
+                    )
+
         except asyncio.CancelledError:
             logger.info("Zombie Actor Sweeper shutting down...")
             break
@@ -510,6 +718,127 @@ async def run_tau_zombie_sweeper():
             await asyncio.sleep(60)  # Wait before retrying
 
 
+class AuditGuardContext(GuardContext):
+    """
+    Guard context for the background state hash audit.
+
+    The audit only reads, so authorization is never requested; drift
+    violations are logged and broadcast as state_drift_detected events.
+    """
+
+    def is_authorized(self, actor_id: Optional[uuid.UUID], uow_id: uuid.UUID) -> bool:
+        return False
+
+    def emit_violation(self, packet: ViolationPacket) -> None:
+        logger.error(f"State drift detected by audit: UOW {packet.uow_id}")
+        emit("state_drift_detected", packet.to_dict())
+
+
+async def run_state_hash_audit():
+    """
+    Background task that periodically verifies every UOW's X-Content-Hash.
+
+    Each sweep runs StateHashScanner in a worker thread (hashing itself is
+    spread over a process pool), streaming UOWs in chunks. Sweeps are
+    checkpointed, so a restart resumes the interrupted sweep instead of
+    starting over.
+    """
+    logger.info("State hash audit starting...")
+
+    while True:
+        try:
+            await asyncio.sleep(STATE_HASH_AUDIT_INTERVAL_SECONDS)
+
+            if db_manager is None or db_manager.instance_engine is None:
+                logger.debug("Database not initialized, skipping state hash audit")
+                continue
+
+            scanner = StateHashScanner(
+                session_factory=sessionmaker(bind=db_manager.instance_engine),
+                guard_context=AuditGuardContext(),
+                chunk_size=STATE_HASH_AUDIT_CHUNK_SIZE,
+                max_workers=STATE_HASH_AUDIT_WORKERS,
+                checkpoint_path=STATE_HASH_AUDIT_CHECKPOINT,
+            )
+            report = await asyncio.to_thread(scanner.scan)
+            logger.info(
+                f"State hash audit: {report.scanned} UOW(s) verified, {report.drifted} drifted, "
+                f"{report.unhashed} never hashed"
+            )
+
+        except asyncio.CancelledError:
+            logger.info("State hash audit shutting down...")
+            break
+        except Exception as e:
+            logger.error(f"Unexpected error in state hash audit: {e}")
+
+
+async def run_history_archiver():
+    """
+    Background task that periodically archives finished instances' ledgers.
+
+    Moves uow_history and interaction_logs rows older than
+    HISTORY_ARCHIVE_MIN_AGE_DAYS of completed instances into the
+    date-partitioned archive in HISTORY_ARCHIVE_DIR.
+    """
+    logger.info("History archiver starting...")
+
+    while True:
+        try:
+            await asyncio.sleep(HISTORY_ARCHIVE_INTERVAL_SECONDS)
+
+            if db_manager is None or db_manager.instance_engine is None:
+                logger.debug("Database not initialized, skipping history archive")
+                continue
+
+            archiver = HistoryArchiver(
+                session_factory=sessionmaker(bind=db_manager.instance_engine),
+                archive=HistoryArchive(HISTORY_ARCHIVE_DIR),
+            )
+            cutoff = datetime.now(timezone.utc) - timedelta(days=HISTORY_ARCHIVE_MIN_AGE_DAYS)
+            results = await asyncio.to_thread(archiver.archive_completed_instances, cutoff)
+            if results:
+                logger.info(f"Archived ledger rows for {len(results)} instance(s)")
+
+        except asyncio.CancelledError:
+            logger.info("History archiver shutting down...")
+            break
+        except Exception as e:
+            logger.error(f"Unexpected error in history archiver: {e}")
+
+
+async def run_history_wal_drainer():
+    """
+    Background task that copies the history write-ahead log into uow_history.
+
+    Runs every HISTORY_WAL_DRAIN_INTERVAL_SECONDS; the audit trail lags the
+    UOW tables by at most one interval (Pilot continuation lookups read
+    undrained rows directly).
+    """
+    logger.info("History WAL drainer starting...")
+
+    while True:
+        try:
+            await asyncio.sleep(HISTORY_WAL_DRAIN_INTERVAL_SECONDS)
+
+            wal = db_manager.history_wal if db_manager is not None else None
+            if wal is None:
+                logger.debug("History WAL not configured, skipping drain")
+                continue
+
+            drained = await asyncio.to_thread(
+                wal.drain, sessionmaker(bind=db_manager.instance_engine)
+            )
+            if drained:
+                logger.debug(f"Drained {drained} history row(s) from the WAL")
+
+        except asyncio.CancelledError:
+            logger.info("History WAL drainer shutting down...")
+            break
+        except Exception as e:
+            logger.error(f"Unexpected error in history WAL drainer: {e}")
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API information"""
@@ -527,6 +856,138 @@ async def health_check():
     return {"status": "healthy"}
 
 
+# ============================================================================
+# History & Audit API Endpoints
+# ============================================================================
+
+HISTORY_PAGE_MAX = 1000
+
+
+def _parse_history_args(entity_id: str, after: Optional[str], limit: int):
+    """Validate a history id, cursor and page size (HTTP 400 on bad input)."""
+    try:
+        entity_uuid = uuid.UUID(entity_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid ID format")
+    if not 1 <= limit <= HISTORY_PAGE_MAX:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {HISTORY_PAGE_MAX}")
+    try:
+        cursor = UOWPersistenceService.decode_history_cursor(after) if after else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return entity_uuid, cursor
+
+
+def _history_page(entries, limit: int) -> Dict[str, Any]:
+    """Serialise a history page with the cursor for the next one."""
+    return {
+        "items": [row_to_record(entry, "uow_history") for entry in entries],
+        "next_cursor": (
+            UOWPersistenceService.encode_history_cursor(entries[-1])
+            if len(entries) == limit else None
+        ),
+    }
+
+
+@app.get("/api/history/uow/{uow_id}")
+async def get_uow_history_page(
+    uow_id: str,
+    after: str | None = None,
+    limit: int = 100,
+    db: Session = Depends(get_db_session),
+    auth: PilotAuthContext = Depends(require_pilot_permission("/api/history")),
+):
+    """
+    Get one page of a UOW's transition history (oldest first).
+    
+    Requires: VIEWER+ role
+    
+    Args:
+        uow_id: The UOW ID
+        after: Cursor from the previous page's next_cursor
+        limit: Page size (max 1000)
+        auth: Authenticated Pilot context from JWT token
+    
+    Returns:
+        {"items": [...], "next_cursor": str | None}
+    """
+    uow_uuid, cursor = _parse_history_args(uow_id, after, limit)
+    entries = UOWPersistenceService.get_uow_history(db, uow_uuid, limit=limit, after=cursor)
+    return _history_page(entries, limit)
+
+
+@app.get("/api/history/instance/{instance_id}")
+async def get_instance_history_page(
+    instance_id: str,
+    after: str | None = None,
+    limit: int = 100,
+    db: Session = Depends(get_db_session),
+    auth: PilotAuthContext = Depends(require_pilot_permission("/api/history")),
+):
+    """
+    Get one page of the transition history of every UOW in an instance.
+    
+    Requires: VIEWER+ role
+    
+    Args:
+        instance_id: The instance ID
+        after: Cursor from the previous page's next_cursor
+        limit: Page size (max 1000)
+        auth: Authenticated Pilot context from JWT token
+    
+    Returns:
+        {"items": [...], "next_cursor": str | None}
+    """
+    instance_uuid, cursor = _parse_history_args(instance_id, after, limit)
+    entries = UOWPersistenceService.get_instance_history(
+        db, instance_uuid, limit=limit, after=cursor
+    )
+    return _history_page(entries, limit)
+
+
+@app.get("/api/history/instance/{instance_id}/export")
+async def export_instance_history(
+    instance_id: str,
+    after: str | None = None,
+    auth: PilotAuthContext = Depends(require_pilot_permission("/api/history")),
+):
+    """
+    Stream an instance's full transition history as NDJSON.
+    
+    The export holds one streaming cursor (HistoryReader.stream_instance_history)
+    that merges the archive with live keyset pages of HISTORY_PAGE_MAX rows,
+    each in a short-lived session, so memory and transaction length stay
+    bounded however long the history is.
+    
+    Requires: VIEWER+ role
+    
+    Args:
+        instance_id: The instance ID
+        after: Optional cursor to resume an interrupted export
+        auth: Authenticated Pilot context from JWT token
+    
+    Returns:
+        application/x-ndjson stream, one history entry per line
+    """
+    instance_uuid, cursor = _parse_history_args(instance_id, after, HISTORY_PAGE_MAX)
+    if db_manager is None or db_manager.instance_engine is None:
+        raise HTTPException(status_code=503, detail="Database not initialized")
+
+    def generate_lines():
+        lines = []
+        for record in get_history_reader().stream_instance_history(
+            db_manager.get_instance_session, instance_uuid, after=cursor, page_size=HISTORY_PAGE_MAX
+        ):
+            lines.append(json.dumps(record) + "\n")
+            if len(lines) >= HISTORY_PAGE_MAX:
+                yield "".join(lines)
+                lines = []
+        if lines:
+            yield "".join(lines)
+
+    return StreamingResponse(generate_lines(), media_type="application/x-ndjson")
+
+
 # ============================================================================
 # Intervention REST API Endpoints (Phase 3)
 # ============================================================================
@@ -553,9 +1014,50 @@ async def get_pending_interventions(
     if not store:
         raise HTTPException(status_code=500, detail="Intervention store not initialized")
     
-    requests = store.get_pending_requests(pilot_id=pilot_id, limit=limit)
-    # Apply offset manually since store doesn't support it
-    return [r.to_dict() for r in requests[offset:]]
+    requests = store.get_pending_requests(pilot_id=pilot_id, limit=limit, offset=offset)
+    return [r.to_dict() for r in requests]
+
+
+# Largest page the pending-intervention endpoint will serve
+INTERVENTION_PAGE_MAX = 1000
+
+
+@app.get("/api/interventions/pending/page")
+async def get_pending_interventions_page(
+    after: str | None = None,
+    limit: int = 50,
+    pilot_id: str | None = None,
+):
+    """
+    Get one page of pending intervention requests (priority, then age).
+    
+    Keyset-paginated: the cost of a page does not grow with its position in
+    the backlog, unlike offset paging.
+    
+    Args:
+        after: Cursor from the previous page's next_cursor
+        limit: Page size (max 1000)
+        pilot_id: Filter by assigned pilot (optional)
+    
+    Returns:
+        {"items": [...], "next_cursor": str | None}
+    """
+    if not 1 <= limit <= INTERVENTION_PAGE_MAX:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {INTERVENTION_PAGE_MAX}")
+    try:
+        cursor = InterventionStoreSQLAlchemy.decode_pending_cursor(after) if after else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    store = get_intervention_store()
+    requests = store.get_pending_requests(pilot_id=pilot_id, limit=limit, after=cursor)
+    return {
+        "items": [r.to_dict() for r in requests],
+        "next_cursor": (
+            InterventionStoreSQLAlchemy.encode_pending_cursor(requests[-1])
+            if len(requests) == limit else None
+        ),
+    }
 
 
 @app.get("/api/interventions/metrics")
@@ -591,62 +1093,390 @@ async def get_intervention(request_id: str):
     return request.to_dict()
 
 
+class PilotDecisionGuardContext(GuardContext):
+    """
+    Guard context for resuming UOWs parked for Pilot approval.
+
+    The resume is authorized only if the authenticated Pilot holds the
+    permission of the decision endpoint; refusals are logged as violations.
+    """
+
+    def __init__(self, auth: PilotAuthContext, endpoint: str):
+        self.auth = auth
+        self.endpoint = endpoint
+
+    def is_authorized(self, actor_id: Optional[uuid.UUID], uow_id: uuid.UUID) -> bool:
+        return self.auth.has_permission(self.endpoint)
+
+    def emit_violation(self, packet: ViolationPacket) -> None:
+        logger.warning(f"Guard violation during Pilot resume by {self.auth.pilot_id}: {packet.to_dict()}")
+
+
+def _has_pilot_continuation(request) -> bool:
+    """Whether an intervention request was raised by save_uow_with_pilot_check."""
+    return (request.context or {}).get("continuation") == PILOT_CONTINUATION_KEY
+
+
+def _resume_pilot_continuation(
+    session: Session,
+    request,
+    decision: Dict[str, Any],
+    auth: PilotAuthContext,
+    endpoint: str,
+) -> Dict[str, Any]:
+    """
+    Resume a UOW parked by save_uow_with_pilot_check with the Pilot's decision.
+
+    Changes are flushed on the given session; the caller commits them
+    before resolving the intervention request. If the request's decision
+    was already applied (a retry after the request could not be resolved),
+    the earlier resume is reported instead of failing as not parked.
+
+    Args:
+        session: Instance database session
+        request: The InterventionRequest carrying the continuation
+        decision: Pilot decision (approved, waiver_issued, rejection_reason, ...)
+        auth: Authenticated Pilot making the decision
+        endpoint: RBAC endpoint the decision is authorized against
+
+    Returns:
+        Summary of the resumed transition
+
+    Raises:
+        HTTPException: 404 if the UOW is gone, 409 if it is no longer parked
+            or the resume is refused
+    """
+    uow = session.get(UnitsOfWork, uuid.UUID(request.uow_id))
+    if uow is None:
+        raise HTTPException(status_code=404, detail=f"UOW {request.uow_id} not found")
+
+    result = UOWPersistenceService.resume_parked_uow(
+        session=session,
+        uow=uow,
+        guard_context=PilotDecisionGuardContext(auth, endpoint),
+        decision=decision,
+        pilot_id=auth.pilot_id,
+    )
+    if result["blocked_by"] == "NOT_PARKED":
+        applied = UOWPersistenceService.find_pilot_decision(session, uow, request.request_id)
+        if applied is None:
+            raise HTTPException(status_code=409, detail=result["error"])
+        waiver_issued = "constitutional_waiver" in applied
+        pilot_approved = applied["pilot_decision"]["approved"]
+        wants_resume = bool(decision.get("approved") or decision.get("waiver_issued"))
+        if (pilot_approved or waiver_issued) != wants_resume:
+            raise HTTPException(
+                status_code=409,
+                detail=f"UOW {request.uow_id} was already resumed with a different decision",
+            )
+        return {
+            "uow_id": request.uow_id,
+            "status": uow.status,
+            "pilot_approved": pilot_approved,
+            "waiver_issued": waiver_issued,
+        }
+    if result["blocked_by"] == "GUARD_EXCEPTION":
+        raise HTTPException(status_code=409, detail=result["error"])
+
+    return {
+        "uow_id": request.uow_id,
+        "status": uow.status,
+        "pilot_approved": result["pilot_approved"],
+        "waiver_issued": result["waiver_issued"],
+    }
+
+
+def _decide_intervention(
+    request_id: str,
+    status: InterventionStatus,
+    action_reason: Optional[str],
+    decision: Dict[str, Any],
+    auth: PilotAuthContext,
+    endpoint: str,
+) -> Dict[str, Any]:
+    """
+    Approve or reject one intervention request, resuming its parked UOW.
+
+    The parked UOW's resume is committed before the request is resolved
+    (the store commits in its own database): if the resume fails the
+    request stays open, and if resolving the request fails after the
+    resume committed, the request also stays open and a retry of the same
+    decision recognises the applied resume and resolves it.
+
+    Args:
+        request_id: The intervention request ID
+        status: APPROVED or REJECTED
+        action_reason: Optional reason for the decision
+        decision: Pilot decision for a parked UOW
+        auth: Authenticated Pilot making the decision
+        endpoint: RBAC endpoint the decision is authorized against
+
+    Returns:
+        Updated InterventionRequest (with resumed_uow for parked UOWs)
+    """
+    store = get_intervention_store()
+    request = store.get_request(request_id)
+    if not request:
+        raise HTTPException(status_code=404, detail=f"Intervention {request_id} not found")
+
+    if not _has_pilot_continuation(request):
+        request = store.update_request(
+            request_id=request_id,
+            status=status,
+            action_reason=action_reason,
+            assigned_to=auth.pilot_id,
+        )
+        if not request:
+            raise HTTPException(status_code=404, detail=f"Intervention {request_id} not found")
+        return request.to_dict()
+
+    if db_manager is None or db_manager.instance_engine is None:
+        raise HTTPException(status_code=503, detail="Database not initialized")
+
+    # Raising inside the session rolls the resume back; leaving it commits
+    with db_manager.get_instance_session() as session:
+        resumed = _resume_pilot_continuation(session, request, decision, auth, endpoint)
+
+    request = store.update_request(
+        request_id=request_id,
+        status=status,
+        action_reason=action_reason,
+        assigned_to=auth.pilot_id,
+    )
+    if not request:
+        raise HTTPException(status_code=404, detail=f"Intervention {request_id} not found")
+
+    response = request.to_dict()
+    response["resumed_uow"] = resumed
+    return response
+
+
+def _bulk_update_interventions(
+    request_ids: List[str],
+    status: InterventionStatus,
+    auth: PilotAuthContext,
+    endpoint: str,
+    action_reason: Optional[str] = None,
+    assigned_to: Optional[str] = None,
+    decision: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Apply one status change to many interventions, resuming parked UOWs first.
+
+    Parked UOWs are resumed in one instance transaction, which commits
+    before the interventions are updated in a single store transaction. If
+    the store update fails the requests stay open and retrying the same
+    decision resolves them (see _resume_pilot_continuation). A request
+    whose resume is refused (UOW gone or no longer parked) is reported in
+    resume_errors and left open.
+
+    Args:
+        request_ids: Intervention request IDs
+        status: New status
+        auth: Authenticated Pilot performing the change
+        endpoint: RBAC endpoint resumes are authorized against
+        action_reason: Optional reason for the action
+        assigned_to: Pilot to assign (default: the deciding Pilot)
+        decision: Pilot decision for parked UOWs (None = don't resume)
+
+    Returns:
+        {"updated": [...], "not_updated": [...], "resume_errors": {...}}
+    """
+    if not 1 <= len(request_ids) <= INTERVENTION_PAGE_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail=f"request_ids must contain between 1 and {INTERVENTION_PAGE_MAX} IDs",
+        )
+
+    store = get_intervention_store()
+    assigned_to = assigned_to or auth.pilot_id
+    resumed: Dict[str, Dict[str, Any]] = {}
+    resume_errors: Dict[str, str] = {}
+
+    parked = []
+    if decision is not None:
+        parked = [r for r in store.get_open_requests(request_ids) if _has_pilot_continuation(r)]
+
+    if parked:
+        if db_manager is None or db_manager.instance_engine is None:
+            raise HTTPException(status_code=503, detail="Database not initialized")
+
+        # Raising inside the session rolls every resume back; leaving it commits
+        with db_manager.get_instance_session() as session:
+            for request in parked:
+                try:
+                    resumed[request.request_id] = _resume_pilot_continuation(
+                        session, request, decision, auth, endpoint
+                    )
+                except HTTPException as e:
+                    resume_errors[request.request_id] = e.detail
+        requests = store.update_requests_bulk(
+            [rid for rid in request_ids if rid not in resume_errors],
+            status, action_reason=action_reason, assigned_to=assigned_to,
+        )
+    else:
+        requests = store.update_requests_bulk(
+            request_ids, status, action_reason=action_reason, assigned_to=assigned_to
+        )
+    logger.info(
+        f"{len(requests)} interventions set to {status.value} in bulk by {auth.pilot_id}. "
+        f"Reason: {action_reason}"
+    )
+
+    updated = []
+    for request in requests:
+        response = request.to_dict()
+        if request.request_id in resumed:
+            response["resumed_uow"] = resumed[request.request_id]
+        updated.append(response)
+
+    updated_ids = {request.request_id for request in requests}
+    return {
+        "updated": updated,
+        "not_updated": [rid for rid in dict.fromkeys(request_ids) if rid not in updated_ids],
+        "resume_errors": resume_errors,
+    }
+
+
+# Bulk routes are declared before /api/interventions/{request_id}/... so that
+# "bulk" is not taken as a request ID
+@app.post("/api/interventions/bulk/approve")
+async def bulk_approve_interventions(
+    body: BulkInterventionRequest,
+    auth: PilotAuthContext = Depends(require_pilot_permission("/pilot/resume")),
+):
+    """
+    Approve many intervention requests in one transaction.
+    
+    Requires: OPERATOR+ role (same authority as /pilot/resume)
+    
+    Args:
+        body: Request IDs and optional reason
+        auth: Authenticated Pilot context from JWT token
+    
+    Returns:
+        Updated requests, IDs not updated (unknown, already resolved, or
+        whose parked UOW could not be resumed), and the resume errors
+    """
+    return _bulk_update_interventions(
+        body.request_ids, InterventionStatus.APPROVED, auth, "/pilot/resume",
+        action_reason=body.action_reason,
+        decision={"approved": True},
+    )
+
+
+@app.post("/api/interventions/bulk/reject")
+async def bulk_reject_interventions(
+    body: BulkInterventionRequest,
+    auth: PilotAuthContext = Depends(require_pilot_permission("/pilot/cancel")),
+):
+    """
+    Reject many intervention requests in one transaction.
+    
+    Requires: OPERATOR+ role (same authority as /pilot/cancel)
+    
+    Args:
+        body: Request IDs and optional reason
+        auth: Authenticated Pilot context from JWT token
+    
+    Returns:
+        Updated requests, IDs not updated (unknown, already resolved, or
+        whose parked UOW could not be restored), and the resume errors
+    """
+    return _bulk_update_interventions(
+        body.request_ids, InterventionStatus.REJECTED, auth, "/pilot/cancel",
+        action_reason=body.action_reason,
+        decision={"approved": False, "rejection_reason": body.action_reason},
+    )
+
+
+@app.post("/api/interventions/bulk/assign")
+async def bulk_assign_interventions(
+    body: BulkAssignInterventionRequest,
+    auth: PilotAuthContext = Depends(require_pilot_permission("/pilot/assign")),
+):
+    """
+    Assign many intervention requests to a Pilot (status IN_PROGRESS).
+    
+    Requires: OPERATOR+ role
+    
+    Args:
+        body: Request IDs and the Pilot ID
+        auth: Authenticated Pilot context from JWT token
+    
+    Returns:
+        Updated requests and IDs not updated (unknown or already resolved)
+    """
+    return _bulk_update_interventions(
+        body.request_ids, InterventionStatus.IN_PROGRESS, auth, "/pilot/assign",
+        assigned_to=body.pilot_id,
+    )
+
+
 @app.post("/api/interventions/{request_id}/approve")
 async def approve_intervention(
     request_id: str,
     action_reason: str | None = None,
+    auth: PilotAuthContext = Depends(require_pilot_permission("/pilot/resume")),
 ):
     """
     Approve an intervention request.
     
+    If the request belongs to a UOW parked for Pilot approval, the parked
+    transition is resumed to its original target status first; the request
+    is only approved if the resume succeeds.
+    
+    Requires: OPERATOR+ role (same authority as /pilot/resume)
+    
     Args:
         request_id: The intervention request ID
         action_reason: Optional reason for approval
+        auth: Authenticated Pilot context from JWT token
     
     Returns:
         Updated InterventionRequest
     """
-    store = get_intervention_store()
-    request = store.update_request(
-        request_id=request_id,
-        status=InterventionStatus.APPROVED,
-        action_reason=action_reason,
+    response = _decide_intervention(
+        request_id, InterventionStatus.APPROVED, action_reason,
+        decision={"approved": True},
+        auth=auth,
+        endpoint="/pilot/resume",
     )
-    
-    if not request:
-        raise HTTPException(status_code=404, detail=f"Intervention {request_id} not found")
-    
-    logger.info(f"Intervention {request_id} approved. Reason: {action_reason}")
-    return request.to_dict()
+    logger.info(f"Intervention {request_id} approved by {auth.pilot_id}. Reason: {action_reason}")
+    return response
 
 
 @app.post("/api/interventions/{request_id}/reject")
 async def reject_intervention(
     request_id: str,
     action_reason: str | None = None,
+    auth: PilotAuthContext = Depends(require_pilot_permission("/pilot/cancel")),
 ):
     """
     Reject an intervention request.
     
+    If the request belongs to a UOW parked for Pilot approval, the UOW is
+    first restored to the status it had before it was parked; the request
+    is only rejected if that succeeds.
+    
+    Requires: OPERATOR+ role (same authority as /pilot/cancel)
+    
     Args:
         request_id: The intervention request ID
         action_reason: Optional reason for rejection
+        auth: Authenticated Pilot context from JWT token
     
     Returns:
         Updated InterventionRequest
     """
-    store = get_intervention_store()
-    request = store.update_request(
-        request_id=request_id,
-        status=InterventionStatus.REJECTED,
-        action_reason=action_reason,
+    response = _decide_intervention(
+        request_id, InterventionStatus.REJECTED, action_reason,
+        decision={"approved": False, "rejection_reason": action_reason},
+        auth=auth,
+        endpoint="/pilot/cancel",
     )
-    
-    if not request:
-        raise HTTPException(status_code=404, detail=f"Intervention {request_id} not found")
-    
-    logger.info(f"Intervention {request_id} rejected. Reason: {action_reason}")
-    return request.to_dict()
+    logger.info(f"Intervention {request_id} rejected by {auth.pilot_id}. Reason: {action_reason}")
+    return response
 
 
 # ============================================================================
@@ -656,13 +1486,49 @@ async def reject_intervention(
 from fastapi import WebSocket, WebSocketDisconnect
 
 
+async def _authenticate_websocket(websocket: WebSocket) -> Optional[PilotAuthContext]:
+    """
+    Authenticate a WebSocket handshake with the Pilot's JWT.
+    
+    Browsers cannot set headers on a WebSocket, so the token is read from
+    the Authorization header or, failing that, a ``token`` query parameter.
+    It goes through the process-wide validator (cache and deny-list), so a
+    revoked token cannot open a socket. Rejected handshakes are closed with
+    1008 (policy violation).
+    
+    Args:
+        websocket: The connecting WebSocket (not yet accepted)
+    
+    Returns:
+        PilotAuthContext, or None if the handshake was rejected
+    """
+    validator = get_jwt_validator()
+    try:
+        auth_header = websocket.headers.get("Authorization")
+        if auth_header is None and websocket.query_params.get("token"):
+            auth_header = f"Bearer {websocket.query_params['token']}"
+        token = validator.extract_bearer_token(auth_header)
+        pilot_token: PilotToken = validator.validate_pilot_token(token)
+        return PilotAuthContext(pilot_id=pilot_token.pilot_id, role=pilot_token.role)
+    except (JWTError, RBACError) as e:
+        logger.warning(f"WebSocket authentication failed: {e}")
+        await websocket.close(code=1008)
+        return None
+
+
 @app.websocket("/ws/interventions")
 async def websocket_interventions(websocket: WebSocket):
     """
     WebSocket endpoint for real-time intervention updates.
     
+    The Pilot authenticates once, on connect, with a bearer token (see
+    _authenticate_websocket); pushed updates are scoped to the pilot_id and
+    role from that token, never to identity claims in a message payload.
+    
     Message types:
-    - subscribe: Subscribe to updates
+    - subscribe: Subscribe to pushed updates (payload: priorities,
+      intervention_types - optional filters)
+    - unsubscribe: Stop pushed updates
     - get_pending: Fetch pending requests
     - get_metrics: Fetch metrics
     - request_detail: Get single request details
@@ -670,11 +1536,26 @@ async def websocket_interventions(websocket: WebSocket):
     Sends:
     - pending_requests: List of pending interventions
     - metrics_update: Updated metrics
-    - new_request: New intervention created
-    - status_changed: Intervention status changed
+    - intervention_updates: Pushed deltas, coalesced per burst
+      (new_request: full request, status_changed: changed fields,
+      request_removed: the request left the pilot's view)
+    - resync: Updates were dropped (slow client); re-fetch with get_pending
     """
+    auth = await _authenticate_websocket(websocket)
+    if auth is None:
+        return
     await websocket.accept()
-    
+
+    # Replies and pushed updates share the socket; send one message at a time
+    send_lock = asyncio.Lock()
+
+    async def send(message: dict):
+        async with send_lock:
+            await websocket.send_json(message)
+
+    hub = get_intervention_hub()
+    subscription = None
+
     try:
         while True:
             # Receive message
@@ -686,19 +1567,34 @@ async def websocket_interventions(websocket: WebSocket):
             
             # Route to handler
             if message_type == "subscribe":
-                await handle_subscribe(websocket, payload)
+                if subscription is not None:
+                    await hub.unsubscribe(subscription)
+                subscription = await hub.subscribe(
+                    send,
+                    pilot_id=auth.pilot_id,
+                    role=auth.role.value,
+                    priorities=payload.get("priorities"),
+                    intervention_types=payload.get("intervention_types"),
+                )
+                await handle_subscribe(send, auth.pilot_id)
+
+            elif message_type == "unsubscribe":
+                if subscription is not None:
+                    await hub.unsubscribe(subscription)
+                    subscription = None
+                await send({"success": True, "data": {"subscribed": False}})
             
             elif message_type == "get_pending":
-                await handle_get_pending(websocket, payload)
+                await handle_get_pending(send, payload)
             
             elif message_type == "get_metrics":
-                await handle_get_metrics(websocket)
+                await handle_get_metrics(send)
             
             elif message_type == "request_detail":
-                await handle_request_detail(websocket, payload)
+                await handle_request_detail(send, payload)
             
             else:
-                await websocket.send_json({
+                await send({
                     "success": False,
                     "error": {"code": "UNKNOWN_MESSAGE", "message": f"Unknown message type: {message_type}"}
                 })
@@ -708,18 +1604,76 @@ async def websocket_interventions(websocket: WebSocket):
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         try:
-            await websocket.send_json({
+            await send({
                 "success": False,
                 "error": {"code": "SERVER_ERROR", "message": str(e)}
             })
         except:
             pass
+    finally:
+        if subscription is not None:
+            await hub.unsubscribe(subscription)
 
 
-async def handle_subscribe(websocket: WebSocket, payload: dict):
+@app.websocket("/ws/monitor")
+async def websocket_monitor(websocket: WebSocket):
+    """
+    WebSocket endpoint streaming broadcaster events as they are emitted.
+    
+    Disabled unless EVENT_MONITOR_ENABLED. Pilots authenticate on connect
+    like /ws/interventions. Each connection follows the active broadcaster
+    with its own cursor (reader_for_broadcaster): a byte offset into the
+    JSONL log, or a per-connection Redis consumer group that is destroyed
+    on disconnect, so every monitor sees every event exactly once from the
+    moment it connected.
+    
+    Sends:
+    - event: One broadcaster event (event_type, payload, timestamp)
+    """
+    if not EVENT_MONITOR_ENABLED:
+        await websocket.close(code=1008)
+        return
+    auth = await _authenticate_websocket(websocket)
+    if auth is None:
+        return
+
+    connection_id = f"{auth.pilot_id}-{uuid.uuid4().hex[:8]}"
+    reader = reader_for_broadcaster(
+        get_broadcaster(), group=f"{EVENT_MONITOR_GROUP}-{connection_id}", consumer=connection_id
+    )
+    if reader is None:
+        logger.warning(f"/ws/monitor: no reader for {get_broadcaster().__class__.__name__}")
+        await websocket.close(code=1011)
+        return
+    await websocket.accept()
+
+    async def pump():
+        async for event in reader.events():
+            await websocket.send_json({"type": "event", "data": event})
+
+    pump_task = asyncio.create_task(pump())
+    try:
+        # Nothing to handle from the client; receiving only detects the disconnect
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        logger.info("Monitor WebSocket client disconnected")
+    finally:
+        pump_task.cancel()
+        try:
+            await pump_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        if isinstance(reader, RedisStreamReader):
+            try:
+                await asyncio.to_thread(reader.destroy_group)
+            except Exception as e:
+                logger.warning(f"Could not remove monitor consumer group {reader.group}: {e}")
+
+
+async def handle_subscribe(send, pilot_id: str):
     """Handle subscribe message"""
-    pilot_id = payload.get("pilot_id")
-    await websocket.send_json({
+    await send({
         "success": True,
         "data": {
             "subscribed": True,
@@ -729,31 +1683,31 @@ async def handle_subscribe(websocket: WebSocket, payload: dict):
     })
 
 
-async def handle_get_pending(websocket: WebSocket, payload: dict):
+async def handle_get_pending(send, payload: dict):
     """Handle get_pending message"""
     from chameleon_workflow_engine.interactive_dashboard import WebSocketMessageHandler
     
     handler = WebSocketMessageHandler()
     response = handler.handle_message("get_pending", payload)
-    await websocket.send_json(response)
+    await send(response)
 
 
-async def handle_get_metrics(websocket: WebSocket):
+async def handle_get_metrics(send):
     """Handle get_metrics message"""
     from chameleon_workflow_engine.interactive_dashboard import WebSocketMessageHandler
     
     handler = WebSocketMessageHandler()
     response = handler.handle_message("get_metrics", {})
-    await websocket.send_json(response)
+    await send(response)
 
 
-async def handle_request_detail(websocket: WebSocket, payload: dict):
+async def handle_request_detail(send, payload: dict):
     """Handle request_detail message"""
     from chameleon_workflow_engine.interactive_dashboard import WebSocketMessageHandler
     
     handler = WebSocketMessageHandler()
     response = handler.handle_message("request_detail", payload)
-    await websocket.send_json(response)
+    await send(response)
 
 
 @app.post("/workflows", response_model=WorkflowResponse)
@@ -1286,15 +2240,17 @@ async def pilot_kill_switch(
         if db_manager is None:
             raise HTTPException(status_code=503, detail="Database not initialized")
         
-        # Create PilotInterface instance
-        pilot_interface = PilotInterface(db_manager)
+        # Create PilotInterface instance (set-based pause on the request session)
+        pilot_interface = PilotInterface(UOWRepositorySQLAlchemy(db))
         
         # Execute kill switch
-        paused_count = pilot_interface.kill_switch(
+        result = pilot_interface.kill_switch(
             instance_id=instance_uuid,
             reason=request.reason,
-            pilot_id=auth.pilot_id
+            pilot_id=auth.pilot_id,
+            freeze=request.freeze,
         )
+        paused_count = result["paused_uows"]
         
         logger.info(
             f"Pilot {auth.pilot_id} ({auth.role.value}) executed kill_switch on instance {instance_uuid}: "
@@ -1304,7 +2260,8 @@ async def pilot_kill_switch(
         return PilotKillSwitchResponse(
             success=True,
             message=f"Kill switch executed: {paused_count} UOWs paused",
-            paused_uow_count=paused_count
+            paused_uow_count=paused_count,
+            frozen=result["frozen"],
         )
         
     except HTTPException:
@@ -1314,6 +2271,38 @@ async def pilot_kill_switch(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@app.post("/pilot/kill-switch/release", response_model=PilotKillSwitchReleaseResponse)
+async def pilot_release_kill_switch(
+    request: PilotKillSwitchReleaseRequest,
+    auth: PilotAuthContext = Depends(require_pilot_permission("/pilot/kill-switch")),
+    db: Session = Depends(get_db_session),
+):
+    """
+    Lift the checkout freeze set by a kill switch with freeze=True.
+    
+    Requires: ADMIN role (same authority as the kill switch)
+    
+    Args:
+        request: Contains instance_id
+        auth: Authenticated Pilot context from JWT token
+        db: Database session
+        
+    Returns:
+        PilotKillSwitchReleaseResponse (paused UOWs stay PAUSED)
+    """
+    try:
+        instance_uuid = uuid.UUID(request.instance_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid instance_id format")
+
+    pilot_interface = PilotInterface(UOWRepositorySQLAlchemy(db))
+    result = pilot_interface.release_kill_switch(instance_uuid, pilot_id=auth.pilot_id)
+    logger.info(f"Pilot {auth.pilot_id} released kill switch on instance {instance_uuid}")
+    return PilotKillSwitchReleaseResponse(
+        success=True, message=result["message"], was_frozen=result["was_frozen"]
+    )
+
+
 @app.post("/pilot/clarification/{uow_id}", response_model=PilotClarificationResponse)
 async def pilot_submit_clarification(
     uow_id: str,
@@ -1568,6 +2557,39 @@ async def pilot_cancel_uow(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@app.post("/pilot/logout", response_model=PilotLogoutResponse)
+async def pilot_logout(
+    request: Request,
+    auth: PilotAuthContext = Depends(get_current_pilot),
+):
+    """
+    Revoke the bearer token the request was made with.
+    
+    The token goes on the process-wide validator's deny-list until its exp,
+    so it is refused by every REST route and by /ws/interventions even
+    though it is still validly signed.
+    
+    Requires: any authenticated Pilot (a Pilot can only revoke their own token)
+    Authentication: JWT token in 'Authorization: Bearer <token>' header
+    
+    Args:
+        request: The HTTP request (carries the token to revoke)
+        auth: Authenticated Pilot context from JWT token
+        
+    Returns:
+        PilotLogoutResponse
+        
+    Raises:
+        HTTPException: 401 if auth token invalid
+    """
+    validator = get_jwt_validator()
+    validator.revoke_token(validator.extract_bearer_token(request.headers.get("Authorization")))
+    
+    logger.info(f"Pilot {auth.pilot_id} ({auth.role.value}) logged out; token revoked")
+    
+    return PilotLogoutResponse(success=True, message="Token revoked")
+
+
 if __name__ == "__main__":
     import uvicorn
     import os
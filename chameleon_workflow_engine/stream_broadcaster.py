@@ -13,11 +13,26 @@ Constitutional Reference: Article XVII (Atomic Traceability) - All events logged
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Deque, Dict, List, Optional
+import atexit
+import gzip
 import json
 import logging
+import os
+import shutil
+import threading
+import time
+
+from common.config import (
+    EVENT_LOG_PATH,
+    EVENT_LOG_FLUSH_INTERVAL_SECONDS,
+    EVENT_LOG_MAX_BYTES,
+    EVENT_LOG_ROTATE_INTERVAL_SECONDS,
+    EVENT_LOG_FSYNC,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +58,19 @@ class StreamBroadcaster(ABC):
         """
         pass
 
+    def flush(self) -> int:
+        """
+        Publish any events buffered by the implementation.
+
+        Returns:
+            Number of events flushed (0 for unbuffered implementations)
+        """
+        return 0
+
+    def close(self) -> None:
+        """Flush and release resources held by the implementation."""
+        pass
+
 
 class FileStreamBroadcaster(StreamBroadcaster):
     """
@@ -50,42 +78,275 @@ class FileStreamBroadcaster(StreamBroadcaster):
     
     Each event is written as a single JSON object per line (JSONL format).
     Suitable for file-based systems, local development, and audit compliance.
+
+    Buffered mode (the default) keeps emit() off the disk: events are
+    serialized on the caller's thread and appended to a bounded in-memory
+    queue, and a background flusher writes them through a persistent file
+    handle when flush_size events are pending or every flush_interval_seconds.
+    When the queue is full, new events are dropped and counted rather than
+    blocking the emitter. buffered=False writes each event synchronously
+    (still through the persistent handle).
+
+    The active file rotates when it would exceed max_bytes or when it is
+    older than rotate_interval_seconds. Rolled segments are renamed to
+    "<log name>.<UTC timestamp>" next to the active file and gzipped.
     
     Example:
         {"timestamp": "2026-01-29T10:00:00Z", "event_type": "intervention_request", ...}
         {"timestamp": "2026-01-29T10:00:01Z", "event_type": "pilot_waiver_granted", ...}
     """
 
-    def __init__(self, log_path: str = "events.jsonl"):
+    def __init__(
+        self,
+        log_path: str = "events.jsonl",
+        buffered: bool = True,
+        flush_interval_seconds: float = 1.0,
+        flush_size: int = 256,
+        max_queue_size: int = 100000,
+        fsync: bool = False,
+        max_bytes: Optional[int] = None,
+        rotate_interval_seconds: Optional[float] = None,
+        compress_rotated: bool = True,
+    ):
         """
         Initialize file-based broadcaster.
         
         Args:
             log_path: Path to JSONL event log file
+            buffered: Queue events and write them on a background flusher
+            flush_interval_seconds: Maximum time an event waits in the queue
+            flush_size: Pending events that trigger an early flush
+            max_queue_size: Events held in memory before new ones are dropped
+            fsync: fsync the file after every flushed batch
+            max_bytes: Rotate before the active file exceeds this size (None/0 disables)
+            rotate_interval_seconds: Rotate the active file after this long (None/0 disables)
+            compress_rotated: gzip rolled segments
         """
         self.log_path = Path(log_path)
         # Ensure directory exists
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
 
+        self.buffered = buffered
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_size = max(1, flush_size)
+        self.max_queue_size = max_queue_size
+        self.fsync = fsync
+        self.max_bytes = max_bytes or None
+        self.rotate_interval_seconds = rotate_interval_seconds or None
+        self.compress_rotated = compress_rotated
+
+        # Serialized lines awaiting the flusher (deque append/popleft are atomic)
+        self._queue: Deque[str] = deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+        # File state, guarded by _write_lock
+        self._write_lock = threading.Lock()
+        self._file = None
+        self._file_bytes = 0
+        self._file_opened_at = 0.0
+
+        self.metrics = {
+            "events_emitted": 0,
+            "events_written": 0,
+            "events_dropped": 0,
+            "flushes": 0,
+            "rotations": 0,
+            "errors": 0,
+        }
+
+        # Don't lose queued events when the interpreter exits
+        atexit.register(self.close)
+
     def emit(self, event_type: str, payload: Dict[str, Any]) -> None:
-        """Write event to JSONL file in append-only mode."""
+        """Queue (or, unbuffered, write) the event as one JSONL line."""
         try:
             event = {
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "event_type": event_type,
                 "payload": payload,
             }
+            # Serialize now so later mutation of payload can't change the record
+            line = json.dumps(event) + "\n"
+        except Exception as e:
+            logger.error(f"Failed to serialize event {event_type}: {e}")
+            raise StreamBroadcasterError(f"Event serialization failed: {e}")
 
-            # Append-only: open in append mode
-            with open(self.log_path, "a") as f:
-                f.write(json.dumps(event) + "\n")
-
+        if not self.buffered:
+            with self._write_lock:
+                self._write_lines([line])
+            self.metrics["events_emitted"] += 1
             logger.debug(f"Event emitted: {event_type}")
+            return
+
+        if len(self._queue) >= self.max_queue_size:
+            self.metrics["events_dropped"] += 1
+            if self.metrics["events_dropped"] % 1000 == 1:
+                logger.warning(
+                    f"Event queue for {self.log_path} is full; "
+                    f"{self.metrics['events_dropped']} events dropped so far"
+                )
+            return
+
+        self._queue.append(line)
+        self.metrics["events_emitted"] += 1
+        if self._thread is None:
+            self._start_flusher()
+        if len(self._queue) >= self.flush_size:
+            self._wake.set()
+        logger.debug(f"Event queued: {event_type}")
+
+    def flush(self) -> int:
+        """
+        Write every queued event to disk now.
+
+        Returns:
+            Number of events written
 
+        Raises:
+            StreamBroadcasterError: If the write fails (events stay queued)
+        """
+        with self._write_lock:
+            lines = []
+            while self._queue:
+                lines.append(self._queue.popleft())
+            if not lines:
+                return 0
+            try:
+                self._write_lines(lines)
+            except StreamBroadcasterError:
+                # Put the batch back in order so a later flush can retry it
+                self._queue.extendleft(reversed(lines))
+                raise
+            return len(lines)
+
+    def close(self) -> None:
+        """Stop the flusher, write any queued events and close the file."""
+        with self._thread_lock:
+            thread = self._thread
+            if thread is not None:
+                self._stop.set()
+                self._wake.set()
+                thread.join()
+                self._thread = None
+                self._stop.clear()
+        try:
+            self.flush()
+        except StreamBroadcasterError:
+            pass
+        with self._write_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get broadcaster metrics.
+
+        Returns:
+            Dictionary with events_emitted, events_written, events_dropped,
+            flushes, rotations, errors and pending (queued, not yet written)
+        """
+        metrics = self.metrics.copy()
+        metrics["pending"] = len(self._queue)
+        return metrics
+
+    def rotated_segments(self) -> List[Path]:
+        """
+        List rolled segments of this log, oldest first.
+
+        Returns:
+            Paths of "<log name>.<timestamp>[.gz]" files next to the active log
+        """
+        return sorted(self.log_path.parent.glob(f"{self.log_path.name}.*"))
+
+    def _start_flusher(self) -> None:
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_flusher, name="event-log-flusher", daemon=True
+                )
+                self._thread.start()
+
+    def _run_flusher(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except StreamBroadcasterError:
+                # Already logged; retried on the next cycle
+                pass
+
+    def _write_lines(self, lines: List[str]) -> None:
+        """Append lines to the active file, rotating first if due (caller holds _write_lock)."""
+        data = "".join(lines).encode("utf-8")
+        try:
+            self._rotate_if_due(len(data))
+            if self._file is None:
+                self._open()
+            self._file.write(data)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
         except Exception as e:
+            self.metrics["errors"] += 1
             logger.error(f"Failed to emit event to {self.log_path}: {e}")
+            # Reopen on the next write in case the handle is unusable
+            if self._file is not None:
+                try:
+                    self._file.close()
+                except Exception:
+                    pass
+                self._file = None
             raise StreamBroadcasterError(f"File write failed: {e}")
 
+        self._file_bytes += len(data)
+        self.metrics["events_written"] += len(lines)
+        self.metrics["flushes"] += 1
+
+    def _open(self) -> None:
+        self._file = open(self.log_path, "ab")
+        self._file_bytes = self.log_path.stat().st_size
+        self._file_opened_at = time.monotonic()
+
+    def _rotate_if_due(self, incoming_bytes: int) -> None:
+        if self._file is None:
+            if not (self.max_bytes or self.rotate_interval_seconds):
+                return
+            self._open()
+        if self._file_bytes == 0:
+            return
+        too_big = self.max_bytes and self._file_bytes + incoming_bytes > self.max_bytes
+        too_old = (
+            self.rotate_interval_seconds
+            and time.monotonic() - self._file_opened_at >= self.rotate_interval_seconds
+        )
+        if too_big or too_old:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        segment = self.log_path.with_name(f"{self.log_path.name}.{stamp}")
+        suffix = 1
+        while segment.exists() or Path(f"{segment}.gz").exists():
+            segment = self.log_path.with_name(f"{self.log_path.name}.{stamp}-{suffix}")
+            suffix += 1
+        os.replace(self.log_path, segment)
+
+        if self.compress_rotated:
+            with open(segment, "rb") as src, gzip.open(f"{segment}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            segment.unlink()
+
+        self.metrics["rotations"] += 1
+        logger.info(f"Rotated event log {self.log_path} to {segment.name}")
+
 
 class RedisStreamBroadcaster(StreamBroadcaster):
     """
@@ -98,18 +359,24 @@ class RedisStreamBroadcaster(StreamBroadcaster):
     
     Features:
     - Append-only Redis Streams (XADD) for ordered events
-    - Automatic TTL management (optional maxlen trimming)
+    - Approximate length capping on every XADD (MAXLEN ~ max_stream_length)
     - Consumer group support for multi-client processing
     - Metrics tracking (events emitted, bytes written)
-    - Graceful fallback on connection errors
+    - Optional batching mode: emit() only queues the event and a background
+      thread pipelines XADDs, so Redis latency stays off the caller's path
+    - Graceful degradation (batching mode): while Redis is unreachable,
+      batches are appended to a local JSONL spill file and replayed, in
+      order, once the connection comes back
     
     Example:
         broadcaster = RedisStreamBroadcaster(
             redis_client=redis.from_url("redis://localhost"),
             stream_key="chameleon:events",
-            max_stream_length=100000
+            max_stream_length=100000,
+            batched=True,
+            spill_path="events.spill.jsonl",
         )
-        StreamBroadcaster.set_global_broadcaster(broadcaster)
+        set_broadcaster(broadcaster)
         # All subsequent emit() calls use Redis without code changes
     
     Constitutional Reference: Article XVII (Atomic Traceability) - All events logged immutably.
@@ -121,6 +388,12 @@ class RedisStreamBroadcaster(StreamBroadcaster):
         stream_key: str = "chameleon:events",
         max_stream_length: int = 100000,
         enable_metrics: bool = True,
+        batched: bool = False,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 0.1,
+        max_queue_size: int = 100000,
+        spill_path: Optional[str] = None,
+        reconnect_interval_seconds: float = 5.0,
     ):
         """
         Initialize Redis-based broadcaster.
@@ -130,40 +403,76 @@ class RedisStreamBroadcaster(StreamBroadcaster):
             stream_key: Redis Stream key name
             max_stream_length: Maximum entries before trimming (approximate)
             enable_metrics: Whether to track metrics (events, bytes)
+            batched: Queue events and pipeline XADDs on a background thread
+            batch_size: Maximum XADDs per pipeline round trip
+            flush_interval_seconds: Maximum time an event waits in the queue
+            max_queue_size: Events held in memory before new ones are dropped
+            spill_path: JSONL file for batches Redis could not accept (batched
+                mode; None drops such batches)
+            reconnect_interval_seconds: Delay between reconnect attempts while degraded
         
         Raises:
-            ConnectionError: If Redis connection fails
+            ConnectionError: If Redis connection fails (unless batched with a spill file)
         """
         self.redis = redis_client
         self.stream_key = stream_key
         self.max_stream_length = max_stream_length
         self.enable_metrics = enable_metrics
+        self.batched = batched
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_queue_size = max_queue_size
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.reconnect_interval_seconds = reconnect_interval_seconds
         
         # Metrics
         self.metrics = {
             "events_emitted": 0,
             "bytes_written": 0,
             "errors": 0,
+            "events_dropped": 0,
+            "events_spilled": 0,
+            "events_replayed": 0,
         }
+
+        # Batching state
+        self._queue: Deque[Dict[bytes, str]] = deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self.degraded = False
+        self._next_reconnect_at = 0.0
         
         # Verify connection
         try:
             self.redis.ping()
             logger.info(f"Redis connection established to {stream_key}")
         except Exception as e:
-            logger.error(f"Redis connection failed: {e}")
-            raise ConnectionError(f"Cannot connect to Redis: {e}")
+            if not (batched and self.spill_path):
+                logger.error(f"Redis connection failed: {e}")
+                raise ConnectionError(f"Cannot connect to Redis: {e}")
+            logger.warning(f"Redis unreachable, spilling events to {self.spill_path}: {e}")
+            self._mark_degraded()
+
+        if batched:
+            atexit.register(self.close)
 
     def emit(self, event_type: str, payload: Dict[str, Any]) -> None:
         """
         Publish event to Redis Stream (append-only).
         
+        In batching mode the event is only queued; failures are handled by the
+        background sender (spill or drop) and never raised to the caller.
+        
         Args:
             event_type: Type of event
             payload: Event metadata (will be JSON-serialized)
         
         Raises:
-            StreamBroadcasterError: If Redis write fails
+            StreamBroadcasterError: If Redis write fails (unbatched) or the
+                payload cannot be serialized
         """
         try:
             event_data = {
@@ -171,47 +480,213 @@ class RedisStreamBroadcaster(StreamBroadcaster):
                 b"payload": json.dumps(payload),
                 b"timestamp": datetime.now(timezone.utc).isoformat(),
             }
+        except Exception as e:
+            self.metrics["errors"] += 1
+            logger.error(f"Failed to serialize event {event_type}: {e}")
+            raise StreamBroadcasterError(f"Event serialization failed: {e}")
+
+        if self.batched:
+            self._enqueue(event_data)
+            return
 
+        try:
             # XADD: Append to Redis Stream (append-only, ordered by timestamp)
-            # Returns the generated ID (e.g., "1234567890000-0")
-            stream_id = self.redis.xadd(self.stream_key, event_data)
-
-            # Track metrics
-            if self.enable_metrics:
-                self.metrics["events_emitted"] += 1
-                self.metrics["bytes_written"] += sum(
-                    len(str(v)) for v in event_data.values()
+            # MAXLEN ~ lets Redis trim whole macro nodes as part of the append
+            stream_id = self.redis.xadd(
+                self.stream_key,
+                event_data,
+                maxlen=self.max_stream_length,
+                approximate=True,
+            )
+        except Exception as e:
+            self.metrics["errors"] += 1
+            logger.error(f"Failed to emit event to Redis: {e}")
+            raise StreamBroadcasterError(f"Redis write failed: {e}")
+
+        self._record_written([event_data])
+        logger.debug(f"Event emitted to Redis: {event_type} (ID: {stream_id})")
+
+    def flush(self) -> int:
+        """
+        Send every queued event now (batching mode).
+
+        Returns:
+            Number of events handed to Redis or the spill file
+        """
+        handled = 0
+        with self._send_lock:
+            if self.degraded:
+                self._try_reconnect(force=True)
+            while self._queue:
+                batch = []
+                while self._queue and len(batch) < self.batch_size:
+                    batch.append(self._queue.popleft())
+                self._send_batch(batch)
+                handled += len(batch)
+        return handled
+
+    def close(self) -> None:
+        """Stop the background sender and flush queued events."""
+        with self._thread_lock:
+            thread = self._thread
+            if thread is not None:
+                self._stop.set()
+                self._wake.set()
+                thread.join()
+                self._thread = None
+                self._stop.clear()
+        self.flush()
+
+    def _enqueue(self, event_data: Dict[bytes, str]) -> None:
+        if len(self._queue) >= self.max_queue_size:
+            self.metrics["events_dropped"] += 1
+            if self.metrics["events_dropped"] % 1000 == 1:
+                logger.warning(
+                    f"Redis event queue is full; {self.metrics['events_dropped']} events dropped so far"
+                )
+            return
+        self._queue.append(event_data)
+        if self._thread is None:
+            self._start_sender()
+        if len(self._queue) >= self.batch_size:
+            self._wake.set()
+
+    def _start_sender(self) -> None:
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_sender, name="redis-event-sender", daemon=True
                 )
+                self._thread.start()
+
+    def _run_sender(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval_seconds)
+            self._wake.clear()
+            with self._send_lock:
+                if self.degraded:
+                    self._try_reconnect()
+                batch = []
+                while self._queue and len(batch) < self.batch_size:
+                    batch.append(self._queue.popleft())
+                if batch:
+                    self._send_batch(batch)
+            if self._queue:
+                # More than one batch pending - keep going without waiting
+                self._wake.set()
+
+    def _send_batch(self, batch: List[Dict[bytes, str]]) -> None:
+        """Pipeline a batch of XADDs, spilling it if Redis fails (caller holds _send_lock)."""
+        if not self.degraded:
+            try:
+                self._pipeline_xadd(batch)
+                self._record_written(batch)
+                return
+            except Exception as e:
+                self.metrics["errors"] += 1
+                logger.warning(f"Redis pipeline failed, entering degraded mode: {e}")
+                self._mark_degraded()
+        self._spill(batch)
+
+    def _pipeline_xadd(self, batch: List[Dict[bytes, str]]) -> None:
+        pipe = self.redis.pipeline(transaction=False)
+        for event_data in batch:
+            pipe.xadd(
+                self.stream_key,
+                event_data,
+                maxlen=self.max_stream_length,
+                approximate=True,
+            )
+        pipe.execute()
 
-            logger.debug(
-                f"Event emitted to Redis: {event_type} (ID: {stream_id})"
+    def _record_written(self, batch: List[Dict[bytes, str]]) -> None:
+        if self.enable_metrics:
+            self.metrics["events_emitted"] += len(batch)
+            self.metrics["bytes_written"] += sum(
+                len(str(v)) for event_data in batch for v in event_data.values()
             )
 
-            # Approximate trimming (not blocking)
-            # Keep only the last max_stream_length entries
-            if self.metrics["events_emitted"] % 1000 == 0:
-                try:
-                    self.redis.xtrim(
-                        self.stream_key,
-                        maxlen=self.max_stream_length,
-                        approximate=True
-                    )
-                except Exception as trim_error:
-                    logger.warning(f"Stream trim failed: {trim_error}")
+    def _mark_degraded(self) -> None:
+        self.degraded = True
+        self._next_reconnect_at = time.monotonic() + self.reconnect_interval_seconds
+
+    def _spill(self, batch: List[Dict[bytes, str]]) -> None:
+        if self.spill_path is None:
+            self.metrics["events_dropped"] += len(batch)
+            return
+        try:
+            with open(self.spill_path, "a") as f:
+                for event_data in batch:
+                    f.write(json.dumps({key.decode(): value for key, value in event_data.items()}) + "\n")
+            self.metrics["events_spilled"] += len(batch)
+        except Exception as e:
+            self.metrics["errors"] += 1
+            self.metrics["events_dropped"] += len(batch)
+            logger.error(f"Failed to spill {len(batch)} events to {self.spill_path}: {e}")
+
+    def _try_reconnect(self, force: bool = False) -> None:
+        """Ping Redis and, if it answers, replay the spill file (caller holds _send_lock)."""
+        if not force and time.monotonic() < self._next_reconnect_at:
+            return
+        try:
+            self.redis.ping()
+        except Exception:
+            self._mark_degraded()
+            return
+        logger.info(f"Redis reachable again, replaying {self.spill_path}")
+        if self._replay_spill():
+            self.degraded = False
+        else:
+            self._mark_degraded()
+
+    def _replay_spill(self) -> bool:
+        """
+        XADD spilled events in their original order.
 
+        Returns:
+            True if the spill file was fully replayed (and removed)
+        """
+        if self.spill_path is None or not self.spill_path.exists():
+            return True
+
+        with open(self.spill_path) as f:
+            lines = [line for line in f.read().splitlines() if line]
+
+        replayed = 0
+        try:
+            for start in range(0, len(lines), self.batch_size):
+                batch = [
+                    {key.encode(): value for key, value in json.loads(line).items()}
+                    for line in lines[start:start + self.batch_size]
+                ]
+                self._pipeline_xadd(batch)
+                self._record_written(batch)
+                replayed += len(batch)
         except Exception as e:
             self.metrics["errors"] += 1
-            logger.error(f"Failed to emit event to Redis: {e}")
-            raise StreamBroadcasterError(f"Redis write failed: {e}")
+            logger.warning(f"Spill replay interrupted after {replayed} events: {e}")
+            # Keep only what Redis has not accepted yet
+            with open(self.spill_path, "w") as f:
+                f.writelines(line + "\n" for line in lines[replayed:])
+            self.metrics["events_replayed"] += replayed
+            return False
+
+        self.spill_path.unlink()
+        self.metrics["events_replayed"] += replayed
+        return True
 
     def get_metrics(self) -> Dict[str, int]:
         """
         Get broadcaster metrics.
         
         Returns:
-            Dictionary with events_emitted, bytes_written, errors
+            Dictionary with events_emitted, bytes_written, errors,
+            events_dropped, events_spilled, events_replayed and pending
+            (queued in batching mode)
         """
-        return self.metrics.copy()
+        metrics = self.metrics.copy()
+        metrics["pending"] = len(self._queue)
+        return metrics
 
     def read_events(
         self,
@@ -236,39 +711,45 @@ class RedisStreamBroadcaster(StreamBroadcaster):
                 count=count
             )
             
-            events = []
-            for stream_id, data in results:
-                event = {
-                    "id": stream_id.decode() if isinstance(stream_id, bytes) else stream_id,
-                    "event_type": (
-                        data[b"event_type"].decode()
-                        if isinstance(data[b"event_type"], bytes)
-                        else data[b"event_type"]
-                    ),
-                    "payload": json.loads(
-                        data[b"payload"].decode()
-                        if isinstance(data[b"payload"], bytes)
-                        else data[b"payload"]
-                    ),
-                    "timestamp": (
-                        data[b"timestamp"].decode()
-                        if isinstance(data[b"timestamp"], bytes)
-                        else data[b"timestamp"]
-                    ),
-                }
-                events.append(event)
-            
-            return events
+            return [decode_stream_entry(stream_id, data) for stream_id, data in results]
         except Exception as e:
             logger.error(f"Failed to read events from Redis: {e}")
             return []
 
 
+def decode_stream_entry(stream_id, data: Dict[bytes, Any]) -> Dict[str, Any]:
+    """
+    Decode one Redis Stream entry written by RedisStreamBroadcaster.
+
+    Args:
+        stream_id: Entry ID (bytes or str)
+        data: Entry fields keyed by bytes (values bytes or str)
+
+    Returns:
+        Event dictionary with id, event_type, payload, timestamp
+    """
+    def text(value):
+        return value.decode() if isinstance(value, bytes) else value
+
+    return {
+        "id": text(stream_id),
+        "event_type": text(data[b"event_type"]),
+        "payload": json.loads(text(data[b"payload"])),
+        "timestamp": text(data[b"timestamp"]),
+    }
+
+
 # ============================================================================
 # Global Dependency Injection
 # ============================================================================
 
-_global_broadcaster: StreamBroadcaster = FileStreamBroadcaster()
+_global_broadcaster: StreamBroadcaster = FileStreamBroadcaster(
+    EVENT_LOG_PATH,
+    flush_interval_seconds=EVENT_LOG_FLUSH_INTERVAL_SECONDS,
+    fsync=EVENT_LOG_FSYNC,
+    max_bytes=EVENT_LOG_MAX_BYTES,
+    rotate_interval_seconds=EVENT_LOG_ROTATE_INTERVAL_SECONDS,
+)
 
 
 def set_broadcaster(broadcaster: StreamBroadcaster) -> None:
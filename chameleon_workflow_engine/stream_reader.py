@@ -0,0 +1,418 @@
+"""
+Stream Readers: incremental consumers for the StreamBroadcaster backends.
+
+RedisStreamBroadcaster.read_events() re-reads the stream from a start ID on
+every call. The readers here keep a cursor instead, so a dashboard only
+receives events it has not seen:
+
+- RedisStreamReader: consumer-group reader (XREADGROUP with blocking reads,
+  XACK, and reclaim of entries left pending by dead consumers via
+  XAUTOCLAIM, falling back to XPENDING + XCLAIM on older servers).
+- FileStreamReader: tail-follow reader for the JSONL file backend. The cursor
+  is a byte offset; partial lines are left for the next read, and rotation
+  (rename + new file) or truncation is followed like `tail -F`.
+
+Both expose events() as an async generator for the WebSocket layer;
+reader_for_broadcaster() builds the reader matching the active broadcaster
+(used by the /ws/monitor endpoint).
+
+Constitutional Reference: Article XVII (Atomic Traceability) - All events logged immutably.
+"""
+
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+import asyncio
+import json
+import logging
+import os
+import time
+
+from chameleon_workflow_engine.stream_broadcaster import (
+    FileStreamBroadcaster,
+    RedisStreamBroadcaster,
+    StreamBroadcaster,
+    decode_stream_entry,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RedisStreamReader:
+    """
+    Consumer-group reader for a Redis Stream written by RedisStreamBroadcaster.
+
+    Several readers sharing a group split the stream between them; each
+    entry is delivered to one consumer and stays pending until acknowledged.
+    On start, a consumer first re-reads its own pending entries (e.g. after a
+    crash), then new ones. Entries pending on another consumer for longer than
+    min_idle_ms are claimed every reclaim_interval_seconds.
+
+    Example:
+        reader = RedisStreamReader(redis_client, group="dashboard", consumer="web-1")
+        async for event in reader.events():
+            await websocket.send_json(event)
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        group: str,
+        consumer: str,
+        stream_key: str = "chameleon:events",
+        start_id: str = "$",
+        count: int = 100,
+        block_ms: int = 5000,
+        min_idle_ms: int = 60000,
+        reclaim_interval_seconds: float = 30.0,
+    ):
+        """
+        Initialize the reader.
+
+        Args:
+            redis_client: redis.Redis client instance
+            group: Consumer group name
+            consumer: This consumer's name within the group
+            stream_key: Redis Stream key name
+            start_id: Where a newly created group starts ("$" = new entries only, "0" = all)
+            count: Maximum entries per read
+            block_ms: How long XREADGROUP blocks waiting for entries (0 = don't block)
+            min_idle_ms: Idle time after which another consumer's pending entry is claimed
+            reclaim_interval_seconds: Minimum time between reclaim passes
+        """
+        self.redis = redis_client
+        self.group = group
+        self.consumer = consumer
+        self.stream_key = stream_key
+        self.start_id = start_id
+        self.count = count
+        self.block_ms = block_ms
+        self.min_idle_ms = min_idle_ms
+        self.reclaim_interval_seconds = reclaim_interval_seconds
+
+        self._group_ready = False
+        # Re-deliver our own pending entries before reading new ones
+        self._recovering = True
+        self._next_reclaim_at = 0.0
+
+    def ensure_group(self) -> None:
+        """Create the consumer group (and stream) if it does not exist yet."""
+        if self._group_ready:
+            return
+        try:
+            self.redis.xgroup_create(self.stream_key, self.group, id=self.start_id, mkstream=True)
+            logger.info(f"Created consumer group {self.group} on {self.stream_key}")
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    def destroy_group(self) -> None:
+        """Delete the consumer group (for a per-connection reader that is done)."""
+        self.redis.xgroup_destroy(self.stream_key, self.group)
+        self._group_ready = False
+
+    def read(self, count: Optional[int] = None, block_ms: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Read the next batch of entries for this consumer.
+
+        Args:
+            count: Maximum entries (default: self.count)
+            block_ms: Blocking timeout (default: self.block_ms)
+
+        Returns:
+            Decoded events (id, event_type, payload, timestamp); they stay
+            pending until passed to ack()
+        """
+        self.ensure_group()
+        count = count or self.count
+
+        if time.monotonic() >= self._next_reclaim_at:
+            self._next_reclaim_at = time.monotonic() + self.reclaim_interval_seconds
+            claimed = self.reclaim_pending(count)
+            if claimed:
+                return claimed
+
+        if self._recovering:
+            events = self._read_group("0", count, block_ms=None)
+            if events:
+                return events
+            self._recovering = False
+
+        return self._read_group(">", count, self.block_ms if block_ms is None else block_ms)
+
+    def ack(self, *event_ids: str) -> int:
+        """
+        Acknowledge processed entries.
+
+        Args:
+            *event_ids: Entry IDs returned by read()
+
+        Returns:
+            Number of entries acknowledged
+        """
+        if not event_ids:
+            return 0
+        return self.redis.xack(self.stream_key, self.group, *event_ids)
+
+    def reclaim_pending(self, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Claim entries another consumer left pending for at least min_idle_ms.
+
+        Args:
+            count: Maximum entries to claim (default: self.count)
+
+        Returns:
+            Claimed, decoded events (now pending on this consumer)
+        """
+        self.ensure_group()
+        count = count or self.count
+        try:
+            result = self.redis.xautoclaim(
+                self.stream_key, self.group, self.consumer,
+                min_idle_time=self.min_idle_ms, start_id="0-0", count=count,
+            )
+            entries = result[1]
+        except Exception as e:
+            if "unknown command" not in str(e).lower():
+                raise
+            # Redis < 6.2: XPENDING + XCLAIM
+            pending = self.redis.xpending_range(
+                self.stream_key, self.group, min="-", max="+", count=count
+            )
+            message_ids = [
+                item["message_id"] for item in pending
+                if item["time_since_delivered"] >= self.min_idle_ms
+            ]
+            if not message_ids:
+                return []
+            entries = self.redis.xclaim(
+                self.stream_key, self.group, self.consumer, self.min_idle_ms, message_ids
+            )
+
+        events = self._decode_entries(entries)
+        if events:
+            logger.info(f"Consumer {self.consumer} reclaimed {len(events)} pending entries")
+        return events
+
+    async def events(self, auto_ack: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield events forever (blocking reads run in a worker thread).
+
+        Args:
+            auto_ack: Acknowledge each event once the consumer asks for the next one
+
+        Yields:
+            Decoded events
+        """
+        while True:
+            batch = await asyncio.to_thread(self.read)
+            processed: List[str] = []
+            try:
+                for event in batch:
+                    yield event
+                    processed.append(event["id"])
+            finally:
+                if auto_ack and processed:
+                    await asyncio.to_thread(self.ack, *processed)
+
+    def _read_group(self, stream_id: str, count: int, block_ms: Optional[int]) -> List[Dict[str, Any]]:
+        response = self.redis.xreadgroup(
+            self.group, self.consumer, {self.stream_key: stream_id}, count=count, block=block_ms or None
+        )
+        events: List[Dict[str, Any]] = []
+        # [[stream, [(id, fields), ...]], ...]
+        for _, entries in response or []:
+            events.extend(self._decode_entries(entries))
+        return events
+
+    def _decode_entries(self, entries) -> List[Dict[str, Any]]:
+        events = []
+        for stream_id, data in entries:
+            if not data:
+                # Entry was trimmed/deleted while pending - nothing to deliver
+                self.ack(stream_id)
+                continue
+            try:
+                events.append(decode_stream_entry(stream_id, data))
+            except Exception as e:
+                # Never re-deliver an entry that can't be decoded
+                logger.warning(f"Skipping malformed stream entry {stream_id}: {e}")
+                self.ack(stream_id)
+        return events
+
+
+class FileStreamReader:
+    """
+    Tail-follow reader for the JSONL log written by FileStreamBroadcaster.
+
+    The cursor (offset) is the byte position after the last complete line
+    returned, so a reader can be resumed with FileStreamReader(path, offset=...).
+    When the log is rotated, the reader finishes the renamed file through its
+    open handle before switching to the new one. Only one rotation can be
+    followed between reads: segments rolled (and gzipped) in between are
+    skipped, so poll well inside the broadcaster's rotation thresholds.
+
+    Example:
+        reader = FileStreamReader("events.jsonl", from_end=True)
+        async for event in reader.events():
+            await websocket.send_json(event)
+    """
+
+    def __init__(
+        self,
+        log_path: str = "events.jsonl",
+        offset: int = 0,
+        from_end: bool = False,
+        poll_interval_seconds: float = 0.5,
+        max_events: int = 1000,
+    ):
+        """
+        Initialize the reader.
+
+        Args:
+            log_path: Path to the JSONL event log
+            offset: Byte offset to resume from
+            from_end: Start at the current end of the file (ignores offset)
+            poll_interval_seconds: Sleep between reads when no new events arrive
+            max_events: Maximum events per read
+        """
+        self.log_path = Path(log_path)
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_events = max_events
+
+        self._offset = offset
+        self._from_end = from_end
+        self._file = None
+        self._draining = False
+
+    @property
+    def offset(self) -> int:
+        """Byte offset in the current file after the last event returned."""
+        return self._offset
+
+    def read(self, max_events: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Read complete lines appended since the last call.
+
+        Args:
+            max_events: Maximum events (default: self.max_events)
+
+        Returns:
+            Decoded events in file order
+        """
+        max_events = max_events or self.max_events
+        events: List[Dict[str, Any]] = []
+
+        while len(events) < max_events:
+            if self._file is None and not self._open():
+                break
+
+            line = self._file.readline()
+            if line.endswith(b"\n"):
+                self._offset += len(line)
+                try:
+                    events.append(json.loads(line))
+                except ValueError as e:
+                    logger.warning(f"Skipping malformed line in {self.log_path}: {e}")
+                continue
+
+            # EOF or a partial line still being written: leave it for next time
+            self._file.seek(self._offset)
+            if self._draining:
+                # Rotated file read to EOF a second time - move to the new one
+                self._draining = False
+                self.close()
+                self._offset = 0
+                continue
+            if not self._check_rotation():
+                break
+
+        return events
+
+    def close(self) -> None:
+        """Close the underlying file handle."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._draining = False
+
+    async def events(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield events forever, polling for new lines.
+
+        Yields:
+            Decoded events
+        """
+        try:
+            while True:
+                batch = await asyncio.to_thread(self.read)
+                if not batch:
+                    await asyncio.sleep(self.poll_interval_seconds)
+                    continue
+                for event in batch:
+                    yield event
+        finally:
+            self.close()
+
+    def _open(self) -> bool:
+        try:
+            self._file = open(self.log_path, "rb")
+        except FileNotFoundError:
+            return False
+        size = os.fstat(self._file.fileno()).st_size
+        if self._from_end:
+            self._offset = size
+            self._from_end = False
+        elif self._offset > size:
+            # File was replaced or truncated since the offset was taken
+            self._offset = 0
+        self._file.seek(self._offset)
+        return True
+
+    def _check_rotation(self) -> bool:
+        """At EOF: detect rotation or truncation; True if there may be more to read."""
+        try:
+            current = os.stat(self.log_path)
+        except FileNotFoundError:
+            # Renamed, new file not created yet
+            return False
+        if current.st_ino != os.fstat(self._file.fileno()).st_ino:
+            # Re-read the old handle once more: the writer may have appended
+            # to it after our EOF and before rotating
+            self._draining = True
+            return True
+        if current.st_size < self._offset:
+            logger.warning(f"{self.log_path} was truncated; reading from the start")
+            self._offset = 0
+            self._file.seek(0)
+            return True
+        return False
+
+
+def reader_for_broadcaster(
+    broadcaster: StreamBroadcaster,
+    group: str,
+    consumer: str,
+) -> Optional[Union[FileStreamReader, RedisStreamReader]]:
+    """
+    Build a reader that follows a broadcaster's events from now on.
+
+    Args:
+        broadcaster: The broadcaster whose output should be followed
+        group: Consumer group for a Redis-backed reader
+        consumer: Consumer name within the group
+
+    Returns:
+        FileStreamReader positioned at the current end of the log,
+        RedisStreamReader for new stream entries, or None for other backends
+    """
+    if isinstance(broadcaster, FileStreamBroadcaster):
+        log_path = broadcaster.log_path
+        offset = log_path.stat().st_size if log_path.exists() else 0
+        return FileStreamReader(log_path, offset=offset)
+    if isinstance(broadcaster, RedisStreamBroadcaster):
+        return RedisStreamReader(
+            broadcaster.redis, group=group, consumer=consumer,
+            stream_key=broadcaster.stream_key, start_id="$",
+        )
+    return None
@@ -58,6 +58,26 @@ class Config:
         except ValueError:
             raise ValueError(f"Environment variable {key} must be an integer, got '{value}'")
 
+    @staticmethod
+    def get_float(key: str, default: Optional[float] = None) -> Optional[float]:
+        """
+        Get an environment variable as a float.
+
+        Args:
+            key: Environment variable name
+            default: Default value if variable not found
+
+        Returns:
+            Environment variable value as float or default
+        """
+        value = os.getenv(key)
+        if value is None:
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError(f"Environment variable {key} must be a number, got '{value}'")
+
     @staticmethod
     def get_bool(key: str, default: bool = False) -> bool:
         """
@@ -81,4 +101,61 @@ _config = Config()
 # Shared by Server, Tools, and Tests
 TEMPLATE_DB_URL = Config.get("TEMPLATE_DB_URL", "sqlite:///template.db")
 INSTANCE_DB_URL = Config.get("INSTANCE_DB_URL", "sqlite:///instance.db")
-PHASE3_DB_URL = Config.get("PHASE3_DB_URL", "sqlite:///phase3.db")
\ No newline at end of file
+PHASE3_DB_URL = Config.get("PHASE3_DB_URL", "sqlite:///phase3.db")
+# --- Background State Hash Audit ---
+# Seconds between full-fleet X-Content-Hash sweeps (0 disables the audit).
+# Off by default: UOWs created by the engine outside save_uow carry no hash yet
+STATE_HASH_AUDIT_INTERVAL_SECONDS = Config.get_int("STATE_HASH_AUDIT_INTERVAL_SECONDS", 0)
+STATE_HASH_AUDIT_CHECKPOINT = Config.get("STATE_HASH_AUDIT_CHECKPOINT", "state_hash_audit.checkpoint.json")
+STATE_HASH_AUDIT_CHUNK_SIZE = Config.get_int("STATE_HASH_AUDIT_CHUNK_SIZE", 500)
+# Process pool size for hashing (unset = CPU count, 0 = hash in the audit thread)
+STATE_HASH_AUDIT_WORKERS = Config.get_int("STATE_HASH_AUDIT_WORKERS")
+
+# --- History Archival ---
+# Directory for archived (date-partitioned, gzip JSONL) ledger rows
+HISTORY_ARCHIVE_DIR = Config.get("HISTORY_ARCHIVE_DIR", "history_archive")
+# Seconds between archive runs (0 disables the archival job)
+HISTORY_ARCHIVE_INTERVAL_SECONDS = Config.get_int("HISTORY_ARCHIVE_INTERVAL_SECONDS", 0)
+# Only archive ledger rows older than this many days
+HISTORY_ARCHIVE_MIN_AGE_DAYS = Config.get_int("HISTORY_ARCHIVE_MIN_AGE_DAYS", 30)
+
+# --- History Write-Behind ---
+# Buffered uow_history rows per bulk INSERT (0 = one ORM insert per transition)
+HISTORY_WRITER_FLUSH_SIZE = Config.get_int("HISTORY_WRITER_FLUSH_SIZE", 500)
+# Local JSONL write-ahead log for history rows ("" = write history in the UOW transaction)
+HISTORY_WAL_PATH = Config.get("HISTORY_WAL_PATH", "")
+# Seconds between WAL drains into uow_history (WAL mode only)
+HISTORY_WAL_DRAIN_INTERVAL_SECONDS = Config.get_float("HISTORY_WAL_DRAIN_INTERVAL_SECONDS", 1.0)
+
+# --- Telemetry Drainer ---
+# Seconds an Interaction_Logs telemetry entry may wait before it is flushed
+TELEMETRY_FLUSH_INTERVAL_SECONDS = Config.get_float("TELEMETRY_FLUSH_INTERVAL_SECONDS", 1.0)
+# Retries per telemetry batch on transient database errors
+TELEMETRY_MAX_RETRIES = Config.get_int("TELEMETRY_MAX_RETRIES", 3)
+# Per-log_type sampling, e.g. "GUARDIAN_DECISION=0.01,TELEMETRY=0.1" (unlisted types kept)
+TELEMETRY_SAMPLE_RATES = Config.get("TELEMETRY_SAMPLE_RATES", "")
+
+# --- Event Log (FileStreamBroadcaster) ---
+EVENT_LOG_PATH = Config.get("EVENT_LOG_PATH", "events.jsonl")
+# Seconds a queued event may wait before the background flusher writes it
+EVENT_LOG_FLUSH_INTERVAL_SECONDS = Config.get_float("EVENT_LOG_FLUSH_INTERVAL_SECONDS", 1.0)
+# Rotate the active log at this size / age (0 disables); rolled segments are gzipped
+EVENT_LOG_MAX_BYTES = Config.get_int("EVENT_LOG_MAX_BYTES", 0)
+EVENT_LOG_ROTATE_INTERVAL_SECONDS = Config.get_float("EVENT_LOG_ROTATE_INTERVAL_SECONDS", 0)
+# fsync after every flushed batch (durability over throughput)
+EVENT_LOG_FSYNC = Config.get_bool("EVENT_LOG_FSYNC", False)
+
+# --- Event Monitor (/ws/monitor) ---
+# Stream broadcaster events to authenticated Pilots over /ws/monitor
+EVENT_MONITOR_ENABLED = Config.get_bool("EVENT_MONITOR_ENABLED", False)
+# Consumer group name prefix for Redis-backed monitors (one group per connection)
+EVENT_MONITOR_GROUP = Config.get("EVENT_MONITOR_GROUP", "monitor")
+
+# --- Intervention Dashboard ---
+# Maximum age of the incrementally maintained metrics before they are rebuilt from the DB
+INTERVENTION_METRICS_MAX_AGE_SECONDS = Config.get_float("INTERVENTION_METRICS_MAX_AGE_SECONDS", 30.0)
+# Phase 3 connection pool (server databases only; SQLite uses SQLAlchemy's defaults).
+# Size it for concurrent pilots: each request/WebSocket message holds a connection briefly
+PHASE3_DB_POOL_SIZE = Config.get_int("PHASE3_DB_POOL_SIZE", 10)
+PHASE3_DB_MAX_OVERFLOW = Config.get_int("PHASE3_DB_MAX_OVERFLOW", 20)
+PHASE3_DB_POOL_TIMEOUT_SECONDS = Config.get_float("PHASE3_DB_POOL_TIMEOUT_SECONDS", 30.0)
@@ -0,0 +1,827 @@
+"""
+History Archive: date-partitioned cold storage for append-only ledgers.
+
+Implements Article XVII (Atomic Traceability) retention without unbounded
+live tables. ``uow_history`` and ``interaction_logs`` only ever grow; once an
+instance has finished, its ledger rows are needed for audits but not for
+routing. The archiver moves them out of the live tables into compressed,
+date-partitioned JSONL files, and the reader merges archived and live rows
+so audit queries see one continuous history.
+
+Archive layout (one gzip JSONL file per table, day and instance, plus a
+uow_id index of its gzip members):
+
+    <archive_dir>/<table>/<YYYY-MM-DD>/<instance_id>.jsonl.gz
+    <archive_dir>/<table>/<YYYY-MM-DD>/<instance_id>.idx.jsonl
+
+Days are UTC days of the row timestamp (transition_timestamp / timestamp).
+Files are append-only gzip streams: re-archiving the same day appends a new
+gzip member, and readers de-duplicate by primary key, so an archive run
+interrupted between writing a file and deleting the live rows is safe to
+repeat. Each member is written sorted by (timestamp, primary key), and its
+index line records the byte range, the first and last key and the UOWs in
+it. Keyset reads seek straight to the members after a cursor and stream
+them lazily, so a page costs about one member however deep it is; files the
+index does not fully cover are scanned (and sorted) instead.
+
+Only ledger tables are archived. ``uow_attributes`` is the live state the
+X-Content-Hash is computed over, so it stays in the instance database.
+
+Usage:
+    archive = HistoryArchive("/var/lib/chameleon/archive")
+    HistoryArchiver(session_factory, archive).archive_completed_instances()
+    rows = HistoryReader(archive).history_for_uow(session, uow_id)
+
+UOWPersistenceService.get_uow_history / get_instance_history (and the
+/api/history endpoints) read through the process-wide reader returned by
+get_history_reader(); the server installs one over HISTORY_ARCHIVE_DIR.
+"""
+
+import gzip
+import heapq
+import io
+import itertools
+import json
+import logging
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import DateTime, and_, delete, or_, select
+from sqlalchemy.orm import Query, Session
+
+from database.enums import InstanceStatus, UOWStatus
+from database.history_writer import flush_pending_history
+from database.models_instance import (
+    UUID,
+    Instance_Context,
+    Interaction_Logs,
+    UnitsOfWork,
+    UnitsOfWorkHistory,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# UOW statuses after which no further transitions are recorded
+TERMINAL_UOW_STATUSES = {
+    UOWStatus.COMPLETED.value,
+    UOWStatus.FAILED.value,
+    UOWStatus.ZOMBIED_DEAD.value,
+    UOWStatus.FAILED_SECURITY_BREACH.value,
+    UOWStatus.ARCHIVED.value,
+}
+
+# Archived table -> (model, timestamp column name, primary key column name)
+ARCHIVED_TABLES = {
+    "uow_history": (UnitsOfWorkHistory, "transition_timestamp", "history_id"),
+    "interaction_logs": (Interaction_Logs, "timestamp", "log_id"),
+}
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Normalise a timestamp to aware UTC (SQLite returns naive datetimes)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def row_to_record(row: Any, table: str) -> Dict[str, Any]:
+    """
+    Convert an ORM row of an archived table to a JSON-ready dict.
+
+    UUIDs become strings and timestamps ISO-8601 UTC strings, which is the
+    representation both the archive files and HistoryReader return.
+    """
+    model = ARCHIVED_TABLES[table][0]
+    record = {}
+    for column in model.__table__.columns:
+        value = getattr(row, column.key)
+        if isinstance(value, uuid.UUID):
+            value = str(value)
+        elif isinstance(value, datetime):
+            # Fixed width so ISO strings sort chronologically
+            value = _as_utc(value).isoformat(timespec="microseconds")
+        record[column.key] = value
+    return record
+
+
+def record_to_row(record: Dict[str, Any], table: str) -> Any:
+    """
+    Rebuild a transient (never added to a Session) ORM row from an archived record.
+
+    Inverse of row_to_record, so archived and live history can be returned
+    through the same UnitsOfWorkHistory-typed APIs.
+    """
+    model = ARCHIVED_TABLES[table][0]
+    values = {}
+    for column in model.__table__.columns:
+        value = record.get(column.key)
+        if value is not None and isinstance(column.type, UUID):
+            value = uuid.UUID(value)
+        elif value is not None and isinstance(column.type, DateTime):
+            value = datetime.fromisoformat(value)
+        values[column.key] = value
+    return model(**values)
+
+
+def _history_key(timestamp: datetime, history_id: Any) -> Tuple[str, str]:
+    """(transition_timestamp, history_id) sort key shared by live rows and archived records."""
+    return _as_utc(timestamp).isoformat(timespec="microseconds"), str(history_id)
+
+
+def _record_key(record: Dict[str, Any], table: str) -> Tuple[Any, Any]:
+    """(timestamp, primary key) sort key of an archived record."""
+    _, timestamp_key, pk_key = ARCHIVED_TABLES[table]
+    return record[timestamp_key], record[pk_key]
+
+
+def _merge_sorted_sources(
+    sources: List[Tuple[Tuple, Callable[[], Iterator[Tuple[Tuple, Dict[str, Any]]]]]],
+) -> Iterator[Tuple[Tuple, Dict[str, Any]]]:
+    """
+    Merge key-ordered sources, opening each only once the merge reaches its first key.
+
+    Args:
+        sources: (min_key, opener) pairs; opener() returns (key, record)
+                 pairs in key order, all >= min_key
+
+    Yields:
+        (key, record) pairs in key order, adjacent duplicate keys dropped
+    """
+    sources = sorted(sources, key=lambda source: source[0])
+    heap: List[Tuple[Tuple, int, Dict[str, Any], Iterator]] = []
+    sequence = itertools.count()
+    next_source = 0
+    last_key = None
+    while True:
+        # A source whose first key is past the heap's smallest cannot win yet
+        while next_source < len(sources) and (not heap or sources[next_source][0] <= heap[0][0]):
+            iterator = sources[next_source][1]()
+            next_source += 1
+            first = next(iterator, None)
+            if first is not None:
+                heapq.heappush(heap, (first[0], next(sequence), first[1], iterator))
+        if not heap:
+            return
+        key, _, record, iterator = heapq.heappop(heap)
+        following = next(iterator, None)
+        if following is not None:
+            heapq.heappush(heap, (following[0], next(sequence), following[1], iterator))
+        if key != last_key:
+            last_key = key
+            yield key, record
+
+
+def page_history_query(
+    query: Query,
+    limit: Optional[int],
+    after: Optional[Tuple[datetime, uuid.UUID]],
+) -> List[UnitsOfWorkHistory]:
+    """Apply the (transition_timestamp, history_id) keyset to a live history query."""
+    if after is not None:
+        after_timestamp, after_id = after
+        # Expanded row-value comparison (portable across dialects)
+        query = query.filter(or_(
+            UnitsOfWorkHistory.transition_timestamp > after_timestamp,
+            and_(
+                UnitsOfWorkHistory.transition_timestamp == after_timestamp,
+                UnitsOfWorkHistory.history_id > after_id,
+            ),
+        ))
+
+    query = query.order_by(
+        UnitsOfWorkHistory.transition_timestamp.asc(),
+        UnitsOfWorkHistory.history_id.asc(),
+    )
+    if limit:
+        query = query.limit(limit)
+
+    return query.all()
+
+
+class HistoryArchive:
+    """
+    Date-partitioned gzip JSONL store for archived ledger rows.
+    """
+
+    def __init__(self, archive_dir: str):
+        """
+        Initialize the archive.
+
+        Args:
+            archive_dir: Root directory of the archive
+        """
+        self.archive_dir = archive_dir
+
+    def partition_path(self, table: str, day: str, instance_id: str) -> str:
+        """Path of the file holding one table's rows for one day and instance."""
+        return os.path.join(self.archive_dir, table, day, f"{instance_id}.jsonl.gz")
+
+    @staticmethod
+    def index_path(partition_path: str) -> str:
+        """Path of the uow_id member index of a partition file."""
+        return partition_path[: -len(".jsonl.gz")] + ".idx.jsonl"
+
+    def write(self, table: str, instance_id: str, records: List[Dict[str, Any]]) -> None:
+        """
+        Append records to their day partitions (durably, before returning).
+
+        Args:
+            table: Archived table name (key of ARCHIVED_TABLES)
+            instance_id: Instance the records belong to
+            records: Records produced by row_to_record
+        """
+        timestamp_key = ARCHIVED_TABLES[table][1]
+        by_day: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            by_day.setdefault(record[timestamp_key][:10], []).append(record)
+
+        for day, day_records in by_day.items():
+            day_records.sort(key=lambda r: _record_key(r, table))
+            path = self.partition_path(table, day, instance_id)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            payload = "".join(json.dumps(r, sort_keys=True) + "\n" for r in day_records)
+            member = gzip.compress(payload.encode("utf-8"))
+            with open(path, "ab") as raw:
+                # Each write is a complete gzip member; readers see one stream
+                offset = raw.seek(0, os.SEEK_END)
+                raw.write(member)
+                raw.flush()
+                os.fsync(raw.fileno())
+
+            entry = {
+                "offset": offset,
+                "length": len(member),
+                "min_key": list(_record_key(day_records[0], table)),
+                "max_key": list(_record_key(day_records[-1], table)),
+                "uow_ids": sorted({r["uow_id"] for r in day_records if r.get("uow_id")}),
+            }
+            with open(self.index_path(path), "a", encoding="utf-8") as index:
+                index.write(json.dumps(entry) + "\n")
+                index.flush()
+                os.fsync(index.fileno())
+
+    def days(self, table: str) -> List[str]:
+        """Archived day partitions of a table, oldest first."""
+        table_dir = os.path.join(self.archive_dir, table)
+        if not os.path.isdir(table_dir):
+            return []
+        return sorted(os.listdir(table_dir))
+
+    def read(
+        self,
+        table: str,
+        instance_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        uow_id: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream archived records, partition by partition.
+
+        Args:
+            table: Archived table name
+            instance_id: Only read this instance's files (None = all)
+            since: First day to read (YYYY-MM-DD, inclusive)
+            until: Last day to read (YYYY-MM-DD, inclusive)
+            uow_id: Only return this UOW's records, decompressing only the
+                    members the index lists for it
+
+        Yields:
+            Archived records (may contain duplicates across re-runs)
+        """
+        for day in self.days(table):
+            if (since and day < since) or (until and day > until):
+                continue
+            for record in self.read_day(table, day, instance_id, uow_id):
+                yield record
+
+    def read_day(
+        self,
+        table: str,
+        day: str,
+        instance_id: Optional[str] = None,
+        uow_id: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream one day partition's records (same filters as read())."""
+        for path in self._day_paths(table, day, instance_id):
+            entries = self._index_entries(path) if uow_id else None
+            if entries is None:
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    lines: Iterable[str] = list(f)
+            else:
+                lines = []
+                for entry in entries:
+                    if uow_id in entry["uow_ids"]:
+                        lines.extend(self._member_lines(path, entry))
+            for line in lines:
+                if line.strip():
+                    record = json.loads(line)
+                    if uow_id is None or record.get("uow_id") == uow_id:
+                        yield record
+
+    def read_sorted(
+        self,
+        table: str,
+        instance_id: Optional[str] = None,
+        uow_id: Optional[str] = None,
+        after: Optional[Tuple[Any, Any]] = None,
+    ) -> Iterator[Tuple[Tuple, Dict[str, Any]]]:
+        """
+        Lazily stream archived records after a keyset cursor, in key order.
+
+        Day partitions before the cursor's day and members whose last key is
+        not after the cursor are never opened; the rest are decompressed
+        only as the consumer advances, so reading N records costs about N
+        records plus the member the cursor falls in.
+
+        Args:
+            table: Archived table name
+            instance_id: Only read this instance's files (None = all)
+            uow_id: Only return this UOW's records
+            after: Optional (timestamp, primary key) cursor (exclusive)
+
+        Yields:
+            ((timestamp, primary key), record) pairs, de-duplicated
+        """
+        since = after[0][:10] if after is not None else None
+        for day in self.days(table):
+            if since and day < since:
+                continue
+            sources = []
+            for path in self._day_paths(table, day, instance_id):
+                entries = self._index_entries(path)
+                if entries is None or any("min_key" not in entry for entry in entries):
+                    sources.append(((), self._sorted_file_opener(path, table, uow_id, after)))
+                    continue
+                for entry in entries:
+                    if after is not None and tuple(entry["max_key"]) <= after:
+                        continue
+                    if uow_id is not None and uow_id not in entry["uow_ids"]:
+                        continue
+                    sources.append((
+                        tuple(entry["min_key"]),
+                        self._member_opener(path, entry, table, uow_id, after),
+                    ))
+            for item in _merge_sorted_sources(sources):
+                yield item
+
+    def _day_paths(self, table: str, day: str, instance_id: Optional[str]) -> List[str]:
+        day_dir = os.path.join(self.archive_dir, table, day)
+        if instance_id:
+            names = [f"{instance_id}.jsonl.gz"]
+        elif os.path.isdir(day_dir):
+            names = sorted(n for n in os.listdir(day_dir) if n.endswith(".jsonl.gz"))
+        else:
+            names = []
+        paths = [os.path.join(day_dir, name) for name in names]
+        return [path for path in paths if os.path.exists(path)]
+
+    def _index_entries(self, path: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Member index of a partition.
+
+        Returns None when the index does not cover the whole file (written
+        before indexing existed, or a crash between the data and index
+        writes): the caller then scans the file.
+        """
+        index_path = self.index_path(path)
+        if not os.path.exists(index_path):
+            return None
+        with open(index_path, "r", encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        if sum(entry["length"] for entry in entries) != os.path.getsize(path):
+            return None
+        return entries
+
+    @staticmethod
+    def _member_lines(path: str, entry: Dict[str, Any]) -> Iterator[str]:
+        """Lazily decompress the lines of one indexed gzip member."""
+        with open(path, "rb") as raw:
+            raw.seek(entry["offset"])
+            member = raw.read(entry["length"])
+        with gzip.GzipFile(fileobj=io.BytesIO(member)) as f:
+            for line in f:
+                yield line.decode("utf-8")
+
+    def _member_opener(
+        self,
+        path: str,
+        entry: Dict[str, Any],
+        table: str,
+        uow_id: Optional[str],
+        after: Optional[Tuple],
+    ) -> Callable[[], Iterator[Tuple[Tuple, Dict[str, Any]]]]:
+        def open_member() -> Iterator[Tuple[Tuple, Dict[str, Any]]]:
+            for line in self._member_lines(path, entry):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                key = _record_key(record, table)
+                if after is not None and key <= after:
+                    continue
+                if uow_id is None or record.get("uow_id") == uow_id:
+                    yield key, record
+        return open_member
+
+    @staticmethod
+    def _sorted_file_opener(
+        path: str,
+        table: str,
+        uow_id: Optional[str],
+        after: Optional[Tuple],
+    ) -> Callable[[], Iterator[Tuple[Tuple, Dict[str, Any]]]]:
+        # Unindexed (or pre-sorting) partition: load and sort it whole
+        def open_file() -> Iterator[Tuple[Tuple, Dict[str, Any]]]:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                records = [json.loads(line) for line in f if line.strip()]
+            keyed = sorted(
+                (
+                    (_record_key(record, table), record)
+                    for record in records
+                    if uow_id is None or record.get("uow_id") == uow_id
+                ),
+                key=lambda item: item[0],
+            )
+            return iter([item for item in keyed if after is None or item[0] > after])
+        return open_file
+
+
+class HistoryArchiver:
+    """
+    Moves ledger rows of finished instances from the live tables to the archive.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        archive: HistoryArchive,
+        batch_size: int = 5000,
+    ):
+        """
+        Initialize the archiver.
+
+        Args:
+            session_factory: Callable returning a new Session on the instance DB
+            archive: Destination archive
+            batch_size: Rows archived and deleted per transaction
+        """
+        self.session_factory = session_factory
+        self.archive = archive
+        self.batch_size = batch_size
+
+    @staticmethod
+    def is_completed(session: Session, instance_id: uuid.UUID) -> bool:
+        """
+        An instance is complete when it is ARCHIVED or all its UOWs are terminal.
+        """
+        instance = session.get(Instance_Context, instance_id)
+        if instance is None:
+            return False
+        if instance.status == InstanceStatus.ARCHIVED.value:
+            return True
+
+        open_uow = session.execute(
+            select(UnitsOfWork.uow_id)
+            .where(
+                UnitsOfWork.instance_id == instance_id,
+                UnitsOfWork.status.notin_(TERMINAL_UOW_STATUSES),
+            )
+            .limit(1)
+        ).first()
+        has_uows = session.execute(
+            select(UnitsOfWork.uow_id).where(UnitsOfWork.instance_id == instance_id).limit(1)
+        ).first()
+        return open_uow is None and has_uows is not None
+
+    def archive_instance(
+        self,
+        instance_id: uuid.UUID,
+        before: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """
+        Archive one completed instance's ledger rows.
+
+        Each batch is written to the archive (fsync'd) before the same rows
+        are deleted and committed, so rows are never lost; a crash in
+        between only leaves duplicates that readers drop.
+
+        Args:
+            instance_id: Instance to archive
+            before: Only archive rows older than this timestamp (None = all)
+
+        Returns:
+            Rows archived per table (empty if the instance is not complete)
+        """
+        archived: Dict[str, int] = {}
+        session = self.session_factory()
+        try:
+            if not self.is_completed(session, instance_id):
+                logger.info(f"Instance {instance_id} is not complete; skipping archive")
+                return archived
+
+            for table, (model, timestamp_key, pk_key) in ARCHIVED_TABLES.items():
+                timestamp_col = getattr(model, timestamp_key)
+                pk_col = getattr(model, pk_key)
+                archived[table] = 0
+
+                while True:
+                    stmt = (
+                        select(model)
+                        .where(model.instance_id == instance_id)
+                        .order_by(timestamp_col, pk_col)
+                        .limit(self.batch_size)
+                    )
+                    if before is not None:
+                        stmt = stmt.where(timestamp_col < before)
+                    rows = session.execute(stmt).scalars().all()
+                    if not rows:
+                        break
+
+                    self.archive.write(
+                        table, str(instance_id), [row_to_record(row, table) for row in rows]
+                    )
+                    session.execute(
+                        delete(model).where(pk_col.in_([getattr(row, pk_key) for row in rows]))
+                    )
+                    session.commit()
+                    session.expunge_all()
+                    archived[table] += len(rows)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        logger.info(f"Archived instance {instance_id}: {archived}")
+        return archived
+
+    def archive_completed_instances(
+        self,
+        before: Optional[datetime] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Archive every completed instance.
+
+        Args:
+            before: Only archive rows older than this timestamp (None = all)
+
+        Returns:
+            Mapping of instance_id -> rows archived per table
+        """
+        session = self.session_factory()
+        try:
+            instance_ids = session.execute(select(Instance_Context.instance_id)).scalars().all()
+            completed = [i for i in instance_ids if self.is_completed(session, i)]
+        finally:
+            session.close()
+
+        results = {}
+        for instance_id in completed:
+            archived = self.archive_instance(instance_id, before=before)
+            if any(archived.values()):
+                results[str(instance_id)] = archived
+        return results
+
+
+class HistoryReader:
+    """
+    Audit reads over archived + live ledger rows as one ordered history.
+    """
+
+    def __init__(self, archive: Optional[HistoryArchive] = None):
+        """
+        Initialize the reader.
+
+        Args:
+            archive: Archive to merge with the live tables (None = live only)
+        """
+        self.archive = archive
+
+    def uow_history(
+        self,
+        session: Session,
+        uow_id: uuid.UUID,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> List[UnitsOfWorkHistory]:
+        """
+        One keyset page of a UOW's transition history, oldest first.
+
+        Live rows come from the (uow_id, transition_timestamp, history_id)
+        index; archived rows are streamed from the first indexed member
+        after the cursor that contains this UOW (see HistoryArchive.read_sorted).
+
+        Args:
+            session: Session on the instance DB
+            uow_id: UOW to read
+            limit: Optional page size
+            after: Optional (transition_timestamp, history_id) cursor; only
+                   entries strictly after it are returned
+
+        Returns:
+            UnitsOfWorkHistory entries; archived ones are transient objects
+        """
+        query = session.query(UnitsOfWorkHistory).filter(UnitsOfWorkHistory.uow_id == uow_id)
+        uow = session.get(UnitsOfWork, uow_id)
+        instance_id = str(uow.instance_id) if uow is not None else None
+        return self._page(query, limit, after, instance_id=instance_id, uow_id=str(uow_id))
+
+    def instance_history(
+        self,
+        session: Session,
+        instance_id: uuid.UUID,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> List[UnitsOfWorkHistory]:
+        """
+        One keyset page of every UOW's transition history in an instance.
+
+        Same ordering, cursor and return type as uow_history.
+        """
+        query = session.query(UnitsOfWorkHistory).filter(
+            UnitsOfWorkHistory.instance_id == instance_id
+        )
+        return self._page(query, limit, after, instance_id=str(instance_id))
+
+    def history_for_uow(self, session: Session, uow_id: uuid.UUID) -> List[Dict[str, Any]]:
+        """
+        Full transition history of a UOW, oldest first.
+
+        Args:
+            session: Session on the instance DB
+            uow_id: UOW to read
+
+        Returns:
+            History records (row_to_record format) ordered by
+            (transition_timestamp, history_id)
+        """
+        return [row_to_record(row, "uow_history") for row in self.uow_history(session, uow_id)]
+
+    def history_for_instance(self, session: Session, instance_id: uuid.UUID) -> List[Dict[str, Any]]:
+        """
+        Full transition history of every UOW in an instance, oldest first.
+        """
+        return [
+            row_to_record(row, "uow_history")
+            for row in self.instance_history(session, instance_id)
+        ]
+
+    def _page(
+        self,
+        query: Query,
+        limit: Optional[int],
+        after: Optional[Tuple[datetime, uuid.UUID]],
+        instance_id: Optional[str] = None,
+        uow_id: Optional[str] = None,
+    ) -> List[UnitsOfWorkHistory]:
+        live = page_history_query(query, limit, after)
+        if self.archive is None:
+            return live
+
+        after_key = _history_key(*after) if after is not None else None
+        merged = heapq.merge(
+            ((_history_key(row.transition_timestamp, row.history_id), row) for row in live),
+            self._archived_history(after_key, instance_id, uow_id),
+            key=lambda item: item[0],
+        )
+        page: List[UnitsOfWorkHistory] = []
+        last_key = None
+        for key, row in merged:
+            # Rows archived but not yet deleted (interrupted run): live wins,
+            # and merge() yields the live iterable first on ties
+            if key == last_key:
+                continue
+            last_key = key
+            page.append(row)
+            if limit and len(page) >= limit:
+                break
+        return page
+
+    def _archived_history(
+        self,
+        after_key: Optional[Tuple[str, str]],
+        instance_id: Optional[str],
+        uow_id: Optional[str],
+    ) -> Iterator[Tuple[Tuple[str, str], UnitsOfWorkHistory]]:
+        """Archived history entries after a cursor in key order (lazy)."""
+        for key, record in self.archive.read_sorted(
+            "uow_history", instance_id=instance_id, uow_id=uow_id, after=after_key
+        ):
+            yield key, record_to_row(record, "uow_history")
+
+    def stream_instance_history(
+        self,
+        session_scope: Callable[[], ContextManager[Session]],
+        instance_id: uuid.UUID,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        page_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream an instance's whole transition history as records, oldest first.
+
+        One lazy cursor over the archive is merged with live keyset pages of
+        page_size rows, each read in its own short session, so memory and
+        transaction length stay bounded and no archive member is read twice.
+
+        Args:
+            session_scope: Context manager factory yielding an instance
+                           Session (e.g. DatabaseManager.get_instance_session)
+            instance_id: Instance to read
+            after: Optional (transition_timestamp, history_id) cursor
+            page_size: Live rows fetched per session
+
+        Yields:
+            History records (row_to_record format)
+        """
+        def live() -> Iterator[Tuple[Tuple[str, str], Dict[str, Any]]]:
+            page_after = after
+            while True:
+                with session_scope() as session:
+                    flush_pending_history(session)
+                    query = session.query(UnitsOfWorkHistory).filter(
+                        UnitsOfWorkHistory.instance_id == instance_id
+                    )
+                    rows = page_history_query(query, page_size, page_after)
+                    records = [row_to_record(row, "uow_history") for row in rows]
+                    if rows:
+                        page_after = (rows[-1].transition_timestamp, rows[-1].history_id)
+                for record in records:
+                    yield (record["transition_timestamp"], record["history_id"]), record
+                if len(rows) < page_size:
+                    return
+
+        if self.archive is None:
+            for _, record in live():
+                yield record
+            return
+
+        after_key = _history_key(*after) if after is not None else None
+        merged = heapq.merge(
+            live(),
+            self.archive.read_sorted("uow_history", instance_id=str(instance_id), after=after_key),
+            key=lambda item: item[0],
+        )
+        last_key = None
+        for key, record in merged:
+            # Live wins on ties (interrupted archive run), as in _page
+            if key != last_key:
+                last_key = key
+                yield record
+
+    def interaction_logs_for_instance(
+        self, session: Session, instance_id: uuid.UUID
+    ) -> List[Dict[str, Any]]:
+        """
+        Every interaction log entry of an instance, oldest first.
+        """
+        live = session.execute(
+            select(Interaction_Logs).where(Interaction_Logs.instance_id == instance_id)
+        ).scalars()
+        archived = (
+            self.archive.read("interaction_logs", instance_id=str(instance_id))
+            if self.archive is not None else ()
+        )
+        return self._merge("interaction_logs", live, archived)
+
+    @staticmethod
+    def _merge(table: str, live_rows, archived_records) -> List[Dict[str, Any]]:
+        _, timestamp_key, pk_key = ARCHIVED_TABLES[table]
+        merged: Dict[Any, Dict[str, Any]] = {}
+        for record in archived_records:
+            merged[record[pk_key]] = record
+        for row in live_rows:
+            record = row_to_record(row, table)
+            merged[record[pk_key]] = record  # Live wins
+        return sorted(merged.values(), key=lambda r: (r[timestamp_key], r[pk_key]))
+
+
+# Global history reader (live only until the server installs the archive)
+_global_history_reader = HistoryReader()
+
+
+def get_history_reader() -> HistoryReader:
+    """
+    Get the global history reader used by the persistence history getters.
+
+    Returns:
+        The singleton HistoryReader
+    """
+    return _global_history_reader
+
+
+def set_history_reader(reader: HistoryReader) -> HistoryReader:
+    """
+    Replace the global history reader (server startup, tests).
+
+    Args:
+        reader: Reader to install
+
+    Returns:
+        The installed reader
+    """
+    global _global_history_reader
+    _global_history_reader = reader
+    return _global_history_reader
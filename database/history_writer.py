@@ -0,0 +1,376 @@
+"""
+History Writer: write-behind batching for UnitsOfWorkHistory appends.
+
+Implements Article XVII (Atomic Traceability) for high-volume deployments.
+The history table receives one row per UOW transition, which makes it the
+busiest write path. Adding each row through the ORM costs a unit-of-work
+flush and an INSERT round trip per transition. The HistoryWriter buffers
+rows as plain dicts and persists them with one Core bulk INSERT
+(executemany) per batch.
+
+Two modes:
+
+1. Transactional (default): the writer is attached to a Session. Buffered
+   rows are inserted on the Session's connection when the buffer reaches
+   flush_size, after any ORM flush once the buffer is full, and always
+   right before the Session commits, so history rows commit or roll back
+   together with the UOW changes that produced them.
+
+2. Write-ahead log: with a HistoryWAL the rows are appended (fsync'd) to a
+   local JSONL file once the transaction has committed, and
+   HistoryWAL.drain() copies them into the database asynchronously (the
+   server schedules it every HISTORY_WAL_DRAIN_INTERVAL_SECONDS). The
+   audit trail then lags the UOW tables by up to one drain interval but
+   never blocks a transition on the history table; lookups that must see
+   the latest rows read HistoryWriter.unflushed_rows() alongside the table.
+   The trade-off: a crash between the commit and the WAL fsync loses those
+   history rows.
+
+Ordering: rows are written in append order, and transition_timestamp is
+made strictly increasing per uow_id (bumped by one microsecond on ties), so
+reading history ordered by transition_timestamp always reproduces the
+append order of each UOW.
+
+Usage (DatabaseManager.enable_history_writer attaches a writer to every
+instance session):
+    writer = HistoryWriter.attach(session, flush_size=500)
+    UOWPersistenceService.save_uow(session, uow, guard_context, ...)  # buffered
+    session.commit()  # buffered history is inserted first
+"""
+
+import json
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session
+
+from database.models_instance import UnitsOfWorkHistory
+
+logger = logging.getLogger(__name__)
+
+
+_SESSION_INFO_KEY = "history_writer"
+_UUID_COLUMNS = (
+    "history_id",
+    "instance_id",
+    "uow_id",
+    "previous_interaction_id",
+    "new_interaction_id",
+    "actor_id",
+)
+
+
+class HistoryWAL:
+    """
+    Durable local write-ahead log for history rows (JSONL, fsync per batch).
+
+    Rows are appended to ``path``; drain() atomically moves the file aside
+    as a segment, inserts its rows in batches and deletes the segment once
+    committed. A segment left behind by a crash is drained first on the
+    next call, and rows whose history_id already exists are skipped, so a
+    crash between commit and delete never duplicates history.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the WAL.
+
+        Args:
+            path: File the WAL appends to
+        """
+        self.path = path
+        self._lock = Lock()
+
+    @property
+    def segment_path(self) -> str:
+        return f"{self.path}.draining"
+
+    def append(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Durably append rows (written and fsync'd before returning).
+
+        Args:
+            rows: History rows as produced by HistoryWriter
+        """
+        if not rows:
+            return
+        lines = "".join(json.dumps(_encode_row(row)) + "\n" for row in rows)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def read(self, uow_id: Optional[uuid.UUID] = None) -> List[Dict[str, Any]]:
+        """
+        Return rows still in the log (not yet drained), in append order.
+
+        Args:
+            uow_id: Only return this UOW's rows (None = all rows)
+
+        Returns:
+            Decoded history rows
+        """
+        lines: List[str] = []
+        # Under the lock so a concurrent drain cannot move rows between the reads
+        with self._lock:
+            for path in (self.segment_path, self.path):
+                if os.path.exists(path):
+                    with open(path, "r", encoding="utf-8") as f:
+                        lines.extend(line for line in f if line.strip())
+
+        rows = [json.loads(line) for line in lines]
+        if uow_id is not None:
+            rows = [row for row in rows if row["uow_id"] == str(uow_id)]
+        return [_decode_row(row) for row in rows]
+
+    def drain(self, session_factory: Callable[[], Session], batch_size: int = 1000) -> int:
+        """
+        Copy logged rows into the history table.
+
+        Args:
+            session_factory: Callable returning a new Session on the instance DB
+            batch_size: Rows per bulk INSERT
+
+        Returns:
+            Number of rows inserted
+        """
+        with self._lock:
+            if not os.path.exists(self.segment_path):
+                if not os.path.exists(self.path):
+                    return 0
+                os.replace(self.path, self.segment_path)
+
+        with open(self.segment_path, "r", encoding="utf-8") as f:
+            rows = [_decode_row(json.loads(line)) for line in f if line.strip()]
+
+        session = session_factory()
+        inserted = 0
+        try:
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                existing = set(session.execute(
+                    select(UnitsOfWorkHistory.history_id).where(
+                        UnitsOfWorkHistory.history_id.in_([row["history_id"] for row in batch])
+                    )
+                ).scalars())
+                batch = [row for row in batch if row["history_id"] not in existing]
+                if batch:
+                    session.execute(insert(UnitsOfWorkHistory), batch)
+                    inserted += len(batch)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        os.remove(self.segment_path)
+        return inserted
+
+
+class HistoryWriter:
+    """
+    Buffers UnitsOfWorkHistory rows and writes them with Core bulk inserts.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        flush_size: int = 500,
+        wal: Optional[HistoryWAL] = None,
+    ):
+        """
+        Initialize a writer for one Session (use attach() to install it).
+
+        Args:
+            session: Session whose transaction the history belongs to
+            flush_size: Buffered rows that trigger a bulk insert
+            wal: Optional write-ahead log; rows go there after each commit
+                 instead of into the database
+        """
+        if flush_size <= 0:
+            raise ValueError("flush_size must be positive")
+
+        self.session = session
+        self.flush_size = flush_size
+        self.wal = wal
+        self._buffer: List[Dict[str, Any]] = []
+        self._last_timestamp: Dict[uuid.UUID, datetime] = {}
+
+    @classmethod
+    def attach(
+        cls,
+        session: Session,
+        flush_size: int = 500,
+        wal: Optional[HistoryWAL] = None,
+    ) -> "HistoryWriter":
+        """
+        Install a writer on a Session; save_uow then buffers history through it.
+
+        Args:
+            session: Session to attach to
+            flush_size: Buffered rows that trigger a bulk insert
+            wal: Optional write-ahead log (see HistoryWAL)
+
+        Returns:
+            The attached writer (the existing one if already attached)
+        """
+        existing = cls.for_session(session)
+        if existing is not None:
+            return existing
+
+        writer = cls(session, flush_size=flush_size, wal=wal)
+        session.info[_SESSION_INFO_KEY] = writer
+        event.listen(session, "after_flush", writer._on_after_flush)
+        event.listen(session, "before_commit", writer._on_before_commit)
+        event.listen(session, "after_commit", writer._on_after_commit)
+        event.listen(session, "after_rollback", writer._on_after_rollback)
+        return writer
+
+    @staticmethod
+    def for_session(session: Session) -> Optional["HistoryWriter"]:
+        """Return the writer attached to a Session, if any."""
+        return session.info.get(_SESSION_INFO_KEY)
+
+    def detach(self) -> None:
+        """Write any buffered rows and remove the writer from its Session."""
+        self.flush()
+        event.remove(self.session, "after_flush", self._on_after_flush)
+        event.remove(self.session, "before_commit", self._on_before_commit)
+        event.remove(self.session, "after_commit", self._on_after_commit)
+        event.remove(self.session, "after_rollback", self._on_after_rollback)
+        self.session.info.pop(_SESSION_INFO_KEY, None)
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered rows."""
+        return len(self._buffer)
+
+    def append(self, **values: Any) -> uuid.UUID:
+        """
+        Buffer one history row.
+
+        Accepts UnitsOfWorkHistory column names. history_id,
+        transition_timestamp and event_type are defaulted like the ORM
+        model does.
+
+        Returns:
+            The row's history_id
+        """
+        row = {column: None for column in _ROW_COLUMNS}
+        row.update(values)
+        row["history_id"] = row["history_id"] or uuid.uuid4()
+        row["event_type"] = row["event_type"] or "STATE_TRANSITION"
+
+        # Strictly increasing per UOW so timestamp order == append order
+        timestamp = row["transition_timestamp"] or datetime.now(timezone.utc)
+        last = self._last_timestamp.get(row["uow_id"])
+        if last is not None and timestamp <= last:
+            timestamp = last + timedelta(microseconds=1)
+        row["transition_timestamp"] = timestamp
+        self._last_timestamp[row["uow_id"]] = timestamp
+
+        self._buffer.append(row)
+        if self.wal is None and len(self._buffer) >= self.flush_size:
+            self.flush()
+        return row["history_id"]
+
+    def unflushed_rows(self, uow_id: uuid.UUID) -> List[Dict[str, Any]]:
+        """
+        Rows of a UOW that a query on the history table cannot see yet (WAL mode).
+
+        These are the rows still in the WAL plus the rows buffered by this
+        Session's open transaction. Call it before querying the table: a
+        drain only moves rows from the WAL into the table, so nothing is
+        missed in between. In transactional mode flush_pending_history
+        makes everything queryable and this returns an empty list.
+
+        Args:
+            uow_id: The UOW whose rows are wanted
+
+        Returns:
+            Rows in append order
+        """
+        if self.wal is None:
+            return []
+        return self.wal.read(uow_id) + [row for row in self._buffer if row["uow_id"] == uow_id]
+
+    def flush(self) -> int:
+        """
+        Write buffered rows now (bulk INSERT, or WAL append in WAL mode).
+
+        Returns:
+            Number of rows written
+        """
+        if not self._buffer:
+            return 0
+
+        rows, self._buffer = self._buffer, []
+        if self.wal is not None:
+            self.wal.append(rows)
+        else:
+            # Core executemany on the Session's connection: same transaction,
+            # no ORM unit-of-work (and no autoflush recursion)
+            self.session.connection().execute(insert(UnitsOfWorkHistory.__table__), rows)
+        return len(rows)
+
+    def _on_after_flush(self, session: Session, flush_context) -> None:
+        if self.wal is None and len(self._buffer) >= self.flush_size:
+            self.flush()
+
+    def _on_before_commit(self, session: Session) -> None:
+        if self.wal is None:
+            # Ensure pending ORM rows the history refers to are written first
+            session.flush()
+            self.flush()
+
+    def _on_after_commit(self, session: Session) -> None:
+        if self.wal is not None:
+            # Only committed transitions reach the WAL
+            self.flush()
+
+    def _on_after_rollback(self, session: Session) -> None:
+        if self._buffer:
+            logger.debug(f"Discarding {len(self._buffer)} buffered history row(s) on rollback")
+        self._buffer = []
+        self._last_timestamp.clear()
+
+
+def flush_pending_history(session: Session) -> None:
+    """
+    Write buffered history for a Session so it can be queried (read-your-writes).
+
+    No-op when no HistoryWriter is attached or in WAL mode (see
+    HistoryWriter.unflushed_rows for WAL-mode lookups).
+    """
+    writer = HistoryWriter.for_session(session)
+    if writer is not None and writer.wal is None:
+        session.flush()
+        writer.flush()
+
+
+_ROW_COLUMNS = tuple(column.name for column in UnitsOfWorkHistory.__table__.columns)
+
+
+def _encode_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    encoded = dict(row)
+    for column in _UUID_COLUMNS:
+        if encoded.get(column) is not None:
+            encoded[column] = str(encoded[column])
+    encoded["transition_timestamp"] = encoded["transition_timestamp"].isoformat()
+    return encoded
+
+
+def _decode_row(data: Dict[str, Any]) -> Dict[str, Any]:
+    row = dict(data)
+    for column in _UUID_COLUMNS:
+        if row.get(column) is not None:
+            row[column] = uuid.UUID(row[column])
+    row["transition_timestamp"] = datetime.fromisoformat(row["transition_timestamp"])
+    return row
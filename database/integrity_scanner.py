@@ -0,0 +1,338 @@
+"""
+State Hash Integrity Scanner: background X-Content-Hash audit of every UOW.
+
+Implements Article XVII (Atomic Traceability) at fleet scale.
+UOWPersistenceService.verify_state_hash checks a single UOW on demand; the
+scanner sweeps all UOWs so drift from out-of-band edits is detected even
+for UOWs nobody touches.
+
+Design:
+1. UOW rows are streamed in uow_id order through a server-side cursor
+   (yield_per), one chunk at a time, so memory stays bounded.
+2. For each chunk the effective attributes (own + inherited) are loaded
+   with UOWPersistenceService.resolve_attributes_by_id: one query per
+   ancestor level plus one attribute query. UOWs that were never hashed
+   (content_hash NULL, e.g. freshly instantiated by the engine) have no
+   baseline to drift from; they are skipped and only counted.
+3. The SHA-256 work is shipped to a process pool as plain data; the main
+   process keeps reading the next chunks while workers hash.
+4. After each chunk completes (in order) the last uow_id is written to a
+   checkpoint file, so an interrupted sweep resumes where it stopped. A
+   finished sweep clears the checkpoint.
+5. Every mismatch produces a ViolationPacket (ARTICLE_XVII_STATE_DRIFT),
+   emitted through the optional GuardContext and returned in the report.
+
+The scanner only reads; it never modifies UOWs, so it can run alongside
+production traffic.
+
+Usage:
+    scanner = StateHashScanner(session_factory, guard_context=guard,
+                               checkpoint_path="state_hash_audit.json")
+    report = scanner.scan()
+"""
+
+import json
+import logging
+import os
+import uuid
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from database.models_instance import UnitsOfWork
+from database.persistence_service import GuardContext, UOWPersistenceService, ViolationPacket
+from database.state_hasher import StateHasher
+from chameleon_workflow_engine.semantic_guard import StateVerifier
+
+logger = logging.getLogger(__name__)
+
+
+# (uow_id, stored content_hash, uses incremental digests, effective attributes)
+ScanItem = Tuple[str, Optional[str], bool, Dict[str, Any]]
+
+
+def verify_hash_chunk(items: List[ScanItem]) -> List[Dict[str, Any]]:
+    """
+    Recompute content hashes for a chunk of UOWs (process pool entry point).
+
+    Args:
+        items: Scan items built by the scanner
+
+    Returns:
+        One dict per drifted UOW with uow_id, stored_hash, computed_hash and
+        attributes_count
+    """
+    drifted = []
+    for uow_id, stored_hash, incremental, attributes in items:
+        if incremental:
+            computed_hash, _ = StateHasher.compute_incremental_hash(attributes)
+        else:
+            computed_hash = StateVerifier.compute_hash(attributes)
+        if computed_hash != stored_hash:
+            drifted.append({
+                "uow_id": uow_id,
+                "stored_hash": stored_hash,
+                "computed_hash": computed_hash,
+                "attributes_count": len(attributes),
+            })
+    return drifted
+
+
+class _InlineExecutor(Executor):
+    """Runs submitted work synchronously (max_workers=0, tests, debugging)."""
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+@dataclass
+class ScanCheckpoint:
+    """
+    Resumable position of an in-progress sweep.
+
+    Attributes:
+        last_uow_id: Last uow_id whose chunk was fully verified (None = start)
+        scanned: UOWs verified so far in this sweep
+        drifted: Drifted UOWs found so far in this sweep
+        started_at: ISO timestamp of when the sweep started
+        unhashed: UOWs skipped so far because they were never hashed
+    """
+
+    last_uow_id: Optional[str] = None
+    scanned: int = 0
+    drifted: int = 0
+    started_at: Optional[str] = None
+    unhashed: int = 0
+
+    @classmethod
+    def load(cls, path: Optional[str]) -> "ScanCheckpoint":
+        """Load a checkpoint file (a fresh checkpoint if missing or unreadable)."""
+        if not path or not os.path.exists(path):
+            return cls()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(**json.load(f))
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable scan checkpoint {path}: {e}")
+            return cls()
+
+    def save(self, path: Optional[str]) -> None:
+        """Atomically write the checkpoint (no-op without a path)."""
+        if not path:
+            return
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.__dict__, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def clear(path: Optional[str]) -> None:
+        """Remove the checkpoint once a sweep completes."""
+        if path and os.path.exists(path):
+            os.remove(path)
+
+
+@dataclass
+class ScanReport:
+    """
+    Result of a scan() call.
+
+    Attributes:
+        scanned: UOWs verified by this call
+        drifted: Drifted UOWs found by this call
+        violations: ViolationPackets for the drifted UOWs
+        last_uow_id: Position reached (checkpointed unless completed)
+        completed: True if the sweep reached the end of the table
+        unhashed: UOWs skipped because they have no content_hash yet
+    """
+
+    scanned: int = 0
+    drifted: int = 0
+    violations: List[ViolationPacket] = field(default_factory=list)
+    last_uow_id: Optional[str] = None
+    completed: bool = False
+    unhashed: int = 0
+
+
+class StateHashScanner:
+    """
+    Streaming, parallel, resumable X-Content-Hash audit across all UOWs.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        guard_context: Optional[GuardContext] = None,
+        chunk_size: int = 500,
+        max_workers: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        max_pending_chunks: Optional[int] = None,
+    ):
+        """
+        Initialize the scanner.
+
+        Args:
+            session_factory: Callable returning a new Session on the instance DB
+            guard_context: Optional Guard context receiving drift violations
+            chunk_size: UOWs per streamed chunk / worker task
+            max_workers: Process pool size (None = CPU count, 0 = run inline)
+            checkpoint_path: JSON file for resumable sweeps (None = not resumable)
+            max_pending_chunks: Chunks in flight before reading pauses
+                                (default: twice the worker count)
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        self.session_factory = session_factory
+        self.guard_context = guard_context
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.checkpoint_path = checkpoint_path
+        self.max_pending_chunks = max_pending_chunks or 2 * (max_workers or os.cpu_count() or 1)
+
+    def scan(self, max_uows: Optional[int] = None) -> ScanReport:
+        """
+        Verify UOW content hashes, resuming from the checkpoint.
+
+        Args:
+            max_uows: Stop (checkpointed) after roughly this many UOWs; None
+                      sweeps to the end of the table
+
+        Returns:
+            ScanReport for the UOWs verified by this call
+        """
+        checkpoint = ScanCheckpoint.load(self.checkpoint_path)
+        if checkpoint.started_at is None:
+            checkpoint.started_at = datetime.now(timezone.utc).isoformat()
+
+        report = ScanReport(last_uow_id=checkpoint.last_uow_id)
+        pending: Deque[Tuple[Future, str, int, int]] = deque()
+        executor = self._create_executor()
+        session = self.session_factory()
+        exhausted = False
+
+        try:
+            stmt = select(
+                UnitsOfWork.uow_id,
+                UnitsOfWork.parent_id,
+                UnitsOfWork.content_hash,
+                # Loaded rather than tested in SQL: a JSON column stores
+                # None as JSON null, which IS NULL does not match
+                UnitsOfWork.content_digests,
+            ).order_by(UnitsOfWork.uow_id)
+            if checkpoint.last_uow_id is not None:
+                stmt = stmt.where(UnitsOfWork.uow_id > uuid.UUID(checkpoint.last_uow_id))
+
+            result = session.execute(
+                stmt.execution_options(stream_results=True, yield_per=self.chunk_size)
+            )
+
+            submitted = 0
+            for rows in result.partitions():
+                items = self._build_chunk(session, rows)
+                pending.append((
+                    executor.submit(verify_hash_chunk, items),
+                    str(rows[-1][0]),
+                    len(items),
+                    len(rows) - len(items),
+                ))
+                submitted += len(rows)
+
+                while len(pending) >= self.max_pending_chunks:
+                    self._collect(pending.popleft(), checkpoint, report)
+
+                if max_uows is not None and submitted >= max_uows:
+                    break
+            else:
+                exhausted = True
+
+            result.close()
+            while pending:
+                self._collect(pending.popleft(), checkpoint, report)
+        finally:
+            for future, _, _, _ in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            session.close()
+
+        if exhausted:
+            report.completed = True
+            ScanCheckpoint.clear(self.checkpoint_path)
+            logger.info(
+                f"State hash sweep complete: {checkpoint.scanned} UOW(s) verified, "
+                f"{checkpoint.drifted} drifted, {checkpoint.unhashed} never hashed (skipped)"
+            )
+        return report
+
+    def _create_executor(self) -> Executor:
+        if self.max_workers == 0:
+            return _InlineExecutor()
+        return ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _build_chunk(self, session: Session, rows) -> List[ScanItem]:
+        """Resolve effective attributes for the hashed UOWs of one streamed chunk."""
+        hashed = [row for row in rows if row[2] is not None]
+        if not hashed:
+            return []
+
+        resolved = UOWPersistenceService.resolve_attributes_by_id(
+            session, {uow_id: parent_id for uow_id, parent_id, _, _ in hashed}
+        )
+        return [
+            (str(uow_id), content_hash, content_digests is not None, resolved[uow_id])
+            for uow_id, _, content_hash, content_digests in hashed
+        ]
+
+    def _collect(
+        self,
+        entry: Tuple[Future, str, int, int],
+        checkpoint: ScanCheckpoint,
+        report: ScanReport,
+    ) -> None:
+        """Record one finished chunk, emit its violations and advance the checkpoint."""
+        future, last_uow_id, chunk_count, unhashed_count = entry
+        drifted = future.result()
+
+        for entry_data in drifted:
+            violation = ViolationPacket(
+                rule_id="ARTICLE_XVII_STATE_DRIFT",
+                severity="CRITICAL",
+                violation_type="STATE_HASH_MISMATCH",
+                uow_id=entry_data["uow_id"],
+                raw_data={
+                    "stored_hash": entry_data["stored_hash"],
+                    "computed_hash": entry_data["computed_hash"],
+                    "attributes_count": entry_data["attributes_count"],
+                    "detected_by": "STATE_HASH_SCANNER",
+                },
+                remedy_suggestion=(
+                    "State drift detected by background audit! Remediation options:\n"
+                    "1. ROLLBACK: Revert attributes to match stored hash\n"
+                    "2. QUARANTINE: Isolate UOW for manual inspection\n"
+                    "3. CONSTITUTIONAL_WAIVER: Issue waiver and proceed (requires Pilot approval)"
+                ),
+            )
+            report.violations.append(violation)
+            if self.guard_context:
+                self.guard_context.emit_violation(violation)
+
+        report.scanned += chunk_count
+        report.drifted += len(drifted)
+        report.unhashed += unhashed_count
+        report.last_uow_id = last_uow_id
+
+        checkpoint.last_uow_id = last_uow_id
+        checkpoint.scanned += chunk_count
+        checkpoint.drifted += len(drifted)
+        checkpoint.unhashed += unhashed_count
+        checkpoint.save(self.checkpoint_path)
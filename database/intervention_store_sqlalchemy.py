@@ -8,22 +8,167 @@ This adapter:
 - Provides CRUD operations for interventions
 - Supports filtering by status, priority, pilot, and type
 - Implements pagination for large result sets
-- Calculates metrics from persisted data
+- Calculates metrics from persisted data (maintained incrementally,
+  reconciled against the database within a staleness bound)
 - Maintains compatibility with Phase 2 API
+- Opens a short-lived session per operation when given a session factory,
+  so concurrent requests never share a Session
 """
 
-from typing import Optional, List, Dict, Any
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterator, Union
 from datetime import datetime, timezone, timedelta
+import base64
+import heapq
+import threading
+import time
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_, func, insert, update
 
 from chameleon_workflow_engine.interactive_dashboard import (
     InterventionRequest,
     InterventionStatus,
     InterventionType,
     DashboardMetrics,
+    get_intervention_hub,
 )
-from database.models_phase3 import Intervention, InterventionHistory
+from database.models_phase3 import Intervention, InterventionHistory, rank_for_priority
+
+
+class InterventionMetricsCounters:
+    """
+    In-memory counters behind InterventionStoreSQLAlchemy.get_metrics.
+
+    Each counter mirrors one of the aggregate queries in from_session():
+    status counts, by type, by priority, resolution time (sum/count) and
+    per-pilot resolutions. The store applies the effect of its own writes;
+    changes made elsewhere (other stores, processes) are picked up when the
+    counters are rebuilt from the database.
+    """
+
+    def __init__(self):
+        """Initialize zeroed counters."""
+        self.pending = 0
+        self.approved = 0
+        self.rejected = 0
+        self.by_type: Dict[str, int] = {}
+        self.by_priority: Dict[str, int] = {}
+        self.resolution_sum = 0.0
+        self.resolution_count = 0
+        self.by_pilot: Dict[str, int] = {}
+        self._top_pilots: Optional[List[Dict[str, Any]]] = None
+
+    @classmethod
+    def from_session(cls, session: Session) -> "InterventionMetricsCounters":
+        """
+        Rebuild the counters with aggregate queries.
+
+        Args:
+            session: SQLAlchemy Session
+
+        Returns:
+            InterventionMetricsCounters matching the database
+        """
+        counters = cls()
+
+        # Count by status (pending only from active table)
+        counters.pending = session.query(func.count(Intervention.id)).filter(
+            Intervention.status == "PENDING"
+        ).scalar() or 0
+
+        # Count from history (completed requests)
+        history_status = dict(
+            session.query(InterventionHistory.status, func.count(InterventionHistory.id))
+            .filter(InterventionHistory.status.in_(("APPROVED", "REJECTED")))
+            .group_by(InterventionHistory.status)
+            .all()
+        )
+        counters.approved = history_status.get("APPROVED", 0)
+        counters.rejected = history_status.get("REJECTED", 0)
+
+        # By type / priority (from active interventions)
+        counters.by_type = dict(
+            session.query(Intervention.intervention_type, func.count(Intervention.id))
+            .group_by(Intervention.intervention_type)
+            .all()
+        )
+        counters.by_priority = dict(
+            session.query(Intervention.priority, func.count(Intervention.id))
+            .group_by(Intervention.priority)
+            .all()
+        )
+
+        # Resolution time as sum/count so it can be updated incrementally
+        resolution_sum, resolution_count = session.query(
+            func.sum(InterventionHistory.resolution_time_seconds),
+            func.count(InterventionHistory.resolution_time_seconds),
+        ).one()
+        counters.resolution_sum = float(resolution_sum or 0.0)
+        counters.resolution_count = resolution_count or 0
+
+        # Resolutions per pilot
+        counters.by_pilot = dict(
+            session.query(InterventionHistory.assigned_to, func.count(InterventionHistory.id))
+            .filter(InterventionHistory.assigned_to.isnot(None))
+            .group_by(InterventionHistory.assigned_to)
+            .all()
+        )
+        return counters
+
+    def on_created(self, intervention_type: str, priority: str) -> None:
+        """Account for a new PENDING intervention."""
+        self.pending += 1
+        self.by_type[intervention_type] = self.by_type.get(intervention_type, 0) + 1
+        self.by_priority[priority] = self.by_priority.get(priority, 0) + 1
+
+    def on_status_changed(self, old_status: str, new_status: str) -> None:
+        """Account for an intervention moving between statuses."""
+        if old_status == "PENDING" and new_status != "PENDING":
+            self.pending -= 1
+        elif new_status == "PENDING" and old_status != "PENDING":
+            self.pending += 1
+
+    def on_archived(
+        self, status: str, resolution_seconds: Optional[float], assigned_to: Optional[str]
+    ) -> None:
+        """Account for a new InterventionHistory row."""
+        if status == "APPROVED":
+            self.approved += 1
+        elif status == "REJECTED":
+            self.rejected += 1
+        if resolution_seconds is not None:
+            self.resolution_sum += resolution_seconds
+            self.resolution_count += 1
+        if assigned_to:
+            self.by_pilot[assigned_to] = self.by_pilot.get(assigned_to, 0) + 1
+            self._top_pilots = None
+
+    def to_metrics(self) -> DashboardMetrics:
+        """
+        Build DashboardMetrics from the counters.
+
+        Returns:
+            DashboardMetrics (fresh dicts; safe for callers to mutate)
+        """
+        if self._top_pilots is None:
+            self._top_pilots = [
+                {"pilot_id": pilot_id, "interventions": count}
+                for pilot_id, count in heapq.nlargest(
+                    10, self.by_pilot.items(), key=lambda item: item[1]
+                )
+            ]
+        return DashboardMetrics(
+            total_interventions=self.pending + self.approved + self.rejected,
+            pending_interventions=self.pending,
+            approved_interventions=self.approved,
+            rejected_interventions=self.rejected,
+            avg_resolution_time_seconds=(
+                self.resolution_sum / self.resolution_count if self.resolution_count else 0.0
+            ),
+            by_type=dict(self.by_type),
+            by_priority=dict(self.by_priority),
+            top_pilots=[dict(pilot) for pilot in self._top_pilots],
+        )
 
 
 class InterventionStoreSQLAlchemy:
@@ -31,16 +176,43 @@ class InterventionStoreSQLAlchemy:
     SQLAlchemy-backed implementation of InterventionStore.
     
     Provides persistence while maintaining compatibility with the Phase 2 in-memory API.
+    
+    Given a session factory (e.g. Phase3DatabaseManager.SessionLocal), every
+    operation runs in its own session that is closed before returning, so the
+    store is safe to share between concurrent requests and WebSockets and
+    connections go back to the pool between operations. Given a Session, all
+    operations use that session (single-threaded callers and tests).
+    
+    Example:
+        store = InterventionStoreSQLAlchemy(phase3_db_manager.SessionLocal)
     """
 
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Union[Session, Callable[[], Session]],
+        metrics_max_age_seconds: float = 30.0,
+    ):
         """
-        Initialize with database session.
+        Initialize with a session factory or a database session.
         
         Args:
-            session: SQLAlchemy Session for database operations
+            session: Session factory (sessionmaker or any callable returning a
+                Session) for per-operation sessions, or a SQLAlchemy Session
+                to use for every operation
+            metrics_max_age_seconds: How stale get_metrics may be with respect to
+                writes made outside this store (0 = recompute on every call)
         """
-        self.session = session
+        if isinstance(session, Session):
+            self.session: Optional[Session] = session
+            self.session_factory: Optional[Callable[[], Session]] = None
+        else:
+            self.session = None
+            self.session_factory = session
+        self.metrics_max_age_seconds = metrics_max_age_seconds
+
+        self._metrics_lock = threading.Lock()
+        self._metrics: Optional[InterventionMetricsCounters] = None
+        self._metrics_refreshed_at = 0.0
 
     # ========================================================================
     # CRUD Operations
@@ -95,6 +267,7 @@ class InterventionStoreSQLAlchemy:
             ),
             status="PENDING",
             priority=priority,
+            priority_rank=rank_for_priority(priority),
             title=title,
             description=description,
             context=context or {},
@@ -103,10 +276,17 @@ class InterventionStoreSQLAlchemy:
             created_at=now_naive,
         )
 
-        self.session.add(db_intervention)
-        self.session.commit()
+        with self._session_scope() as session:
+            session.add(db_intervention)
+            session.commit()
+            request = self._db_to_request(db_intervention)
+
+        with self._metrics_lock:
+            if self._metrics is not None:
+                self._metrics.on_created(request.intervention_type.value, priority)
 
-        return self._db_to_request(db_intervention)
+        get_intervention_hub().publish_created(request)
+        return request
 
     def get_request(self, request_id: str) -> Optional[InterventionRequest]:
         """
@@ -118,14 +298,43 @@ class InterventionStoreSQLAlchemy:
         Returns:
             InterventionRequest or None if not found
         """
-        db_intervention = self.session.query(Intervention).filter(
-            Intervention.request_id == request_id
-        ).first()
+        with self._session_scope() as session:
+            db_intervention = session.query(Intervention).filter(
+                Intervention.request_id == request_id
+            ).first()
 
-        if not db_intervention:
-            return None
+            if not db_intervention:
+                return None
 
-        return self._db_to_request(db_intervention)
+            return self._db_to_request(db_intervention)
+
+    def get_open_requests(self, request_ids: List[str]) -> List[InterventionRequest]:
+        """
+        Get the requests among request_ids that are not yet archived.
+        
+        One SELECT for the whole list, matching the rows update_requests_bulk
+        would update.
+        
+        Args:
+            request_ids: Request IDs to retrieve
+        
+        Returns:
+            InterventionRequest list, in request_ids order
+        """
+        request_ids = list(dict.fromkeys(request_ids))
+        if not request_ids:
+            return []
+
+        with self._session_scope() as session:
+            rows = session.query(Intervention).filter(
+                and_(
+                    Intervention.request_id.in_(request_ids),
+                    Intervention.is_archived == False,
+                )
+            ).all()
+            by_id = {row.request_id: self._db_to_request(row) for row in rows}
+
+        return [by_id[request_id] for request_id in request_ids if request_id in by_id]
 
     def update_request(
         self,
@@ -146,54 +355,190 @@ class InterventionStoreSQLAlchemy:
         Returns:
             Updated InterventionRequest or None
         """
-        db_intervention = self.session.query(Intervention).filter(
-            Intervention.request_id == request_id
-        ).first()
+        with self._session_scope() as session:
+            db_intervention = session.query(Intervention).filter(
+                Intervention.request_id == request_id
+            ).first()
+
+            if not db_intervention:
+                return None
+
+            now = datetime.now(timezone.utc)
+            now_naive = now.replace(tzinfo=None)
+            old_status = db_intervention.status
+            old_assigned_to = db_intervention.assigned_to
+            db_intervention.status = (
+                status.value if isinstance(status, InterventionStatus) else status
+            )
+            db_intervention.updated_at = now_naive
+            db_intervention.action_reason = action_reason
+            db_intervention.action_timestamp = now_naive
+
+            if assigned_to:
+                db_intervention.assigned_to = assigned_to
+
+            # Move to history if terminal state
+            history = None
+            if status in [
+                InterventionStatus.APPROVED,
+                InterventionStatus.REJECTED,
+                InterventionStatus.COMPLETED,
+            ]:
+                # Create history record
+                resolution_seconds = None
+                if db_intervention.created_at:
+                    resolution_seconds = (now_naive - db_intervention.created_at).total_seconds()
+                
+                history = InterventionHistory(
+                    request_id=db_intervention.request_id,
+                    uow_id=db_intervention.uow_id,
+                    status=db_intervention.status,
+                    priority=db_intervention.priority,
+                    created_at=db_intervention.created_at,
+                    completed_at=now_naive,
+                    resolution_time_seconds=resolution_seconds,
+                    assigned_to=assigned_to,
+                    action_reason=action_reason,
+                )
+                session.add(history)
 
-        if not db_intervention:
-            return None
+                # Mark as archived
+                db_intervention.is_archived = True
 
-        now = datetime.now(timezone.utc)
-        now_naive = now.replace(tzinfo=None)
-        db_intervention.status = (
-            status.value if isinstance(status, InterventionStatus) else status
-        )
-        db_intervention.updated_at = now_naive
-        db_intervention.action_reason = action_reason
-        db_intervention.action_timestamp = now_naive
+            session.commit()
+            request = self._db_to_request(db_intervention)
 
-        if assigned_to:
-            db_intervention.assigned_to = assigned_to
+        with self._metrics_lock:
+            if self._metrics is not None:
+                self._metrics.on_status_changed(old_status, request.status.value)
+                if history is not None:
+                    self._metrics.on_archived(request.status.value, resolution_seconds, assigned_to)
 
-        # Move to history if terminal state
-        if status in [
+        get_intervention_hub().publish_updated(request, old_assigned_to)
+        return request
+
+    def update_requests_bulk(
+        self,
+        request_ids: List[str],
+        status: InterventionStatus,
+        action_reason: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+    ) -> List[InterventionRequest]:
+        """
+        Update many intervention requests in one transaction.
+        
+        Same effect as update_request on each ID, applied set-wise: one
+        SELECT ... FOR UPDATE of the affected rows, one UPDATE, and (for
+        terminal statuses) one multi-row INSERT into InterventionHistory,
+        committed together. Where the dialect supports UPDATE ... RETURNING,
+        only the rows the UPDATE actually changed are returned and archived,
+        so a request archived concurrently between the SELECT and the UPDATE
+        is not written to history twice. Requests that do not exist or are
+        already archived are skipped.
+        
+        Args:
+            request_ids: Request IDs to update
+            status: New status
+            action_reason: Reason for action
+            assigned_to: Assigned pilot ID
+        
+        Returns:
+            Updated InterventionRequest list, in request_ids order
+        """
+        request_ids = list(dict.fromkeys(request_ids))
+        if not request_ids:
+            return []
+
+        now_naive = datetime.now(timezone.utc).replace(tzinfo=None)
+        status_value = status.value if isinstance(status, InterventionStatus) else status
+        terminal = status in [
             InterventionStatus.APPROVED,
             InterventionStatus.REJECTED,
             InterventionStatus.COMPLETED,
-        ]:
-            # Create history record
-            resolution_seconds = None
-            if db_intervention.created_at:
-                resolution_seconds = (now_naive - db_intervention.created_at).total_seconds()
-            
-            history = InterventionHistory(
-                request_id=db_intervention.request_id,
-                uow_id=db_intervention.uow_id,
-                status=db_intervention.status,
-                priority=db_intervention.priority,
-                created_at=db_intervention.created_at,
-                completed_at=now_naive,
-                resolution_time_seconds=resolution_seconds,
-                assigned_to=assigned_to,
-                action_reason=action_reason,
-            )
-            self.session.add(history)
-
-            # Mark as archived
-            db_intervention.is_archived = True
+        ]
+        criteria = and_(
+            Intervention.request_id.in_(request_ids),
+            Intervention.is_archived == False,
+        )
 
-        self.session.commit()
-        return self._db_to_request(db_intervention)
+        with self._session_scope() as session:
+            # FOR UPDATE (where supported) keeps a concurrent update_request
+            # from archiving a selected row before the UPDATE below
+            db_interventions = session.query(Intervention).filter(criteria).with_for_update().all()
+            if not db_interventions:
+                return []
+            old_statuses = {row.request_id: row.status for row in db_interventions}
+            old_assignees = {row.request_id: row.assigned_to for row in db_interventions}
+
+            values = {
+                Intervention.status: status_value,
+                Intervention.updated_at: now_naive,
+                Intervention.action_reason: action_reason,
+                Intervention.action_timestamp: now_naive,
+            }
+            if assigned_to:
+                values[Intervention.assigned_to] = assigned_to
+            if terminal:
+                values[Intervention.is_archived] = True
+            # "evaluate" applies the same change to the loaded objects, so
+            # the returned requests need no re-select
+            statement = (
+                update(Intervention)
+                .where(criteria)
+                .values(values)
+                .execution_options(synchronize_session="evaluate")
+            )
+            if session.get_bind().dialect.update_returning:
+                # Only rows the UPDATE actually changed get history and metrics
+                changed = set(
+                    session.execute(statement.returning(Intervention.request_id)).scalars()
+                )
+                db_interventions = [row for row in db_interventions if row.request_id in changed]
+                old_statuses = {rid: old for rid, old in old_statuses.items() if rid in changed}
+            else:
+                session.execute(statement)
+
+            history_rows = []
+            if terminal:
+                history_rows = [
+                    {
+                        "request_id": row.request_id,
+                        "uow_id": row.uow_id,
+                        "status": status_value,
+                        "priority": row.priority,
+                        "created_at": row.created_at,
+                        "completed_at": now_naive,
+                        "resolution_time_seconds": (
+                            (now_naive - row.created_at).total_seconds()
+                            if row.created_at else None
+                        ),
+                        "assigned_to": assigned_to,
+                        "action_reason": action_reason,
+                    }
+                    for row in db_interventions
+                ]
+                session.execute(insert(InterventionHistory), history_rows)
+
+            order = {request_id: i for i, request_id in enumerate(request_ids)}
+            requests = sorted(
+                (self._db_to_request(row) for row in db_interventions),
+                key=lambda request: order[request.request_id],
+            )
+            session.commit()
+
+        with self._metrics_lock:
+            if self._metrics is not None:
+                for old_status in old_statuses.values():
+                    self._metrics.on_status_changed(old_status, status_value)
+                for history in history_rows:
+                    self._metrics.on_archived(
+                        status_value, history["resolution_time_seconds"], assigned_to
+                    )
+
+        hub = get_intervention_hub()
+        for request in requests:
+            hub.publish_updated(request, old_assignees[request.request_id])
+        return requests
 
     # ========================================================================
     # Query Operations
@@ -203,43 +548,97 @@ class InterventionStoreSQLAlchemy:
         self,
         pilot_id: Optional[str] = None,
         limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[int, datetime, str]] = None,
     ) -> List[InterventionRequest]:
         """
         Get pending intervention requests.
         
+        Ordered by (priority_rank, created_at, request_id) in SQL, which the
+        (status, priority_rank, created_at, request_id) index serves directly.
+        Pass the decoded cursor of the last request of a page as ``after``
+        (see encode_pending_cursor) to page at constant cost; ``offset`` is
+        supported for compatibility.
+        
         Args:
             pilot_id: Filter by assigned pilot (None = all)
             limit: Maximum results to return
+            offset: Rows to skip (after the cursor, if any)
+            after: Optional (priority_rank, created_at, request_id) cursor;
+                   only requests strictly after it are returned
         
         Returns:
             List of pending InterventionRequest (sorted by priority, then age)
         """
-        query = self.session.query(Intervention).filter(
-            and_(
-                Intervention.status == "PENDING",
-                Intervention.is_archived == False,
+        with self._session_scope() as session:
+            query = session.query(Intervention).filter(
+                and_(
+                    Intervention.status == "PENDING",
+                    Intervention.is_archived == False,
+                )
             )
-        )
 
-        if pilot_id:
-            query = query.filter(Intervention.assigned_to == pilot_id)
-
-        # Sort by priority (critical first) then by created_at (oldest first)
-        priority_order = {"critical": 0, "high": 1, "normal": 2, "low": 3}
+            if pilot_id:
+                query = query.filter(Intervention.assigned_to == pilot_id)
+
+            if after is not None:
+                after_rank, after_created_at, after_request_id = after
+                # Expanded row-value comparison (portable across dialects)
+                query = query.filter(or_(
+                    Intervention.priority_rank > after_rank,
+                    and_(
+                        Intervention.priority_rank == after_rank,
+                        or_(
+                            Intervention.created_at > after_created_at,
+                            and_(
+                                Intervention.created_at == after_created_at,
+                                Intervention.request_id > after_request_id,
+                            ),
+                        ),
+                    ),
+                ))
+
+            db_interventions = (
+                query.order_by(
+                    Intervention.priority_rank.asc(),
+                    Intervention.created_at.asc(),
+                    Intervention.request_id.asc(),
+                )
+                .offset(offset)
+                .limit(limit)
+                .all()
+            )
 
-        db_interventions = query.all()
+            return [self._db_to_request(db_int) for db_int in db_interventions]
 
-        # Python-side sorting for priority
-        db_interventions.sort(
-            key=lambda r: (
-                priority_order.get(r.priority, 999),
-                r.created_at or datetime.now(timezone.utc),
-            )
-        )
+    @staticmethod
+    def encode_pending_cursor(request: InterventionRequest) -> str:
+        """
+        Encode the keyset cursor pointing just after a pending request.
+        
+        Args:
+            request: Last request of a page
+        
+        Returns:
+            Opaque URL-safe cursor string
+        """
+        raw = f"{rank_for_priority(request.priority)}|{request.created_at}|{request.request_id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
 
-        return [
-            self._db_to_request(db_int) for db_int in db_interventions[:limit]
-        ]
+    @staticmethod
+    def decode_pending_cursor(cursor: str) -> Tuple[int, datetime, str]:
+        """
+        Decode a cursor produced by encode_pending_cursor.
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            rank, created_at, request_id = raw.split("|", 2)
+            return int(rank), datetime.fromisoformat(created_at), request_id
+        except Exception as e:
+            raise ValueError(f"Invalid pending cursor: {cursor}") from e
 
     def get_requests_by_status(
         self,
@@ -258,20 +657,21 @@ class InterventionStoreSQLAlchemy:
         Returns:
             List of InterventionRequest matching status
         """
-        db_interventions = (
-            self.session.query(Intervention)
-            .filter(
-                Intervention.status == (
-                    status.value if isinstance(status, InterventionStatus) else status
+        with self._session_scope() as session:
+            db_interventions = (
+                session.query(Intervention)
+                .filter(
+                    Intervention.status == (
+                        status.value if isinstance(status, InterventionStatus) else status
+                    )
                 )
+                .order_by(Intervention.created_at.desc())
+                .offset(offset)
+                .limit(limit)
+                .all()
             )
-            .order_by(Intervention.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
-        )
 
-        return [self._db_to_request(db_int) for db_int in db_interventions]
+            return [self._db_to_request(db_int) for db_int in db_interventions]
 
     def get_requests_by_priority(
         self,
@@ -288,15 +688,16 @@ class InterventionStoreSQLAlchemy:
         Returns:
             List of InterventionRequest with matching priority
         """
-        db_interventions = (
-            self.session.query(Intervention)
-            .filter(Intervention.priority == priority)
-            .order_by(Intervention.created_at.desc())
-            .limit(limit)
-            .all()
-        )
+        with self._session_scope() as session:
+            db_interventions = (
+                session.query(Intervention)
+                .filter(Intervention.priority == priority)
+                .order_by(Intervention.created_at.desc())
+                .limit(limit)
+                .all()
+            )
 
-        return [self._db_to_request(db_int) for db_int in db_interventions]
+            return [self._db_to_request(db_int) for db_int in db_interventions]
 
     def get_requests_by_pilot(
         self,
@@ -315,24 +716,25 @@ class InterventionStoreSQLAlchemy:
         Returns:
             List of InterventionRequest assigned to pilot
         """
-        query = self.session.query(Intervention).filter(
-            Intervention.assigned_to == pilot_id
-        )
+        with self._session_scope() as session:
+            query = session.query(Intervention).filter(
+                Intervention.assigned_to == pilot_id
+            )
 
-        if status:
-            query = query.filter(
-                Intervention.status == (
-                    status.value if isinstance(status, InterventionStatus) else status
+            if status:
+                query = query.filter(
+                    Intervention.status == (
+                        status.value if isinstance(status, InterventionStatus) else status
+                    )
                 )
-            )
 
-        db_interventions = (
-            query.order_by(Intervention.created_at.desc())
-            .limit(limit)
-            .all()
-        )
+            db_interventions = (
+                query.order_by(Intervention.created_at.desc())
+                .limit(limit)
+                .all()
+            )
 
-        return [self._db_to_request(db_int) for db_int in db_interventions]
+            return [self._db_to_request(db_int) for db_int in db_interventions]
 
     # ========================================================================
     # Metrics and Analytics
@@ -340,83 +742,39 @@ class InterventionStoreSQLAlchemy:
 
     def get_metrics(self) -> DashboardMetrics:
         """
-        Calculate dashboard metrics from persisted data.
+        Get dashboard metrics.
+        
+        Served from counters that this store updates on every write, so a
+        call does not query the database. The counters are rebuilt from the
+        database once they are older than metrics_max_age_seconds, which
+        bounds how long writes made by other stores/processes go unseen.
         
         Returns:
             DashboardMetrics with aggregated statistics
         """
-        # Count by status (pending only from active table)
-        pending_count = self.session.query(func.count(Intervention.id)).filter(
-            Intervention.status == "PENDING"
-        ).scalar() or 0
-
-        # Count from history (completed requests)
-        approved_count = self.session.query(func.count(InterventionHistory.id)).filter(
-            InterventionHistory.status == "APPROVED"
-        ).scalar() or 0
-
-        rejected_count = self.session.query(func.count(InterventionHistory.id)).filter(
-            InterventionHistory.status == "REJECTED"
-        ).scalar() or 0
-
-        total = pending_count + approved_count + rejected_count
-
-        # By type (from active interventions)
-        by_type_query = (
-            self.session.query(
-                Intervention.intervention_type, func.count(Intervention.id)
-            )
-            .group_by(Intervention.intervention_type)
-            .all()
-        )
-        by_type = {type_name: count for type_name, count in by_type_query}
-
-        # By priority (from active interventions)
-        by_priority_query = (
-            self.session.query(Intervention.priority, func.count(Intervention.id))
-            .group_by(Intervention.priority)
-            .all()
-        )
-        by_priority = {priority: count for priority, count in by_priority_query}
-
-        # Calculate average resolution time
-        avg_resolution = (
-            self.session.query(func.avg(InterventionHistory.resolution_time_seconds))
-            .scalar()
-        )
-        avg_resolution_seconds = float(avg_resolution) if avg_resolution else 0.0
-
-        # Top pilots (by number of resolved interventions)
-        top_pilots_query = (
-            self.session.query(
-                InterventionHistory.assigned_to,
-                func.count(InterventionHistory.id).label("intervention_count"),
-            )
-            .filter(InterventionHistory.assigned_to.isnot(None))
-            .group_by(InterventionHistory.assigned_to)
-            .order_by(func.count(InterventionHistory.id).desc())
-            .limit(10)
-            .all()
-        )
-
-        top_pilots = [
-            {
-                "pilot_id": pilot_id,
-                "interventions": count,
-            }
-            for pilot_id, count in top_pilots_query
-        ]
+        with self._metrics_lock:
+            if (
+                self._metrics is None
+                or time.monotonic() - self._metrics_refreshed_at >= self.metrics_max_age_seconds
+            ):
+                self._refresh_metrics_locked()
+            return self._metrics.to_metrics()
+
+    def refresh_metrics(self) -> DashboardMetrics:
+        """
+        Rebuild the metrics counters from the database now.
+        
+        Returns:
+            DashboardMetrics with aggregated statistics
+        """
+        with self._metrics_lock:
+            self._refresh_metrics_locked()
+            return self._metrics.to_metrics()
 
-        return DashboardMetrics(
-            total_interventions=total,
-            pending_interventions=pending_count,
-            approved_interventions=approved_count,
-            rejected_interventions=rejected_count,
-            avg_resolution_time_seconds=avg_resolution_seconds,
-            by_type=by_type,
-            by_priority=by_priority,
-            top_pilots=top_pilots,
-        )
+    def _refresh_metrics_locked(self) -> None:
+        with self._session_scope() as session:
+            self._metrics = InterventionMetricsCounters.from_session(session)
+        self._metrics_refreshed_at = time.monotonic()
 
     # ========================================================================
     # Bulk Operations
@@ -432,21 +790,24 @@ class InterventionStoreSQLAlchemy:
         now = datetime.now(timezone.utc)
         now_naive = now.replace(tzinfo=None)
 
-        expired = self.session.query(Intervention).filter(
-            and_(
-                Intervention.expires_at.isnot(None),
-                Intervention.expires_at <= now_naive,
-                Intervention.status == "PENDING",
+        with self._session_scope() as session:
+            # One UPDATE statement, however many requests have expired
+            count = session.query(Intervention).filter(
+                and_(
+                    Intervention.expires_at.isnot(None),
+                    Intervention.expires_at <= now_naive,
+                    Intervention.status == "PENDING",
+                )
+            ).update(
+                {Intervention.status: "EXPIRED", Intervention.updated_at: now_naive},
+                synchronize_session="evaluate",
             )
-        ).all()
 
-        count = 0
-        for intervention in expired:
-            intervention.status = "EXPIRED"
-            intervention.updated_at = now_naive
-            count += 1
+            session.commit()
 
-        self.session.commit()
+        with self._metrics_lock:
+            if self._metrics is not None:
+                self._metrics.pending -= count
         return count
 
     def clear_archived(self, days: int = 90) -> int:
@@ -461,19 +822,50 @@ class InterventionStoreSQLAlchemy:
         """
         cutoff_date = (datetime.now(timezone.utc) - timedelta(days=days)).replace(tzinfo=None)
 
-        count = (
-            self.session.query(InterventionHistory)
-            .filter(InterventionHistory.archived_at < cutoff_date)
-            .delete()
-        )
+        with self._session_scope() as session:
+            count = (
+                session.query(InterventionHistory)
+                .filter(InterventionHistory.archived_at < cutoff_date)
+                .delete()
+            )
+
+            session.commit()
 
-        self.session.commit()
+        if count:
+            # History rows feed several counters; rebuild on next read
+            with self._metrics_lock:
+                self._metrics = None
         return count
 
     # ========================================================================
     # Helper Methods
     # ========================================================================
 
+    @contextmanager
+    def _session_scope(self) -> Iterator[Session]:
+        """
+        Session for one store operation.
+        
+        With a session factory, a new session is opened and always closed
+        (rolled back if the operation raised). With a shared Session, that
+        session is yielded unchanged.
+        
+        Yields:
+            SQLAlchemy Session
+        """
+        if self.session_factory is None:
+            yield self.session
+            return
+
+        session = self.session_factory()
+        try:
+            yield session
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
     def _db_to_request(self, db_intervention: Intervention) -> InterventionRequest:
         """
         Convert database model to InterventionRequest dataclass.
@@ -509,4 +901,4 @@ class InterventionStoreSQLAlchemy:
         )
 
 
-__all__ = ["InterventionStoreSQLAlchemy"]
+__all__ = ["InterventionStoreSQLAlchemy", "InterventionMetricsCounters"]
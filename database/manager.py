@@ -13,6 +13,7 @@ from contextlib import contextmanager
 
 from .models_template import TemplateBase
 from .models_instance import InstanceBase
+from .history_writer import HistoryWAL, HistoryWriter
 
 
 class DatabaseManager:
@@ -43,6 +44,8 @@ class DatabaseManager:
         self._instance_engine: Optional[Engine] = None
         self._template_session_factory: Optional[sessionmaker] = None
         self._instance_session_factory: Optional[sessionmaker] = None
+        self._history_flush_size: Optional[int] = None
+        self._history_wal: Optional[HistoryWAL] = None
         self._echo = echo
 
         if template_url:
@@ -93,6 +96,25 @@ class DatabaseManager:
             raise RuntimeError("Instance engine not initialized. Call initialize_instance_engine() first.")
         return self._instance_engine
 
+    def enable_history_writer(self, flush_size: int = 500, wal: Optional[HistoryWAL] = None) -> None:
+        """
+        Attach a write-behind HistoryWriter to every instance session.
+
+        Args:
+            flush_size: Buffered history rows per bulk INSERT
+            wal: Optional write-ahead log; history then reaches the database
+                 only when the WAL is drained (see HistoryWAL.drain)
+        """
+        if flush_size <= 0:
+            raise ValueError("flush_size must be positive")
+        self._history_flush_size = flush_size
+        self._history_wal = wal
+
+    @property
+    def history_wal(self) -> Optional[HistoryWAL]:
+        """The write-ahead log instance sessions write history to, if any."""
+        return self._history_wal
+
     @contextmanager
     def get_template_session(self) -> Generator[Session, None, None]:
         """
@@ -132,6 +154,8 @@ class DatabaseManager:
             raise RuntimeError("Instance engine not initialized. Call initialize_instance_engine() first.")
 
         session = self._instance_session_factory()
+        if self._history_flush_size is not None:
+            HistoryWriter.attach(session, flush_size=self._history_flush_size, wal=self._history_wal)
         try:
             yield session
             session.commit()
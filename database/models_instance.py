@@ -10,7 +10,7 @@ All tables use InstanceBase to ensure complete isolation from template models.
 
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, Text, Integer, BigInteger, DateTime, Boolean, ForeignKey, JSON, UniqueConstraint
+from sqlalchemy import Column, String, Text, Integer, BigInteger, DateTime, Boolean, ForeignKey, JSON, UniqueConstraint, Index
 from sqlalchemy.types import TypeDecorator, CHAR
 from sqlalchemy.dialects.postgresql import UUID as PostgreSQL_UUID
 from sqlalchemy.orm import declarative_base, relationship
@@ -665,6 +665,12 @@ class UnitsOfWork(InstanceBase):
         nullable=False,
         comment="Total children completed (Optimization for Cerberus)."
     )
+    failed_child_count = Column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Total children failed via the Ate Path (settled for Cerberus, not completed)."
+    )
     last_heartbeat = Column(
         DateTime(timezone=True),
         nullable=True,
@@ -684,6 +690,16 @@ class UnitsOfWork(InstanceBase):
         nullable=True,
         comment="X-Content-Hash (SHA256) of the UOW attributes at last state. Used for state verification."
     )
+    content_digests = Column(
+        JSON,
+        nullable=True,
+        comment="Per-key digest cache for the incremental X-Content-Hash (key -> {ref, digest}). NULL for legacy full-JSON hashes."
+    )
+    inherited_versions = Column(
+        JSON,
+        nullable=True,
+        comment="Parent attribute versions pinned at decomposition (key -> version). NULL resolves the parent's latest attributes."
+    )
     last_heartbeat_at = Column(
         DateTime(timezone=True),
         nullable=True,
@@ -747,9 +763,14 @@ class UnitsOfWorkHistory(InstanceBase):
     state drift detection via X-Content-Hash verification.
     """
     __tablename__ = "uow_history"
-    __table_args__ = {
-        "comment": "Append-only historical ledger of UOW state transitions with X-Content-Hash tracking."
-    }
+    __table_args__ = (
+        # Keyset pagination: (timestamp, history_id) cursors per UOW and per instance
+        Index('ix_uow_history_uow_ts', 'uow_id', 'transition_timestamp', 'history_id'),
+        Index('ix_uow_history_instance_ts', 'instance_id', 'transition_timestamp', 'history_id'),
+        {
+            "comment": "Append-only historical ledger of UOW state transitions with X-Content-Hash tracking."
+        }
+    )
 
     history_id = Column(
         UUID(),
@@ -925,8 +946,11 @@ class Interaction_Logs(InstanceBase):
         "comment": "The immutable ledger of every movement in the system with telemetry support."
     }
 
+    # BIGINT on server databases; INTEGER on SQLite, where only an
+    # "INTEGER PRIMARY KEY" column aliases the rowid and autoincrements.
+    # Database-assigned keys let telemetry be bulk inserted without ids.
     log_id = Column(
-        BigInteger,
+        BigInteger().with_variant(Integer, "sqlite"),
         primary_key=True,
         autoincrement=True,
         comment="Sequence number."
@@ -946,14 +970,14 @@ class Interaction_Logs(InstanceBase):
     actor_id = Column(
         UUID(),
         ForeignKey("local_actors.actor_id", ondelete="CASCADE"),
-        nullable=False,
-        comment="The actor responsible."
+        nullable=True,
+        comment="The actor responsible (NULL for system events such as zombie reclamation)."
     )
     role_id = Column(
         UUID(),
         ForeignKey("local_roles.role_id", ondelete="CASCADE"),
-        nullable=False,
-        comment="The active role context."
+        nullable=True,
+        comment="The active role context (NULL when not known, e.g. on submit)."
     )
     interaction_id = Column(
         UUID(),
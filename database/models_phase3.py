@@ -29,6 +29,19 @@ from sqlalchemy.orm import sessionmaker, Session
 # Create declarative base for Phase 3 models
 Phase3Base = declarative_base()
 
+# Pending requests are served critical first; unknown priorities sort last
+PRIORITY_RANKS = {"critical": 0, "high": 1, "normal": 2, "low": 3}
+UNKNOWN_PRIORITY_RANK = 999
+
+
+def rank_for_priority(priority: Optional[str]) -> int:
+    """Sort rank of a priority level (lower is served first)."""
+    return PRIORITY_RANKS.get(priority, UNKNOWN_PRIORITY_RANK)
+
+
+def _default_priority_rank(context) -> int:
+    return rank_for_priority(context.get_current_parameters().get("priority"))
+
 
 class Intervention(Phase3Base):
     """
@@ -47,6 +60,8 @@ class Intervention(Phase3Base):
         Index("idx_created_at", "created_at"),
         Index("idx_expires_at", "expires_at"),
         Index("idx_assigned_to", "assigned_to"),
+        # Pending queue order: get_pending_requests keyset pagination
+        Index("idx_status_priority_rank_created", "status", "priority_rank", "created_at", "request_id"),
     )
 
     # Primary key
@@ -74,6 +89,12 @@ class Intervention(Phase3Base):
         default="normal",
         comment="Priority level: critical, high, normal, low",
     )
+    priority_rank = Column(
+        Integer,
+        nullable=False,
+        default=_default_priority_rank,
+        comment="Sort rank derived from priority (critical=0 ... low=3)",
+    )
 
     # Request content
     title = Column(String(255), nullable=False, comment="Human-readable title")
@@ -219,19 +240,35 @@ class InterventionHistory(Phase3Base):
 class Phase3DatabaseManager:
     """Manages Phase 3 intervention database connections."""
 
-    def __init__(self, database_url: str = "sqlite:///interventions.db"):
+    def __init__(
+        self,
+        database_url: str = "sqlite:///interventions.db",
+        pool_size: int = 10,
+        max_overflow: int = 20,
+        pool_timeout: float = 30.0,
+    ):
         """
         Initialize database manager.
         
         Args:
             database_url: SQLAlchemy database URL
+            pool_size: Connections kept open in the pool (server databases only)
+            max_overflow: Extra connections allowed under burst load
+            pool_timeout: Seconds to wait for a free connection before failing
         """
         self.database_url = database_url
-        self.engine = create_engine(
-            database_url,
-            echo=False,
-            connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
-        )
+        if "sqlite" in database_url:
+            # SQLite picks its own pool class (file vs. :memory:); pool sizing
+            # arguments are not accepted by all of them
+            engine_kwargs = {"connect_args": {"check_same_thread": False}}
+        else:
+            engine_kwargs = {
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_timeout": pool_timeout,
+                "pool_pre_ping": True,
+            }
+        self.engine = create_engine(database_url, echo=False, **engine_kwargs)
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
@@ -252,6 +289,8 @@ class Phase3DatabaseManager:
 
 
 __all__ = [
+    "PRIORITY_RANKS",
+    "rank_for_priority",
     "Phase3Base",
     "Intervention",
     "InterventionHistory",
@@ -14,15 +14,22 @@ This service layer provides:
 All operations maintain ACID guarantees and are transaction-safe.
 """
 
+import base64
 import uuid
 import hashlib
+import itertools
 import json
+import logging
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional, List, Union
+from typing import Callable, Deque, Dict, Any, Iterator, Optional, List, Set, Tuple, Union
 from dataclasses import dataclass, field
-from queue import Queue
-from threading import Lock
+from fractions import Fraction
+from collections import deque
+from threading import Event, Thread
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
 from database.models_instance import (
@@ -33,29 +40,72 @@ from database.models_instance import (
     Local_Interactions,
 )
 from database.enums import GuardLayerBypassException, GuardStateDriftException
-from chameleon_workflow_engine.semantic_guard import StateVerifier
+from database.state_hasher import StateHasher
+from database.history_writer import HistoryWriter, flush_pending_history
+from database.history_archive import get_history_reader
+from chameleon_workflow_engine.semantic_guard import ShadowLogEntry, StateVerifier
 from chameleon_workflow_engine.stream_broadcaster import emit
+from chameleon_workflow_engine.interactive_dashboard import (
+    InterventionType,
+    get_intervention_store,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Park state and continuation key for non-blocking Pilot approval
+PILOT_PARK_STATUS = "PENDING_PILOT_APPROVAL"
+PILOT_CONTINUATION_KEY = "pilot_continuation"
+PILOT_DECISION_TIMEOUT_SECONDS = 300
 
 
-@dataclass
 class TelemetryEntry:
     """
     Represents a single telemetry event waiting to be persisted.
     Used by the TelemetryBuffer for high-performance, non-blocking writes.
-    """
-    instance_id: uuid.UUID
-    uow_id: uuid.UUID
-    actor_id: uuid.UUID
-    role_id: uuid.UUID
-    interaction_id: uuid.UUID
-    log_type: str = "TELEMETRY"
-    event_details: Optional[Dict[str, Any]] = None
-    error_metadata: Optional[Dict[str, Any]] = None
-    timestamp: Optional[datetime] = None
 
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now(timezone.utc)
+    A plain __slots__ class rather than a dataclass: one is built per guard
+    decision, so it is kept small and cheap to allocate.
+    """
+    __slots__ = (
+        "instance_id",
+        "uow_id",
+        "actor_id",
+        "role_id",
+        "interaction_id",
+        "log_type",
+        "event_details",
+        "error_metadata",
+        "timestamp",
+    )
+
+    def __init__(
+        self,
+        instance_id: uuid.UUID,
+        uow_id: uuid.UUID,
+        actor_id: Optional[uuid.UUID],
+        role_id: Optional[uuid.UUID],
+        interaction_id: uuid.UUID,
+        log_type: str = "TELEMETRY",
+        event_details: Optional[Dict[str, Any]] = None,
+        error_metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[datetime] = None,
+    ):
+        self.instance_id = instance_id
+        self.uow_id = uow_id
+        self.actor_id = actor_id
+        self.role_id = role_id
+        self.interaction_id = interaction_id
+        self.log_type = log_type
+        self.event_details = event_details
+        self.error_metadata = error_metadata
+        self.timestamp = timestamp if timestamp is not None else datetime.now(timezone.utc)
+
+    def __repr__(self) -> str:
+        return (
+            f"TelemetryEntry(log_type={self.log_type!r}, uow_id={self.uow_id!r}, "
+            f"timestamp={self.timestamp!r})"
+        )
 
 
 @dataclass
@@ -124,8 +174,8 @@ class GuardContext(ABC):
     acts as the supreme filter over all UOW transitions. No transition occurs
     without Guard authorization."
     
-    Subclasses must implement authorization, pilot communication, and violation
-    emission to enforce Constitutional compliance.
+    Subclasses must implement authorization and violation emission to enforce
+    Constitutional compliance.
     """
 
     @abstractmethod
@@ -144,29 +194,6 @@ class GuardContext(ABC):
         """
         pass
 
-    @abstractmethod
-    def wait_for_pilot(
-        self, uow_id: uuid.UUID, reason: str, timeout_seconds: int = 300
-    ) -> Dict[str, Any]:
-        """
-        Wait for Pilot (human) approval on a high-risk UOW transition.
-        
-        Used for transitions marked as requiring manual approval.
-        
-        Args:
-            uow_id: The UOW requiring approval
-            reason: Human-readable reason for pilot intervention
-            timeout_seconds: Maximum time to wait for response (default 300s)
-        
-        Returns:
-            Dictionary with keys:
-            - approved (bool): Whether pilot approved
-            - waiver_issued (bool): Whether constitutional waiver was issued
-            - waiver_reason (Optional[str]): Reason for waiver if issued
-            - rejection_reason (Optional[str]): Reason for rejection if denied
-        """
-        pass
-
     @abstractmethod
     def emit_violation(self, packet: ViolationPacket) -> None:
         """
@@ -260,13 +287,10 @@ class UOWPersistenceService:
                 f"Guard authorization failed for UOW {uow.uow_id} by actor {actor_id}"
             )
 
-        # 1. Get all current attributes and compute state hash
-        current_attributes = {}
-        for attr in uow.attributes:
-            if attr.key not in current_attributes:
-                current_attributes[attr.key] = attr.value
-
-        new_state_hash = StateVerifier.compute_hash(current_attributes)
+        # 1. Resolve effective attributes (own + inherited) and compute the
+        #    incremental state hash: only keys whose backing row changed since
+        #    the last save are rehashed
+        new_state_hash = UOWPersistenceService._update_content_digests(session, uow)
 
         # 2. Store previous state hash before update
         previous_state_hash = uow.content_hash
@@ -287,7 +311,7 @@ class UOWPersistenceService:
         if (new_status and new_status != previous_status) or \
            (new_interaction_id and new_interaction_id != previous_interaction_id):
             
-            history_entry = UnitsOfWorkHistory(
+            history_values = dict(
                 history_id=uuid.uuid4(),
                 instance_id=uow.instance_id,
                 uow_id=uow.uow_id,
@@ -300,58 +324,14 @@ class UOWPersistenceService:
                 actor_id=actor_id,
                 transition_timestamp=datetime.now(timezone.utc),
                 reasoning=reasoning,
-                metadata=metadata,
+                transition_metadata=metadata,
             )
-            session.add(history_entry)
-
-        # 6. Flush to database (transactional)
-        session.add(uow)
-        session.flush()
-
-        return uow
-        # 1. Get all current attributes and compute state hash
-        current_attributes = {}
-        for attr in uow.attributes:
-            if attr.key not in current_attributes:
-                current_attributes[attr.key] = attr.value
-
-        new_state_hash = StateVerifier.compute_hash(current_attributes)
-
-        # 2. Store previous state hash before update
-        previous_state_hash = uow.content_hash
-        previous_status = uow.status
-        previous_interaction_id = uow.current_interaction_id
-
-        # 3. Update UOW with new state
-        if new_status:
-            uow.status = new_status
-        if new_interaction_id:
-            uow.current_interaction_id = new_interaction_id
-
-        # 4. Update heartbeat and content hash atomically
-        uow.last_heartbeat_at = datetime.now(timezone.utc)
-        uow.content_hash = new_state_hash
-
-        # 5. Create history entry if status or interaction changed
-        if (new_status and new_status != previous_status) or \
-           (new_interaction_id and new_interaction_id != previous_interaction_id):
-            
-            history_entry = UnitsOfWorkHistory(
-                history_id=uuid.uuid4(),
-                instance_id=uow.instance_id,
-                uow_id=uow.uow_id,
-                previous_status=previous_status,
-                new_status=uow.status,
-                previous_state_hash=previous_state_hash,
-                new_state_hash=new_state_hash,
-                previous_interaction_id=previous_interaction_id,
-                new_interaction_id=uow.current_interaction_id,
-                actor_id=actor_id,
-                transition_timestamp=datetime.now(timezone.utc),
-                reasoning=reasoning,
-                metadata=metadata,
-            )
-            session.add(history_entry)
+            # Write-behind batching when a HistoryWriter is attached
+            history_writer = HistoryWriter.for_session(session)
+            if history_writer is not None:
+                history_writer.append(**history_values)
+            else:
+                session.add(UnitsOfWorkHistory(**history_values))
 
         # 6. Flush to database (transactional)
         session.add(uow)
@@ -364,6 +344,7 @@ class UOWPersistenceService:
         session: Session,
         uow_id: uuid.UUID,
         limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
     ) -> List[UnitsOfWorkHistory]:
         """
         Retrieve the complete state transition history for a UOW.
@@ -371,22 +352,345 @@ class UOWPersistenceService:
         Returns entries in chronological order (oldest to newest),
         showing the full audit trail of state changes.
         
+        Pages are keyset-paginated: pass the (transition_timestamp,
+        history_id) of the last entry of a page as ``after`` to get the next
+        one. Served by the (uow_id, transition_timestamp, history_id) index,
+        so every page costs the same regardless of depth (no OFFSET scans).
+        Reads go through the global HistoryReader, so entries already moved
+        to the history archive are merged into the same keyset order.
+        
         Args:
             session: SQLAlchemy session
             uow_id: The UOW ID to get history for
             limit: Optional limit on number of entries to return
+            after: Optional (transition_timestamp, history_id) cursor; only
+                   entries strictly after it are returned
         
         Returns:
             List of UnitsOfWorkHistory entries in chronological order
+            (archived entries are transient objects)
+        """
+        flush_pending_history(session)
+        return get_history_reader().uow_history(session, uow_id, limit=limit, after=after)
+
+    @staticmethod
+    def get_instance_history(
+        session: Session,
+        instance_id: uuid.UUID,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> List[UnitsOfWorkHistory]:
+        """
+        Retrieve the state transition history of every UOW in an instance.
+        
+        Same ordering and keyset pagination as get_uow_history, served by
+        the (instance_id, transition_timestamp, history_id) index.
+        
+        Args:
+            session: SQLAlchemy session
+            instance_id: The instance to get history for
+            limit: Optional limit on number of entries to return
+            after: Optional (transition_timestamp, history_id) cursor
+        
+        Returns:
+            List of UnitsOfWorkHistory entries in chronological order
+        """
+        flush_pending_history(session)
+        return get_history_reader().instance_history(session, instance_id, limit=limit, after=after)
+
+    @staticmethod
+    def encode_history_cursor(entry: UnitsOfWorkHistory) -> str:
+        """
+        Encode the keyset cursor pointing just after a history entry.
+        
+        Args:
+            entry: Last history entry of a page
+        
+        Returns:
+            Opaque URL-safe cursor string
+        """
+        raw = f"{entry.transition_timestamp.isoformat()}|{entry.history_id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_history_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+        """
+        Decode a cursor produced by encode_history_cursor.
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            timestamp, history_id = raw.split("|", 1)
+            return datetime.fromisoformat(timestamp), uuid.UUID(history_id)
+        except Exception as e:
+            raise ValueError(f"Invalid history cursor: {cursor}") from e
+
+    @staticmethod
+    def resolve_attributes(
+        session: Session,
+        uow: UnitsOfWork,
+    ) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """
+        Resolve the effective attribute namespace of a UOW (copy-on-write).
+        
+        Child UOWs created by BETA decomposition do not copy their parent's
+        attributes; they store only the keys they override. Reads walk the
+        parent chain (child -> parent -> grandparent ...) and the nearest layer
+        that defines a key wins. Within a layer the highest version wins.
+        
+        A child pins its parent's attribute versions when it is created
+        (UnitsOfWork.inherited_versions), so the parent layer is read as it
+        was at decomposition: later parent writes and keys the child was not
+        given are invisible to it. Children without a pin read the parent's
+        latest versions.
+        
+        Implements Article III.1 (Attribute Inheritance) without duplicating
+        the Global Blueprint into every child.
+        
+        Args:
+            session: SQLAlchemy session
+            uow: The UOW whose attributes should be resolved
+        
+        Returns:
+            Tuple of (attributes, versions):
+                - attributes: Latest value per key across all layers
+                - versions: Latest version per key owned by this UOW only.
+                  Inherited keys are absent, so the first override in a child
+                  starts the child's own lineage at version 1.
+        """
+        resolved = UOWPersistenceService._resolve_attribute_rows(session, uow)
+
+        attributes = {key: attr.value for key, (_, attr) in resolved.items()}
+        versions = {
+            key: attr.version
+            for key, (depth, attr) in resolved.items()
+            if depth == 0
+        }
+        return attributes, versions
+
+    @staticmethod
+    def resolve_attributes_batch(
+        session: Session,
+        uows: List[UnitsOfWork],
+        keys: Optional[Set[str]] = None,
+    ) -> Dict[uuid.UUID, Dict[str, Any]]:
+        """
+        Resolve the effective attributes of many UOWs with a fixed number of queries.
+
+        Same resolution rules as resolve_attributes (nearest layer wins,
+        then highest pinned version), but the parent chains of the whole batch are
+        walked level by level and all attribute rows are loaded with a
+        single query, optionally restricted to the given keys.
+
+        Args:
+            session: SQLAlchemy session
+            uows: UOWs to resolve
+            keys: Only resolve these attribute keys (None = all keys)
+
+        Returns:
+            Mapping of uow_id -> {key: value}
+        """
+        return UOWPersistenceService.resolve_attributes_by_id(
+            session, {uow.uow_id: uow.parent_id for uow in uows}, keys
+        )
+
+    @staticmethod
+    def resolve_attributes_by_id(
+        session: Session,
+        parents: Dict[uuid.UUID, Optional[uuid.UUID]],
+        keys: Optional[Set[str]] = None,
+    ) -> Dict[uuid.UUID, Dict[str, Any]]:
+        """
+        resolve_attributes_batch for callers holding IDs rather than ORM objects.
+
+        Args:
+            session: SQLAlchemy session
+            parents: Mapping of uow_id -> parent_id for the UOWs to resolve
+            keys: Only resolve these attribute keys (None = all keys)
+
+        Returns:
+            Mapping of uow_id -> {key: value}
         """
-        query = session.query(UnitsOfWorkHistory) \
-            .filter(UnitsOfWorkHistory.uow_id == uow_id) \
-            .order_by(UnitsOfWorkHistory.transition_timestamp.asc())
+        uow_ids = list(parents)
+        parents = dict(parents)
+
+        # Pinned parent versions of every child in the chains
+        pins: Dict[uuid.UUID, Optional[Dict[str, int]]] = {}
+        children = [uow_id for uow_id, parent_id in parents.items() if parent_id is not None]
+        if children:
+            pins.update(
+                session.query(UnitsOfWork.uow_id, UnitsOfWork.inherited_versions)
+                .filter(UnitsOfWork.uow_id.in_(children))
+                .all()
+            )
 
-        if limit:
-            query = query.limit(limit)
+        missing = {p for p in parents.values() if p is not None and p not in parents}
+        while missing:
+            found = session.query(
+                UnitsOfWork.uow_id, UnitsOfWork.parent_id, UnitsOfWork.inherited_versions
+            ).filter(UnitsOfWork.uow_id.in_(missing)).all()
+            for uow_id, parent_id, pinned in found:
+                parents[uow_id] = parent_id
+                pins[uow_id] = pinned
+            for uow_id in missing - {row[0] for row in found}:
+                parents[uow_id] = None  # Dangling parent reference
+            missing = {p for p in parents.values() if p is not None and p not in parents}
+
+        if keys is not None and not keys:
+            return {uow_id: {} for uow_id in uow_ids}
+
+        query = session.query(
+            UOW_Attributes.uow_id, UOW_Attributes.key, UOW_Attributes.version, UOW_Attributes.value
+        ).filter(UOW_Attributes.uow_id.in_(list(parents)))
+        if keys is not None:
+            query = query.filter(UOW_Attributes.key.in_(keys))
+
+        # Every version per (layer, key): children may pin different versions
+        layers: Dict[uuid.UUID, Dict[str, List[Tuple[int, Any]]]] = {}
+        for uow_id, key, version, value in query:
+            layers.setdefault(uow_id, {}).setdefault(key, []).append((version, value))
+
+        resolved: Dict[uuid.UUID, Dict[str, Any]] = {}
+        for uow_id in uow_ids:
+            # Walk the chain from the root down so nearer layers overwrite
+            chain: List[uuid.UUID] = []
+            current: Optional[uuid.UUID] = uow_id
+            while current is not None and current not in chain:
+                chain.append(current)
+                current = parents.get(current)
+            attributes: Dict[str, Any] = {}
+            for depth in range(len(chain) - 1, -1, -1):
+                # A layer is read through the pin of the child directly below it
+                pin = pins.get(chain[depth - 1]) if depth > 0 else None
+                for key, versions in layers.get(chain[depth], {}).items():
+                    visible = [
+                        entry for entry in versions
+                        if pin is None or entry[0] <= pin.get(key, 0)
+                    ]
+                    if visible:
+                        attributes[key] = max(visible, key=lambda entry: entry[0])[1]
+            resolved[uow_id] = attributes
+        return resolved
 
-        return query.all()
+    @staticmethod
+    def _resolve_attribute_rows(
+        session: Session,
+        uow: UnitsOfWork,
+    ) -> Dict[str, Tuple[int, UOW_Attributes]]:
+        """
+        Resolve the winning UOW_Attributes row per key across the parent chain.
+        
+        Returns:
+            Mapping of key -> (layer depth, row); depth 0 is the UOW itself
+        """
+        # Collect the layer chain, nearest first. The identity map makes
+        # parent lookups free for UOWs already loaded in this session.
+        layer_ids: List[uuid.UUID] = []
+        layer_pins: List[Optional[Dict[str, int]]] = [None]
+        current: Optional[UnitsOfWork] = uow
+        while current is not None and current.uow_id not in layer_ids:
+            layer_ids.append(current.uow_id)
+            # The parent layer is read through this UOW's pinned versions
+            layer_pins.append(current.inherited_versions)
+            current = session.get(UnitsOfWork, current.parent_id) if current.parent_id else None
+
+        layer_depth = {layer_id: depth for depth, layer_id in enumerate(layer_ids)}
+
+        rows = (
+            session.query(UOW_Attributes)
+            .filter(UOW_Attributes.uow_id.in_(layer_ids))
+            .all()
+        )
+
+        # Lower depth beats higher version
+        resolved: Dict[str, Tuple[int, UOW_Attributes]] = {}
+        for attr in rows:
+            depth = layer_depth[attr.uow_id]
+            pin = layer_pins[depth]
+            if pin is not None and attr.version > pin.get(attr.key, 0):
+                continue  # Written after the child was created
+            existing = resolved.get(attr.key)
+            if (
+                existing is None
+                or depth < existing[0]
+                or (depth == existing[0] and attr.version > existing[1].version)
+            ):
+                resolved[attr.key] = (depth, attr)
+
+        return resolved
+
+    @staticmethod
+    def _update_content_digests(session: Session, uow: UnitsOfWork) -> str:
+        """
+        Recompute the incremental X-Content-Hash, rehashing only changed keys.
+        
+        The per-key digest cache (uow.content_digests) records which
+        UOW_Attributes row each digest was computed from. Attribute versions
+        are append-only, so a key whose winning row is unchanged keeps its
+        cached digest and only new/overridden keys are serialised and hashed.
+        
+        In-place edits of an existing row (which Article XVII forbids) are not
+        picked up here by design; verify_state_hash recomputes every digest
+        from the stored values and flags them as drift.
+        
+        Args:
+            session: SQLAlchemy session
+            uow: The UOW being saved (content_digests is updated in place)
+        
+        Returns:
+            The new combined content hash
+        """
+        resolved = UOWPersistenceService._resolve_attribute_rows(session, uow)
+        cache = uow.content_digests or {}
+
+        attributes = {}
+        refs = {}
+        changed_keys = []
+        for key, (_, attr) in resolved.items():
+            attributes[key] = attr.value
+            refs[key] = str(attr.attribute_id)
+            if (cache.get(key) or {}).get("ref") != refs[key]:
+                changed_keys.append(key)
+
+        cached_digests = {
+            key: entry["digest"] for key, entry in cache.items() if key in refs
+        }
+        content_hash, digests = StateHasher.compute_incremental_hash(
+            attributes, cached_digests, changed_keys
+        )
+
+        # Reassign (not mutate) so the JSON column is flagged dirty
+        uow.content_digests = {
+            key: {"ref": refs[key], "digest": digests[key]} for key in refs
+        }
+        return content_hash
+
+    @staticmethod
+    def refresh_content_hash(session: Session, uow: UnitsOfWork) -> Optional[str]:
+        """
+        Recompute a UOW's stored content hash after a system attribute write.
+        
+        Keeps the hash scheme the UOW already uses (incremental digests or the
+        legacy full-JSON hash) so verify_state_hash keeps passing. UOWs that
+        were never hashed are left unhashed.
+        
+        Args:
+            session: SQLAlchemy session
+            uow: The UOW whose attributes were written
+        
+        Returns:
+            The new content hash, or None if the UOW has never been hashed
+        """
+        if uow.content_hash is None:
+            return None
+        if uow.content_digests is None:
+            attributes, _ = UOWPersistenceService.resolve_attributes(session, uow)
+            uow.content_hash = StateVerifier.compute_hash(attributes)
+        else:
+            uow.content_hash = UOWPersistenceService._update_content_digests(session, uow)
+        return uow.content_hash
 
     @staticmethod
     def verify_state_hash(
@@ -418,12 +722,15 @@ class UOWPersistenceService:
         Raises:
             GuardStateDriftException: Only if emit_violation=True and guard_context is set
         """
-        current_attributes = {}
-        for attr in uow.attributes:
-            if attr.key not in current_attributes:
-                current_attributes[attr.key] = attr.value
-
-        expected_hash = StateVerifier.compute_hash(current_attributes)
+        current_attributes, _ = UOWPersistenceService.resolve_attributes(session, uow)
+
+        # Full-hash audit: every per-key digest is recomputed from the stored
+        # values, ignoring the digest cache. UOWs without a cache were hashed
+        # by the legacy full-JSON scheme and are verified against it.
+        if uow.content_digests is None:
+            expected_hash = StateVerifier.compute_hash(current_attributes)
+        else:
+            expected_hash, _ = StateHasher.compute_incremental_hash(current_attributes)
         is_valid = uow.content_hash == expected_hash
 
         # Backward compatibility: simple boolean return
@@ -515,13 +822,21 @@ class UOWPersistenceService:
         Implements UOW Lifecycle Spec (Pilot Pulse): Critical transitions like
         COMPLETED and FAILED require Pilot approval before they are persisted.
         
+        The check is non-blocking (park-and-resume). A high-risk transition is
+        persisted as PENDING_PILOT_APPROVAL together with a continuation (the
+        requested target plus the pre-park location) in the history metadata,
+        the transaction is committed immediately, and an intervention request
+        is raised for the Pilot. The Pilot's approve/reject decision later
+        completes the transition via resume_parked_uow(). No DB connection or
+        worker thread is held while the Pilot decides.
+        
         This ensures human oversight of important decisions and provides
         Constitutional Waiver capability for exceptional cases.
         
         Args:
-            session: SQLAlchemy session
+            session: SQLAlchemy session (committed when the UOW is parked)
             uow: The UOW to save
-            guard_context: REQUIRED. Guard context for pilot communication
+            guard_context: REQUIRED. Guard context for authorization
             new_status: The target status
             new_interaction_id: The target interaction
             actor_id: Optional actor responsible for change
@@ -532,21 +847,22 @@ class UOWPersistenceService:
         
         Returns:
             Dict with keys:
-            - success (bool): Whether save succeeded
-            - pilot_approved (bool): Whether pilot approved (if high-risk)
-            - waiver_issued (bool): Whether constitutional waiver was issued
+            - success (bool): Whether save succeeded (True when parked)
+            - parked (bool): Whether the UOW was parked awaiting the Pilot
+            - intervention_request_id (Optional[str]): Pilot request to resume from
+            - pilot_approved (bool): Whether pilot approved (set on resume)
+            - waiver_issued (bool): Whether constitutional waiver was issued (set on resume)
             - uow (UnitsOfWork): The saved UOW (if successful)
             - blocked_by (Optional[str]): Reason for block if not successful
             - error (Optional[str]): Error message if operation failed
-        
-        Raises:
-            GuardLayerBypassException: If Guard authorization fails
         """
         if high_risk_transitions is None:
             high_risk_transitions = ["COMPLETED", "FAILED"]
 
         result = {
             "success": False,
+            "parked": False,
+            "intervention_request_id": None,
             "pilot_approved": False,
             "waiver_issued": False,
             "uow": None,
@@ -557,56 +873,365 @@ class UOWPersistenceService:
         # Check if this is a high-risk transition
         is_high_risk = new_status in high_risk_transitions
 
-        if is_high_risk:
-            # Require Pilot approval for high-risk transitions
-            reason_msg = f"UOW {uow.uow_id} transitioning to {new_status}. Reason: {reasoning}"
-            pilot_decision = guard_context.wait_for_pilot(
-                uow_id=uow.uow_id,
-                reason=reason_msg,
-                timeout_seconds=300,
+        if not is_high_risk:
+            try:
+                result["uow"] = UOWPersistenceService.save_uow(
+                    session=session,
+                    uow=uow,
+                    guard_context=guard_context,
+                    new_status=new_status,
+                    new_interaction_id=new_interaction_id,
+                    actor_id=actor_id,
+                    reasoning=reasoning,
+                    metadata=metadata,
+                )
+                result["success"] = True
+            except Exception as e:
+                result["error"] = str(e)
+                result["blocked_by"] = "GUARD_EXCEPTION"
+            return result
+
+        # PARK: persist the continuation alongside the PENDING_PILOT_APPROVAL
+        # transition. The UOW stays at its current interaction until resumed.
+        intervention_request_id = str(uuid.uuid4())
+        continuation = {
+            "intervention_request_id": intervention_request_id,
+            "target_status": new_status,
+            "target_interaction_id": str(new_interaction_id) if new_interaction_id else None,
+            "previous_status": uow.status,
+            "previous_interaction_id": (
+                str(uow.current_interaction_id) if uow.current_interaction_id else None
+            ),
+            "actor_id": str(actor_id) if actor_id else None,
+            "reasoning": reasoning,
+            "metadata": metadata or {},
+            "parked_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+        try:
+            parked_uow = UOWPersistenceService.save_uow(
+                session=session,
+                uow=uow,
+                guard_context=guard_context,
+                new_status=PILOT_PARK_STATUS,
+                new_interaction_id=uow.current_interaction_id,
+                actor_id=actor_id,
+                reasoning=f"PARK: {reasoning}" if reasoning else "PARK: High-risk transition requires Pilot approval",
+                metadata={PILOT_CONTINUATION_KEY: continuation},
             )
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            result["error"] = str(e)
+            result["blocked_by"] = "GUARD_EXCEPTION"
+            return result
 
-            if not pilot_decision.get("approved", False):
-                if not pilot_decision.get("waiver_issued", False):
-                    result["blocked_by"] = "PILOT_APPROVAL_REQUIRED"
-                    result["error"] = (
-                        f"Pilot rejected transition to {new_status}: "
-                        f"{pilot_decision.get('rejection_reason', 'No reason provided')}"
-                    )
-                    return result
-                else:
-                    # Waiver issued - allowed to proceed
+        # NOTIFY (after commit): raise the intervention request the Pilot answers
+        UOWPersistenceService._request_pilot_decision(parked_uow, continuation)
+
+        result["success"] = True
+        result["parked"] = True
+        result["intervention_request_id"] = intervention_request_id
+        result["uow"] = parked_uow
+        return result
+
+    @staticmethod
+    def _request_pilot_decision(uow: UnitsOfWork, continuation: Dict[str, Any]) -> None:
+        """
+        Register the intervention request for a parked UOW and broadcast it.
+        
+        Failures are reported but not raised: the UOW is already parked and
+        committed, and expire_parked_uows() restores parked UOWs nobody
+        resumes within PILOT_DECISION_TIMEOUT_SECONDS.
+        """
+        request_id = continuation["intervention_request_id"]
+        target_status = continuation["target_status"]
+        reason = continuation["reasoning"] or "High-risk transition"
+
+        try:
+            get_intervention_store().create_request(
+                request_id=request_id,
+                uow_id=str(uow.uow_id),
+                intervention_type=InterventionType.RESUME,
+                title=f"Approve transition to {target_status}",
+                description=f"UOW {uow.uow_id} transitioning to {target_status}. Reason: {reason}",
+                priority="high",
+                context={
+                    "continuation": PILOT_CONTINUATION_KEY,
+                    "instance_id": str(uow.instance_id),
+                    "original_target_status": target_status,
+                    "actor_id": continuation["actor_id"],
+                },
+                expires_in_seconds=PILOT_DECISION_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            logger.error(f"Failed to register pilot request {request_id} for UOW {uow.uow_id}: {e}")
+
+        emit(
+            "intervention_request",
+            {
+                "intervention_request_id": request_id,
+                "uow_id": str(uow.uow_id),
+                "instance_id": str(uow.instance_id),
+                "status": PILOT_PARK_STATUS,
+                "original_target_status": target_status,
+                "reason": reason,
+                "actor_id": continuation["actor_id"],
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "pilot_action_required": True,
+                "pilot_options": ["approve", "reject"],
+                "timeout_seconds": PILOT_DECISION_TIMEOUT_SECONDS,
+            }
+        )
+
+    @staticmethod
+    def get_pilot_continuation(
+        session: Session, uow: UnitsOfWork
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load the continuation recorded when a UOW was parked for the Pilot.
+        
+        Args:
+            session: SQLAlchemy session
+            uow: The parked UOW
+        
+        Returns:
+            The continuation dict, or None if the UOW is not parked by
+            save_uow_with_pilot_check
+        """
+        if uow.status != PILOT_PARK_STATUS:
+            return None
+
+        # WAL mode: the park row may not be drained into the table yet. Rows
+        # still in the WAL are newer than any drained row, so they win.
+        history_writer = HistoryWriter.for_session(session)
+        unflushed = history_writer.unflushed_rows(uow.uow_id) if history_writer else []
+        park_rows = [row for row in unflushed if row["new_status"] == PILOT_PARK_STATUS]
+        if park_rows:
+            metadata = park_rows[-1]["transition_metadata"]
+            return metadata.get(PILOT_CONTINUATION_KEY) if metadata else None
+
+        flush_pending_history(session)
+
+        park_entry = (
+            session.query(UnitsOfWorkHistory)
+            .filter(
+                UnitsOfWorkHistory.uow_id == uow.uow_id,
+                UnitsOfWorkHistory.new_status == PILOT_PARK_STATUS,
+            )
+            .order_by(UnitsOfWorkHistory.transition_timestamp.desc())
+            .first()
+        )
+        if park_entry is None or not park_entry.transition_metadata:
+            return None
+        return park_entry.transition_metadata.get(PILOT_CONTINUATION_KEY)
+
+    @staticmethod
+    def find_pilot_decision(
+        session: Session, uow: UnitsOfWork, intervention_request_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the transition that applied the Pilot's decision on a request.
+        
+        Lets a caller that committed a resume but failed to resolve the
+        intervention request recognise the resume on retry.
+        
+        Args:
+            session: SQLAlchemy session
+            uow: The (formerly) parked UOW
+            intervention_request_id: Request the UOW was parked for
+        
+        Returns:
+            transition_metadata of the resuming transition, or None if the
+            request's decision has not been applied
+        """
+        def applies(metadata: Optional[Dict[str, Any]]) -> bool:
+            decision = (metadata or {}).get("pilot_decision") or {}
+            return decision.get("intervention_request_id") == intervention_request_id
+
+        history_writer = HistoryWriter.for_session(session)
+        unflushed = history_writer.unflushed_rows(uow.uow_id) if history_writer else []
+        for row in reversed(unflushed):
+            if applies(row["transition_metadata"]):
+                return row["transition_metadata"]
+
+        flush_pending_history(session)
+        entries = (
+            session.query(UnitsOfWorkHistory)
+            .filter(UnitsOfWorkHistory.uow_id == uow.uow_id)
+            .order_by(UnitsOfWorkHistory.transition_timestamp.desc())
+            .all()
+        )
+        for entry in entries:
+            if applies(entry.transition_metadata):
+                return entry.transition_metadata
+        return None
+
+    @staticmethod
+    def resume_parked_uow(
+        session: Session,
+        uow: UnitsOfWork,
+        guard_context: GuardContext,
+        decision: Dict[str, Any],
+        pilot_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Complete a parked high-risk transition with the Pilot's decision.
+        
+        This is the continuation of save_uow_with_pilot_check(). On approval
+        (or a Constitutional Waiver) the original target status and
+        interaction are applied on behalf of the original actor; on rejection
+        the UOW is restored to its pre-park status and interaction.
+        
+        Changes are flushed, not committed; the caller owns the transaction.
+        
+        Args:
+            session: SQLAlchemy session
+            uow: The parked UOW
+            guard_context: REQUIRED. Guard context for authorization
+            decision: Pilot decision with keys approved, waiver_issued,
+                      waiver_reason and rejection_reason
+            pilot_id: Optional identifier of the deciding Pilot
+        
+        Returns:
+            Dict with the same keys as save_uow_with_pilot_check()
+        """
+        result = {
+            "success": False,
+            "parked": False,
+            "intervention_request_id": None,
+            "pilot_approved": False,
+            "waiver_issued": False,
+            "uow": None,
+            "blocked_by": None,
+            "error": None,
+        }
+
+        continuation = UOWPersistenceService.get_pilot_continuation(session, uow)
+        if continuation is None:
+            result["blocked_by"] = "NOT_PARKED"
+            result["error"] = f"UOW {uow.uow_id} is not awaiting Pilot approval"
+            return result
+        result["intervention_request_id"] = continuation.get("intervention_request_id")
+
+        target_status = continuation["target_status"]
+        actor_id = uuid.UUID(continuation["actor_id"]) if continuation.get("actor_id") else None
+        metadata = dict(continuation.get("metadata") or {})
+        metadata["pilot_decision"] = {
+            "pilot_id": pilot_id,
+            "approved": bool(decision.get("approved", False)),
+            "intervention_request_id": continuation.get("intervention_request_id"),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+        approved = decision.get("approved", False)
+        waiver = not approved and decision.get("waiver_issued", False)
+
+        try:
+            if approved or waiver:
+                if waiver:
                     result["waiver_issued"] = True
-                    if metadata is None:
-                        metadata = {}
                     metadata["constitutional_waiver"] = {
                         "issued": True,
-                        "reason": pilot_decision.get("waiver_reason", ""),
+                        "reason": decision.get("waiver_reason", ""),
                         "timestamp": datetime.now(timezone.utc).isoformat(),
                     }
-            else:
-                result["pilot_approved"] = True
+                else:
+                    result["pilot_approved"] = True
 
-        # Proceed with save
-        try:
-            updated_uow = UOWPersistenceService.save_uow(
+                target_interaction_id = continuation.get("target_interaction_id")
+                result["uow"] = UOWPersistenceService.save_uow(
+                    session=session,
+                    uow=uow,
+                    guard_context=guard_context,
+                    new_status=target_status,
+                    # "None" was stored by parks written before targets were optional
+                    new_interaction_id=(
+                        uuid.UUID(target_interaction_id)
+                        if target_interaction_id and target_interaction_id != "None" else None
+                    ),
+                    actor_id=actor_id,
+                    reasoning=continuation.get("reasoning"),
+                    metadata=metadata,
+                )
+                result["success"] = True
+                return result
+
+            rejection_reason = decision.get("rejection_reason") or "No reason provided"
+            previous_interaction_id = continuation.get("previous_interaction_id")
+            result["uow"] = UOWPersistenceService.save_uow(
                 session=session,
                 uow=uow,
                 guard_context=guard_context,
-                new_status=new_status,
-                new_interaction_id=new_interaction_id,
+                new_status=continuation["previous_status"],
+                new_interaction_id=(
+                    uuid.UUID(previous_interaction_id) if previous_interaction_id else None
+                ),
                 actor_id=actor_id,
-                reasoning=reasoning,
+                reasoning=f"Pilot rejected transition to {target_status}: {rejection_reason}",
                 metadata=metadata,
             )
-            result["success"] = True
-            result["uow"] = updated_uow
-        except Exception as e:
+            result["blocked_by"] = "PILOT_APPROVAL_REQUIRED"
+            result["error"] = f"Pilot rejected transition to {target_status}: {rejection_reason}"
+        except (GuardLayerBypassException, ValueError) as e:
+            # Refused before anything was written; database errors propagate
+            # so the caller's transaction is not committed half-applied
             result["error"] = str(e)
             result["blocked_by"] = "GUARD_EXCEPTION"
 
         return result
 
+    @staticmethod
+    def expire_parked_uows(
+        session: Session,
+        guard_context: GuardContext,
+        timeout_seconds: int = PILOT_DECISION_TIMEOUT_SECONDS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Restore UOWs whose Pilot decision has timed out.
+        
+        A UOW parked by save_uow_with_pilot_check() that nobody resumes within
+        timeout_seconds is treated as rejected: it returns to its pre-park
+        status and interaction, where the normal lifecycle (including the
+        Zombie Sweeper for stale ACTIVE work) takes over again.
+        
+        Changes are flushed, not committed; the caller owns the transaction.
+        
+        Args:
+            session: SQLAlchemy session
+            guard_context: REQUIRED. Guard context for authorization
+            timeout_seconds: How long a UOW may stay parked (default 300s)
+        
+        Returns:
+            resume_parked_uow() results of the restored UOWs
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=timeout_seconds)
+        parked = (
+            session.query(UnitsOfWork)
+            .filter(
+                UnitsOfWork.status == PILOT_PARK_STATUS,
+                UnitsOfWork.last_heartbeat_at < cutoff,
+            )
+            .all()
+        )
+
+        expired = []
+        for uow in parked:
+            result = UOWPersistenceService.resume_parked_uow(
+                session=session,
+                uow=uow,
+                guard_context=guard_context,
+                decision={
+                    "approved": False,
+                    "rejection_reason": f"No Pilot decision within {timeout_seconds}s",
+                },
+            )
+            if result["blocked_by"] == "PILOT_APPROVAL_REQUIRED":
+                expired.append(result)
+            else:
+                logger.warning(f"Could not expire parked UOW {uow.uow_id}: {result['error']}")
+        return expired
+
     @staticmethod
     def save_uow_with_park_notify(
         session: Session,
@@ -622,31 +1247,20 @@ class UOWPersistenceService:
         """
         Save UOW with Park & Notify pattern for high-risk transitions (NON-BLOCKING).
         
-        Implements the Park & Notify pattern per Constitutional Article XV (Pilot Sovereignty):
-        When a high-risk transition is detected, the UOW is immediately:
-        1. Transitioned to PENDING_PILOT_APPROVAL (parked in DB)
-        2. An InterventionRequest event is emitted to StreamBroadcaster
-        3. Returns successfully without blocking
-        4. The workflow thread terminates cleanly
+        Implements the Park & Notify pattern per Constitutional Article XV (Pilot Sovereignty)
+        on top of save_uow_with_pilot_check(): a high-risk transition is
+        1. Parked as PENDING_PILOT_APPROVAL with its continuation and committed
+        2. Raised to the Pilot as an intervention request (and broadcast)
+        3. Returned immediately without blocking the workflow thread
         
-        Pilot then has up to 5 minutes (via UnitsOfWork heartbeat timeout) to review
-        the parked UOW and either:
-        - Call /pilot/resume/{uow_id} to approve → ACTIVE
-        - Call /pilot/cancel/{uow_id} to reject → FAILED
-        
-        If no Pilot action taken within 5 minutes, the Zombie Sweeper will
-        move it to ZOMBIED_SOFT (per UOW Lifecycle Specs).
-        
-        This implementation:
-        - Does NOT block the workflow thread
-        - Does NOT use timeout loops or polling
-        - DOES persist the parked UOW to DB immediately
-        - DOES emit a clear audit trail for dashboard monitoring
+        The Pilot's approve/reject decision completes or reverts the transition
+        (resume_parked_uow); without a decision within
+        PILOT_DECISION_TIMEOUT_SECONDS, expire_parked_uows() restores the UOW.
         
         Args:
-            session: SQLAlchemy session
+            session: SQLAlchemy session (committed when the UOW is parked)
             uow: The UOW to save
-            guard_context: REQUIRED. Guard context for pilot communication
+            guard_context: REQUIRED. Guard context for authorization
             new_status: The target status (should be one of high_risk_transitions)
             new_interaction_id: The target interaction
             actor_id: Optional actor responsible for change
@@ -660,111 +1274,49 @@ class UOWPersistenceService:
             - success (bool): Always True if no exception
             - parked (bool): Whether UOW was parked (True if high-risk, False if normal save)
             - status (str): New UOW status (PENDING_PILOT_APPROVAL if high-risk)
-            - intervention_request_id (Optional[str]): ID of emitted intervention request
+            - intervention_request_id (Optional[str]): ID of the Pilot's intervention request
             - message (str): Human-readable description
             - uow (UnitsOfWork): The saved UOW
-            - error (Optional[str]): Error message if operation failed
+            - error (Optional[str]): Always None (failures raise)
         
         Constitutional Reference: Article XV (Pilot Sovereignty), UOW Lifecycle Specs
         
         Raises:
             GuardLayerBypassException: If Guard authorization fails
         """
-        if high_risk_transitions is None:
-            high_risk_transitions = ["COMPLETED", "FAILED"]
+        result = UOWPersistenceService.save_uow_with_pilot_check(
+            session=session,
+            uow=uow,
+            guard_context=guard_context,
+            new_status=new_status,
+            new_interaction_id=new_interaction_id,
+            actor_id=actor_id,
+            reasoning=reasoning,
+            metadata=metadata,
+            high_risk_transitions=high_risk_transitions,
+        )
+        if not result["success"]:
+            raise GuardLayerBypassException(result["error"])
+
+        if result["parked"]:
+            message = (
+                f"UOW {uow.uow_id} parked for Pilot approval. "
+                f"Original target: {new_status}. Awaiting approve/reject on "
+                f"intervention {result['intervention_request_id']}."
+            )
+        else:
+            message = f"UOW {uow.uow_id} saved with status {new_status}."
 
-        result = {
-            "success": False,
-            "parked": False,
-            "status": new_status,
-            "intervention_request_id": None,
-            "message": "",
-            "uow": None,
+        return {
+            "success": True,
+            "parked": result["parked"],
+            "status": result["uow"].status,
+            "intervention_request_id": result["intervention_request_id"],
+            "message": message,
+            "uow": result["uow"],
             "error": None,
         }
 
-        try:
-            # Check if this is a high-risk transition
-            is_high_risk = new_status in high_risk_transitions
-
-            if is_high_risk:
-                # PARK: Transition UOW to PENDING_PILOT_APPROVAL (Park state)
-                parked_uow = UOWPersistenceService.save_uow(
-                    session=session,
-                    uow=uow,
-                    guard_context=guard_context,
-                    new_status="PENDING_PILOT_APPROVAL",  # Park state (not the original target)
-                    new_interaction_id=new_interaction_id,
-                    actor_id=actor_id,
-                    reasoning=f"PARK: {reasoning}" if reasoning else "PARK: High-risk transition requires Pilot approval",
-                    metadata={
-                        **(metadata or {}),
-                        "original_target_status": new_status,
-                        "park_reason": reasoning or "High-risk transition",
-                        "parked_at": datetime.now(timezone.utc).isoformat(),
-                    },
-                )
-
-                # NOTIFY: Emit InterventionRequest event to StreamBroadcaster
-                intervention_request_id = str(uuid.uuid4())
-                emit(
-                    "intervention_request",
-                    {
-                        "intervention_request_id": intervention_request_id,
-                        "uow_id": str(uow.uow_id),
-                        "instance_id": str(uow.instance_id),
-                        "status": "PENDING_PILOT_APPROVAL",
-                        "original_target_status": new_status,
-                        "reason": reasoning or "High-risk transition",
-                        "actor_id": str(actor_id) if actor_id else None,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "pilot_action_required": True,
-                        "pilot_options": ["resume", "cancel"],
-                        "timeout_seconds": 300,  # 5 minutes
-                    }
-                )
-
-                result["success"] = True
-                result["parked"] = True
-                result["status"] = "PENDING_PILOT_APPROVAL"
-                result["intervention_request_id"] = intervention_request_id
-                result["message"] = (
-                    f"UOW {uow.uow_id} parked for Pilot approval. "
-                    f"Original target: {new_status}. Awaiting /pilot/resume or /pilot/cancel."
-                )
-                result["uow"] = parked_uow
-
-            else:
-                # NORMAL SAVE: Not high-risk, proceed normally with auto_increment
-                saved_uow = UOWPersistenceService.save_uow(
-                    session=session,
-                    uow=uow,
-                    guard_context=guard_context,
-                    new_status=new_status,
-                    new_interaction_id=new_interaction_id,
-                    actor_id=actor_id,
-                    reasoning=reasoning,
-                    metadata=metadata,
-                )
-
-                result["success"] = True
-                result["parked"] = False
-                result["status"] = new_status
-                result["message"] = f"UOW {uow.uow_id} saved with status {new_status}."
-                result["uow"] = saved_uow
-
-        except GuardLayerBypassException as e:
-            result["success"] = False
-            result["error"] = str(e)
-            raise
-        except Exception as e:
-            result["success"] = False
-            result["error"] = str(e)
-            raise
-
-        return result
-
-
 class TelemetryBuffer:
     """
     High-performance, non-blocking telemetry buffering service.
@@ -774,51 +1326,109 @@ class TelemetryBuffer:
     the main execution flow.
     
     Features:
-    - Thread-safe, lock-based queueing
-    - Batch writes for efficiency (configurable)
+    - Lock-free hot path: a bounded ring of entries on a collections.deque,
+      whose append/popleft are atomic, so record() takes no lock
+    - Per-log_type sampling (e.g. keep every ERROR, 1% of GUARDIAN_DECISIONs)
+    - Batch writes for efficiency (configurable), as one Core executemany INSERT
     - FIFO ordering guarantee
     - Automatic timestamp injection
-    - Type-safe entries with dataclasses
+    - Drop/backpressure counters (see get_stats)
+    
+    Entries are normally drained by a TelemetryDrainer thread; flush() can
+    still be called directly with a caller-owned session.
     
     Usage:
-        buffer = TelemetryBuffer(batch_size=100)
+        buffer = TelemetryBuffer(batch_size=100, sample_rates={"GUARDIAN_DECISION": 0.01})
         buffer.record(TelemetryEntry(...))
         written = buffer.flush(session)  # Non-blocking flush
     """
 
-    def __init__(self, max_queue_size: int = 10000, batch_size: int = 100):
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 100,
+        sample_rates: Optional[Dict[str, float]] = None,
+    ):
         """
         Initialize the telemetry buffer.
         
         Args:
-            max_queue_size: Maximum entries before blocking (defensive against memory overflow)
+            max_queue_size: Maximum buffered entries; further entries are
+                            dropped (defensive against memory overflow)
             batch_size: Target batch size for flush operations
+            sample_rates: Fraction of entries to keep per log_type
+                          (log types not listed are always kept)
         """
-        self.queue: Queue = Queue(maxsize=max_queue_size)
+        self.max_queue_size = max_queue_size
         self.batch_size = batch_size
-        self._lock = Lock()
-        self._pending_count = 0
+        self._entries: Deque[TelemetryEntry] = deque()
+        # Counters are plain ints bumped without a lock; under heavy
+        # contention they are approximate, which is fine for monitoring
+        self._dropped_count = 0
+        self._sampled_out_count = 0
+        self._written_count = 0
+        self._sample_rates: Dict[str, Fraction] = {}
+        self._sample_counters: Dict[str, Iterator[int]] = {}
+        self.set_sample_rates(sample_rates or {})
+        # Set once a full batch is waiting, so a drainer can flush early
+        self.batch_ready = Event()
+
+    def set_sample_rates(self, sample_rates: Dict[str, float]) -> None:
+        """
+        Configure per-log_type sampling.
+        
+        Sampling is deterministic: the n-th entry of a type is kept when
+        ceil(n * rate) steps up, so after n entries exactly ceil(n * rate)
+        have been kept. A rate of 0.01 keeps the 1st, 101st, 201st ...
+        entry, and rates that are not 1/k (e.g. 0.3) are honoured exactly
+        rather than rounded to a stride. A rate of 0 drops the type
+        entirely; 1 (or an unlisted type) keeps everything.
+        
+        Args:
+            sample_rates: Mapping of log_type -> fraction kept (0.0 - 1.0)
+        """
+        rates = {}
+        for log_type, rate in sample_rates.items():
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"Sample rate for {log_type} must be between 0 and 1, got {rate}")
+            if rate < 1.0:
+                # Exact fraction, so 0.1 * 10 is 1 (no float drift in the accumulator)
+                rates[log_type] = Fraction(rate).limit_denominator(1_000_000)
+        self._sample_counters = {log_type: itertools.count() for log_type in rates}
+        self._sample_rates = rates
 
     def record(self, entry: TelemetryEntry) -> bool:
         """
         Record a telemetry entry (non-blocking, returns immediately).
         
-        If queue is full, returns False (backpressure).
+        Entries removed by sampling count as recorded. If the buffer is
+        full, the entry is dropped, counted, and False is returned
+        (backpressure).
         
         Args:
             entry: The TelemetryEntry to record
         
         Returns:
-            True if recorded, False if queue full (backpressure)
+            True if recorded (or sampled out), False if buffer full (backpressure)
         """
-        try:
-            self.queue.put_nowait(entry)
-            with self._lock:
-                self._pending_count += 1
-            return True
-        except:
-            # Queue full - return False to signal backpressure
+        rate = self._sample_rates.get(entry.log_type)
+        if rate is not None:
+            # next() on itertools.count is atomic under the GIL
+            seen = next(self._sample_counters[entry.log_type])
+            numerator, denominator = rate.numerator, rate.denominator
+            # Integer ceil(seen * rate) vs ceil((seen + 1) * rate)
+            if -(-(seen + 1) * numerator // denominator) == -(-seen * numerator // denominator):
+                self._sampled_out_count += 1
+                return True
+
+        entries = self._entries
+        if len(entries) >= self.max_queue_size:
+            self._dropped_count += 1
             return False
+        entries.append(entry)
+        if len(entries) >= self.batch_size and not self.batch_ready.is_set():
+            self.batch_ready.set()
+        return True
 
     def get_pending_count(self) -> int:
         """
@@ -827,8 +1437,89 @@ class TelemetryBuffer:
         Returns:
             Count of entries in buffer
         """
-        with self._lock:
-            return self._pending_count
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get buffer counters for monitoring.
+        
+        Returns:
+            Dictionary with pending, written, dropped and sampled_out entry
+            counts (dropped = rejected by backpressure or discarded after a
+            failed write)
+        """
+        return {
+            "pending": len(self._entries),
+            "written": self._written_count,
+            "dropped": self._dropped_count,
+            "sampled_out": self._sampled_out_count,
+            "capacity": self.max_queue_size,
+        }
+
+    def take(self, max_entries: Optional[int] = None) -> List[TelemetryEntry]:
+        """
+        Remove up to max_entries entries from the buffer, in FIFO order.
+        
+        Args:
+            max_entries: Maximum entries to take (default: batch_size)
+        
+        Returns:
+            The entries taken (empty if the buffer is empty)
+        """
+        limit = max_entries if max_entries else self.batch_size
+        entries: List[TelemetryEntry] = []
+        popleft = self._entries.popleft
+        while len(entries) < limit:
+            try:
+                entries.append(popleft())
+            except IndexError:
+                break
+
+        if len(self._entries) < self.batch_size:
+            self.batch_ready.clear()
+        return entries
+
+    def write(self, session: Session, entries: List[TelemetryEntry]) -> int:
+        """
+        Insert entries as Interaction_Logs rows with one executemany INSERT.
+        
+        The caller owns the transaction (commit/rollback).
+        
+        Args:
+            session: SQLAlchemy session for persistence
+            entries: Entries previously removed with take()
+        
+        Returns:
+            Number of rows inserted
+        """
+        if not entries:
+            return 0
+
+        rows = [
+            {
+                "instance_id": entry.instance_id,
+                "uow_id": entry.uow_id,
+                "actor_id": entry.actor_id,
+                "role_id": entry.role_id,
+                "interaction_id": entry.interaction_id,
+                "timestamp": entry.timestamp or datetime.now(timezone.utc),
+                "log_type": entry.log_type,
+                "event_details": entry.event_details,
+                "error_metadata": entry.error_metadata,
+            }
+            for entry in entries
+        ]
+        session.execute(insert(Interaction_Logs.__table__), rows)
+        self.record_written(len(rows))
+        return len(rows)
+
+    def record_written(self, count: int) -> None:
+        """Count entries persisted."""
+        self._written_count += count
+
+    def record_dropped(self, count: int) -> None:
+        """Count entries discarded after they left the buffer (e.g. failed writes)."""
+        self._dropped_count += count
 
     def flush(self, session: Session, max_entries: Optional[int] = None) -> int:
         """
@@ -836,8 +1527,8 @@ class TelemetryBuffer:
         
         This operation:
         1. Extracts up to batch_size entries from the queue
-        2. Creates Interaction_Logs entries
-        3. Commits to database in a single transaction
+        2. Inserts them as Interaction_Logs rows (one executemany INSERT)
+        3. Leaves the commit to the caller's transaction
         4. Maintains FIFO ordering and reliability
         
         Args:
@@ -847,44 +1538,7 @@ class TelemetryBuffer:
         Returns:
             Number of entries actually written
         """
-        flush_count = max_entries if max_entries else self.batch_size
-        entries_to_write = []
-
-        # Extract entries from queue (non-blocking)
-        while len(entries_to_write) < flush_count and not self.queue.empty():
-            try:
-                entry = self.queue.get_nowait()
-                entries_to_write.append(entry)
-            except:
-                break
-
-        # Convert to database entries
-        logs = []
-        for entry in entries_to_write:
-            log = Interaction_Logs(
-                log_id=str(uuid.uuid4()),
-                instance_id=str(entry.instance_id),
-                uow_id=str(entry.uow_id),
-                actor_id=str(entry.actor_id),
-                role_id=str(entry.role_id),
-                interaction_id=str(entry.interaction_id),
-                timestamp=entry.timestamp or datetime.now(timezone.utc),
-                log_type=entry.log_type,
-                event_details=entry.event_details,
-                error_metadata=entry.error_metadata,
-            )
-            logs.append(log)
-
-        # Batch insert
-        if logs:
-            session.bulk_save_objects(logs)
-            session.flush()
-
-        # Update counter
-        with self._lock:
-            self._pending_count = max(0, self._pending_count - len(entries_to_write))
-
-        return len(entries_to_write)
+        return self.write(session, self.take(max_entries))
 
     def flush_all(self, session: Session) -> int:
         """
@@ -897,7 +1551,7 @@ class TelemetryBuffer:
             Total number of entries written
         """
         total_written = 0
-        while not self.queue.empty():
+        while True:
             written = self.flush(session, max_entries=self.batch_size)
             total_written += written
             if written == 0:
@@ -905,6 +1559,133 @@ class TelemetryBuffer:
         return total_written
 
 
+class TelemetryDrainer:
+    """
+    Background thread that persists TelemetryBuffer entries.
+    
+    Flushes whenever a full batch is waiting or flush_interval_seconds have
+    passed, whichever comes first. Each batch is written in its own
+    short-lived session so telemetry never shares a transaction with
+    routing logic. Transient database errors (OperationalError, e.g. a
+    locked SQLite file or a dropped connection) are retried with linear
+    backoff; a batch that still fails is dropped and counted in the
+    buffer's stats rather than blocking the queue.
+    
+    Usage:
+        drainer = TelemetryDrainer(get_telemetry_buffer(), session_factory)
+        drainer.start()
+        ...
+        drainer.stop()  # Flushes everything still queued
+    """
+
+    def __init__(
+        self,
+        buffer: TelemetryBuffer,
+        session_factory: Callable[[], Session],
+        flush_interval_seconds: float = 1.0,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.1,
+    ):
+        """
+        Initialize the drainer (call start() to run it).
+        
+        Args:
+            buffer: The TelemetryBuffer to drain
+            session_factory: Callable returning a new Session on the instance DB
+            flush_interval_seconds: Maximum time an entry waits before a flush
+            max_retries: Retries per batch on transient errors
+            retry_backoff_seconds: Base delay between retries (multiplied by attempt)
+        """
+        self.buffer = buffer
+        self.session_factory = session_factory
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.retry_count = 0
+        self.failed_batches = 0
+        self._stopping = Event()
+        self._thread: Optional[Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the drainer thread (no-op if already running)."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = Thread(target=self._run, name="telemetry-drainer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 10.0) -> int:
+        """
+        Stop the drainer thread and flush whatever is still queued.
+        
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        
+        Returns:
+            Number of entries written by the final flush
+        """
+        self._stopping.set()
+        self.buffer.batch_ready.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        return self.drain()
+
+    def drain(self) -> int:
+        """
+        Write every queued entry now, batch by batch.
+        
+        Returns:
+            Number of entries written
+        """
+        written = 0
+        while True:
+            entries = self.buffer.take()
+            if not entries:
+                return written
+            written += self._write_batch(entries)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self.buffer.batch_ready.wait(self.flush_interval_seconds)
+            if self._stopping.is_set():
+                break
+            try:
+                self.drain()
+            except Exception as e:
+                # Never let the drainer thread die
+                logger.error(f"Telemetry drainer error: {e}")
+
+    def _write_batch(self, entries: List[TelemetryEntry]) -> int:
+        for attempt in range(self.max_retries + 1):
+            session = self.session_factory()
+            try:
+                written = self.buffer.write(session, entries)
+                session.commit()
+                return written
+            except OperationalError as e:
+                session.rollback()
+                if attempt < self.max_retries:
+                    self.retry_count += 1
+                    time.sleep(self.retry_backoff_seconds * (attempt + 1))
+                    continue
+                logger.error(f"Dropping {len(entries)} telemetry entries after retries: {e}")
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Dropping {len(entries)} telemetry entries: {e}")
+            finally:
+                session.close()
+            break
+
+        self.failed_batches += 1
+        self.buffer.record_dropped(len(entries))
+        return 0
+
+
 class ShadowLoggerTelemetryAdapter:
     """
     Adapter that bridges the Semantic Guard's ShadowLogger with the TelemetryBuffer.
@@ -931,7 +1712,7 @@ class ShadowLoggerTelemetryAdapter:
     def capture_shadow_log_error(
         self,
         uow_id: uuid.UUID,
-        role_id: uuid.UUID,
+        role_id: Optional[uuid.UUID],
         interaction_id: uuid.UUID,
         actor_id: Optional[uuid.UUID],
         error_message: str,
@@ -958,7 +1739,7 @@ class ShadowLoggerTelemetryAdapter:
         entry = TelemetryEntry(
             instance_id=self.instance_id,
             uow_id=uow_id,
-            actor_id=actor_id or uuid.UUID("00000000-0000-0000-0000-000000000000"),
+            actor_id=actor_id,
             role_id=role_id,
             interaction_id=interaction_id,
             log_type="ERROR",
@@ -1003,7 +1784,7 @@ class ShadowLoggerTelemetryAdapter:
         entry = TelemetryEntry(
             instance_id=self.instance_id,
             uow_id=uow_id,
-            actor_id=actor_id or uuid.UUID("00000000-0000-0000-0000-000000000000"),
+            actor_id=actor_id,
             role_id=role_id,
             interaction_id=interaction_id,
             log_type="GUARDIAN_DECISION",
@@ -1018,6 +1799,57 @@ class ShadowLoggerTelemetryAdapter:
         return self.buffer.record(entry)
 
 
+def spill_shadow_log_to_telemetry(entry: ShadowLogEntry, trace: Dict[str, Any]) -> None:
+    """
+    ShadowLogger sink that records captured errors as ERROR telemetry.
+    
+    Install with shadow_logger.add_sink(spill_shadow_log_to_telemetry).
+    Entries whose trace lacks the ids an Interaction_Logs row needs
+    (uow, instance and interaction) stay in memory only.
+    
+    Args:
+        entry: The captured ShadowLogEntry
+        trace: Identifiers passed to ShadowLogger.capture_error
+    """
+    instance_id = trace.get("instance_id")
+    interaction_id = trace.get("interaction_id")
+    if not entry.uow_id or instance_id is None or interaction_id is None:
+        return
+
+    adapter = ShadowLoggerTelemetryAdapter(get_telemetry_buffer(), instance_id)
+    adapter.capture_shadow_log_error(
+        uow_id=uuid.UUID(str(entry.uow_id)),
+        role_id=trace.get("role_id"),
+        interaction_id=interaction_id,
+        actor_id=trace.get("actor_id"),
+        error_message=f"{entry.error_type}: {entry.error_message}",
+        condition=entry.condition,
+        variables=entry.variable_context,
+    )
+
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    """
+    Parse a sampling spec such as "GUARDIAN_DECISION=0.01,TELEMETRY=0.1".
+    
+    Args:
+        spec: Comma-separated log_type=rate pairs (empty = no sampling)
+    
+    Returns:
+        Mapping of log_type -> fraction kept
+    
+    Raises:
+        ValueError: If a pair is malformed
+    """
+    rates = {}
+    for pair in filter(None, (part.strip() for part in spec.split(","))):
+        log_type, sep, rate = pair.partition("=")
+        if not sep or not log_type.strip():
+            raise ValueError(f"Invalid telemetry sample rate '{pair}', expected LOG_TYPE=RATE")
+        rates[log_type.strip()] = float(rate)
+    return rates
+
+
 # Global telemetry buffer instance (singleton pattern)
 _global_telemetry_buffer = TelemetryBuffer(max_queue_size=10000, batch_size=100)
 
@@ -1042,3 +1874,49 @@ def reset_telemetry_buffer() -> TelemetryBuffer:
     global _global_telemetry_buffer
     _global_telemetry_buffer = TelemetryBuffer(max_queue_size=10000, batch_size=100)
     return _global_telemetry_buffer
+
+
+# Global telemetry drainer (started by the server lifespan)
+_global_telemetry_drainer: Optional[TelemetryDrainer] = None
+
+
+def start_telemetry_drainer(
+    session_factory: Callable[[], Session],
+    flush_interval_seconds: float = 1.0,
+    max_retries: int = 3,
+) -> TelemetryDrainer:
+    """
+    Start draining the global telemetry buffer in a background thread.
+    
+    Args:
+        session_factory: Callable returning a new Session on the instance DB
+        flush_interval_seconds: Maximum time an entry waits before a flush
+        max_retries: Retries per batch on transient errors
+    
+    Returns:
+        The running TelemetryDrainer
+    """
+    global _global_telemetry_drainer
+    stop_telemetry_drainer()
+    _global_telemetry_drainer = TelemetryDrainer(
+        get_telemetry_buffer(),
+        session_factory,
+        flush_interval_seconds=flush_interval_seconds,
+        max_retries=max_retries,
+    )
+    _global_telemetry_drainer.start()
+    return _global_telemetry_drainer
+
+
+def stop_telemetry_drainer() -> int:
+    """
+    Stop the global telemetry drainer, flushing any queued entries.
+    
+    Returns:
+        Number of entries written by the final flush (0 if not running)
+    """
+    global _global_telemetry_drainer
+    drainer, _global_telemetry_drainer = _global_telemetry_drainer, None
+    if drainer is None:
+        return 0
+    return drainer.stop()
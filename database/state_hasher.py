@@ -12,16 +12,193 @@ Strategy:
 2. Sort keys alphabetically (JSON dict consistency)
 3. Serialize to UTF-8 JSON (no whitespace)
 4. Compute SHA-256 hash (cryptographic strength)
+
+Incremental Mode:
+Large UOWs re-serialising every attribute on each save is expensive. The
+incremental scheme hashes each key independently (SHA-256 of the canonical
+``{key: value}`` object) and combines the per-key digests with LtHash16
+(a lattice-based homomorphic set hash: 1024 lanes of 16 bits, added lane
+by lane), which is order-independent. Callers cache the per-key digests
+and only rehash the keys that changed; an audit recomputes every digest
+from scratch and must arrive at the same combined hash.
+
+Plain addition of 256-bit digests would not do here: finding a set of
+digests that sums to a chosen target is a generalised birthday problem
+(Wagner), feasible for an attacker who controls attribute values. LtHash16
+expands each digest to 2048 bytes with SHAKE-256, which keeps that attack
+out of reach (about 200 bits of security at these parameters).
+
+Canonical Serialisation:
+Serialisation goes through a pluggable CanonicalSerializer. The stdlib
+backend is the reference. When orjson is installed it is used as a fast
+path, but only for payloads whose output provably matches the stdlib bytes
+(see OrjsonCanonicalSerializer); anything else transparently falls back, so
+hashes never change with the backend.
 """
 
+import enum
 import hashlib
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install orjson
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+# LtHash16 parameters: 1024 lanes of 16 bits (2048-byte elements)
+_LTHASH_LANES = 1024
+_LTHASH_BYTES = _LTHASH_LANES * 2
+
+# Lanes are summed inside one Python int with 32-bit spacing, so the upper
+# half of each slot absorbs carries; reduce before they can spill over.
+_LTHASH_LANE_MASK = int.from_bytes(b"\xff\xff\x00\x00" * _LTHASH_LANES, "little")
+_LTHASH_MAX_UNREDUCED = (1 << 16) - 1
+
+
+def _lthash_element(digest: str) -> int:
+    """Expand a per-key digest into a packed LtHash16 element."""
+    expanded = hashlib.shake_256(bytes.fromhex(digest)).digest(_LTHASH_BYTES)
+    spaced = bytearray(_LTHASH_BYTES * 2)
+    spaced[0::4] = expanded[0::2]
+    spaced[1::4] = expanded[1::2]
+    return int.from_bytes(spaced, "little")
+
+
+# ============================================================================
+# Canonical JSON Serialisers
+# ============================================================================
+
+
+class CanonicalSerializer:
+    """
+    Reference canonical JSON serialiser (stdlib).
+
+    Canonical form: keys sorted, no whitespace, ASCII-only (non-ASCII
+    escaped as \\uXXXX), non-JSON types rendered with str(). This is the
+    byte format every content hash has been computed over, so other
+    backends must reproduce it exactly.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialise obj to canonical UTF-8 JSON bytes."""
+        return json.dumps(
+            obj,
+            sort_keys=True,
+            separators=(',', ':'),  # Remove spaces for consistency
+            default=str  # Handle non-JSON-serializable types
+        ).encode('utf-8')
+
+
+class OrjsonCanonicalSerializer(CanonicalSerializer):
+    """
+    orjson fast path, byte-identical to CanonicalSerializer.
+
+    orjson (with OPT_SORT_KEYS) matches the stdlib output for ASCII strings,
+    64-bit integers, booleans, None, lists/tuples, str-keyed dicts and UUIDs.
+    It differs for floats (exponent formatting, NaN/Infinity as null),
+    non-ASCII text and DEL (not escaped), plain enum.Enum members (by value,
+    where stdlib renders "Cls.MEMBER") and datetimes/dataclasses/builtin
+    subclasses (which stdlib renders via str()). Those are routed to the
+    stdlib backend:
+
+    - one pass over the input's JSON values (dict/list/tuple containers,
+      with str/int/bool/None leaves skipped by exact type) finds floats and
+      plain (not str/int based) Enum members, which no orjson option
+      disables;
+    - other non-builtin types, >64-bit integers and non-str keys make orjson
+      raise (passthrough options + a raising default); and
+    - the output is rejected if it is non-ASCII or contains DEL.
+
+    The pass costs a fraction of a stdlib dump, so the fast path stays
+    faster than the reference on the nested dicts UOW attributes hold.
+    """
+
+    name = "orjson"
+
+    _OPTIONS = 0
+    if orjson is not None:
+        _OPTIONS = (
+            orjson.OPT_SORT_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+        )
+
+    # Leaves orjson renders exactly like stdlib; anything else is inspected
+    _IDENTICAL_SCALARS = frozenset((str, int, bool, type(None)))
+
+    @staticmethod
+    def _reject(obj: Any) -> Any:
+        raise TypeError(f"Not natively serialisable: {type(obj).__name__}")
+
+    @classmethod
+    def _needs_stdlib(cls, obj: Any) -> bool:
+        """True if obj holds a float or a non-str/int Enum member anywhere in its values."""
+        scalars = cls._IDENTICAL_SCALARS
+        stack = [(obj,)]
+        while stack:
+            container = stack.pop()
+            container_type = type(container)
+            values = container.values() if container_type is dict else container
+            for value in values:
+                value_type = type(value)
+                if value_type in scalars:
+                    continue
+                if value_type is dict or value_type is list or value_type is tuple:
+                    stack.append(value)
+                elif value_type is float:
+                    return True
+                elif isinstance(value, enum.Enum) and not isinstance(value, (str, int)):
+                    return True
+        return False
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialise obj with orjson, falling back to stdlib when not provably identical."""
+        if self._needs_stdlib(obj):
+            return super().dumps(obj)
+
+        try:
+            out = orjson.dumps(obj, default=self._reject, option=self._OPTIONS)
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            return super().dumps(obj)
+
+        if not out.isascii() or b"\x7f" in out:
+            return super().dumps(obj)
+
+        return out
+
+
+_canonical_serializer: Optional[CanonicalSerializer] = None
+
+
+def get_canonical_serializer() -> CanonicalSerializer:
+    """Get the active canonical serialiser (orjson if installed, else stdlib)."""
+    global _canonical_serializer
+    if _canonical_serializer is None:
+        _canonical_serializer = (
+            OrjsonCanonicalSerializer() if orjson is not None else CanonicalSerializer()
+        )
+    return _canonical_serializer
+
+
+def set_canonical_serializer(serializer: Optional[CanonicalSerializer]) -> None:
+    """
+    Set the canonical serialiser (None restores the default selection).
+
+    Args:
+        serializer: Serialiser instance to use for all state hashing
+    """
+    global _canonical_serializer
+    _canonical_serializer = serializer
+
+
 class StateHasher:
     """Cryptographic state verification utility."""
 
@@ -56,17 +233,9 @@ class StateHasher:
             if attributes is None:
                 attributes = {}
 
-            # Sort keys alphabetically for determinism
+            # Sort keys alphabetically for determinism and encode to UTF-8
             # This ensures {"a": 1, "b": 2} and {"b": 2, "a": 1} produce identical hash
-            normalized_json = json.dumps(
-                attributes,
-                sort_keys=True,
-                separators=(',', ':'),  # Remove spaces for consistency
-                default=str  # Handle non-JSON-serializable types
-            )
-
-            # Encode to UTF-8 bytes
-            json_bytes = normalized_json.encode('utf-8')
+            json_bytes = get_canonical_serializer().dumps(attributes)
 
             # Compute SHA-256 hash
             hash_hex = hashlib.sha256(json_bytes).hexdigest()
@@ -77,6 +246,91 @@ class StateHasher:
             logger.error(f"Failed to compute content hash: {e}")
             raise StateHasherError(f"Hash computation failed: {e}")
 
+    @staticmethod
+    def compute_key_digest(key: str, value: Any) -> str:
+        """
+        Compute the SHA-256 digest of a single attribute.
+        
+        The digest covers the canonical JSON of ``{key: value}`` so the key
+        name is bound to its value (swapping values between keys changes
+        both digests).
+        
+        Args:
+            key: Attribute key
+            value: Attribute value
+        
+        Returns:
+            SHA-256 hash as hex string (64 characters)
+        """
+        return StateHasher.compute_content_hash({key: value})
+
+    @staticmethod
+    def combine_key_digests(digests: Dict[str, str]) -> str:
+        """
+        Combine per-key digests into one order-independent content hash.
+        
+        Each digest is expanded to an LtHash16 element and the elements are
+        added lane-wise modulo 2^16; the resulting state (with the key count)
+        is hashed once more, so the result is a regular 64-character SHA-256
+        hex string and adding/removing/changing one key only costs one digest.
+        
+        Args:
+            digests: Mapping of attribute key -> per-key digest
+        
+        Returns:
+            SHA-256 hash as hex string (64 characters)
+        """
+        total = 0
+        for count, digest in enumerate(digests.values(), 1):
+            total += _lthash_element(digest)
+            if count % _LTHASH_MAX_UNREDUCED == 0:
+                total &= _LTHASH_LANE_MASK
+        spaced = (total & _LTHASH_LANE_MASK).to_bytes(_LTHASH_BYTES * 2, "little")
+        state = bytearray(_LTHASH_BYTES)
+        state[0::2] = spaced[0::4]
+        state[1::2] = spaced[1::4]
+        return hashlib.sha256(f"{len(digests)}:".encode('utf-8') + bytes(state)).hexdigest()
+
+    @staticmethod
+    def compute_incremental_hash(
+        attributes: Optional[Dict[str, Any]],
+        cached_digests: Optional[Dict[str, str]] = None,
+        changed_keys: Optional[Iterable[str]] = None,
+    ) -> Tuple[str, Dict[str, str]]:
+        """
+        Compute the incremental content hash, rehashing only changed keys.
+        
+        With no cache (or ``changed_keys=None``) every key is hashed: this is
+        the full-hash audit mode. Otherwise cached digests are reused for
+        keys that are not in ``changed_keys``; keys missing from the cache are
+        always hashed and keys no longer present are dropped.
+        
+        Args:
+            attributes: Current attributes (may be None)
+            cached_digests: Previously computed per-key digests
+            changed_keys: Keys whose values changed since the cache was built
+        
+        Returns:
+            Tuple of (combined hash, per-key digests for the current attributes)
+        
+        Raises:
+            StateHasherError: If a value cannot be serialised
+        """
+        if attributes is None:
+            attributes = {}
+        cached_digests = cached_digests or {}
+        changed = None if changed_keys is None else set(changed_keys)
+
+        digests = {}
+        for key, value in attributes.items():
+            cached = cached_digests.get(key)
+            if cached is not None and changed is not None and key not in changed:
+                digests[key] = cached
+            else:
+                digests[key] = StateHasher.compute_key_digest(key, value)
+
+        return StateHasher.combine_key_digests(digests), digests
+
     @staticmethod
     def verify_state_hash(
         current_attributes: Dict[str, Any],
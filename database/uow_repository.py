@@ -11,6 +11,8 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 from uuid import UUID
 
+from database.enums import UOWStatus
+
 
 class UOWRepository(ABC):
     """
@@ -28,7 +30,8 @@ class UOWRepository(ABC):
         Create a new UOW.
         
         Args:
-            uow_data: Dict containing uow_id, instance_id, local_workflow_id, attributes, interaction_policy, etc.
+            uow_data: Dict containing uow_id, instance_id, local_workflow_id, current_interaction_id,
+                attributes (with actor_id), interaction_policy, etc.
         
         Returns:
             uow_id (str)
@@ -133,6 +136,31 @@ class UOWRepository(ABC):
         """
         pass
 
+    def pause_active(self, instance_id: UUID, payload: Dict[str, Any]) -> int:
+        """
+        Pause every ACTIVE UOW of an instance (Pilot kill switch).
+        
+        This default transitions the UOWs one at a time through update_state.
+        Implementations should override it with a set-based operation, since
+        it runs in an emergency on instances of any size.
+        
+        Args:
+            instance_id: Instance whose ACTIVE UOWs are paused
+            payload: Audit metadata (e.g. kill_switch_reason, triggered_by)
+        
+        Returns:
+            Number of UOWs paused
+        """
+        active_uows = self.find_by_status(status=UOWStatus.ACTIVE.value, instance_id=instance_id)
+        for uow in active_uows:
+            self.update_state(
+                uow_id=UUID(uow["uow_id"]),
+                new_status=UOWStatus.PAUSED.value,
+                payload=payload,
+                auto_increment=False,
+            )
+        return len(active_uows)
+
     @abstractmethod
     def find_by_interaction_limit(self, instance_id: UUID) -> list:
         """
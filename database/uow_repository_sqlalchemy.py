@@ -4,16 +4,20 @@ SQLAlchemy UOWRepository: Concrete implementation for PostgreSQL, Snowflake, Dat
 Constitutional Reference: Article XVII (Atomic Traceability) - Every save computes content_hash and records history.
 """
 
+import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
-from database.models_instance import UnitsOfWork, UnitsOfWorkHistory, UOWStatus
-from database.state_hasher import StateHasher
+from database.models_instance import UnitsOfWork, UnitsOfWorkHistory, UOW_Attributes, UOWStatus
+from database.history_writer import HistoryWriter, flush_pending_history
 from database.uow_repository import UOWRepository
 
+logger = logging.getLogger(__name__)
+
 
 class UOWRepositorySQLAlchemy(UOWRepository):
     """SQLAlchemy-based UOW repository supporting PostgreSQL, Snowflake, Databricks, SQLite."""
@@ -28,40 +32,63 @@ class UOWRepositorySQLAlchemy(UOWRepository):
         self.session = session
 
     def create(self, uow_data: Dict[str, Any]) -> str:
-        """Create a new UOW with initial state hash."""
+        """
+        Create a new UOW with initial state hash.
+        
+        Initial attributes are stored as version-1 UOW_Attributes rows
+        attributed to uow_data["actor_id"] (required when attributes are
+        given). The hash is the incremental X-Content-Hash with its per-key
+        digest cache, the same scheme save_uow and verify_state_hash use.
+        """
         # Extract required fields
         uow_id = uow_data.get("uow_id")
         instance_id = uow_data.get("instance_id")
         local_workflow_id = uow_data.get("local_workflow_id")
+        current_interaction_id = uow_data.get("current_interaction_id")
         attributes = uow_data.get("attributes", {})
         interaction_policy = uow_data.get("interaction_policy", {})
         max_interactions = uow_data.get("max_interactions")
+        actor_id = uow_data.get("actor_id")
 
-        if not all([uow_id, instance_id, local_workflow_id]):
-            raise ValueError("uow_id, instance_id, local_workflow_id are required")
-
-        # Compute initial state hash
-        content_hash = StateHasher.compute_content_hash(attributes)
+        if not all([uow_id, instance_id, local_workflow_id, current_interaction_id]):
+            raise ValueError(
+                "uow_id, instance_id, local_workflow_id, current_interaction_id are required"
+            )
+        if attributes and not actor_id:
+            raise ValueError("actor_id is required when initial attributes are given")
 
         # Create UOW
         uow = UnitsOfWork(
             uow_id=uow_id,
             instance_id=instance_id,
             local_workflow_id=local_workflow_id,
+            current_interaction_id=current_interaction_id,
             status=UOWStatus.PENDING.value,
-            attributes=attributes,
             interaction_policy=interaction_policy,  # Immutable snapshot
-            content_hash=content_hash,
             interaction_count=0,
             max_interactions=max_interactions,
             retry_count=0,
-            created_at=datetime.now(timezone.utc),
             last_heartbeat_at=datetime.now(timezone.utc),
         )
 
         self.session.add(uow)
+        self.session.add_all(
+            UOW_Attributes(
+                uow_id=uow_id,
+                instance_id=instance_id,
+                key=key,
+                value=value,
+                version=1,
+                actor_id=actor_id,
+                reasoning="Initial attribute",
+            )
+            for key, value in attributes.items()
+        )
         self.session.flush()
 
+        # Compute initial state hash
+        uow.content_hash = self._rehash(uow)
+
         # Record creation in history
         self.append_history(
             uow_id=uow_id,
@@ -100,10 +127,15 @@ class UOWRepositorySQLAlchemy(UOWRepository):
         - Article XVII (Atomic Traceability): Computes new content_hash, records previous_state_hash
         - Article IX (Logic-Blind): Immutable interaction_policy snapshot
         
+        The payload is Pilot audit metadata: it is recorded on the history
+        row, not written to the versioned attributes. The content hash is
+        recomputed from the stored attributes with the incremental scheme so
+        the per-key digest cache never goes stale.
+        
         Args:
             uow_id: UUID of UOW to update
             new_status: New status (e.g., "ACTIVE", "COMPLETED", "PENDING_PILOT_APPROVAL")
-            payload: Attributes to merge into UOW
+            payload: Audit metadata recorded with the transition
             interaction_policy: IGNORED for Phase 1 (immutable after creation)
             auto_increment: If True, increment interaction_count. If False (for resume/clarification),
                           count stays same. Only Guard evaluation increments counter.
@@ -113,15 +145,12 @@ class UOWRepositorySQLAlchemy(UOWRepository):
         if not uow:
             raise NotFoundError(f"UOW {uow_id} not found")
 
-        # Store previous hash for history
+        # Store previous hash and status for history
         previous_hash = uow.content_hash
-
-        # Merge payload into attributes
-        if payload:
-            uow.attributes.update(payload)
+        previous_status = uow.status
 
         # Compute new content hash (Constitutional Article XVII)
-        new_hash = StateHasher.compute_content_hash(uow.attributes)
+        new_hash = self._rehash(uow)
 
         # Update UOW fields
         uow.status = new_status
@@ -147,13 +176,25 @@ class UOWRepositorySQLAlchemy(UOWRepository):
         self.append_history(
             uow_id=uow_id,
             event_type="STATE_TRANSITION",
-            payload={"new_status": new_status, "transition_reason": payload.get("reasoning", "")},
+            payload={
+                **payload,
+                "previous_status": previous_status,
+                "new_status": new_status,
+                "transition_reason": payload.get("reasoning", ""),
+            },
             previous_hash=previous_hash,
         )
 
         self.session.commit()
         return self._to_dict(uow)
 
+    def _rehash(self, uow: UnitsOfWork) -> str:
+        """Recompute the incremental content hash, refreshing uow.content_digests."""
+        # Imported here: persistence_service imports the engine package, which imports database
+        from database.persistence_service import UOWPersistenceService
+
+        return UOWPersistenceService._update_content_digests(self.session, uow)
+
     def append_history(
         self,
         uow_id: UUID,
@@ -169,16 +210,102 @@ class UOWRepositorySQLAlchemy(UOWRepository):
         - Records previous_state_hash
         - Timestamp included automatically
         """
-        history = UOWHistory(
-            uow_id=uow_id,
+        uow = self.session.get(UnitsOfWork, uow_id)
+        if not uow:
+            raise NotFoundError(f"UOW {uow_id} not found")
+
+        history_values = dict(
+            instance_id=uow.instance_id,
+            uow_id=uow.uow_id,
+            previous_status=payload.get("previous_status") or payload.get("initial_status") or uow.status,
+            new_status=uow.status,
+            previous_state_hash=previous_hash or None,
+            new_state_hash=uow.content_hash,
+            previous_interaction_id=uow.current_interaction_id,
+            new_interaction_id=uow.current_interaction_id,
+            transition_timestamp=datetime.now(timezone.utc),
             event_type=event_type,
             payload=payload,
-            previous_state_hash=previous_hash,
-            created_at=datetime.now(timezone.utc),
         )
 
-        self.session.add(history)
-        self.session.flush()
+        # Write-behind batching when a HistoryWriter is attached to the session
+        history_writer = HistoryWriter.for_session(self.session)
+        if history_writer is not None:
+            history_writer.append(**history_values)
+        else:
+            self.session.add(UnitsOfWorkHistory(history_id=uuid4(), **history_values))
+            self.session.flush()
+
+    def pause_active(self, instance_id: UUID, payload: Dict[str, Any]) -> int:
+        """
+        Pause every ACTIVE UOW of an instance with a single UPDATE.
+        
+        Attributes are left untouched, so content hashes stay valid and are
+        not recomputed; the audit payload is recorded in one STATE_TRANSITION
+        history row per paused UOW, bulk-inserted in the same transaction.
+        On dialects with UPDATE ... RETURNING the paused rows come back from
+        the UPDATE itself; elsewhere they are selected (FOR UPDATE) first.
+        
+        Args:
+            instance_id: Instance whose ACTIVE UOWs are paused
+            payload: Audit metadata (e.g. kill_switch_reason, triggered_by)
+        
+        Returns:
+            Number of UOWs paused
+        """
+        now = datetime.now(timezone.utc)
+        criteria = (
+            UnitsOfWork.instance_id == instance_id,
+            UnitsOfWork.status == UOWStatus.ACTIVE.value,
+        )
+        columns = (UnitsOfWork.uow_id, UnitsOfWork.content_hash, UnitsOfWork.current_interaction_id)
+        statement = (
+            update(UnitsOfWork)
+            .where(*criteria)
+            .values(status=UOWStatus.PAUSED.value, last_heartbeat_at=now)
+            .execution_options(synchronize_session="evaluate")
+        )
+
+        if self.session.get_bind().dialect.update_returning:
+            paused = self.session.execute(statement.returning(*columns)).all()
+        else:
+            paused = self.session.execute(select(*columns).where(*criteria).with_for_update()).all()
+            self.session.execute(statement)
+
+        history_payload = {
+            **payload,
+            "previous_status": UOWStatus.ACTIVE.value,
+            "new_status": UOWStatus.PAUSED.value,
+            "transition_reason": payload.get("reasoning", ""),
+        }
+        history_rows = [
+            dict(
+                history_id=uuid4(),
+                instance_id=instance_id,
+                uow_id=uow_id,
+                previous_status=UOWStatus.ACTIVE.value,
+                new_status=UOWStatus.PAUSED.value,
+                previous_state_hash=content_hash,
+                # Attributes are unchanged; a UOW never hashed has nothing to verify
+                new_state_hash=content_hash or "",
+                previous_interaction_id=interaction_id,
+                new_interaction_id=interaction_id,
+                transition_timestamp=now,
+                event_type="STATE_TRANSITION",
+                payload=history_payload,
+            )
+            for uow_id, content_hash, interaction_id in paused
+        ]
+
+        history_writer = HistoryWriter.for_session(self.session)
+        if history_writer is not None:
+            for values in history_rows:
+                history_writer.append(**values)
+        elif history_rows:
+            self.session.execute(insert(UnitsOfWorkHistory), history_rows)
+
+        self.session.commit()
+        return len(paused)
 
     def find_by_status(self, status: str, instance_id: Optional[UUID] = None) -> List[Dict[str, Any]]:
         """Find all UOWs with given status."""
@@ -202,10 +329,11 @@ class UOWRepositorySQLAlchemy(UOWRepository):
 
     def get_history(self, uow_id: UUID, limit: int = 100) -> List[Dict[str, Any]]:
         """Retrieve immutable history for UOW."""
+        flush_pending_history(self.session)
         records = (
-            self.session.query(UOWHistory)
-            .filter(UOWHistory.uow_id == uow_id)
-            .order_by(UOWHistory.created_at.asc())
+            self.session.query(UnitsOfWorkHistory)
+            .filter(UnitsOfWorkHistory.uow_id == uow_id)
+            .order_by(UnitsOfWorkHistory.transition_timestamp.asc())
             .limit(limit)
             .all()
         )
@@ -215,7 +343,7 @@ class UOWRepositorySQLAlchemy(UOWRepository):
                 "event_type": r.event_type,
                 "payload": r.payload,
                 "previous_state_hash": r.previous_state_hash,
-                "created_at": r.created_at.isoformat(),
+                "created_at": r.transition_timestamp.isoformat(),
             }
             for r in records
         ]
@@ -228,13 +356,15 @@ class UOWRepositorySQLAlchemy(UOWRepository):
             "instance_id": str(uow.instance_id),
             "local_workflow_id": str(uow.local_workflow_id),
             "status": uow.status,
-            "attributes": uow.attributes or {},
+            # Own attribute rows only; the latest version of each key wins
+            "attributes": {
+                attr.key: attr.value for attr in sorted(uow.attributes, key=lambda a: a.version)
+            },
             "interaction_policy": uow.interaction_policy or {},
             "content_hash": uow.content_hash,
             "interaction_count": uow.interaction_count,
             "max_interactions": uow.max_interactions,
             "retry_count": uow.retry_count,
-            "created_at": uow.created_at.isoformat() if uow.created_at else None,
             "last_heartbeat_at": uow.last_heartbeat_at.isoformat() if uow.last_heartbeat_at else None,
         }
 
@@ -3,16 +3,25 @@ Pytest Configuration and Shared Fixtures
 
 Provides:
 1. MockGuardContext fixture for Phase 3 testing
-2. Shared database and instance fixtures
-3. Test configuration
+2. Shared database and instance fixtures (temporary engine databases,
+   instantiated workflows with a test actor)
+3. CapturingBroadcaster fixture for asserting emitted events
+4. Test configuration
 """
 
 import pytest
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from database import DatabaseManager, Local_Actors
 from database.persistence_service import GuardContext, ViolationPacket
+from chameleon_workflow_engine.engine import ChameleonEngine
+from chameleon_workflow_engine.stream_broadcaster import (
+    StreamBroadcaster,
+    get_broadcaster,
+    set_broadcaster,
+)
 
 
 class MockGuardContext(GuardContext):
@@ -124,3 +133,90 @@ def mock_guard_context():
         MockGuardContext instance with default permissive behavior
     """
     return MockGuardContext()
+
+
+class CapturingBroadcaster(StreamBroadcaster):
+    """StreamBroadcaster that records (event_type, payload) instead of writing."""
+
+    def __init__(self):
+        self.events: List[Tuple[str, Dict[str, Any]]] = []
+
+    def emit(self, event_type: str, payload: Dict[str, Any]) -> None:
+        self.events.append((event_type, payload))
+
+    def of_type(self, event_type: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Recorded events of one type, in emission order."""
+        return [event for event in self.events if event[0] == event_type]
+
+
+@pytest.fixture
+def capturing_broadcaster():
+    """
+    Install a CapturingBroadcaster as the global broadcaster for one test.
+    
+    Returns:
+        The CapturingBroadcaster (the previous broadcaster is restored afterwards)
+    """
+    previous = get_broadcaster()
+    capture = CapturingBroadcaster()
+    set_broadcaster(capture)
+    yield capture
+    set_broadcaster(previous)
+
+
+@pytest.fixture
+def engine_databases(tmp_path):
+    """
+    Provide a DatabaseManager over temporary template and instance SQLite files.
+    
+    Returns:
+        DatabaseManager with both schemas created (closed after the test)
+    """
+    manager = DatabaseManager(
+        template_url=f"sqlite:///{tmp_path / 'template.db'}",
+        instance_url=f"sqlite:///{tmp_path / 'instance.db'}",
+    )
+    manager.create_template_schema()
+    manager.create_instance_schema()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def engine_instance(engine_databases):
+    """
+    Factory fixture: import a template and instantiate it with a test actor.
+    
+    Usage:
+        engine, instance_id, actor_id = engine_instance(
+            create_simple_template_workflow, {"batch": "B-1"}
+        )
+    
+    Returns:
+        Callable taking (build_template, initial_context), where
+        build_template(manager) imports a template and returns its ID;
+        the callable returns (ChameleonEngine, instance_id, actor_id)
+    """
+    def instantiate(
+        build_template: Callable[[DatabaseManager], uuid.UUID],
+        initial_context: Dict[str, Any],
+    ) -> Tuple[ChameleonEngine, uuid.UUID, uuid.UUID]:
+        template_id = build_template(engine_databases)
+        engine = ChameleonEngine(engine_databases)
+        instance_id = engine.instantiate_workflow(
+            template_id=template_id,
+            initial_context=initial_context,
+        )
+        actor_id = uuid.uuid4()
+        with engine_databases.get_instance_session() as session:
+            session.add(Local_Actors(
+                actor_id=actor_id,
+                instance_id=instance_id,
+                identity_key="test_actor",
+                name="Test Actor",
+                type="HUMAN",
+            ))
+            session.commit()
+        return engine, instance_id, actor_id
+
+    return instantiate
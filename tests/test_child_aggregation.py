@@ -0,0 +1,70 @@
+"""
+Tests for streaming child-result aggregation (Omega reconciliation).
+
+Tests cover:
+1. Spec validation
+2. Each reducer (count, sum, top_k, merge_dict)
+3. Fold purity (aggregate input is not mutated)
+"""
+
+import pytest
+
+from chameleon_workflow_engine.child_aggregation import ChildResultAggregator
+
+
+class TestChildResultAggregator:
+    """Tests for ChildResultAggregator."""
+
+    def test_rejects_unknown_reducer(self):
+        """Test spec validation rejects unknown reducers."""
+        with pytest.raises(ValueError, match="Unknown reducer"):
+            ChildResultAggregator({"x": {"reducer": "median", "source": "v"}})
+
+    def test_rejects_missing_source(self):
+        """Test reducers that read a child attribute require a source."""
+        with pytest.raises(ValueError, match="requires a 'source'"):
+            ChildResultAggregator({"total": {"reducer": "sum"}})
+
+    def test_initial_state(self):
+        """Test initial state has an empty value per reducer."""
+        aggregator = ChildResultAggregator({
+            "n": {"reducer": "count"},
+            "total": {"reducer": "sum", "source": "amount"},
+            "best": {"reducer": "top_k", "source": "score", "k": 2},
+            "tags": {"reducer": "merge_dict", "source": "tags"},
+        })
+        assert aggregator.initial_state() == {"n": 0, "total": 0, "best": [], "tags": {}}
+
+    def test_fold_count_and_sum(self):
+        """Test count and sum fold across children, skipping non-numeric values."""
+        aggregator = ChildResultAggregator({
+            "n": {"reducer": "count"},
+            "with_amount": {"reducer": "count", "source": "amount"},
+            "total": {"reducer": "sum", "source": "amount"},
+        })
+        state = None
+        for attrs in ({"amount": 5}, {"amount": 2.5}, {"amount": "n/a"}, {}):
+            state = aggregator.fold(state, attrs, "child")
+
+        assert state == {"n": 4, "with_amount": 3, "total": 7.5}
+
+    def test_fold_top_k(self):
+        """Test top_k keeps the k best children in order."""
+        aggregator = ChildResultAggregator({"best": {"reducer": "top_k", "source": "score", "k": 2}})
+        state = None
+        for child_id, score in (("a", 3), ("b", 9), ("c", 5)):
+            state = aggregator.fold(state, {"score": score}, child_id)
+
+        assert state["best"] == [
+            {"uow_id": "b", "value": 9},
+            {"uow_id": "c", "value": 5},
+        ]
+
+    def test_fold_merge_dict_does_not_mutate_input(self):
+        """Test merge_dict merges shallowly and leaves the previous aggregate intact."""
+        aggregator = ChildResultAggregator({"tags": {"reducer": "merge_dict", "source": "tags"}})
+        first = aggregator.fold(None, {"tags": {"a": 1, "b": 1}}, "c1")
+        second = aggregator.fold(first, {"tags": {"b": 2}}, "c2")
+
+        assert first == {"tags": {"a": 1, "b": 1}}
+        assert second == {"tags": {"a": 1, "b": 2}}
@@ -0,0 +1,181 @@
+"""
+Tests for column-oriented batch guard evaluation.
+
+Tests cover:
+1. Batch results match ChameleonEngine._evaluate_guard row by row
+2. COMPOSITE short-circuit semantics for evaluation errors
+3. Batch attribute resolution matches resolve_attributes (incl. parent chain)
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database.models_instance import (
+    InstanceBase,
+    Instance_Context,
+    Local_Guardians,
+    Local_Interactions,
+    Local_Workflows,
+    UnitsOfWork,
+    UOW_Attributes,
+)
+from database.enums import InstanceStatus, UOWStatus
+from database.persistence_service import UOWPersistenceService
+from chameleon_workflow_engine.engine import ChameleonEngine
+from chameleon_workflow_engine.guard_batch import (
+    evaluate_guard_batch,
+    is_batchable,
+    required_attribute_keys,
+    to_columns,
+)
+
+NOW = datetime.now(timezone.utc)
+ACTOR_ID = uuid.uuid4()
+
+ROWS = [
+    {"amount": 150, "tier": "gold", "created": (NOW - timedelta(hours=1)).isoformat()},
+    {"amount": 50, "tier": "silver", "created": (NOW - timedelta(days=3)).isoformat()},
+    {"amount": "n/a", "tier": "gold", "created": "not a date"},
+    {"tier": "bronze", "created": NOW - timedelta(minutes=5)},
+    {},
+]
+
+GUARDS = [
+    ("PASS_THRU", {}),
+    ("CRITERIA_GATE", {"field": "amount", "operator": "GT", "threshold": 100}),
+    ("CRITERIA_GATE", {"field": "amount", "operator": "LT", "threshold": 100}),
+    ("CRITERIA_GATE", {"field": "tier", "operator": "EQ", "threshold": "gold"}),
+    ("CRITERIA_GATE", {"field": "tier", "operator": "IN", "threshold": ["gold", "bronze"]}),
+    ("CRITERIA_GATE", {"field": "tier", "operator": "IN", "threshold": "gold"}),
+    ("CRITERIA_GATE", {"field": "amount", "operator": "NE", "threshold": 1}),
+    ("CRITERIA_GATE", {"operator": "GT", "threshold": 1}),
+    ("TTL_CHECK", {"reference_field": "created", "max_age_seconds": 86400}),
+    ("TTL_CHECK", {"reference_field": "created"}),
+    ("COMPOSITE", {"logic": "AND", "steps": [
+        {"type": "CRITERIA_GATE", "config": {"field": "tier", "operator": "EQ", "threshold": "gold"}},
+        {"type": "CRITERIA_GATE", "config": {"field": "amount", "operator": "GT", "threshold": 100}},
+    ]}),
+    ("COMPOSITE", {"logic": "OR", "steps": [
+        {"type": "CRITERIA_GATE", "config": {"field": "amount", "operator": "GT", "threshold": 100}},
+        {"type": "TTL_CHECK", "config": {"reference_field": "created", "max_age_seconds": 86400}},
+    ]}),
+    ("COMPOSITE", {"logic": "XOR", "steps": [{"type": "PASS_THRU"}]}),
+    ("COMPOSITE", {"logic": "AND", "steps": []}),
+]
+
+
+def per_uow_outcome(guard_type, config, attributes):
+    """Reference result from the engine's per-UOW evaluator (errors reject)."""
+    guard = Local_Guardians(
+        guardian_id=uuid.uuid4(), local_workflow_id=uuid.uuid4(), component_id=uuid.uuid4(),
+        name="ref", type=guard_type, attributes=config,
+    )
+    engine = ChameleonEngine.__new__(ChameleonEngine)
+    try:
+        return engine._evaluate_guard(guard, None, attributes, None)
+    except Exception:
+        return False
+
+
+class TestEvaluateGuardBatch:
+    """Tests for evaluate_guard_batch."""
+
+    @pytest.mark.parametrize("guard_type,config", GUARDS)
+    def test_matches_per_uow_evaluation(self, guard_type, config):
+        """Test batch outcomes equal the per-UOW evaluator for every row."""
+        assert is_batchable(guard_type, config)
+        keys = required_attribute_keys(guard_type, config)
+
+        outcomes = evaluate_guard_batch(guard_type, config, to_columns(ROWS, keys), len(ROWS), NOW)
+
+        assert [bool(o) for o in outcomes] == [
+            per_uow_outcome(guard_type, config, row) for row in ROWS
+        ]
+
+    def test_composite_or_stops_at_error(self):
+        """Test an erroring first OR step rejects even if a later step passes."""
+        config = {"logic": "OR", "steps": [
+            {"type": "CRITERIA_GATE", "config": {"field": "amount", "operator": "GT", "threshold": 100}},
+            {"type": "PASS_THRU"},
+        ]}
+        rows = [{"amount": "n/a"}, {"amount": 10}]
+
+        outcomes = evaluate_guard_batch("COMPOSITE", config, to_columns(rows, {"amount"}), 2, NOW)
+
+        assert outcomes == [None, True]
+        assert per_uow_outcome("COMPOSITE", config, rows[0]) is False
+
+    def test_unknown_types_are_not_batchable(self):
+        """Test unsupported guards stay on the per-UOW path."""
+        assert not is_batchable("CONDITIONAL_INJECTOR", {})
+        assert not is_batchable("COMPOSITE", {"steps": [{"type": "CONDITIONAL_INJECTOR"}]})
+        with pytest.raises(ValueError):
+            evaluate_guard_batch("CONDITIONAL_INJECTOR", {}, {}, 1)
+
+
+class TestResolveAttributesBatch:
+    """Tests for UOWPersistenceService.resolve_attributes_batch."""
+
+    @pytest.fixture
+    def session(self):
+        engine = create_engine("sqlite:///:memory:")
+        InstanceBase.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    def test_matches_single_resolution(self, session):
+        """Test batch resolution equals resolve_attributes, with and without a key filter."""
+        instance = Instance_Context(
+            instance_id=uuid.uuid4(), name="Batch", description="Batch", status=InstanceStatus.ACTIVE.value
+        )
+        workflow = Local_Workflows(
+            local_workflow_id=uuid.uuid4(), instance_id=instance.instance_id,
+            original_workflow_id=uuid.uuid4(), name="Batch_WF", version=1, is_master=True,
+        )
+        interaction = Local_Interactions(
+            interaction_id=uuid.uuid4(), local_workflow_id=workflow.local_workflow_id, name="Batch_Int"
+        )
+        session.add_all([instance, workflow, interaction])
+
+        def make_uow(parent=None):
+            uow = UnitsOfWork(
+                uow_id=uuid.uuid4(), instance_id=instance.instance_id,
+                local_workflow_id=workflow.local_workflow_id,
+                current_interaction_id=interaction.interaction_id,
+                status=UOWStatus.PENDING.value, parent_id=parent.uow_id if parent else None,
+            )
+            session.add(uow)
+            return uow
+
+        def set_attr(uow, key, value, version=1):
+            session.add(UOW_Attributes(
+                attribute_id=uuid.uuid4(), uow_id=uow.uow_id, instance_id=instance.instance_id,
+                key=key, value=value, version=version, actor_id=ACTOR_ID,
+            ))
+
+        root = make_uow()
+        child = make_uow(root)
+        grandchild = make_uow(child)
+        other = make_uow()
+        set_attr(root, "amount", 10)
+        set_attr(root, "amount", 20, version=2)
+        set_attr(root, "tier", "gold")
+        set_attr(child, "amount", 30)
+        set_attr(grandchild, "note", "x")
+        set_attr(other, "tier", "silver")
+        session.flush()
+
+        uows = [grandchild, child, other]
+        batch = UOWPersistenceService.resolve_attributes_batch(session, uows)
+        filtered = UOWPersistenceService.resolve_attributes_batch(session, uows, keys={"amount"})
+
+        for uow in uows:
+            expected, _ = UOWPersistenceService.resolve_attributes(session, uow)
+            assert batch[uow.uow_id] == expected
+            assert filtered[uow.uow_id] == {k: v for k, v in expected.items() if k == "amount"}
+        assert batch[grandchild.uow_id] == {"amount": 30, "tier": "gold", "note": "x"}
@@ -0,0 +1,262 @@
+"""
+Tests for keyset-paginated history queries and the audit API.
+
+Tests cover:
+1. (timestamp, history_id) keyset paging per UOW and per instance
+2. Entries sharing a timestamp are neither skipped nor repeated
+3. Paged REST endpoints, cursor validation and Pilot authentication
+4. Streaming NDJSON export
+5. Paging and export merge archived entries with live ones
+"""
+
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from database import DatabaseManager
+from database.models_instance import (
+    Instance_Context,
+    Local_Workflows,
+    Local_Interactions,
+    UnitsOfWork,
+    UnitsOfWorkHistory,
+)
+from database.enums import InstanceStatus, UOWStatus
+from database.history_archive import (
+    HistoryArchive,
+    HistoryArchiver,
+    HistoryReader,
+    get_history_reader,
+    set_history_reader,
+)
+from database.persistence_service import UOWPersistenceService
+from chameleon_workflow_engine import server
+from chameleon_workflow_engine.jwt_utils import JWTConfig, create_token, set_jwt_config
+
+BASE_TIME = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def pilot_auth():
+    """Sign and verify Pilot tokens with a test secret."""
+    set_jwt_config(JWTConfig(secret_key="test-secret-key-that-is-long-enough-for-hs256"))
+    yield
+    set_jwt_config(None)
+
+
+def viewer_client(manager, monkeypatch):
+    """TestClient authenticated as a VIEWER Pilot (history is read-only)."""
+    monkeypatch.setattr(server, "db_manager", manager)
+    return TestClient(
+        server.app, headers={"Authorization": f"Bearer {create_token('pilot-1', 'VIEWER')}"}
+    )
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = DatabaseManager(instance_url=f"sqlite:///{tmp_path / 'instance.db'}")
+    manager.create_instance_schema()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def history(manager):
+    """Two UOWs in one instance: 7 and 3 history entries, several sharing timestamps."""
+    with manager.get_instance_session() as session:
+        instance = Instance_Context(
+            instance_id=uuid.uuid4(), name="Audit", description="Audit", status=InstanceStatus.ACTIVE.value
+        )
+        workflow = Local_Workflows(
+            local_workflow_id=uuid.uuid4(), instance_id=instance.instance_id,
+            original_workflow_id=uuid.uuid4(), name="Audit_WF", version=1, is_master=True,
+        )
+        interaction = Local_Interactions(
+            interaction_id=uuid.uuid4(), local_workflow_id=workflow.local_workflow_id, name="Audit_Int"
+        )
+        session.add_all([instance, workflow, interaction])
+        uows = []
+        for _ in range(2):
+            uow = UnitsOfWork(
+                uow_id=uuid.uuid4(), instance_id=instance.instance_id,
+                local_workflow_id=workflow.local_workflow_id,
+                current_interaction_id=interaction.interaction_id,
+                status=UOWStatus.ACTIVE.value,
+            )
+            session.add(uow)
+            uows.append(uow)
+        session.flush()
+
+        for uow, count in zip(uows, (7, 3)):
+            for i in range(count):
+                session.add(UnitsOfWorkHistory(
+                    history_id=uuid.uuid4(), instance_id=instance.instance_id, uow_id=uow.uow_id,
+                    previous_status=UOWStatus.PENDING.value, new_status=UOWStatus.ACTIVE.value,
+                    new_state_hash="0" * 64, new_interaction_id=interaction.interaction_id,
+                    # Pairs of entries share a timestamp
+                    transition_timestamp=BASE_TIME + timedelta(seconds=i // 2),
+                ))
+
+        ids = {
+            "instance_id": instance.instance_id,
+            "uow_id": uows[0].uow_id,
+        }
+    return ids
+
+
+class TestKeysetHistory:
+    """Tests for keyset pagination in UOWPersistenceService."""
+
+    def _walk(self, fetch, page_size):
+        seen, after = [], None
+        while True:
+            page = fetch(limit=page_size, after=after)
+            seen.extend(entry.history_id for entry in page)
+            if len(page) < page_size:
+                return seen
+            after = UOWPersistenceService.decode_history_cursor(
+                UOWPersistenceService.encode_history_cursor(page[-1])
+            )
+
+    def test_uow_pages_cover_history_once(self, manager, history):
+        """Test paging a UOW's history returns every entry exactly once, in order."""
+        with manager.get_instance_session() as session:
+            full = UOWPersistenceService.get_uow_history(session, history["uow_id"])
+            paged = self._walk(
+                lambda **kw: UOWPersistenceService.get_uow_history(session, history["uow_id"], **kw),
+                page_size=2,
+            )
+            full_ids = [entry.history_id for entry in full]
+
+        assert len(full_ids) == 7
+        assert paged == full_ids
+
+    def test_instance_pages_cover_all_uows(self, manager, history):
+        """Test instance-wide paging spans every UOW's history."""
+        with manager.get_instance_session() as session:
+            paged = self._walk(
+                lambda **kw: UOWPersistenceService.get_instance_history(
+                    session, history["instance_id"], **kw
+                ),
+                page_size=3,
+            )
+
+        assert len(paged) == 10
+        assert len(set(paged)) == 10
+
+    def test_invalid_cursor_rejected(self):
+        """Test malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            UOWPersistenceService.decode_history_cursor("not-a-cursor")
+
+
+class TestHistoryEndpoints:
+    """Tests for the history REST API."""
+
+    @pytest.fixture
+    def client(self, manager, monkeypatch, pilot_auth):
+        return viewer_client(manager, monkeypatch)
+
+    def test_uow_history_endpoint_pages(self, client, history):
+        """Test the per-UOW endpoint follows next_cursor to the end."""
+        items, after = [], None
+        while True:
+            params = {"limit": 3, **({"after": after} if after else {})}
+            response = client.get(f"/api/history/uow/{history['uow_id']}", params=params)
+            assert response.status_code == 200
+            body = response.json()
+            items.extend(body["items"])
+            after = body["next_cursor"]
+            if after is None:
+                break
+
+        assert len(items) == 7
+        assert len({item["history_id"] for item in items}) == 7
+
+    def test_history_endpoints_require_pilot_token(self, manager, monkeypatch, pilot_auth, history):
+        """Test every history route rejects unauthenticated callers."""
+        monkeypatch.setattr(server, "db_manager", manager)
+        anonymous = TestClient(server.app)
+        for url in (
+            f"/api/history/uow/{history['uow_id']}",
+            f"/api/history/instance/{history['instance_id']}",
+            f"/api/history/instance/{history['instance_id']}/export",
+        ):
+            assert anonymous.get(url).status_code == 401
+
+    def test_bad_cursor_and_limit_return_400(self, client, history):
+        """Test invalid input is rejected with HTTP 400."""
+        url = f"/api/history/instance/{history['instance_id']}"
+        assert client.get(url, params={"after": "garbage"}).status_code == 400
+        assert client.get(url, params={"limit": 0}).status_code == 400
+
+    def test_export_streams_ndjson(self, client, history, monkeypatch):
+        """Test the NDJSON export streams every entry across several pages."""
+        monkeypatch.setattr(server, "HISTORY_PAGE_MAX", 4)
+
+        response = client.get(f"/api/history/instance/{history['instance_id']}/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == 10
+        assert [line["transition_timestamp"] for line in lines] == sorted(
+            line["transition_timestamp"] for line in lines
+        )
+
+
+class TestArchivedHistoryEndpoints:
+    """Tests for the history REST API once part of the ledger is archived."""
+
+    @pytest.fixture
+    def archived(self, manager, history, tmp_path):
+        """Archive every entry before BASE_TIME + 2s (7 of 10) and read through the archive."""
+        with manager.get_instance_session() as session:
+            expected = [
+                str(entry.history_id)
+                for entry in UOWPersistenceService.get_instance_history(session, history["instance_id"])
+            ]
+            for uow in session.query(UnitsOfWork).all():
+                uow.status = UOWStatus.COMPLETED.value
+        archive = HistoryArchive(str(tmp_path / "archive"))
+        archived = HistoryArchiver(sessionmaker(bind=manager.instance_engine), archive).archive_instance(
+            history["instance_id"], before=BASE_TIME + timedelta(seconds=2)
+        )
+        assert archived["uow_history"] == 7
+
+        previous = get_history_reader()
+        set_history_reader(HistoryReader(archive))
+        yield expected
+        set_history_reader(previous)
+
+    @pytest.fixture
+    def client(self, manager, monkeypatch, pilot_auth):
+        return viewer_client(manager, monkeypatch)
+
+    def test_instance_endpoint_pages_across_archive(self, client, history, archived):
+        """Test next_cursor walks from archived entries into live ones in order."""
+        items, after = [], None
+        while True:
+            params = {"limit": 4, **({"after": after} if after else {})}
+            response = client.get(f"/api/history/instance/{history['instance_id']}", params=params)
+            assert response.status_code == 200
+            body = response.json()
+            items.extend(body["items"])
+            after = body["next_cursor"]
+            if after is None:
+                break
+
+        assert [item["history_id"] for item in items] == archived
+
+    def test_export_includes_archived_entries(self, client, history, archived, monkeypatch):
+        """Test the NDJSON export streams archived and live entries as one history."""
+        monkeypatch.setattr(server, "HISTORY_PAGE_MAX", 4)
+
+        response = client.get(f"/api/history/instance/{history['instance_id']}/export")
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["history_id"] for line in lines] == archived
@@ -0,0 +1,346 @@
+"""
+Tests for date-partitioned history archival.
+
+Tests cover:
+1. Only completed instances are archived
+2. Archived rows leave the live tables and land in day partitions
+3. Reader merges archived and live history in order
+4. Re-running an interrupted archive does not duplicate history
+5. Per-UOW reads use the member index; service getters read the archive
+6. Keyset pages span archived and live rows
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from database.models_instance import (
+    InstanceBase,
+    Instance_Context,
+    Local_Workflows,
+    Local_Roles,
+    Local_Interactions,
+    Local_Actors,
+    UnitsOfWork,
+    UnitsOfWorkHistory,
+    Interaction_Logs,
+)
+from database.enums import InstanceStatus, ActorType, RoleType, UOWStatus
+from database.history_archive import (
+    HistoryArchive,
+    HistoryArchiver,
+    HistoryReader,
+    get_history_reader,
+    row_to_record,
+    set_history_reader,
+)
+from database.persistence_service import UOWPersistenceService
+
+DAY_ONE = datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc)
+DAY_TWO = datetime(2026, 1, 2, 9, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'instance.db'}")
+    InstanceBase.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return HistoryArchive(str(tmp_path / "archive"))
+
+
+@pytest.fixture
+def instance(session_factory):
+    """Instance with one UOW, three history rows over two days and two log entries."""
+    session = session_factory()
+    instance = Instance_Context(
+        instance_id=uuid.uuid4(), name="Archive", description="Archive", status=InstanceStatus.ACTIVE.value
+    )
+    workflow = Local_Workflows(
+        local_workflow_id=uuid.uuid4(), instance_id=instance.instance_id,
+        original_workflow_id=uuid.uuid4(), name="Archive_WF", version=1, is_master=True,
+    )
+    interaction = Local_Interactions(
+        interaction_id=uuid.uuid4(), local_workflow_id=workflow.local_workflow_id, name="Archive_Int"
+    )
+    role = Local_Roles(
+        role_id=uuid.uuid4(), local_workflow_id=workflow.local_workflow_id,
+        name="Archive_Role", role_type=RoleType.BETA.value,
+    )
+    actor = Local_Actors(
+        actor_id=uuid.uuid4(), instance_id=instance.instance_id,
+        identity_key="archiver", name="Archiver", type=ActorType.SYSTEM.value,
+    )
+    uow = UnitsOfWork(
+        uow_id=uuid.uuid4(), instance_id=instance.instance_id,
+        local_workflow_id=workflow.local_workflow_id,
+        current_interaction_id=interaction.interaction_id,
+        status=UOWStatus.ACTIVE.value,
+    )
+    session.add_all([instance, workflow, interaction, role, actor, uow])
+    session.flush()
+
+    transitions = [
+        (UOWStatus.PENDING.value, UOWStatus.ACTIVE.value, DAY_ONE),
+        (UOWStatus.ACTIVE.value, UOWStatus.PENDING.value, DAY_ONE + timedelta(hours=1)),
+        (UOWStatus.PENDING.value, UOWStatus.ACTIVE.value, DAY_TWO),
+    ]
+    for previous, new, timestamp in transitions:
+        session.add(UnitsOfWorkHistory(
+            history_id=uuid.uuid4(), instance_id=instance.instance_id, uow_id=uow.uow_id,
+            previous_status=previous, new_status=new, new_state_hash="0" * 64,
+            new_interaction_id=interaction.interaction_id, transition_timestamp=timestamp,
+        ))
+    for log_id, timestamp in ((1, DAY_ONE), (2, DAY_TWO)):
+        session.add(Interaction_Logs(
+            log_id=log_id, instance_id=instance.instance_id, uow_id=uow.uow_id,
+            actor_id=actor.actor_id, role_id=role.role_id,
+            interaction_id=interaction.interaction_id, timestamp=timestamp,
+        ))
+    session.commit()
+
+    ids = {"instance_id": instance.instance_id, "uow_id": uow.uow_id}
+    session.close()
+    return ids
+
+
+def complete(session_factory, uow_id):
+    session = session_factory()
+    session.get(UnitsOfWork, uow_id).status = UOWStatus.COMPLETED.value
+    session.commit()
+    session.close()
+
+
+def live_count(session_factory, model):
+    session = session_factory()
+    count = session.execute(select(func.count()).select_from(model)).scalar()
+    session.close()
+    return count
+
+
+class TestHistoryArchiver:
+    """Tests for HistoryArchiver."""
+
+    def test_skips_instances_with_open_uows(self, session_factory, archive, instance):
+        """Test an instance with non-terminal UOWs is not archived."""
+        archived = HistoryArchiver(session_factory, archive).archive_instance(instance["instance_id"])
+
+        assert archived == {}
+        assert live_count(session_factory, UnitsOfWorkHistory) == 3
+
+    def test_archives_completed_instance_by_day(self, session_factory, archive, instance):
+        """Test ledger rows move into day partitions and out of the live tables."""
+        complete(session_factory, instance["uow_id"])
+
+        results = HistoryArchiver(session_factory, archive, batch_size=2).archive_completed_instances()
+
+        assert results == {str(instance["instance_id"]): {"uow_history": 3, "interaction_logs": 2}}
+        assert live_count(session_factory, UnitsOfWorkHistory) == 0
+        assert live_count(session_factory, Interaction_Logs) == 0
+        assert archive.days("uow_history") == ["2026-01-01", "2026-01-02"]
+        assert os.path.exists(
+            archive.partition_path("uow_history", "2026-01-01", str(instance["instance_id"]))
+        )
+
+    def test_before_cutoff_keeps_recent_rows_live(self, session_factory, archive, instance):
+        """Test only rows older than the cutoff are archived."""
+        complete(session_factory, instance["uow_id"])
+
+        archived = HistoryArchiver(session_factory, archive).archive_instance(
+            instance["instance_id"], before=DAY_TWO
+        )
+
+        assert archived == {"uow_history": 2, "interaction_logs": 1}
+        assert live_count(session_factory, UnitsOfWorkHistory) == 1
+
+
+class TestHistoryReader:
+    """Tests for merged archived + live reads."""
+
+    def test_merges_archived_and_live_history(self, session_factory, archive, instance):
+        """Test a partially archived UOW reads back as one ordered history."""
+        session = session_factory()
+        expected = [
+            row_to_record(row, "uow_history")
+            for row in session.query(UnitsOfWorkHistory)
+            .order_by(UnitsOfWorkHistory.transition_timestamp)
+            .all()
+        ]
+        session.close()
+        complete(session_factory, instance["uow_id"])
+        HistoryArchiver(session_factory, archive).archive_instance(
+            instance["instance_id"], before=DAY_TWO
+        )
+
+        session = session_factory()
+        reader = HistoryReader(archive)
+        by_uow = reader.history_for_uow(session, instance["uow_id"])
+        by_instance = reader.history_for_instance(session, instance["instance_id"])
+        logs = reader.interaction_logs_for_instance(session, instance["instance_id"])
+        session.close()
+
+        assert by_uow == expected
+        assert by_instance == expected
+        assert [log["log_id"] for log in logs] == [1, 2]
+
+    def test_interrupted_archive_does_not_duplicate(self, session_factory, archive, instance):
+        """Test rows written to the archive but not yet deleted are read once."""
+        session = session_factory()
+        rows = session.query(UnitsOfWorkHistory).all()
+        # Simulate a crash after the archive write, before the live delete
+        archive.write(
+            "uow_history", str(instance["instance_id"]),
+            [row_to_record(row, "uow_history") for row in rows],
+        )
+        session.close()
+        complete(session_factory, instance["uow_id"])
+        HistoryArchiver(session_factory, archive).archive_instance(instance["instance_id"])
+
+        session = session_factory()
+        history = HistoryReader(archive).history_for_uow(session, instance["uow_id"])
+        session.close()
+
+        assert [h["new_status"] for h in history] == [
+            UOWStatus.ACTIVE.value, UOWStatus.PENDING.value, UOWStatus.ACTIVE.value,
+        ]
+
+    def test_uow_read_only_decompresses_indexed_members(self, session_factory, archive, instance, monkeypatch):
+        """Test a per-UOW read skips gzip members the index does not list for it."""
+        complete(session_factory, instance["uow_id"])
+        HistoryArchiver(session_factory, archive).archive_instance(instance["instance_id"])
+        other = {
+            "history_id": str(uuid.uuid4()), "instance_id": str(instance["instance_id"]),
+            "uow_id": str(uuid.uuid4()), "transition_timestamp": "2026-01-01T12:00:00.000000+00:00",
+        }
+        archive.write("uow_history", str(instance["instance_id"]), [other])
+
+        decompressed = []
+        real_member_lines = HistoryArchive._member_lines
+        monkeypatch.setattr(
+            HistoryArchive, "_member_lines",
+            staticmethod(lambda path, entry: decompressed.append(entry) or real_member_lines(path, entry)),
+        )
+        records = list(archive.read("uow_history", uow_id=str(instance["uow_id"])))
+
+        assert len(records) == 3
+        assert len(decompressed) == 2  # One member per day; the other UOW's member is skipped
+
+    def test_unindexed_partition_is_scanned(self, session_factory, archive, instance):
+        """Test a partition whose index does not cover the file is read in full."""
+        complete(session_factory, instance["uow_id"])
+        HistoryArchiver(session_factory, archive).archive_instance(instance["instance_id"])
+        path = archive.partition_path("uow_history", "2026-01-01", str(instance["instance_id"]))
+        os.remove(archive.index_path(path))
+
+        records = list(archive.read("uow_history", uow_id=str(instance["uow_id"])))
+        session = session_factory()
+        paged = HistoryReader(archive).instance_history(session, instance["instance_id"])
+        session.close()
+
+        assert len(records) == 3
+        assert [entry.new_status for entry in paged] == [
+            UOWStatus.ACTIVE.value, UOWStatus.PENDING.value, UOWStatus.ACTIVE.value,
+        ]
+
+    def test_keyset_pages_span_archive_and_live(self, session_factory, archive, instance):
+        """Test cursor pages walk archived rows into live rows without gaps or repeats."""
+        session = session_factory()
+        expected = [
+            row.history_id for row in session.query(UnitsOfWorkHistory)
+            .order_by(UnitsOfWorkHistory.transition_timestamp)
+            .all()
+        ]
+        session.close()
+        complete(session_factory, instance["uow_id"])
+        HistoryArchiver(session_factory, archive).archive_instance(
+            instance["instance_id"], before=DAY_TWO
+        )
+
+        session = session_factory()
+        reader = HistoryReader(archive)
+        seen, after = [], None
+        while True:
+            page = reader.instance_history(session, instance["instance_id"], limit=2, after=after)
+            seen.extend(entry.history_id for entry in page)
+            if len(page) < 2:
+                break
+            after = (page[-1].transition_timestamp, page[-1].history_id)
+        by_uow = reader.uow_history(session, instance["uow_id"], limit=2, after=after)
+        session.close()
+
+        assert seen == expected
+        assert [entry.history_id for entry in by_uow] == expected[2:]
+
+    def test_keyset_page_cost_stays_flat(self, session_factory, archive, instance, monkeypatch):
+        """Test a deep page decodes about one member, not every archived row before it."""
+        import database.history_archive as history_archive
+
+        member_size, members = 500, 20
+        start = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        for m in range(members):
+            archive.write("uow_history", str(instance["instance_id"]), [
+                {
+                    "history_id": str(uuid.uuid4()),
+                    "instance_id": str(instance["instance_id"]),
+                    "uow_id": str(instance["uow_id"]),
+                    "new_status": UOWStatus.ACTIVE.value,
+                    "transition_timestamp": (
+                        start + timedelta(seconds=m * member_size + i)
+                    ).isoformat(timespec="microseconds"),
+                }
+                for i in range(member_size)
+            ])
+
+        decoded = []
+
+        class CountingJson:
+            dumps = staticmethod(json.dumps)
+
+            @staticmethod
+            def loads(text):
+                decoded.append(1)
+                return json.loads(text)
+
+        monkeypatch.setattr(history_archive, "json", CountingJson)
+        session = session_factory()
+        reader = HistoryReader(archive)
+        costs, after, seen = [], None, 0
+        while True:
+            decoded.clear()
+            page = reader.instance_history(session, instance["instance_id"], limit=250, after=after)
+            costs.append(len(decoded))
+            seen += len(page)
+            if len(page) < 250:
+                break
+            after = (page[-1].transition_timestamp, page[-1].history_id)
+        session.close()
+
+        assert seen == member_size * members + 3
+        # Index lines + at most one member skipped into + the page itself
+        assert max(costs) <= members + member_size + 250
+        assert costs[-1] <= costs[1] + member_size
+
+    def test_persistence_getters_read_through_global_reader(self, session_factory, archive, instance):
+        """Test UOWPersistenceService history getters include archived entries."""
+        complete(session_factory, instance["uow_id"])
+        HistoryArchiver(session_factory, archive).archive_instance(instance["instance_id"])
+        previous = get_history_reader()
+        set_history_reader(HistoryReader(archive))
+        try:
+            session = session_factory()
+            history = UOWPersistenceService.get_uow_history(session, instance["uow_id"])
+            session.close()
+        finally:
+            set_history_reader(previous)
+
+        assert [h.new_status for h in history] == [
+            UOWStatus.ACTIVE.value, UOWStatus.PENDING.value, UOWStatus.ACTIVE.value,
+        ]
@@ -0,0 +1,277 @@
+"""
+Tests for write-behind batching of UnitsOfWorkHistory appends.
+
+Tests cover:
+1. Buffered rows commit with the surrounding transaction
+2. One bulk INSERT per flush_size rows
+3. Per-UOW ordering of buffered rows
+4. Rollback discards buffered rows
+5. Write-ahead log mode and idempotent draining
+6. Undrained WAL rows stay visible to Pilot continuation lookups
+"""
+
+import os
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from database.models_instance import (
+    InstanceBase,
+    Instance_Context,
+    Local_Workflows,
+    Local_Interactions,
+    UnitsOfWork,
+    UnitsOfWorkHistory,
+)
+from database.enums import InstanceStatus, UOWStatus
+from database.persistence_service import (
+    UOWPersistenceService,
+    GuardContext,
+    PILOT_CONTINUATION_KEY,
+    PILOT_PARK_STATUS,
+)
+from database.history_writer import HistoryWriter, HistoryWAL
+from database.manager import DatabaseManager
+
+STATUSES = [
+    UOWStatus.ACTIVE.value,
+    UOWStatus.PENDING.value,
+    UOWStatus.ACTIVE.value,
+    UOWStatus.PENDING.value,
+    UOWStatus.ACTIVE.value,
+]
+
+
+class AllowAllGuardContext(GuardContext):
+    """GuardContext that authorizes everything."""
+
+    def is_authorized(self, actor_id, uow_id):
+        return True
+
+    def emit_violation(self, packet):
+        pass
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'instance.db'}")
+    InstanceBase.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def uow_id(session_factory):
+    """Committed UOW to record transitions for."""
+    session = session_factory()
+    instance = Instance_Context(
+        instance_id=uuid.uuid4(), name="History", description="History", status=InstanceStatus.ACTIVE.value
+    )
+    workflow = Local_Workflows(
+        local_workflow_id=uuid.uuid4(), instance_id=instance.instance_id,
+        original_workflow_id=uuid.uuid4(), name="History_WF", version=1, is_master=True,
+    )
+    interaction = Local_Interactions(
+        interaction_id=uuid.uuid4(), local_workflow_id=workflow.local_workflow_id, name="History_Int"
+    )
+    uow_id = uuid.uuid4()
+    uow = UnitsOfWork(
+        uow_id=uow_id, instance_id=instance.instance_id,
+        local_workflow_id=workflow.local_workflow_id,
+        current_interaction_id=interaction.interaction_id,
+        status=UOWStatus.PENDING.value,
+    )
+    session.add_all([instance, workflow, interaction, uow])
+    session.commit()
+    session.close()
+    return uow_id
+
+
+def record_transitions(session, uow_id):
+    uow = session.get(UnitsOfWork, uow_id)
+    for status in STATUSES:
+        UOWPersistenceService.save_uow(
+            session, uow, guard_context=AllowAllGuardContext(), new_status=status
+        )
+    return uow
+
+
+def history_statuses(session, uow_id):
+    rows = (
+        session.query(UnitsOfWorkHistory)
+        .filter(UnitsOfWorkHistory.uow_id == uow_id)
+        .order_by(UnitsOfWorkHistory.transition_timestamp.asc())
+        .all()
+    )
+    return [row.new_status for row in rows]
+
+
+class TestHistoryWriter:
+    """Tests for transactional write-behind batching."""
+
+    def test_buffered_history_commits_with_transaction(self, session_factory, uow_id):
+        """Test buffered rows are readable in-session and committed in order."""
+        session = session_factory()
+        writer = HistoryWriter.attach(session, flush_size=100)
+
+        uow = record_transitions(session, uow_id)
+        assert writer.pending == len(STATUSES)
+
+        # Read-your-writes through the service
+        history = UOWPersistenceService.get_uow_history(session, uow.uow_id)
+        assert [h.new_status for h in history] == STATUSES
+        session.commit()
+        session.close()
+
+        fresh = session_factory()
+        assert history_statuses(fresh, uow_id) == STATUSES
+        fresh.close()
+
+    def test_flush_size_batches_inserts(self, engine, session_factory, uow_id):
+        """Test each flush_size rows go out as one bulk INSERT."""
+        history_inserts = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def count_inserts(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO uow_history"):
+                history_inserts.append(len(parameters) if executemany else 1)
+
+        session = session_factory()
+        HistoryWriter.attach(session, flush_size=2)
+        record_transitions(session, uow_id)
+        session.commit()
+        session.close()
+        event.remove(engine, "before_cursor_execute", count_inserts)
+
+        assert history_inserts == [2, 2, 1]
+
+    def test_ordering_per_uow_with_identical_timestamps(self, session_factory, uow_id):
+        """Test timestamps are made strictly increasing per UOW."""
+        session = session_factory()
+        uow = session.get(UnitsOfWork, uow_id)
+        writer = HistoryWriter.attach(session, flush_size=100)
+        same_instant = datetime.now(timezone.utc)
+
+        for status in STATUSES:
+            writer.append(
+                instance_id=uow.instance_id, uow_id=uow.uow_id,
+                previous_status="PENDING", new_status=status, new_state_hash="0" * 64,
+                new_interaction_id=uow.current_interaction_id,
+                transition_timestamp=same_instant,
+            )
+        session.commit()
+
+        assert history_statuses(session, uow_id) == STATUSES
+        session.close()
+
+    def test_rollback_discards_buffered_rows(self, session_factory, uow_id):
+        """Test buffered history is discarded with the transaction."""
+        session = session_factory()
+        writer = HistoryWriter.attach(session, flush_size=100)
+        record_transitions(session, uow_id)
+
+        session.rollback()
+
+        assert writer.pending == 0
+        assert history_statuses(session, uow_id) == []
+        session.close()
+
+
+class TestHistoryWAL:
+    """Tests for the durable write-ahead log mode."""
+
+    def test_wal_defers_history_until_drained(self, session_factory, uow_id, tmp_path):
+        """Test history goes to the WAL at commit and into the DB on drain."""
+        wal = HistoryWAL(str(tmp_path / "history.wal"))
+        session = session_factory()
+        HistoryWriter.attach(session, flush_size=2, wal=wal)
+        record_transitions(session, uow_id)
+        session.commit()
+        session.close()
+
+        check = session_factory()
+        assert history_statuses(check, uow_id) == []
+        assert os.path.exists(wal.path)
+
+        assert wal.drain(session_factory, batch_size=2) == len(STATUSES)
+        assert history_statuses(check, uow_id) == STATUSES
+        assert wal.drain(session_factory) == 0
+        check.close()
+
+    def test_redrain_after_crash_does_not_duplicate(self, session_factory, uow_id, tmp_path):
+        """Test a segment left behind after commit is drained without duplicates."""
+        wal = HistoryWAL(str(tmp_path / "history.wal"))
+        session = session_factory()
+        HistoryWriter.attach(session, wal=wal)
+        record_transitions(session, uow_id)
+        session.commit()
+        session.close()
+
+        with open(wal.path, "r", encoding="utf-8") as f:
+            logged = f.read()
+        wal.drain(session_factory)
+
+        # Simulate a crash between commit and segment removal
+        with open(wal.segment_path, "w", encoding="utf-8") as f:
+            f.write(logged)
+
+        assert wal.drain(session_factory) == 0
+        check = session_factory()
+        assert history_statuses(check, uow_id) == STATUSES
+        check.close()
+
+    def test_continuation_visible_before_drain(self, session_factory, uow_id, tmp_path):
+        """Test a park row still in the WAL is found by get_pilot_continuation."""
+        wal = HistoryWAL(str(tmp_path / "history.wal"))
+        session = session_factory()
+        writer = HistoryWriter.attach(session, wal=wal)
+        uow = session.get(UnitsOfWork, uow_id)
+        writer.append(
+            instance_id=uow.instance_id,
+            uow_id=uow_id,
+            previous_status=uow.status,
+            new_status=PILOT_PARK_STATUS,
+            new_state_hash="",
+            previous_interaction_id=uow.current_interaction_id,
+            new_interaction_id=uow.current_interaction_id,
+            transition_metadata={PILOT_CONTINUATION_KEY: {"target_status": "COMPLETED"}},
+        )
+        uow.status = PILOT_PARK_STATUS
+        session.commit()
+        session.close()
+
+        lookup = session_factory()
+        HistoryWriter.attach(lookup, wal=wal)
+        parked = lookup.get(UnitsOfWork, uow_id)
+        assert history_statuses(lookup, uow_id) == []
+        assert UOWPersistenceService.get_pilot_continuation(lookup, parked) == {
+            "target_status": "COMPLETED"
+        }
+
+        wal.drain(session_factory)
+        assert wal.read() == []
+        assert UOWPersistenceService.get_pilot_continuation(lookup, parked) == {
+            "target_status": "COMPLETED"
+        }
+        lookup.close()
+
+    def test_manager_attaches_writer_to_instance_sessions(self, tmp_path):
+        """Test enable_history_writer installs a writer on every instance session."""
+        manager = DatabaseManager(instance_url=f"sqlite:///{tmp_path / 'managed.db'}")
+        with manager.get_instance_session() as session:
+            assert HistoryWriter.for_session(session) is None
+
+        wal = HistoryWAL(str(tmp_path / "history.wal"))
+        manager.enable_history_writer(flush_size=50, wal=wal)
+        with manager.get_instance_session() as session:
+            writer = HistoryWriter.for_session(session)
+            assert writer.flush_size == 50
+            assert writer.wal is wal
+        manager.close()
@@ -0,0 +1,202 @@
+"""
+Tests for the background state-hash integrity scanner.
+
+Tests cover:
+1. Clean sweeps over parents and copy-on-write children
+2. Drift detection and ViolationPacket emission
+3. Checkpointed, resumable sweeps
+4. Process-pool hashing
+"""
+
+import os
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+from database.models_instance import (
+    InstanceBase,
+    Instance_Context,
+    Local_Workflows,
+    Local_Interactions,
+    Local_Actors,
+    UnitsOfWork,
+    UOW_Attributes,
+)
+from database.enums import InstanceStatus, ActorType, UOWStatus
+from database.persistence_service import UOWPersistenceService, GuardContext
+from database.integrity_scanner import StateHashScanner, ScanCheckpoint
+from chameleon_workflow_engine.semantic_guard import StateVerifier
+
+
+class RecordingGuardContext(GuardContext):
+    """GuardContext that authorizes everything and records violations."""
+
+    def __init__(self):
+        self.violations = []
+
+    def is_authorized(self, actor_id, uow_id):
+        return True
+
+    def emit_violation(self, packet):
+        self.violations.append(packet)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """File-backed SQLite so every scanner session sees the same data."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'instance.db'}")
+    InstanceBase.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def fleet(session_factory):
+    """One parent UOW with attributes and six children inheriting them."""
+    guard = RecordingGuardContext()
+    session = session_factory()
+
+    instance = Instance_Context(
+        instance_id=uuid.uuid4(), name="Scan", description="Scan", status=InstanceStatus.ACTIVE.value
+    )
+    workflow = Local_Workflows(
+        local_workflow_id=uuid.uuid4(), instance_id=instance.instance_id,
+        original_workflow_id=uuid.uuid4(), name="Scan_WF", version=1, is_master=True,
+    )
+    interaction = Local_Interactions(
+        interaction_id=uuid.uuid4(), local_workflow_id=workflow.local_workflow_id, name="Scan_Int"
+    )
+    actor = Local_Actors(
+        actor_id=uuid.uuid4(), instance_id=instance.instance_id,
+        identity_key="scanner", name="Scanner", type=ActorType.SYSTEM.value,
+    )
+    session.add_all([instance, workflow, interaction, actor])
+    session.flush()
+
+    def new_uow(parent_id=None, **attributes):
+        uow = UnitsOfWork(
+            uow_id=uuid.uuid4(), instance_id=instance.instance_id,
+            local_workflow_id=workflow.local_workflow_id,
+            current_interaction_id=interaction.interaction_id,
+            status=UOWStatus.PENDING.value, parent_id=parent_id,
+        )
+        session.add(uow)
+        session.flush()
+        for key, value in attributes.items():
+            session.add(UOW_Attributes(
+                attribute_id=uuid.uuid4(), uow_id=uow.uow_id, instance_id=uow.instance_id,
+                actor_id=actor.actor_id, key=key, value=value, version=1,
+            ))
+        session.flush()
+        UOWPersistenceService.save_uow(session, uow, guard_context=guard)
+        return uow
+
+    parent = new_uow(customer="ACME", amount=100)
+    children = [new_uow(parent_id=parent.uow_id, item=i) for i in range(5)]
+    children.append(new_uow(parent_id=parent.uow_id, amount=250))  # Overrides the parent
+    session.commit()
+
+    ids = [parent.uow_id] + [child.uow_id for child in children]
+    session.close()
+    return ids
+
+
+class TestStateHashScanner:
+    """Tests for StateHashScanner."""
+
+    def test_clean_sweep_reports_no_drift(self, session_factory, fleet):
+        """Test that a sweep over untouched UOWs (incl. inherited attributes) is clean."""
+        guard = RecordingGuardContext()
+        scanner = StateHashScanner(session_factory, guard_context=guard, chunk_size=3, max_workers=0)
+
+        report = scanner.scan()
+
+        assert report.completed is True
+        assert report.scanned == len(fleet)
+        assert report.drifted == 0
+        assert guard.violations == []
+
+    def test_detects_tampered_and_legacy_hashes(self, session_factory, fleet):
+        """Test out-of-band edits are flagged and legacy full-JSON hashes verify."""
+        tampered_id, legacy_id = fleet[1], fleet[2]
+        session = session_factory()
+        legacy = session.get(UnitsOfWork, legacy_id)
+        legacy_attributes, _ = UOWPersistenceService.resolve_attributes(session, legacy)
+        legacy.content_digests = None
+        legacy.content_hash = StateVerifier.compute_hash(legacy_attributes)
+        session.execute(
+            update(UOW_Attributes)
+            .where(UOW_Attributes.uow_id == tampered_id)
+            .values(value=999)
+        )
+        session.commit()
+        session.close()
+
+        guard = RecordingGuardContext()
+        report = StateHashScanner(
+            session_factory, guard_context=guard, chunk_size=2, max_workers=0
+        ).scan()
+
+        assert report.drifted == 1
+        assert [p.uow_id for p in guard.violations] == [str(tampered_id)]
+        packet = guard.violations[0]
+        assert packet.rule_id == "ARTICLE_XVII_STATE_DRIFT"
+        assert packet.raw_data["detected_by"] == "STATE_HASH_SCANNER"
+
+    def test_unhashed_uows_are_skipped_not_drifted(self, session_factory, fleet):
+        """Test UOWs never stamped with a hash (as created by the engine) are only counted."""
+        session = session_factory()
+        parent = session.get(UnitsOfWork, fleet[0])
+        session.add(UnitsOfWork(
+            uow_id=uuid.uuid4(), instance_id=parent.instance_id,
+            local_workflow_id=parent.local_workflow_id,
+            current_interaction_id=parent.current_interaction_id,
+            status=UOWStatus.PENDING.value, parent_id=parent.uow_id,
+        ))
+        session.commit()
+        session.close()
+
+        guard = RecordingGuardContext()
+        report = StateHashScanner(
+            session_factory, guard_context=guard, chunk_size=1, max_workers=0
+        ).scan()
+
+        assert report.completed is True
+        assert (report.scanned, report.unhashed, report.drifted) == (len(fleet), 1, 0)
+        assert guard.violations == []
+
+    def test_resumes_from_checkpoint(self, session_factory, fleet, tmp_path):
+        """Test an interrupted sweep resumes after the last checkpointed UOW."""
+        checkpoint_path = str(tmp_path / "audit.json")
+        scanner = StateHashScanner(
+            session_factory, chunk_size=2, max_workers=0, checkpoint_path=checkpoint_path
+        )
+
+        first = scanner.scan(max_uows=4)
+        assert first.completed is False
+        assert first.scanned == 4
+        checkpoint = ScanCheckpoint.load(checkpoint_path)
+        assert checkpoint.last_uow_id == first.last_uow_id
+        assert checkpoint.scanned == 4
+
+        second = scanner.scan()
+        assert second.completed is True
+        assert second.scanned == len(fleet) - 4
+        assert not os.path.exists(checkpoint_path)
+
+    def test_process_pool_matches_inline(self, session_factory, fleet):
+        """Test hashing in worker processes gives the same result as inline."""
+        session = session_factory()
+        session.execute(
+            update(UOW_Attributes).where(UOW_Attributes.uow_id == fleet[3]).values(value="x")
+        )
+        session.commit()
+        session.close()
+
+        pooled = StateHashScanner(session_factory, chunk_size=2, max_workers=2).scan()
+        inline = StateHashScanner(session_factory, chunk_size=2, max_workers=0).scan()
+
+        assert pooled.scanned == inline.scanned == len(fleet)
+        assert [p.uow_id for p in pooled.violations] == [p.uow_id for p in inline.violations]
+        assert [p.uow_id for p in pooled.violations] == [str(fleet[3])]
@@ -0,0 +1,265 @@
+"""
+Tests for server-push intervention updates.
+
+Tests cover:
+1. Fan-out of create/update deltas to matching subscriptions only
+   (unassigned new work by role, removal deltas on reassignment)
+2. Coalescing of bursts into one message per subscriber
+3. Slow-consumer detection (bounded backlog, resync)
+4. /ws/interventions subscribe -> pushed updates end to end, scoped to
+   the Pilot identity from the connect-time token
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from chameleon_workflow_engine import server
+from chameleon_workflow_engine.interactive_dashboard import (
+    InterventionHub,
+    InterventionStatus,
+    InterventionStore,
+    InterventionType,
+)
+from chameleon_workflow_engine.jwt_utils import JWTConfig, create_token, set_jwt_config
+
+
+def make_request(store, request_id, priority="normal"):
+    return store.create_request(
+        request_id=request_id,
+        uow_id=f"uow-{request_id}",
+        intervention_type=InterventionType.CLARIFICATION,
+        title="Clarify",
+        description="Clarification needed",
+        priority=priority,
+    )
+
+
+async def collect(hub, store_actions, settle=0.2, **subscribe_kwargs):
+    """Subscribe, run store_actions(), and return the messages pushed."""
+    received = []
+
+    async def send(message):
+        received.append(message)
+
+    subscription = await hub.subscribe(send, coalesce_window_seconds=0.02, **subscribe_kwargs)
+    store_actions()
+    await asyncio.sleep(settle)
+    await hub.unsubscribe(subscription)
+    return received, subscription
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    hub = InterventionHub()
+    monkeypatch.setattr(
+        "chameleon_workflow_engine.interactive_dashboard._global_intervention_hub", hub
+    )
+    return hub
+
+
+class TestInterventionHub:
+    """Tests for InterventionHub fan-out."""
+
+    def test_burst_is_coalesced_into_one_message(self, hub):
+        """Test a create followed by updates arrives as one new_request with the latest state."""
+        store = InterventionStore()
+
+        def actions():
+            make_request(store, "req-1")
+            store.update_request("req-1", InterventionStatus.IN_PROGRESS, assigned_to="pilot-1")
+            make_request(store, "req-2")
+
+        received, _ = asyncio.run(collect(hub, actions))
+
+        assert len(received) == 1
+        updates = received[0]["data"]["updates"]
+        assert [u["type"] for u in updates] == ["new_request", "new_request"]
+        assert updates[0]["data"]["status"] == "IN_PROGRESS"
+        assert updates[0]["data"]["assigned_to"] == "pilot-1"
+
+    def test_update_delta_carries_changed_fields(self, hub):
+        """Test status_changed deltas omit unchanged request content."""
+        store = InterventionStore()
+        make_request(store, "req-1")
+
+        received, _ = asyncio.run(collect(
+            hub, lambda: store.update_request("req-1", InterventionStatus.APPROVED, action_reason="ok")
+        ))
+
+        delta = received[0]["data"]["updates"][0]
+        assert delta["type"] == "status_changed"
+        assert delta["data"]["status"] == "APPROVED"
+        assert "description" not in delta["data"]
+
+    def test_filters_by_pilot_and_priority(self, hub):
+        """Test subscribers only receive deltas matching their filters."""
+        store = InterventionStore()
+
+        def actions():
+            make_request(store, "req-1", priority="critical")
+            store.update_request("req-1", InterventionStatus.IN_PROGRESS, assigned_to="pilot-1")
+            make_request(store, "req-2", priority="low")
+            store.update_request("req-2", InterventionStatus.IN_PROGRESS, assigned_to="pilot-2")
+
+        critical, _ = asyncio.run(collect(hub, actions, priorities=["critical"]))
+        assert [u["data"]["request_id"] for u in critical[0]["data"]["updates"]] == ["req-1"]
+
+        store = InterventionStore()
+        pilot, _ = asyncio.run(collect(hub, actions, pilot_id="pilot-2"))
+        assert [u["data"]["request_id"] for u in pilot[0]["data"]["updates"]] == ["req-2"]
+
+    def test_unassigned_new_request_reaches_pilots_by_role(self, hub):
+        """Test new unassigned work is pushed to pilot subscriptions whose role can take it."""
+        store = InterventionStore()
+
+        def actions():
+            make_request(store, "req-1")  # required_role OPERATOR
+
+        operator, _ = asyncio.run(collect(hub, actions, pilot_id="pilot-1", role="OPERATOR"))
+        admin, _ = asyncio.run(collect(hub, actions, pilot_id="pilot-2", role="ADMIN"))
+        viewer, _ = asyncio.run(collect(hub, actions, pilot_id="pilot-3", role="VIEWER"))
+
+        assert [u["type"] for u in operator[0]["data"]["updates"]] == ["new_request"]
+        assert [u["type"] for u in admin[0]["data"]["updates"]] == ["new_request"]
+        assert viewer == []
+
+    def test_reassignment_removes_request_from_previous_pilot(self, hub):
+        """Test the old assignee gets request_removed and the new one the update."""
+        store = InterventionStore()
+        make_request(store, "req-1")
+        store.update_request("req-1", InterventionStatus.IN_PROGRESS, assigned_to="pilot-1")
+
+        async def scenario():
+            received = {"pilot-1": [], "pilot-2": [], "pilot-3": []}
+            subscriptions = []
+            for pilot_id, messages in received.items():
+                async def send(message, messages=messages):
+                    messages.append(message)
+                subscriptions.append(
+                    await hub.subscribe(send, pilot_id=pilot_id, coalesce_window_seconds=0.02)
+                )
+            store.update_request("req-1", InterventionStatus.IN_PROGRESS, assigned_to="pilot-2")
+            await asyncio.sleep(0.2)
+            for subscription in subscriptions:
+                await hub.unsubscribe(subscription)
+            return received
+
+        received = asyncio.run(scenario())
+
+        removed = received["pilot-1"][0]["data"]["updates"]
+        assert [u["type"] for u in removed] == ["request_removed"]
+        assert removed[0]["data"]["previous_assigned_to"] == "pilot-1"
+        assert removed[0]["data"]["assigned_to"] == "pilot-2"
+        assert [u["type"] for u in received["pilot-2"][0]["data"]["updates"]] == ["status_changed"]
+        assert received["pilot-3"] == []
+
+    def test_slow_consumer_gets_resync(self, hub):
+        """Test a backlog beyond max_pending is dropped in favour of one resync."""
+        store = InterventionStore()
+
+        def actions():
+            for i in range(5):
+                make_request(store, f"req-{i}")
+
+        received, subscription = asyncio.run(collect(hub, actions, max_pending=3))
+
+        assert received == [{"type": "resync", "data": {"reason": "slow_consumer"}}]
+        assert subscription.resyncs == 1
+
+    def test_failed_send_closes_subscription(self, hub):
+        """Test a subscriber whose send fails stops receiving."""
+        store = InterventionStore()
+
+        async def scenario():
+            async def send(message):
+                raise ConnectionError("gone")
+
+            subscription = await hub.subscribe(send, coalesce_window_seconds=0)
+            make_request(store, "req-1")
+            await asyncio.sleep(0.05)
+            closed = subscription.closed
+            await hub.unsubscribe(subscription)
+            return closed
+
+        assert asyncio.run(scenario()) is True
+        assert hub.subscriber_count == 0
+
+
+class TestInterventionWebSocket:
+    """Tests for pushed updates on /ws/interventions."""
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        store = InterventionStore()
+        monkeypatch.setattr(
+            "chameleon_workflow_engine.interactive_dashboard._global_intervention_store", store
+        )
+        return store
+
+    @pytest.fixture
+    def pilot_auth(self):
+        """Sign and verify Pilot tokens with a test secret."""
+        set_jwt_config(JWTConfig(secret_key="test-secret-key-that-is-long-enough-for-hs256"))
+        yield
+        set_jwt_config(None)
+
+    def test_subscribe_receives_pushed_updates(self, hub, store, pilot_auth):
+        """Test a subscribed client is pushed creates without polling."""
+        client = TestClient(server.app)
+        headers = {"Authorization": f"Bearer {create_token('pilot-1', 'OPERATOR')}"}
+
+        with client.websocket_connect("/ws/interventions", headers=headers) as websocket:
+            websocket.send_json({"type": "subscribe", "payload": {}})
+            assert websocket.receive_json()["data"]["subscribed"] is True
+
+            make_request(store, "req-ws")
+            message = websocket.receive_json()
+
+            assert message["type"] == "intervention_updates"
+            assert message["data"]["updates"][0]["data"]["request_id"] == "req-ws"
+
+            websocket.send_json({"type": "get_metrics", "payload": {}})
+            assert websocket.receive_json()["success"] is True
+
+        assert hub.subscriber_count == 0
+
+    def test_connect_without_valid_token_is_rejected(self, hub, store, pilot_auth):
+        """Test the handshake is refused without a token or with a bad one."""
+        client = TestClient(server.app)
+
+        with pytest.raises(WebSocketDisconnect) as missing:
+            with client.websocket_connect("/ws/interventions"):
+                pass
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/ws/interventions?token=not-a-jwt"):
+                pass
+
+        assert missing.value.code == 1008
+        assert hub.subscriber_count == 0
+
+    def test_subscription_uses_token_identity(self, hub, store, pilot_auth):
+        """Test pilot_id/role in the subscribe payload cannot widen the pushed view."""
+        client = TestClient(server.app)
+        token = create_token("viewer-1", "VIEWER")
+
+        with client.websocket_connect(f"/ws/interventions?token={token}") as websocket:
+            websocket.send_json(
+                {"type": "subscribe", "payload": {"pilot_id": "admin-1", "role": "ADMIN"}}
+            )
+            assert websocket.receive_json()["data"]["pilot_id"] == "viewer-1"
+
+            make_request(store, "req-operator")  # required_role OPERATOR: not for a VIEWER
+            store.create_request(
+                request_id="req-viewer",
+                uow_id="uow-req-viewer",
+                intervention_type=InterventionType.CLARIFICATION,
+                title="Clarify",
+                description="Clarification needed",
+                required_role="VIEWER",
+            )
+            message = websocket.receive_json()
+
+            assert [u["data"]["request_id"] for u in message["data"]["updates"]] == ["req-viewer"]
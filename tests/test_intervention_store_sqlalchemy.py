@@ -6,11 +6,18 @@ Tests CRUD operations, filtering, pagination, metrics, and bulk operations.
 """
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from database.models_phase3 import Phase3Base, Intervention, InterventionHistory
+from database.models_phase3 import (
+    Phase3Base,
+    Phase3DatabaseManager,
+    Intervention,
+    InterventionHistory,
+)
 from database.intervention_store_sqlalchemy import InterventionStoreSQLAlchemy
 from chameleon_workflow_engine.interactive_dashboard import (
     InterventionType,
@@ -236,6 +243,49 @@ class TestInterventionStoreRead:
         assert pilot_requests[0].assigned_to == "pilot-001"
 
 
+    def _create_backlog(self, store):
+        priorities = ["low", "critical", "normal", "high", "urgent", "critical", "normal"]
+        for i, priority in enumerate(priorities):
+            store.create_request(
+                request_id=f"req-{i:03d}",
+                uow_id=f"uow-{i:03d}",
+                intervention_type=InterventionType.CLARIFICATION,
+                title=f"Request {i}",
+                description="desc",
+                priority=priority,
+            )
+
+    def test_pending_order_computed_in_sql(self, store, db_session):
+        """Test pending requests come back by priority rank, then age."""
+        self._create_backlog(store)
+
+        pending = store.get_pending_requests(limit=100)
+
+        assert [r.priority for r in pending] == [
+            "critical", "critical", "high", "normal", "normal", "low", "urgent"
+        ]
+        ranks = {i.request_id: i.priority_rank for i in db_session.query(Intervention).all()}
+        assert ranks["req-001"] == 0 and ranks["req-004"] == 999
+
+    def test_pending_cursor_pages_cover_backlog_once(self, store):
+        """Test following cursors returns every pending request once, in order."""
+        self._create_backlog(store)
+        full = [r.request_id for r in store.get_pending_requests(limit=100)]
+
+        paged, after = [], None
+        while True:
+            page = store.get_pending_requests(limit=3, after=after)
+            paged.extend(r.request_id for r in page)
+            if len(page) < 3:
+                break
+            after = store.decode_pending_cursor(store.encode_pending_cursor(page[-1]))
+
+        assert paged == full
+        assert [r.request_id for r in store.get_pending_requests(limit=2, offset=2)] == full[2:4]
+        with pytest.raises(ValueError):
+            store.decode_pending_cursor("garbage")
+
+
 class TestInterventionStoreUpdate:
     """Test update_request functionality."""
 
@@ -422,6 +472,55 @@ class TestInterventionStoreMetrics:
         assert len(metrics.top_pilots) >= 1
 
 
+    def test_incremental_metrics_match_database(self, store):
+        """Test counters maintained on writes equal a full recomputation."""
+        store.get_metrics()  # warm the counters before any write
+
+        for i, priority in enumerate(["critical", "high", "normal", "normal", "low"]):
+            store.create_request(
+                request_id=f"req-{i:03d}",
+                uow_id=f"uow-{i:03d}",
+                intervention_type=(
+                    InterventionType.KILL_SWITCH if i % 2 else InterventionType.CLARIFICATION
+                ),
+                title=f"Request {i}",
+                description="desc",
+                priority=priority,
+                expires_in_seconds=-1 if i == 4 else 3600,
+            )
+        store.update_request("req-000", InterventionStatus.APPROVED, assigned_to="pilot-a")
+        store.update_request("req-001", InterventionStatus.IN_PROGRESS, assigned_to="pilot-b")
+        store.update_request("req-001", InterventionStatus.REJECTED, assigned_to="pilot-b")
+        store.update_request("req-002", InterventionStatus.APPROVED, assigned_to="pilot-a")
+        store.mark_expired()
+
+        incremental = store.get_metrics().to_dict()
+        recomputed = store.refresh_metrics().to_dict()
+
+        assert incremental == recomputed
+        assert incremental["pending_interventions"] == 1
+        assert incremental["top_pilots"][0] == {"pilot_id": "pilot-a", "interventions": 2}
+
+    def test_metrics_staleness_bound(self, db_session):
+        """Test writes from another store show up once the cache is older than the bound."""
+        cached = InterventionStoreSQLAlchemy(db_session, metrics_max_age_seconds=3600)
+        uncached = InterventionStoreSQLAlchemy(db_session, metrics_max_age_seconds=0)
+        assert cached.get_metrics().pending_interventions == 0
+
+        uncached.create_request(
+            request_id="req-001",
+            uow_id="uow-001",
+            intervention_type=InterventionType.CLARIFICATION,
+            title="Elsewhere",
+            description="desc",
+        )
+
+        assert cached.get_metrics().pending_interventions == 0
+        assert uncached.get_metrics().pending_interventions == 1
+        cached.metrics_max_age_seconds = 0
+        assert cached.get_metrics().pending_interventions == 1
+
+
 class TestInterventionStoreBulkOps:
     """Test bulk operations."""
 
@@ -469,6 +568,114 @@ class TestInterventionStoreBulkOps:
         count = store.clear_archived(days=0)
         assert count >= 0  # Archived requests should be cleared
 
+    def make_requests(self, store, count):
+        for i in range(count):
+            store.create_request(
+                request_id=f"req-{i:03d}",
+                uow_id=f"uow-{i:03d}",
+                intervention_type=InterventionType.CLARIFICATION,
+                title=f"Request {i}",
+                description="desc",
+            )
+
+    def test_update_requests_bulk_archives_set(self, store, db_session):
+        """Test a bulk approve updates, archives and counts every request once."""
+        self.make_requests(store, 4)
+        store.get_metrics()  # build counters so the bulk path must update them
+        store.update_request("req-003", InterventionStatus.REJECTED)
+
+        updated = store.update_requests_bulk(
+            ["req-002", "req-000", "missing", "req-003", "req-000"],
+            InterventionStatus.APPROVED,
+            action_reason="batch",
+        )
+
+        assert [r.request_id for r in updated] == ["req-002", "req-000"]
+        assert all(r.status == InterventionStatus.APPROVED for r in updated)
+        assert all(r.action_reason == "batch" for r in updated)
+        history = db_session.query(InterventionHistory).filter(
+            InterventionHistory.status == "APPROVED"
+        ).all()
+        assert sorted(h.request_id for h in history) == ["req-000", "req-002"]
+        assert [r.request_id for r in store.get_pending_requests()] == ["req-001"]
+
+        metrics = store.get_metrics()
+        rebuilt = store.refresh_metrics()
+        assert metrics.to_dict() == rebuilt.to_dict()
+        assert rebuilt.approved_interventions == 2
+        assert rebuilt.pending_interventions == 1
+
+    def test_update_requests_bulk_skips_rows_archived_concurrently(self, store, db_session):
+        """Test a row archived between the SELECT and the UPDATE gets no second history row."""
+        self.make_requests(store, 3)
+        store.get_metrics()
+        engine = db_session.get_bind()
+        raced = []
+
+        def archive_first(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE interventions") and not raced:
+                raced.append(True)
+                # A concurrent single-request approve committing in between
+                cursor.execute(
+                    "UPDATE interventions SET status = 'APPROVED', is_archived = 1 "
+                    "WHERE request_id = 'req-001'"
+                )
+
+        event.listen(engine, "before_cursor_execute", archive_first)
+        try:
+            updated = store.update_requests_bulk(
+                ["req-000", "req-001", "req-002"], InterventionStatus.APPROVED
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", archive_first)
+
+        assert raced
+        assert [r.request_id for r in updated] == ["req-000", "req-002"]
+        assert db_session.query(InterventionHistory).filter(
+            InterventionHistory.request_id == "req-001"
+        ).count() == 0  # The concurrent approve writes its own
+        assert store.get_metrics().approved_interventions == 2  # Counted by the bulk update
+
+    def test_update_requests_bulk_assigns(self, store):
+        """Test a bulk assign moves requests to IN_PROGRESS without archiving."""
+        self.make_requests(store, 3)
+
+        updated = store.update_requests_bulk(
+            ["req-000", "req-001"], InterventionStatus.IN_PROGRESS, assigned_to="pilot-1"
+        )
+
+        assert [r.assigned_to for r in updated] == ["pilot-1", "pilot-1"]
+        assert len(store.get_requests_by_pilot("pilot-1")) == 2
+        assert store.update_requests_bulk([], InterventionStatus.APPROVED) == []
+
+    def test_get_open_requests_skips_archived(self, store):
+        """Test get_open_requests returns the same rows a bulk update would touch."""
+        self.make_requests(store, 3)
+        store.update_request("req-001", InterventionStatus.APPROVED)
+
+        open_requests = store.get_open_requests(["req-002", "req-001", "missing", "req-000"])
+
+        assert [r.request_id for r in open_requests] == ["req-002", "req-000"]
+        assert store.get_open_requests([]) == []
+
+    def test_mark_expired_counts_only_expired(self, store):
+        """Test mark_expired updates exactly the expired pending requests."""
+        for i, expires_in in enumerate([-1, -1, 3600]):
+            store.create_request(
+                request_id=f"req-{i:03d}",
+                uow_id=f"uow-{i:03d}",
+                intervention_type=InterventionType.CLARIFICATION,
+                title="Expiring",
+                description="desc",
+                expires_in_seconds=expires_in,
+            )
+
+        assert store.mark_expired() == 2
+        assert store.get_request("req-000").status == InterventionStatus.EXPIRED
+        assert store.get_request("req-002").status == InterventionStatus.PENDING
+        assert store.mark_expired() == 0
+        assert store.get_metrics().pending_interventions == 1
+
 
 class TestInterventionStoreIntegration:
     """Integration tests for complete workflows."""
@@ -552,5 +759,66 @@ class TestInterventionStoreIntegration:
         assert metrics.rejected_interventions == 1
 
 
+class TestInterventionStoreSessionFactory:
+    """Test per-operation sessions from a session factory."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        manager = Phase3DatabaseManager(f"sqlite:///{tmp_path / 'phase3.db'}")
+        manager.create_schema()
+        yield manager
+        manager.engine.dispose()
+
+    def create(self, store, request_id):
+        return store.create_request(
+            request_id=request_id,
+            uow_id=f"uow-{request_id}",
+            intervention_type=InterventionType.CLARIFICATION,
+            title="Test",
+            description="Test",
+        )
+
+    def test_connections_returned_after_each_operation(self, manager):
+        """Test no session/connection is held between operations."""
+        store = InterventionStoreSQLAlchemy(manager.SessionLocal)
+        pool = manager.engine.pool
+
+        self.create(store, "req-001")
+        assert pool.checkedout() == 0
+        assert store.get_request("req-001").status == InterventionStatus.PENDING
+        store.update_request("req-001", InterventionStatus.APPROVED, assigned_to="pilot-1")
+        assert store.get_pending_requests() == []
+        assert store.get_metrics().approved_interventions == 1
+        assert store.mark_expired() == 0
+        assert pool.checkedout() == 0
+
+    def test_failed_operation_does_not_poison_store(self, manager):
+        """Test a failed write is rolled back without affecting later operations."""
+        store = InterventionStoreSQLAlchemy(manager.SessionLocal)
+        self.create(store, "req-001")
+
+        with pytest.raises(IntegrityError):
+            self.create(store, "req-001")
+
+        self.create(store, "req-002")
+        assert len(store.get_pending_requests()) == 2
+        assert manager.engine.pool.checkedout() == 0
+
+    def test_concurrent_pilots_share_store(self, manager):
+        """Test one store serves concurrent threads, each in its own session."""
+        store = InterventionStoreSQLAlchemy(manager.SessionLocal)
+
+        def pilot(n):
+            self.create(store, f"req-{n:03d}")
+            store.update_request(f"req-{n:03d}", InterventionStatus.APPROVED, assigned_to=f"pilot-{n}")
+            return store.get_request(f"req-{n:03d}").status
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            statuses = list(executor.map(pilot, range(16)))
+
+        assert statuses == [InterventionStatus.APPROVED] * 16
+        assert store.refresh_metrics().approved_interventions == 16
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
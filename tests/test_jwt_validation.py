@@ -0,0 +1,171 @@
+"""
+Tests for cached JWT validation.
+
+Tests cover:
+1. Repeated tokens are served from the cache without re-verification
+2. Cached entries expire with the token; the cache is LRU-bounded
+3. Revoked tokens are denied even when cached
+4. Process-wide validator singleton (revocations survive a config change)
+5. POST /pilot/logout revokes the caller's token for REST and WebSocket
+"""
+
+import time
+
+import jwt
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from chameleon_workflow_engine import server
+from chameleon_workflow_engine.jwt_utils import (
+    InvalidTokenError,
+    JWTConfig,
+    JWTValidator,
+    get_jwt_validator,
+    set_jwt_config,
+    set_jwt_validator,
+)
+
+SECRET = "test-secret-key-that-is-long-enough-for-hs256"
+
+
+def make_token(pilot_id="pilot-1", role="ADMIN", expires_in=3600):
+    now = int(time.time())
+    return jwt.encode(
+        {"sub": pilot_id, "role": role, "iat": now, "exp": now + expires_in}, SECRET, algorithm="HS256"
+    )
+
+
+@pytest.fixture
+def validator(monkeypatch):
+    validator = JWTValidator(JWTConfig(secret_key=SECRET, cache_size=2))
+    decode_calls = []
+    original = validator.decode_token
+
+    def counting_decode(token):
+        decode_calls.append(token)
+        return original(token)
+
+    monkeypatch.setattr(validator, "decode_token", counting_decode)
+    validator.decode_calls = decode_calls
+    return validator
+
+
+class TestJWTValidatorCache:
+    """Tests for JWTValidator.validate_pilot_token."""
+
+    def test_repeated_token_skips_verification(self, validator):
+        """Test a second validation of the same token does not decode it again."""
+        token = make_token()
+
+        first = validator.validate_pilot_token(token)
+        second = validator.validate_pilot_token(token)
+
+        assert second is first
+        assert first.pilot_id == "pilot-1"
+        assert len(validator.decode_calls) == 1
+        assert validator.cache_info()["hits"] == 1
+
+    def test_invalid_tokens_are_not_cached(self, validator):
+        """Test a bad signature fails every time."""
+        token = jwt.encode({"sub": "pilot-1", "exp": int(time.time()) + 60}, SECRET[::-1], algorithm="HS256")
+
+        for _ in range(2):
+            with pytest.raises(InvalidTokenError):
+                validator.validate_pilot_token(token)
+        assert validator.cache_info()["size"] == 0
+
+    def test_cached_token_expires(self, validator):
+        """Test a cached token is re-verified (and rejected) after its exp."""
+        token = make_token(expires_in=1)
+        validator.validate_pilot_token(token)
+
+        time.sleep(1.1)
+
+        with pytest.raises(InvalidTokenError):
+            validator.validate_pilot_token(token)
+
+    def test_cache_is_lru_bounded(self, validator):
+        """Test the least recently used token is evicted beyond cache_size."""
+        tokens = [make_token(pilot_id=f"pilot-{i}") for i in range(3)]
+        validator.validate_pilot_token(tokens[0])
+        validator.validate_pilot_token(tokens[1])
+        validator.validate_pilot_token(tokens[0])
+        validator.validate_pilot_token(tokens[2])
+
+        assert validator.cache_info()["size"] == 2
+        validator.validate_pilot_token(tokens[0])
+        validator.validate_pilot_token(tokens[1])
+        assert len(validator.decode_calls) == 4
+
+    def test_revoked_token_denied_when_cached(self, validator):
+        """Test revocation takes effect immediately and only for that token."""
+        revoked, other = make_token(pilot_id="pilot-1"), make_token(pilot_id="pilot-2")
+        validator.validate_pilot_token(revoked)
+
+        validator.revoke_token(revoked)
+
+        with pytest.raises(InvalidTokenError, match="revoked"):
+            validator.validate_pilot_token(revoked)
+        assert validator.validate_pilot_token(other).pilot_id == "pilot-2"
+        assert validator.cache_info()["denied"] == 1
+
+
+class TestJWTValidatorSingleton:
+    """Tests for the process-wide validator."""
+
+    def test_singleton_follows_config(self):
+        """Test get_jwt_validator is shared and rebuilt when the config changes."""
+        try:
+            set_jwt_config(JWTConfig(secret_key=SECRET))
+            validator = get_jwt_validator()
+            assert get_jwt_validator() is validator
+            assert validator.validate_pilot_token(make_token()).role == "ADMIN"
+
+            set_jwt_config(JWTConfig(secret_key="another-secret"))
+            assert get_jwt_validator() is not validator
+        finally:
+            set_jwt_config(None)
+
+    def test_revocations_survive_config_change(self):
+        """Test set_jwt_config carries the deny-list over to the new validator."""
+        try:
+            set_jwt_config(JWTConfig(secret_key=SECRET))
+            revoked = make_token(pilot_id="revoked-pilot")
+            get_jwt_validator().revoke_token(revoked)
+
+            set_jwt_config(JWTConfig(secret_key=SECRET, cache_size=8))
+
+            with pytest.raises(InvalidTokenError, match="revoked"):
+                get_jwt_validator().validate_pilot_token(revoked)
+        finally:
+            set_jwt_config(None)
+            set_jwt_validator(None)
+
+
+class TestPilotLogout:
+    """Tests for POST /pilot/logout."""
+
+    @pytest.fixture
+    def client(self):
+        set_jwt_config(JWTConfig(secret_key=SECRET))
+        yield TestClient(server.app)
+        set_jwt_config(None)
+        set_jwt_validator(None)  # Drop the deny-list as well
+
+    def test_logout_revokes_token_everywhere(self, client):
+        """Test a logged-out token is refused by REST routes and the WebSocket."""
+        headers = {"Authorization": f"Bearer {make_token(pilot_id='logout-pilot', role='VIEWER')}"}
+
+        response = client.post("/pilot/logout", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+
+        assert client.post("/pilot/logout", headers=headers).status_code == 401
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/ws/interventions", headers=headers):
+                pass
+
+    def test_logout_requires_token(self, client):
+        """Test logout without a token is rejected."""
+        assert client.post("/pilot/logout").status_code == 401
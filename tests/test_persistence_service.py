@@ -10,10 +10,13 @@ Tests cover:
 6. Shadow logger integration
 """
 
+import hashlib
 import pytest
+import time
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker, Session
 
 from database.models_instance import (
@@ -40,12 +43,18 @@ from database.enums import (
 from database.persistence_service import (
     UOWPersistenceService,
     TelemetryBuffer,
+    TelemetryDrainer,
     TelemetryEntry,
     ShadowLoggerTelemetryAdapter,
     get_telemetry_buffer,
+    parse_sample_rates,
     reset_telemetry_buffer,
+    spill_shadow_log_to_telemetry,
     GuardContext,
 )
+from database.state_hasher import StateHasher
+from database.uow_repository_sqlalchemy import UOWRepositorySQLAlchemy
+from chameleon_workflow_engine.semantic_guard import ShadowLogger
 
 
 class MockGuardContext(GuardContext):
@@ -360,6 +369,236 @@ class TestUOWPersistenceService:
         assert is_valid is False
 
 
+class TestCopyOnWriteAttributes:
+    """Tests for copy-on-write attribute resolution across parent/child UOWs."""
+
+    def _child_of(self, db, parent):
+        child = UnitsOfWork(
+            uow_id=uuid.uuid4(),
+            instance_id=parent.instance_id,
+            local_workflow_id=parent.local_workflow_id,
+            parent_id=parent.uow_id,
+            current_interaction_id=parent.current_interaction_id,
+            status=UOWStatus.PENDING.value,
+        )
+        db.add(child)
+        db.flush()
+        return child
+
+    def _set(self, db, uow, actor, key, value, version=1):
+        db.add(
+            UOW_Attributes(
+                attribute_id=uuid.uuid4(),
+                uow_id=uow.uow_id,
+                instance_id=uow.instance_id,
+                actor_id=actor.actor_id,
+                key=key,
+                value=value,
+                version=version,
+            )
+        )
+        db.flush()
+
+    def test_child_inherits_without_copies(self, db, uow, actor):
+        """Test child reads parent attributes and only stores overrides."""
+        self._set(db, uow, actor, "region", "EU")
+        self._set(db, uow, actor, "amount", 100)
+        self._set(db, uow, actor, "amount", 200, version=2)
+        child = self._child_of(db, uow)
+        self._set(db, child, actor, "region", "US")
+
+        attributes, versions = UOWPersistenceService.resolve_attributes(db, child)
+
+        assert attributes == {"region": "US", "amount": 200}
+        # Only the child's own keys carry versions
+        assert versions == {"region": 1}
+        assert db.query(UOW_Attributes).filter(
+            UOW_Attributes.uow_id == child.uow_id
+        ).count() == 1
+
+    def test_grandchild_resolves_nearest_layer(self, db, uow, actor):
+        """Test resolution walks the full parent chain, nearest layer first."""
+        self._set(db, uow, actor, "a", "root")
+        self._set(db, uow, actor, "b", "root")
+        child = self._child_of(db, uow)
+        self._set(db, child, actor, "b", "child")
+        grandchild = self._child_of(db, child)
+
+        attributes, versions = UOWPersistenceService.resolve_attributes(db, grandchild)
+
+        assert attributes == {"a": "root", "b": "child"}
+        assert versions == {}
+
+    def test_child_hash_covers_inherited_attributes(self, db, uow, actor, guard_context):
+        """Test the child's content hash reflects its effective state."""
+        self._set(db, uow, actor, "amount", 50000)
+        child = self._child_of(db, uow)
+
+        UOWPersistenceService.save_uow(db, child, guard_context=guard_context, actor_id=actor.actor_id)
+        UOWPersistenceService.save_uow(db, uow, guard_context=guard_context, actor_id=actor.actor_id)
+
+        assert child.content_hash == uow.content_hash
+        assert UOWPersistenceService.verify_state_hash(db, child) is True
+
+    def test_pinned_child_ignores_later_parent_writes(self, db, uow, actor, guard_context):
+        """Test a child resolves the parent versions pinned at its creation."""
+        self._set(db, uow, actor, "amount", 100)
+        child = self._child_of(db, uow)
+        child.inherited_versions = {"amount": 1}
+        UOWPersistenceService.save_uow(db, child, guard_context=guard_context, actor_id=actor.actor_id)
+
+        self._set(db, uow, actor, "amount", 999, version=2)
+        self._set(db, uow, actor, "_child_aggregate", {"processed": 1})
+
+        attributes, _ = UOWPersistenceService.resolve_attributes(db, child)
+        batch = UOWPersistenceService.resolve_attributes_batch(db, [child, uow])
+
+        assert attributes == {"amount": 100}
+        assert batch[child.uow_id] == {"amount": 100}
+        assert batch[uow.uow_id] == {"amount": 999, "_child_aggregate": {"processed": 1}}
+        # Parent writes no longer drift the child's stored hash
+        assert UOWPersistenceService.verify_state_hash(db, child) is True
+
+    def test_pins_apply_per_layer(self, db, uow, actor):
+        """Test each layer is read through the pin of the child below it."""
+        self._set(db, uow, actor, "a", "root-v1")
+        child = self._child_of(db, uow)
+        child.inherited_versions = {"a": 1}
+        self._set(db, uow, actor, "a", "root-v2", version=2)
+        self._set(db, child, actor, "b", "child-v1")
+        grandchild = self._child_of(db, child)
+        grandchild.inherited_versions = {"b": 1}
+        self._set(db, child, actor, "b", "child-v2", version=2)
+        db.flush()
+
+        attributes, _ = UOWPersistenceService.resolve_attributes(db, grandchild)
+        batch = UOWPersistenceService.resolve_attributes_batch(db, [grandchild])
+
+        assert attributes == {"a": "root-v1", "b": "child-v1"}
+        assert batch[grandchild.uow_id] == attributes
+
+
+class TestIncrementalContentHash:
+    """Tests for the incremental X-Content-Hash scheme."""
+
+    def test_combined_hash_is_order_independent(self):
+        """Test per-key digests combine to the same hash in any order."""
+        h1, _ = StateHasher.compute_incremental_hash({"a": 1, "b": [1, 2], "c": {"x": None}})
+        h2, _ = StateHasher.compute_incremental_hash({"c": {"x": None}, "b": [1, 2], "a": 1})
+        h3, _ = StateHasher.compute_incremental_hash({"a": 1, "b": [2, 1], "c": {"x": None}})
+
+        assert h1 == h2
+        assert h1 != h3
+        assert len(h1) == 64
+
+    def test_cached_digests_match_full_recompute(self):
+        """Test reusing cached digests yields the audit (full) hash."""
+        _, digests = StateHasher.compute_incremental_hash({"a": 1, "b": 2})
+        incremental, _ = StateHasher.compute_incremental_hash(
+            {"a": 1, "b": 3, "c": 4}, digests, changed_keys=["b"]
+        )
+        full, _ = StateHasher.compute_incremental_hash({"a": 1, "b": 3, "c": 4})
+
+        assert incremental == full
+
+    def test_combined_hash_is_lane_wise_lthash(self):
+        """Test digests combine as LtHash16, not as one 256-bit sum."""
+        digests = {key: StateHasher.compute_key_digest(key, key) for key in ("a", "b", "c")}
+        lanes = [0] * 1024
+        for digest in digests.values():
+            element = hashlib.shake_256(bytes.fromhex(digest)).digest(2048)
+            for i in range(1024):
+                lanes[i] = (lanes[i] + int.from_bytes(element[2 * i:2 * i + 2], "little")) % 65536
+        state = b"".join(lane.to_bytes(2, "little") for lane in lanes)
+
+        assert StateHasher.combine_key_digests(digests) == hashlib.sha256(b"3:" + state).hexdigest()
+
+    def test_save_uow_rehashes_only_changed_keys(self, db, uow, actor, guard_context, monkeypatch):
+        """Test save_uow serialises only keys whose attribute row changed."""
+        for key in ("big_payload", "status_note"):
+            db.add(UOW_Attributes(
+                attribute_id=uuid.uuid4(), uow_id=uow.uow_id, instance_id=uow.instance_id,
+                actor_id=actor.actor_id, key=key, value=key * 100, version=1,
+            ))
+        db.flush()
+        UOWPersistenceService.save_uow(db, uow, guard_context=guard_context, actor_id=actor.actor_id)
+
+        hashed_keys = []
+        original = StateHasher.compute_key_digest
+
+        def tracking_digest(key, value):
+            hashed_keys.append(key)
+            return original(key, value)
+
+        monkeypatch.setattr(StateHasher, "compute_key_digest", staticmethod(tracking_digest))
+
+        db.add(UOW_Attributes(
+            attribute_id=uuid.uuid4(), uow_id=uow.uow_id, instance_id=uow.instance_id,
+            actor_id=actor.actor_id, key="status_note", value="updated", version=2,
+        ))
+        db.flush()
+        UOWPersistenceService.save_uow(db, uow, guard_context=guard_context, actor_id=actor.actor_id)
+
+        assert hashed_keys == ["status_note"]
+        monkeypatch.undo()
+        # Full-hash audit agrees with the incrementally maintained hash
+        assert UOWPersistenceService.verify_state_hash(db, uow) is True
+
+    def test_repository_update_keeps_digests_consistent(self, db, uow, actor, guard_context):
+        """Test a repository transition after save_uow still passes the audit."""
+        db.add(UOW_Attributes(
+            attribute_id=uuid.uuid4(), uow_id=uow.uow_id, instance_id=uow.instance_id,
+            actor_id=actor.actor_id, key="draft", value="v1", version=1,
+        ))
+        db.flush()
+        UOWPersistenceService.save_uow(db, uow, guard_context=guard_context, actor_id=actor.actor_id)
+        assert uow.content_digests is not None
+
+        UOWRepositorySQLAlchemy(db).update_state(
+            uow_id=uow.uow_id,
+            new_status=UOWStatus.ACTIVE.value,
+            payload={"pilot_clarification": "use v1", "reasoning": "clarified"},
+            auto_increment=False,
+        )
+
+        assert UOWPersistenceService.verify_state_hash(db, uow) is True
+
+    def test_repository_update_payload_cannot_override_statuses(self, db, uow, actor):
+        """Test caller payload keys do not overwrite the recorded transition."""
+        previous_status = uow.status
+        UOWRepositorySQLAlchemy(db).update_state(
+            uow_id=uow.uow_id,
+            new_status=UOWStatus.ACTIVE.value,
+            payload={"previous_status": "FORGED", "new_status": "FORGED", "note": "kept"},
+            auto_increment=False,
+        )
+
+        row = db.query(UnitsOfWorkHistory).filter(
+            UnitsOfWorkHistory.uow_id == uow.uow_id,
+            UnitsOfWorkHistory.event_type == "STATE_TRANSITION",
+        ).one()
+        assert row.payload["previous_status"] == previous_status
+        assert row.payload["new_status"] == UOWStatus.ACTIVE.value
+        assert row.payload["note"] == "kept"
+        assert row.previous_status == previous_status
+
+    def test_repository_create_uses_incremental_hash(self, db, workflow, interaction, actor):
+        """Test repository-created UOWs are hashed with the digest cache."""
+        uow_id = uuid.uuid4()
+        UOWRepositorySQLAlchemy(db).create({
+            "uow_id": uow_id,
+            "instance_id": workflow.instance_id,
+            "local_workflow_id": workflow.local_workflow_id,
+            "current_interaction_id": interaction.interaction_id,
+            "attributes": {"order": 42, "items": ["a", "b"]},
+            "actor_id": actor.actor_id,
+        })
+
+        created = db.get(UnitsOfWork, uow_id)
+        assert set(created.content_digests) == {"order", "items"}
+        assert UOWPersistenceService.verify_state_hash(db, created) is True
+
+
 class TestTelemetryBuffer:
     """Tests for TelemetryBuffer."""
 
@@ -468,6 +707,145 @@ class TestTelemetryBuffer:
         assert buffer.get_pending_count() == 0
 
 
+    def test_backpressure_counts_dropped_entries(self):
+        """Test entries rejected by a full queue are counted as dropped."""
+        buffer = TelemetryBuffer(max_queue_size=2)
+        results = [buffer.record(make_telemetry_entry(uuid.uuid4())) for _ in range(3)]
+
+        assert results == [True, True, False]
+        assert buffer.get_stats()["dropped"] == 1
+        assert buffer.get_stats()["pending"] == 2
+
+
+    def test_sampling_per_log_type(self):
+        """Test sampled log types are thinned while unlisted types are all kept."""
+        buffer = TelemetryBuffer(sample_rates={"GUARDIAN_DECISION": 0.1, "TELEMETRY": 0.0})
+        for log_type in ("GUARDIAN_DECISION", "TELEMETRY", "ERROR"):
+            for _ in range(20):
+                entry = make_telemetry_entry(uuid.uuid4())
+                entry.log_type = log_type
+                assert buffer.record(entry) is True
+
+        kept = [entry.log_type for entry in buffer.take(max_entries=100)]
+        assert kept.count("GUARDIAN_DECISION") == 2
+        assert kept.count("TELEMETRY") == 0
+        assert kept.count("ERROR") == 20
+        assert buffer.get_stats()["sampled_out"] == 38
+
+    def test_sampling_honours_rates_that_are_not_one_over_k(self):
+        """Test a 0.3 or 0.6 rate keeps exactly that fraction instead of a rounded stride."""
+        buffer = TelemetryBuffer(sample_rates={"GUARDIAN_DECISION": 0.3, "TELEMETRY": 0.6})
+        for log_type in ("GUARDIAN_DECISION", "TELEMETRY"):
+            for _ in range(100):
+                entry = make_telemetry_entry(uuid.uuid4())
+                entry.log_type = log_type
+                buffer.record(entry)
+
+        kept = [entry.log_type for entry in buffer.take(max_entries=200)]
+        assert kept.count("GUARDIAN_DECISION") == 30
+        assert kept.count("TELEMETRY") == 60
+
+    def test_invalid_sample_rate_rejected(self):
+        """Test sample rates outside 0..1 and malformed specs are rejected."""
+        with pytest.raises(ValueError):
+            TelemetryBuffer(sample_rates={"ERROR": 2.0})
+        with pytest.raises(ValueError):
+            parse_sample_rates("GUARDIAN_DECISION")
+        assert parse_sample_rates(" GUARDIAN_DECISION=0.01, ") == {"GUARDIAN_DECISION": 0.01}
+
+
+def make_telemetry_entry(instance_id):
+    return TelemetryEntry(
+        instance_id=instance_id,
+        uow_id=uuid.uuid4(),
+        actor_id=uuid.uuid4(),
+        role_id=uuid.uuid4(),
+        interaction_id=uuid.uuid4(),
+    )
+
+
+class TestTelemetryDrainer:
+    """Tests for the background TelemetryDrainer."""
+
+    @pytest.fixture
+    def session_factory(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'telemetry.db'}")
+        InstanceBase.metadata.create_all(engine)
+        return sessionmaker(bind=engine)
+
+    def log_count(self, session_factory):
+        session = session_factory()
+        count = session.execute(select(func.count()).select_from(Interaction_Logs)).scalar()
+        session.close()
+        return count
+
+    def test_full_batch_flushes_before_interval(self, session_factory):
+        """Test a full batch is written without waiting for the interval."""
+        buffer = TelemetryBuffer(batch_size=5)
+        drainer = TelemetryDrainer(buffer, session_factory, flush_interval_seconds=60)
+        drainer.start()
+        try:
+            for _ in range(5):
+                buffer.record(make_telemetry_entry(uuid.uuid4()))
+            deadline = time.monotonic() + 5
+            while self.log_count(session_factory) < 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            drainer.stop()
+
+        assert self.log_count(session_factory) == 5
+        assert buffer.get_stats()["written"] == 5
+
+    def test_stop_flushes_partial_batch(self, session_factory):
+        """Test stop() writes entries that never filled a batch."""
+        buffer = TelemetryBuffer(batch_size=100)
+        drainer = TelemetryDrainer(buffer, session_factory, flush_interval_seconds=60)
+        drainer.start()
+        for _ in range(3):
+            buffer.record(make_telemetry_entry(uuid.uuid4()))
+
+        assert drainer.stop() == 3
+        assert not drainer.running
+        assert self.log_count(session_factory) == 3
+        assert buffer.get_pending_count() == 0
+
+    def test_transient_errors_are_retried(self, session_factory, monkeypatch):
+        """Test OperationalError is retried and the batch still lands."""
+        buffer = TelemetryBuffer()
+        original_write = buffer.write
+        failures = iter([True, True])
+
+        def flaky_write(session, entries):
+            if next(failures, False):
+                raise OperationalError("INSERT", {}, Exception("database is locked"))
+            return original_write(session, entries)
+
+        monkeypatch.setattr(buffer, "write", flaky_write)
+        drainer = TelemetryDrainer(buffer, session_factory, retry_backoff_seconds=0)
+        buffer.record(make_telemetry_entry(uuid.uuid4()))
+
+        assert drainer.drain() == 1
+        assert drainer.retry_count == 2
+        assert self.log_count(session_factory) == 1
+
+    def test_failed_batch_is_dropped_and_counted(self, session_factory, monkeypatch):
+        """Test a batch that keeps failing is dropped instead of blocking the queue."""
+        buffer = TelemetryBuffer()
+
+        def failing_write(session, entries):
+            raise OperationalError("INSERT", {}, Exception("disk I/O error"))
+
+        monkeypatch.setattr(buffer, "write", failing_write)
+        drainer = TelemetryDrainer(buffer, session_factory, max_retries=1, retry_backoff_seconds=0)
+        for _ in range(2):
+            buffer.record(make_telemetry_entry(uuid.uuid4()))
+
+        assert drainer.drain() == 0
+        assert drainer.failed_batches == 1
+        assert buffer.get_stats()["dropped"] == 2
+        assert buffer.get_pending_count() == 0
+
+
 class TestShadowLoggerTelemetryAdapter:
     """Tests for ShadowLoggerTelemetryAdapter."""
 
@@ -509,6 +887,27 @@ class TestShadowLoggerTelemetryAdapter:
         assert buffer.get_pending_count() == 1
 
 
+    def test_spill_shadow_log_to_telemetry(self, instance_context):
+        """Test the ShadowLogger sink records traced errors as ERROR telemetry."""
+        buffer = reset_telemetry_buffer()
+        shadow = ShadowLogger()
+        shadow.add_sink(spill_shadow_log_to_telemetry)
+        uow_id = uuid.uuid4()
+
+        shadow.capture_error(
+            0, "x / 0 > 5", ZeroDivisionError("division by zero"), str(uow_id),
+            trace={"instance_id": instance_context.instance_id, "interaction_id": uuid.uuid4()},
+        )
+        # Untraced errors stay in memory only
+        shadow.capture_error(1, "y > 1", NameError("y"), str(uow_id))
+
+        entries = buffer.take()
+        assert len(entries) == 1
+        assert entries[0].uow_id == uow_id
+        assert entries[0].log_type == "ERROR"
+        assert len(shadow.get_logs(str(uow_id))) == 2
+
+
 class TestGlobalTelemetryBuffer:
     """Tests for global telemetry buffer singleton."""
 
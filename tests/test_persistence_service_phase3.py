@@ -12,7 +12,7 @@ Tests cover:
 
 import pytest
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 
@@ -36,6 +36,10 @@ from database.persistence_service import (
     UOWPersistenceService,
     GuardLayerBypassException,
 )
+from chameleon_workflow_engine.interactive_dashboard import (
+    InterventionStore,
+    set_intervention_store,
+)
 
 
 @pytest.fixture
@@ -425,25 +429,17 @@ class TestHeartbeatUOW:
 
 
 class TestPilotCheck:
-    """Tests for save_uow_with_pilot_check functionality."""
+    """Tests for save_uow_with_pilot_check (park-and-resume) functionality."""
 
-    def test_save_uow_with_pilot_check_allows_approved(
-        self, db, uow, actor, interaction, mock_guard_context
-    ):
-        """Test that high-risk transition is allowed when Pilot approves."""
-        # Setup: Authorize and approve pilot
-        mock_guard_context.set_authorized(True)
-        mock_guard_context.set_pilot_decision(
-            uow_id=uow.uow_id,
-            decision={
-                "approved": True,
-                "waiver_issued": False,
-                "waiver_reason": None,
-                "rejection_reason": None,
-            },
-        )
+    @pytest.fixture(autouse=True)
+    def intervention_store(self):
+        """Isolate the global intervention store parked UOWs register with."""
+        store = InterventionStore()
+        set_intervention_store(store)
+        yield store
+        set_intervention_store(None)
 
-        # Add attribute
+    def _park(self, db, uow, actor, interaction, guard_context, reasoning=None):
         attr = UOW_Attributes(
             attribute_id=uuid.uuid4(),
             uow_id=uow.uow_id,
@@ -456,121 +452,171 @@ class TestPilotCheck:
         db.add(attr)
         db.flush()
 
-        # Execute: Save with pilot check
-        result = UOWPersistenceService.save_uow_with_pilot_check(
+        return UOWPersistenceService.save_uow_with_pilot_check(
             session=db,
             uow=uow,
-            guard_context=mock_guard_context,
+            guard_context=guard_context,
             new_status=UOWStatus.COMPLETED.value,  # High-risk transition
             new_interaction_id=interaction.interaction_id,
             actor_id=actor.actor_id,
-            reasoning="Completing workflow",
+            reasoning=reasoning,
+        )
+
+    def test_high_risk_transition_parks_without_waiting(
+        self, db, uow, actor, interaction, mock_guard_context, intervention_store
+    ):
+        """Test that high-risk transitions are parked, committed and raised to the Pilot."""
+        mock_guard_context.set_authorized(True)
+        mock_guard_context.wait_for_pilot = None  # Must never be called
+
+        result = self._park(db, uow, actor, interaction, mock_guard_context, "Completing workflow")
+
+        assert result["success"] is True
+        assert result["parked"] is True
+        assert result["pilot_approved"] is False
+        assert result["uow"].status == "PENDING_PILOT_APPROVAL"
+        # Committed immediately: a fresh session sees the parked UOW
+        fresh = sessionmaker(bind=db.get_bind())()
+        assert fresh.get(UnitsOfWork, uow.uow_id).status == "PENDING_PILOT_APPROVAL"
+        fresh.close()
+
+        request = intervention_store.get_request(result["intervention_request_id"])
+        assert request is not None
+        assert request.uow_id == str(uow.uow_id)
+        assert request.context["original_target_status"] == UOWStatus.COMPLETED.value
+
+        continuation = UOWPersistenceService.get_pilot_continuation(db, uow)
+        assert continuation["target_status"] == UOWStatus.COMPLETED.value
+        assert continuation["previous_status"] == UOWStatus.PENDING.value
+
+    def test_save_uow_with_pilot_check_allows_approved(
+        self, db, uow, actor, interaction, mock_guard_context
+    ):
+        """Test that an approved parked transition resumes to its target status."""
+        mock_guard_context.set_authorized(True)
+        self._park(db, uow, actor, interaction, mock_guard_context, "Completing workflow")
+
+        result = UOWPersistenceService.resume_parked_uow(
+            session=db,
+            uow=uow,
+            guard_context=mock_guard_context,
+            decision={"approved": True},
+            pilot_id="pilot-1",
         )
 
-        # Verify: Success and pilot approval recorded
         assert result["success"] is True
         assert result["pilot_approved"] is True
-        assert result["uow"] is not None
         assert result["uow"].status == UOWStatus.COMPLETED.value
+        assert result["uow"].current_interaction_id == interaction.interaction_id
 
-    def test_save_uow_with_pilot_check_blocks_rejected(
+        history = db.query(UnitsOfWorkHistory).filter(
+            UnitsOfWorkHistory.uow_id == uow.uow_id,
+            UnitsOfWorkHistory.new_status == UOWStatus.COMPLETED.value,
+        ).one()
+        assert history.actor_id == actor.actor_id
+        assert history.transition_metadata["pilot_decision"]["pilot_id"] == "pilot-1"
+
+    def test_park_without_interaction_move_resumes(
         self, db, uow, actor, interaction, mock_guard_context
     ):
-        """Test that high-risk transition is blocked when Pilot rejects."""
-        # Setup: Authorize but reject pilot
+        """Test a park with no target interaction resumes in place on approval."""
         mock_guard_context.set_authorized(True)
-        mock_guard_context.set_pilot_decision(
-            uow_id=uow.uow_id,
-            decision={
-                "approved": False,
-                "waiver_issued": False,
-                "waiver_reason": None,
-                "rejection_reason": "Amount exceeds approval limit",
-            },
+        current_interaction_id = uow.current_interaction_id
+        parked = UOWPersistenceService.save_uow_with_pilot_check(
+            session=db,
+            uow=uow,
+            guard_context=mock_guard_context,
+            new_status=UOWStatus.COMPLETED.value,
+            new_interaction_id=None,
+            actor_id=actor.actor_id,
         )
+        assert parked["parked"] is True
+        assert UOWPersistenceService.get_pilot_continuation(db, uow)["target_interaction_id"] is None
 
-        # Add attribute
-        attr = UOW_Attributes(
-            attribute_id=uuid.uuid4(),
-            uow_id=uow.uow_id,
-            instance_id=uow.instance_id,
-            actor_id=actor.actor_id,
-            key="amount",
-            value=50000,
-            version=1,
+        result = UOWPersistenceService.resume_parked_uow(
+            session=db, uow=uow, guard_context=mock_guard_context, decision={"approved": True}
         )
-        db.add(attr)
-        db.flush()
 
-        # Execute: Save with pilot check
-        result = UOWPersistenceService.save_uow_with_pilot_check(
+        assert result["success"] is True, result["error"]
+        assert result["uow"].status == UOWStatus.COMPLETED.value
+        assert result["uow"].current_interaction_id == current_interaction_id
+
+    def test_save_uow_with_pilot_check_blocks_rejected(
+        self, db, uow, actor, interaction, mock_guard_context
+    ):
+        """Test that a rejected parked transition is blocked and the UOW restored."""
+        mock_guard_context.set_authorized(True)
+        self._park(db, uow, actor, interaction, mock_guard_context)
+
+        result = UOWPersistenceService.resume_parked_uow(
             session=db,
             uow=uow,
             guard_context=mock_guard_context,
-            new_status=UOWStatus.COMPLETED.value,
-            new_interaction_id=interaction.interaction_id,
-            actor_id=actor.actor_id,
+            decision={
+                "approved": False,
+                "waiver_issued": False,
+                "rejection_reason": "Amount exceeds approval limit",
+            },
         )
 
-        # Verify: Blocked by pilot
         assert result["success"] is False
         assert result["blocked_by"] == "PILOT_APPROVAL_REQUIRED"
         assert "Amount exceeds approval limit" in result["error"]
+        assert uow.status == UOWStatus.PENDING.value
+
+        # A second decision has nothing left to resume
+        again = UOWPersistenceService.resume_parked_uow(
+            session=db, uow=uow, guard_context=mock_guard_context, decision={"approved": True}
+        )
+        assert again["blocked_by"] == "NOT_PARKED"
 
     def test_constitutional_waiver_logged_in_metadata(
         self, db, uow, actor, interaction, mock_guard_context
     ):
         """Test that Constitutional Waiver is logged in metadata."""
-        # Setup: Authorize but issue waiver instead of approval
         mock_guard_context.set_authorized(True)
-        mock_guard_context.set_pilot_decision(
-            uow_id=uow.uow_id,
+        self._park(db, uow, actor, interaction, mock_guard_context)
+
+        result = UOWPersistenceService.resume_parked_uow(
+            session=db,
+            uow=uow,
+            guard_context=mock_guard_context,
             decision={
                 "approved": False,  # Not directly approved
                 "waiver_issued": True,  # But waiver granted
                 "waiver_reason": "Emergency override authorized by CFO",
-                "rejection_reason": None,
             },
         )
 
-        # Add attribute
-        attr = UOW_Attributes(
-            attribute_id=uuid.uuid4(),
-            uow_id=uow.uow_id,
-            instance_id=uow.instance_id,
-            actor_id=actor.actor_id,
-            key="amount",
-            value=50000,
-            version=1,
-        )
-        db.add(attr)
-        db.flush()
-
-        # Execute: Save with pilot check
-        result = UOWPersistenceService.save_uow_with_pilot_check(
-            session=db,
-            uow=uow,
-            guard_context=mock_guard_context,
-            new_status=UOWStatus.COMPLETED.value,
-            new_interaction_id=interaction.interaction_id,
-            actor_id=actor.actor_id,
-        )
-
-        # Verify: Success with waiver
         assert result["success"] is True
         assert result["waiver_issued"] is True
-        assert result["uow"] is not None
+        assert result["uow"].status == UOWStatus.COMPLETED.value
 
         # Verify: Waiver logged in history transition_metadata
-        db.refresh(result["uow"])
-        # Query history to check metadata
         history = db.query(UnitsOfWorkHistory).filter(
-            UnitsOfWorkHistory.uow_id == uow.uow_id
-        ).order_by(UnitsOfWorkHistory.transition_timestamp.desc()).first()
+            UnitsOfWorkHistory.uow_id == uow.uow_id,
+            UnitsOfWorkHistory.new_status == UOWStatus.COMPLETED.value,
+        ).one()
+        waiver = history.transition_metadata["constitutional_waiver"]
+        assert waiver["reason"] == "Emergency override authorized by CFO"
 
-        assert history is not None
-        # The waiver_issued flag was set - that's the key assertion
-        assert result["waiver_issued"] is True
+    def test_unanswered_park_expires_to_previous_state(
+        self, db, uow, actor, interaction, mock_guard_context
+    ):
+        """Test a UOW parked past the decision timeout is restored, and a fresh one is not."""
+        mock_guard_context.set_authorized(True)
+        self._park(db, uow, actor, interaction, mock_guard_context)
+
+        assert UOWPersistenceService.expire_parked_uows(db, mock_guard_context) == []
+        assert uow.status == "PENDING_PILOT_APPROVAL"
+
+        uow.last_heartbeat_at = datetime.now(timezone.utc) - timedelta(seconds=301)
+        db.flush()
+        expired = UOWPersistenceService.expire_parked_uows(db, mock_guard_context)
+
+        assert [result["uow"] for result in expired] == [uow]
+        assert uow.status == UOWStatus.PENDING.value
+        assert "No Pilot decision" in expired[0]["error"]
 
     def test_save_uow_with_pilot_check_skips_low_risk(
         self, db, uow, actor, interaction, mock_guard_context
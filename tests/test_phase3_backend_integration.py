@@ -15,6 +15,7 @@ import json
 from datetime import datetime, timezone, timedelta
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import sessionmaker
 from database.models_phase3 import Phase3Base, Intervention, Phase3DatabaseManager
 from database.intervention_store_sqlalchemy import InterventionStoreSQLAlchemy
@@ -24,6 +25,20 @@ from chameleon_workflow_engine.interactive_dashboard import (
     initialize_intervention_store,
     get_intervention_store,
 )
+from chameleon_workflow_engine.jwt_utils import JWTConfig, create_token, set_jwt_config
+
+
+def pilot_headers(role="OPERATOR", pilot_id="pilot-1"):
+    """Authorization header for a Pilot (uses the JWT config set by pilot_auth)."""
+    return {"Authorization": f"Bearer {create_token(pilot_id, role)}"}
+
+
+@pytest.fixture
+def pilot_auth():
+    """Sign and verify Pilot tokens with a test secret."""
+    set_jwt_config(JWTConfig(secret_key="test-secret-key-that-is-long-enough-for-hs256"))
+    yield
+    set_jwt_config(None)
 
 
 @pytest.fixture
@@ -283,6 +298,97 @@ class TestPhase3ServerIntegration:
         assert data.get("approved_interventions", 0) == 1
 
 
+    def test_pending_endpoints_page_in_sql(self):
+        """Verify offset and cursor paging on the pending endpoints."""
+        from chameleon_workflow_engine.server import app
+
+        # The app runs handlers in other threads: share one in-memory connection
+        engine = create_engine(
+            "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Phase3Base.metadata.create_all(engine)
+        phase3_store = InterventionStoreSQLAlchemy(sessionmaker(bind=engine)())
+        initialize_intervention_store(phase3_store)
+
+        for i, priority in enumerate(["low", "critical", "normal", "high", "normal"]):
+            phase3_store.create_request(
+                request_id=f"req-page-{i}",
+                uow_id=f"uow-page-{i}",
+                intervention_type=InterventionType.CLARIFICATION,
+                title="Paging",
+                description="Paging",
+                priority=priority,
+            )
+        client = TestClient(app)
+
+        full = [r["request_id"] for r in client.get("/api/interventions/pending").json()]
+        offset_page = client.get("/api/interventions/pending", params={"limit": 2, "offset": 2}).json()
+        assert [r["request_id"] for r in offset_page] == full[2:4]
+
+        items, after = [], None
+        while True:
+            params = {"limit": 2, **({"after": after} if after else {})}
+            body = client.get("/api/interventions/pending/page", params=params).json()
+            items.extend(r["request_id"] for r in body["items"])
+            after = body["next_cursor"]
+            if after is None:
+                break
+        assert items == full
+        assert client.get("/api/interventions/pending/page", params={"after": "bad"}).status_code == 400
+
+    def test_bulk_endpoints(self, pilot_auth):
+        """Verify bulk assign/approve/reject apply to every listed request."""
+        from chameleon_workflow_engine.server import app
+
+        engine = create_engine(
+            "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Phase3Base.metadata.create_all(engine)
+        phase3_store = InterventionStoreSQLAlchemy(sessionmaker(bind=engine))
+        initialize_intervention_store(phase3_store)
+
+        for i in range(4):
+            phase3_store.create_request(
+                request_id=f"req-bulk-{i}",
+                uow_id=f"uow-bulk-{i}",
+                intervention_type=InterventionType.CLARIFICATION,
+                title="Bulk",
+                description="Bulk",
+            )
+        client = TestClient(app)
+
+        assigned = client.post("/api/interventions/bulk/assign", json={
+            "request_ids": ["req-bulk-0", "req-bulk-1"], "pilot_id": "pilot-1",
+        }, headers=pilot_headers(pilot_id="lead")).json()
+        assert [r["assigned_to"] for r in assigned["updated"]] == ["pilot-1", "pilot-1"]
+
+        approved = client.post("/api/interventions/bulk/approve", json={
+            "request_ids": ["req-bulk-0", "req-bulk-1", "req-bulk-9"], "action_reason": "ok",
+        }, headers=pilot_headers()).json()
+        assert [r["status"] for r in approved["updated"]] == ["APPROVED", "APPROVED"]
+        assert approved["not_updated"] == ["req-bulk-9"]
+        assert approved["resume_errors"] == {}
+
+        rejected = client.post("/api/interventions/bulk/reject", json={
+            "request_ids": ["req-bulk-0", "req-bulk-2"],
+        }, headers=pilot_headers()).json()
+        assert [r["request_id"] for r in rejected["updated"]] == ["req-bulk-2"]
+        assert rejected["not_updated"] == ["req-bulk-0"]
+
+        assert client.post(
+            "/api/interventions/bulk/approve", json={"request_ids": []}, headers=pilot_headers()
+        ).status_code == 400
+        assert client.post(
+            "/api/interventions/bulk/approve", json={"request_ids": ["req-bulk-3"]}
+        ).status_code == 401
+        assert client.post(
+            "/api/interventions/bulk/assign", json={"request_ids": ["req-bulk-3"], "pilot_id": "p"},
+            headers=pilot_headers("VIEWER"),
+        ).status_code == 403
+        metrics = phase3_store.refresh_metrics()
+        assert (metrics.approved_interventions, metrics.rejected_interventions) == (2, 1)
+
+
 class TestPhase3DataPersistence:
     """Test that data persists correctly across operations."""
 
@@ -354,3 +460,163 @@ class TestPhase3DataPersistence:
         assert all_history[0].status == "APPROVED"
         
         session.close()
+
+
+class TestPilotDecisionEndpoints:
+    """Test approve/reject of interventions raised for parked UOWs."""
+
+    @pytest.fixture
+    def parked(self, tmp_path, monkeypatch, mock_guard_context):
+        """A UOW parked by save_uow_with_pilot_check, served by the app."""
+        import uuid
+        from database import DatabaseManager
+        from database.enums import InstanceStatus, UOWStatus
+        from database.models_instance import (
+            Instance_Context, Local_Interactions, Local_Workflows, UnitsOfWork,
+        )
+        from database.persistence_service import UOWPersistenceService
+        from chameleon_workflow_engine import server
+        from chameleon_workflow_engine.interactive_dashboard import InterventionStore
+
+        manager = DatabaseManager(instance_url=f"sqlite:///{tmp_path / 'instance.db'}")
+        manager.create_instance_schema()
+        monkeypatch.setattr(server, "db_manager", manager)
+        store = InterventionStore()
+        initialize_intervention_store(store)
+
+        with manager.get_instance_session() as session:
+            instance = Instance_Context(
+                instance_id=uuid.uuid4(), name="Park", description="Park",
+                status=InstanceStatus.ACTIVE.value,
+            )
+            workflow = Local_Workflows(
+                local_workflow_id=uuid.uuid4(), instance_id=instance.instance_id,
+                original_workflow_id=uuid.uuid4(), name="Park_WF", version=1, is_master=True,
+            )
+            interaction = Local_Interactions(
+                interaction_id=uuid.uuid4(), local_workflow_id=workflow.local_workflow_id,
+                name="Park_Int",
+            )
+            uow = UnitsOfWork(
+                uow_id=uuid.uuid4(), instance_id=instance.instance_id,
+                local_workflow_id=workflow.local_workflow_id,
+                current_interaction_id=interaction.interaction_id,
+                status=UOWStatus.ACTIVE.value,
+            )
+            session.add_all([instance, workflow, interaction, uow])
+            session.flush()
+            uow_id = uow.uow_id
+            result = UOWPersistenceService.save_uow_with_pilot_check(
+                session=session, uow=uow, guard_context=mock_guard_context,
+                new_status=UOWStatus.COMPLETED.value,
+                new_interaction_id=interaction.interaction_id,
+            )
+
+        yield {
+            "client": TestClient(server.app),
+            "manager": manager,
+            "store": store,
+            "uow_id": uow_id,
+            "request_id": result["intervention_request_id"],
+        }
+        manager.close()
+
+    def uow_status(self, parked):
+        from database.models_instance import UnitsOfWork
+
+        with parked["manager"].get_instance_session() as session:
+            return session.get(UnitsOfWork, parked["uow_id"]).status
+
+    def test_decisions_require_a_pilot(self, parked, pilot_auth):
+        """Verify unauthenticated and VIEWER callers cannot resume a parked UOW."""
+        url = f"/api/interventions/{parked['request_id']}/approve"
+
+        assert parked["client"].post(url).status_code == 401
+        assert parked["client"].post(url, headers=pilot_headers("VIEWER")).status_code == 403
+        assert self.uow_status(parked) == "PENDING_PILOT_APPROVAL"
+        assert parked["store"].get_request(parked["request_id"]).status == InterventionStatus.PENDING
+
+    def test_approve_resumes_then_archives(self, parked, pilot_auth):
+        """Verify approval completes the UOW and records the deciding Pilot."""
+        response = parked["client"].post(
+            f"/api/interventions/{parked['request_id']}/approve",
+            headers=pilot_headers(pilot_id="pilot-7"),
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "APPROVED"
+        assert body["assigned_to"] == "pilot-7"
+        assert body["resumed_uow"]["status"] == "COMPLETED"
+        assert self.uow_status(parked) == "COMPLETED"
+
+    def test_failed_resume_keeps_request_open(self, parked, pilot_auth):
+        """Verify a resume that cannot run leaves the request actionable."""
+        from database.models_instance import UnitsOfWork
+
+        with parked["manager"].get_instance_session() as session:
+            session.get(UnitsOfWork, parked["uow_id"]).status = "ACTIVE"
+
+        response = parked["client"].post(
+            f"/api/interventions/{parked['request_id']}/reject", headers=pilot_headers()
+        )
+
+        assert response.status_code == 409
+        assert parked["store"].get_request(parked["request_id"]).status == InterventionStatus.PENDING
+
+    def test_approve_retry_after_store_failure(self, parked, pilot_auth, monkeypatch):
+        """Verify a resume committed before a failed request update is resolved on retry."""
+        store = parked["store"]
+        real_update = store.update_request
+        calls = []
+
+        def failing_once(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("store unavailable")
+            return real_update(*args, **kwargs)
+
+        monkeypatch.setattr(store, "update_request", failing_once)
+        url = f"/api/interventions/{parked['request_id']}/approve"
+        client = TestClient(parked["client"].app, raise_server_exceptions=False)
+
+        assert client.post(url, headers=pilot_headers()).status_code == 500
+        assert self.uow_status(parked) == "COMPLETED"
+        assert store.get_request(parked["request_id"]).status == InterventionStatus.PENDING
+
+        reject = client.post(
+            f"/api/interventions/{parked['request_id']}/reject", headers=pilot_headers()
+        )
+        assert reject.status_code == 409
+
+        retry = client.post(url, headers=pilot_headers())
+        assert retry.status_code == 200
+        assert retry.json()["status"] == "APPROVED"
+        assert retry.json()["resumed_uow"]["pilot_approved"] is True
+
+    def test_bulk_approve_resumes_before_archiving(self, parked, pilot_auth):
+        """Verify a bulk approve resolves only requests whose parked UOW resumed."""
+        import uuid
+        from database.persistence_service import PILOT_CONTINUATION_KEY
+
+        parked["store"].create_request(
+            request_id="req-orphan",
+            uow_id=str(uuid.uuid4()),
+            intervention_type=InterventionType.RESUME,
+            title="Orphan",
+            description="Parked UOW no longer exists",
+            context={"continuation": PILOT_CONTINUATION_KEY},
+        )
+
+        body = parked["client"].post(
+            "/api/interventions/bulk/approve",
+            json={"request_ids": [parked["request_id"], "req-orphan"]},
+            headers=pilot_headers(),
+        ).json()
+
+        assert [r["request_id"] for r in body["updated"]] == [parked["request_id"]]
+        assert body["updated"][0]["resumed_uow"]["status"] == "COMPLETED"
+        assert body["not_updated"] == ["req-orphan"]
+        assert "not found" in body["resume_errors"]["req-orphan"]
+        assert parked["store"].get_request("req-orphan").status == InterventionStatus.PENDING
+        assert self.uow_status(parked) == "COMPLETED"
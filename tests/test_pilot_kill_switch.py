@@ -0,0 +1,160 @@
+"""
+Tests for the set-based Pilot kill switch.
+
+Tests cover:
+1. UOWRepositorySQLAlchemy.pause_active: one UPDATE, bulk history rows, hashes kept
+2. PilotInterface.kill_switch summary result and instance freeze flag
+3. ChameleonEngine.checkout_work skips frozen instances
+"""
+
+import uuid
+
+import pytest
+
+from database import (
+    DatabaseManager,
+    Instance_Context,
+    Local_Components,
+    Local_Interactions,
+    Local_Roles,
+    Local_Workflows,
+    UnitsOfWork,
+    UOWRepositorySQLAlchemy,
+)
+from database.enums import ComponentDirection, InstanceStatus, RoleType, UOWStatus
+from database.models_instance import UnitsOfWorkHistory
+from chameleon_workflow_engine.engine import ChameleonEngine
+from chameleon_workflow_engine.pilot_interface import (
+    PilotInterface,
+    get_frozen_instances,
+    is_instance_frozen,
+    unfreeze_instance,
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = DatabaseManager(instance_url=f"sqlite:///{tmp_path / 'instance.db'}")
+    manager.create_instance_schema()
+    return manager
+
+
+@pytest.fixture(autouse=True)
+def clear_frozen_instances():
+    yield
+    for instance_id in get_frozen_instances():
+        unfreeze_instance(instance_id)
+
+
+def create_instance(session, statuses):
+    """Instance with a BETA role fed by one interaction holding UOWs in the given statuses."""
+    instance = Instance_Context(
+        instance_id=uuid.uuid4(), name="Kill", description="Kill", status=InstanceStatus.ACTIVE.value
+    )
+    workflow = Local_Workflows(
+        local_workflow_id=uuid.uuid4(), instance_id=instance.instance_id,
+        original_workflow_id=uuid.uuid4(), name="Kill_WF", version=1, is_master=True,
+    )
+    interaction = Local_Interactions(
+        interaction_id=uuid.uuid4(), local_workflow_id=workflow.local_workflow_id, name="Kill_Int"
+    )
+    role = Local_Roles(
+        role_id=uuid.uuid4(), local_workflow_id=workflow.local_workflow_id,
+        name="Worker", role_type=RoleType.BETA.value,
+    )
+    component = Local_Components(
+        component_id=uuid.uuid4(), local_workflow_id=workflow.local_workflow_id,
+        interaction_id=interaction.interaction_id, role_id=role.role_id,
+        direction=ComponentDirection.INBOUND.value, name="Worker_In",
+    )
+    session.add_all([instance, workflow, interaction, role, component])
+    for i, status in enumerate(statuses):
+        session.add(UnitsOfWork(
+            uow_id=uuid.uuid4(), instance_id=instance.instance_id,
+            local_workflow_id=workflow.local_workflow_id,
+            current_interaction_id=interaction.interaction_id,
+            status=status, content_hash=f"{i:064x}",
+        ))
+    session.commit()
+    return instance.instance_id, role.role_id
+
+
+class TestPauseActive:
+    """Tests for UOWRepositorySQLAlchemy.pause_active."""
+
+    def test_pauses_only_active_uows_of_instance(self, manager):
+        """Test ACTIVE UOWs are paused with one history row each; others are untouched."""
+        with manager.get_instance_session() as session:
+            instance_id, _ = create_instance(
+                session, [UOWStatus.ACTIVE.value] * 3 + [UOWStatus.PENDING.value]
+            )
+            other_id, _ = create_instance(session, [UOWStatus.ACTIVE.value])
+            hashes = {u.uow_id: u.content_hash for u in session.query(UnitsOfWork).all()}
+
+            paused = UOWRepositorySQLAlchemy(session).pause_active(
+                instance_id, {"kill_switch_reason": "incident", "triggered_by": "pilot-1"}
+            )
+
+            assert paused == 3
+            statuses = {
+                (u.instance_id, u.status) for u in session.query(UnitsOfWork).all()
+            }
+            assert statuses == {
+                (instance_id, UOWStatus.PAUSED.value),
+                (instance_id, UOWStatus.PENDING.value),
+                (other_id, UOWStatus.ACTIVE.value),
+            }
+
+            history = session.query(UnitsOfWorkHistory).all()
+            assert len(history) == 3
+            for row in history:
+                assert row.instance_id == instance_id
+                assert (row.previous_status, row.new_status) == ("ACTIVE", "PAUSED")
+                assert row.previous_state_hash == row.new_state_hash == hashes[row.uow_id]
+                assert row.payload["kill_switch_reason"] == "incident"
+
+            assert UOWRepositorySQLAlchemy(session).pause_active(instance_id, {}) == 0
+
+
+class TestKillSwitch:
+    """Tests for PilotInterface.kill_switch and the instance freeze."""
+
+    def test_freeze_blocks_checkout_until_released(self, manager):
+        """Test a frozen instance hands out no work, and does again once released."""
+        with manager.get_instance_session() as session:
+            instance_id, role_id = create_instance(
+                session, [UOWStatus.ACTIVE.value, UOWStatus.PENDING.value]
+            )
+            pilot = PilotInterface(UOWRepositorySQLAlchemy(session))
+
+            result = pilot.kill_switch(instance_id, reason="incident", pilot_id="pilot-1", freeze=True)
+
+            assert result["paused_uows"] == 1
+            assert result["frozen"] is True
+
+        engine = ChameleonEngine(manager)
+        assert engine.checkout_work(actor_id=uuid.uuid4(), role_id=role_id) is None
+
+        with manager.get_instance_session() as session:
+            released = PilotInterface(UOWRepositorySQLAlchemy(session)).release_kill_switch(
+                instance_id, pilot_id="pilot-1"
+            )
+        assert released["was_frozen"] is True
+        assert not is_instance_frozen(instance_id)
+        assert engine.checkout_work(actor_id=uuid.uuid4(), role_id=role_id) is not None
+
+    def test_without_freeze_checkout_continues(self, manager):
+        """Test the default kill switch pauses without freezing the instance."""
+        with manager.get_instance_session() as session:
+            instance_id, _ = create_instance(session, [UOWStatus.ACTIVE.value] * 2)
+            result = PilotInterface(UOWRepositorySQLAlchemy(session)).kill_switch(
+                instance_id, reason="incident", pilot_id="pilot-1"
+            )
+
+        assert result == {
+            "success": True,
+            "paused_uows": 2,
+            "frozen": False,
+            "message": "Kill switch activated: 2 UOWs paused",
+        }
+        assert not is_instance_frozen(instance_id)
@@ -425,6 +425,43 @@ class TestShadowLogger:
         count = logger_instance.clear_logs("UOW-1")
         assert count == 1
         assert len(logger_instance.get_logs()) == 1
+    
+    def test_eviction_keeps_uow_index_consistent(self):
+        """Oldest entries are evicted from both the log and the per-UOW index"""
+        logger_instance = ShadowLogger(max_entries=3)
+        for i, uow in enumerate(["UOW-1", "UOW-2", "UOW-1", "UOW-2"]):
+            logger_instance.capture_error(i, f"expr{i}", ValueError("test"), uow)
+        
+        assert [log.branch_index for log in logger_instance.get_logs()] == [1, 2, 3]
+        assert [log.branch_index for log in logger_instance.get_logs("UOW-1")] == [2]
+        assert [log.branch_index for log in logger_instance.get_logs("UOW-2")] == [1, 3]
+    
+    def test_cleared_entries_age_out(self):
+        """Entries cleared per UOW stay hidden and are evicted first"""
+        logger_instance = ShadowLogger(max_entries=2)
+        logger_instance.capture_error(0, "expr0", ValueError("test"), "UOW-1")
+        logger_instance.capture_error(1, "expr1", ValueError("test"), "UOW-2")
+        logger_instance.clear_logs("UOW-1")
+        logger_instance.capture_error(2, "expr2", ValueError("test"), "UOW-1")
+        
+        assert [log.branch_index for log in logger_instance.get_logs()] == [1, 2]
+        assert logger_instance.clear_logs() == 2
+    
+    def test_sinks_receive_entries_and_trace(self):
+        """Sinks get every entry with its trace; sink errors are swallowed"""
+        logger_instance = ShadowLogger()
+        received = []
+        
+        def failing_sink(entry, trace):
+            raise RuntimeError("sink down")
+        
+        logger_instance.add_sink(failing_sink)
+        logger_instance.add_sink(lambda entry, trace: received.append((entry.uow_id, trace)))
+        logger_instance.capture_error(
+            0, "expr", ValueError("test"), "UOW-1", trace={"instance_id": "I-1"}
+        )
+        
+        assert received == [("UOW-1", {"instance_id": "I-1"})]
 
 
 # ============================================================================
@@ -0,0 +1,170 @@
+"""
+Golden-vector tests for StateHasher canonical serialisation.
+
+Tests cover:
+1. Content hashes are unchanged from the original stdlib json.dumps scheme
+2. Every available serialiser backend is byte-identical to the reference
+   (including plain and str/int Enum members)
+3. Backend selection and override
+4. The orjson fast path is actually faster than the reference
+"""
+
+import datetime
+import enum
+import timeit
+import uuid
+
+import pytest
+
+from database.state_hasher import (
+    StateHasher,
+    CanonicalSerializer,
+    OrjsonCanonicalSerializer,
+    get_canonical_serializer,
+    set_canonical_serializer,
+    orjson,
+)
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = 2
+
+
+class Perm(enum.Flag):
+    READ = 1
+
+
+class Level(enum.IntEnum):
+    HIGH = 3
+
+
+class Mode(str, enum.Enum):
+    FAST = "fast"
+
+
+# (name, attributes, SHA-256 of json.dumps(sort_keys=True, separators=(',', ':'), default=str))
+GOLDEN_VECTORS = [
+    ("empty", {}, "44136fa355b3678a1146ad16f7e8649e94fb4fc21fe77e8310c060f61caaff8a"),
+    (
+        "flat",
+        {"name": "Alice", "age": 30, "active": True},
+        "451c1367a85d4f7ae68b914df5bc08936434176b1ae0330c30b1a7e2500f59ed",
+    ),
+    (
+        "nested",
+        {"order": {"items": [1, 2, 3], "meta": {"z": "last", "a": "first"}}, "tags": ["x", "y"]},
+        "744c95f01e0407a76e937c5531eb7978a344bc3db4139622d9fdbc8aabd898a5",
+    ),
+    (
+        "none_and_bool",
+        {"a": None, "b": False},
+        "f87d1ab64a7bbf059ab4894bea74cbf084704e08a890ba389ea41d8f2c57e582",
+    ),
+    (
+        "floats",
+        {"ratio": 0.1, "big": 1e16, "small": 1e-05, "whole": 100.0, "neg": -2.5},
+        "00d76be3e3a5b284e460ca9938c3c1c68f9b7861f28d72e3e6a8c7b25bba5476",
+    ),
+    (
+        "unicode",
+        {"name": "Zoë", "city": "東京", "emoji": "\U0001F680"},
+        "b442132789ef9b8407a39b489d2104ed01e14528d5d5a830b8cd251d46bcea52",
+    ),
+    (
+        "escapes",
+        {"quote": "say \"hi\"", "path": "C:\\temp", "nl": "a\nb", "ctl": "\x01"},
+        "ed6de34368e2d2ee5c9f570365c51551cce574063e18184a1384e28ce046c84b",
+    ),
+    (
+        "control_chars",
+        {"del": "a\x7fb", "tab": "a\tb"},
+        "776ce795ef357581745b163af3750766606f5999b7efe1fa5588f5a88f6bb7bd",
+    ),
+    (
+        "big_int",
+        {"n": 2**70, "m": -2**63, "u": 2**64 - 1},
+        "7a6b39756e70a3b4b996e03f38b20d79baccd53c10ba7df0af81db8dbaabeae1",
+    ),
+    (
+        "uuid",
+        {"id": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+        "d3c0e73cca7e4577e3614fa162eb643999764add9ec3c59483083f94799a00c7",
+    ),
+    (
+        "datetime",
+        {"at": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)},
+        "e67441d9a8a5708de1a4d9742bce5382965250ea5469bab235508848b76ffd4a",
+    ),
+    (
+        "tuple",
+        {"t": (1, "two")},
+        "9b37a99ee3eac536631f8aea6add45bb9a864d6c804874a2d3203f3eec642a03",
+    ),
+    (
+        "text_with_numbers",
+        {"version": "v1.2.3", "note": "null and 1e5 inside strings"},
+        "55f8a0b9a25c23eee732f57544c75a00e431547b168fedbf03a519b2902f0ebb",
+    ),
+    (
+        "plain_enum",
+        {"color": Color.RED, "nested": [Color.GREEN], "perm": Perm.READ},
+        "33d4c0042b5680d260ccc6224947980bc59b28be4766f9bcdd0f4fc22fe3c1d9",
+    ),
+    (
+        "str_int_enum",
+        {"level": Level.HIGH, "mode": Mode.FAST},
+        "ad2747b85cc5166481a9af6f369a3404aa487c36424741850c32c81b24859f2e",
+    ),
+]
+
+BACKENDS = [CanonicalSerializer()]
+if orjson is not None:
+    BACKENDS.append(OrjsonCanonicalSerializer())
+
+
+@pytest.fixture
+def restore_serializer():
+    """Restore the default serialiser selection after the test."""
+    yield
+    set_canonical_serializer(None)
+
+
+@pytest.mark.parametrize("backend", BACKENDS, ids=lambda b: b.name)
+@pytest.mark.parametrize("name,attributes,expected", GOLDEN_VECTORS, ids=[v[0] for v in GOLDEN_VECTORS])
+def test_golden_vectors(backend, name, attributes, expected, restore_serializer):
+    """Test every backend reproduces the historical content hash."""
+    set_canonical_serializer(backend)
+    assert StateHasher.compute_content_hash(attributes) == expected
+
+
+@pytest.mark.parametrize("name,attributes,expected", GOLDEN_VECTORS, ids=[v[0] for v in GOLDEN_VECTORS])
+def test_orjson_bytes_match_reference(name, attributes, expected):
+    """Test the orjson fast path emits exactly the reference bytes."""
+    if orjson is None:
+        pytest.skip("orjson not installed")
+    assert OrjsonCanonicalSerializer().dumps(attributes) == CanonicalSerializer().dumps(attributes)
+
+
+def test_default_backend_selection(restore_serializer):
+    """Test orjson is selected when installed, stdlib otherwise."""
+    set_canonical_serializer(None)
+    expected = "orjson" if orjson is not None else "json"
+    assert get_canonical_serializer().name == expected
+
+
+def test_orjson_backend_beats_reference():
+    """Test the orjson backend (with its fallback checks) is faster than stdlib on a large UOW."""
+    if orjson is None:
+        pytest.skip("orjson not installed")
+    attributes = {
+        f"key_{i}": {"name": f"value-{i}", "n": i, "tags": ["a", "b", i], "ok": True, "nested": {"x": i}}
+        for i in range(500)
+    }
+    fast, reference = OrjsonCanonicalSerializer(), CanonicalSerializer()
+    assert fast.dumps(attributes) == reference.dumps(attributes)
+
+    fast_time = min(timeit.repeat(lambda: fast.dumps(attributes), number=20, repeat=5))
+    reference_time = min(timeit.repeat(lambda: reference.dumps(attributes), number=20, repeat=5))
+
+    assert fast_time < reference_time
@@ -0,0 +1,255 @@
+"""
+Tests for the StreamBroadcaster implementations.
+
+Tests cover:
+1. Buffered FileStreamBroadcaster: queueing, size-triggered flush, close
+2. Bounded queue drops (and counts) instead of blocking
+3. Size and time based rotation with gzipped segments
+4. Batched RedisStreamBroadcaster: pipelined XADD, spill file and replay (fakeredis)
+"""
+
+import gzip
+import json
+import time
+
+import pytest
+
+from chameleon_workflow_engine.stream_broadcaster import (
+    FileStreamBroadcaster,
+    RedisStreamBroadcaster,
+    StreamBroadcasterError,
+)
+
+try:
+    import fakeredis
+except ImportError:  # optional dev dependency
+    fakeredis = None
+
+
+def read_events(broadcaster):
+    """All events in rolled segments (oldest first) followed by the active file."""
+    lines = []
+    for segment in broadcaster.rotated_segments():
+        opener = gzip.open if segment.suffix == ".gz" else open
+        with opener(segment, "rt") as f:
+            lines.extend(f.read().splitlines())
+    if broadcaster.log_path.exists():
+        lines.extend(broadcaster.log_path.read_text().splitlines())
+    return [json.loads(line) for line in lines]
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestFileStreamBroadcaster:
+    """Tests for the buffered, rotating FileStreamBroadcaster."""
+
+    def test_buffered_emit_is_written_on_flush(self, tmp_path):
+        """Test events are queued by emit and written in order by flush."""
+        broadcaster = FileStreamBroadcaster(tmp_path / "events.jsonl", flush_interval_seconds=60)
+        try:
+            for i in range(5):
+                broadcaster.emit("test_event", {"n": i})
+
+            assert broadcaster.get_metrics()["pending"] == 5
+            assert broadcaster.flush() == 5
+
+            events = read_events(broadcaster)
+            assert [e["payload"]["n"] for e in events] == list(range(5))
+            assert events[0]["event_type"] == "test_event"
+        finally:
+            broadcaster.close()
+
+    def test_flush_size_wakes_background_flusher(self, tmp_path):
+        """Test reaching flush_size writes without waiting for the interval."""
+        broadcaster = FileStreamBroadcaster(
+            tmp_path / "events.jsonl", flush_interval_seconds=60, flush_size=3
+        )
+        try:
+            for i in range(3):
+                broadcaster.emit("test_event", {"n": i})
+
+            assert wait_for(lambda: broadcaster.get_metrics()["events_written"] == 3)
+        finally:
+            broadcaster.close()
+
+    def test_close_flushes_and_emit_restarts(self, tmp_path):
+        """Test close writes queued events and a later emit still works."""
+        broadcaster = FileStreamBroadcaster(tmp_path / "events.jsonl", flush_interval_seconds=60)
+        broadcaster.emit("before_close", {})
+        broadcaster.close()
+        assert len(read_events(broadcaster)) == 1
+
+        broadcaster.emit("after_close", {})
+        broadcaster.close()
+        assert [e["event_type"] for e in read_events(broadcaster)] == ["before_close", "after_close"]
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path):
+        """Test emit drops and counts events once the queue is full."""
+        broadcaster = FileStreamBroadcaster(
+            tmp_path / "events.jsonl", flush_interval_seconds=60, flush_size=100, max_queue_size=3
+        )
+        try:
+            for i in range(5):
+                broadcaster.emit("test_event", {"n": i})
+
+            metrics = broadcaster.get_metrics()
+            assert metrics["events_dropped"] == 2
+            assert broadcaster.flush() == 3
+            assert [e["payload"]["n"] for e in read_events(broadcaster)] == [0, 1, 2]
+        finally:
+            broadcaster.close()
+
+    def test_unbuffered_writes_immediately(self, tmp_path):
+        """Test buffered=False writes before emit returns."""
+        broadcaster = FileStreamBroadcaster(tmp_path / "events.jsonl", buffered=False, fsync=True)
+        try:
+            broadcaster.emit("test_event", {"n": 1})
+            assert len(read_events(broadcaster)) == 1
+        finally:
+            broadcaster.close()
+
+    def test_unserializable_payload_raises(self, tmp_path):
+        """Test a payload that can't be JSON encoded fails at emit time."""
+        broadcaster = FileStreamBroadcaster(tmp_path / "events.jsonl")
+        try:
+            with pytest.raises(StreamBroadcasterError):
+                broadcaster.emit("test_event", {"bad": object()})
+        finally:
+            broadcaster.close()
+
+    def test_size_rotation_gzips_segments(self, tmp_path):
+        """Test the log rolls over at max_bytes and no event is lost."""
+        broadcaster = FileStreamBroadcaster(
+            tmp_path / "events.jsonl", flush_interval_seconds=60, max_bytes=300
+        )
+        try:
+            for i in range(20):
+                broadcaster.emit("test_event", {"n": i})
+                broadcaster.flush()
+
+            segments = broadcaster.rotated_segments()
+            assert segments
+            assert all(segment.suffix == ".gz" for segment in segments)
+            assert broadcaster.log_path.stat().st_size <= 300
+            assert broadcaster.get_metrics()["rotations"] == len(segments)
+            assert [e["payload"]["n"] for e in read_events(broadcaster)] == list(range(20))
+        finally:
+            broadcaster.close()
+
+    def test_time_rotation(self, tmp_path):
+        """Test the log rolls over once rotate_interval_seconds has elapsed."""
+        broadcaster = FileStreamBroadcaster(
+            tmp_path / "events.jsonl", buffered=False, rotate_interval_seconds=0.05,
+            compress_rotated=False,
+        )
+        try:
+            broadcaster.emit("first", {})
+            time.sleep(0.1)
+            broadcaster.emit("second", {})
+
+            segments = broadcaster.rotated_segments()
+            assert len(segments) == 1
+            assert segments[0].suffix != ".gz"
+            assert [e["event_type"] for e in read_events(broadcaster)] == ["first", "second"]
+        finally:
+            broadcaster.close()
+
+
+@pytest.fixture
+def fake_redis():
+    if fakeredis is None:
+        pytest.skip("fakeredis not installed")
+    server = fakeredis.FakeServer()
+    return server, fakeredis.FakeRedis(server=server)
+
+
+class TestRedisStreamBroadcaster:
+    """Tests for RedisStreamBroadcaster against fakeredis."""
+
+    def test_unbatched_emit_caps_stream_length(self, fake_redis):
+        """Test each XADD carries MAXLEN so the stream stays bounded."""
+        _, client = fake_redis
+        broadcaster = RedisStreamBroadcaster(client, stream_key="events", max_stream_length=10)
+
+        for i in range(50):
+            broadcaster.emit("test_event", {"n": i})
+
+        assert client.xlen("events") < 50
+        assert broadcaster.get_metrics()["events_emitted"] == 50
+        assert broadcaster.read_events(count=1)[0]["event_type"] == "test_event"
+
+    def test_batched_emit_pipelines_in_order(self, fake_redis):
+        """Test queued events reach the stream in order after flush."""
+        _, client = fake_redis
+        broadcaster = RedisStreamBroadcaster(
+            client, stream_key="events", batched=True, batch_size=4, flush_interval_seconds=60
+        )
+        try:
+            for i in range(10):
+                broadcaster.emit("test_event", {"n": i})
+            broadcaster.flush()
+
+            events = broadcaster.read_events(count=100)
+            assert [e["payload"]["n"] for e in events] == list(range(10))
+            assert broadcaster.get_metrics()["pending"] == 0
+        finally:
+            broadcaster.close()
+
+    def test_outage_spills_and_replays(self, fake_redis, tmp_path):
+        """Test events emitted while Redis is down are spilled, then replayed in order."""
+        server, client = fake_redis
+        spill_path = tmp_path / "events.spill.jsonl"
+        broadcaster = RedisStreamBroadcaster(
+            client, stream_key="events", batched=True, flush_interval_seconds=60,
+            spill_path=str(spill_path),
+        )
+        try:
+            broadcaster.emit("test_event", {"n": 0})
+            broadcaster.flush()
+
+            server.connected = False
+            for i in range(1, 4):
+                broadcaster.emit("test_event", {"n": i})
+            broadcaster.flush()
+            assert broadcaster.degraded
+            assert broadcaster.get_metrics()["events_spilled"] == 3
+            assert spill_path.exists()
+
+            server.connected = True
+            broadcaster.emit("test_event", {"n": 4})
+            broadcaster.flush()
+
+            assert not broadcaster.degraded
+            assert not spill_path.exists()
+            events = broadcaster.read_events(count=100)
+            assert [e["payload"]["n"] for e in events] == list(range(5))
+            assert broadcaster.get_metrics()["events_replayed"] == 3
+        finally:
+            broadcaster.close()
+
+    def test_unreachable_at_startup(self, fake_redis, tmp_path):
+        """Test batched mode with a spill file starts degraded instead of raising."""
+        server, client = fake_redis
+        server.connected = False
+
+        with pytest.raises(ConnectionError):
+            RedisStreamBroadcaster(client)
+
+        broadcaster = RedisStreamBroadcaster(
+            client, batched=True, flush_interval_seconds=60,
+            spill_path=str(tmp_path / "events.spill.jsonl"),
+        )
+        try:
+            assert broadcaster.degraded
+            broadcaster.emit("test_event", {})
+            broadcaster.flush()
+            assert broadcaster.get_metrics()["events_spilled"] == 1
+        finally:
+            broadcaster.close()
@@ -0,0 +1,265 @@
+"""
+Tests for the incremental stream readers.
+
+Tests cover:
+1. FileStreamReader: byte-offset cursor, partial lines, resume, rotation, truncation
+2. FileStreamReader.events() async generator
+3. RedisStreamReader: consumer groups, ack, crash recovery, pending reclaim (fakeredis)
+4. reader_for_broadcaster() and the /ws/monitor endpoint
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from chameleon_workflow_engine import server
+from chameleon_workflow_engine.jwt_utils import JWTConfig, create_token, set_jwt_config
+from chameleon_workflow_engine.stream_broadcaster import (
+    FileStreamBroadcaster,
+    RedisStreamBroadcaster,
+    get_broadcaster,
+    set_broadcaster,
+)
+from chameleon_workflow_engine.stream_reader import (
+    FileStreamReader,
+    RedisStreamReader,
+    reader_for_broadcaster,
+)
+
+try:
+    import fakeredis
+except ImportError:  # optional dev dependency
+    fakeredis = None
+
+
+def append_line(path, event_type, raw=None):
+    with open(path, "a") as f:
+        f.write(raw if raw is not None else json.dumps({"event_type": event_type, "payload": {}}) + "\n")
+
+
+class TestFileStreamReader:
+    """Tests for the JSONL tail-follow reader."""
+
+    def test_reads_only_new_complete_lines(self, tmp_path):
+        """Test each read returns new events and leaves partial lines for later."""
+        path = tmp_path / "events.jsonl"
+        reader = FileStreamReader(path)
+
+        assert reader.read() == []
+        append_line(path, "a")
+        append_line(path, "b")
+        assert [e["event_type"] for e in reader.read()] == ["a", "b"]
+        assert reader.read() == []
+
+        append_line(path, None, raw='{"event_type": "c", ')
+        assert reader.read() == []
+        append_line(path, None, raw='"payload": {}}\n')
+        assert [e["event_type"] for e in reader.read()] == ["c"]
+        assert reader.offset == path.stat().st_size
+        reader.close()
+
+    def test_resume_from_offset_and_from_end(self, tmp_path):
+        """Test a reader resumes at a saved offset, or starts at the end."""
+        path = tmp_path / "events.jsonl"
+        append_line(path, "a")
+        first = FileStreamReader(path)
+        first.read()
+        append_line(path, "b")
+
+        resumed = FileStreamReader(path, offset=first.offset)
+        tail = FileStreamReader(path, from_end=True)
+
+        assert [e["event_type"] for e in resumed.read()] == ["b"]
+        assert tail.read() == []
+        append_line(path, "c")
+        assert [e["event_type"] for e in tail.read()] == ["c"]
+        for reader in (first, resumed, tail):
+            reader.close()
+
+    def test_follows_rotation(self, tmp_path):
+        """Test no event is lost or repeated across FileStreamBroadcaster rotation."""
+        path = tmp_path / "events.jsonl"
+        broadcaster = FileStreamBroadcaster(path, buffered=False, max_bytes=250)
+        reader = FileStreamReader(path)
+        seen = []
+        try:
+            for i in range(30):
+                broadcaster.emit("test_event", {"n": i})
+                if i % 2 == 0:
+                    seen.extend(e["payload"]["n"] for e in reader.read())
+            seen.extend(e["payload"]["n"] for e in reader.read())
+        finally:
+            broadcaster.close()
+            reader.close()
+
+        assert broadcaster.get_metrics()["rotations"] > 0
+        assert seen == list(range(30))
+
+    def test_truncation_restarts_at_beginning(self, tmp_path):
+        """Test a truncated file is re-read from offset 0."""
+        path = tmp_path / "events.jsonl"
+        append_line(path, "a")
+        append_line(path, "b")
+        reader = FileStreamReader(path)
+        reader.read()
+
+        with open(path, "r+") as f:
+            f.truncate(0)
+        append_line(path, "c")
+
+        assert [e["event_type"] for e in reader.read()] == ["c"]
+        reader.close()
+
+    def test_async_generator_yields_appended_events(self, tmp_path):
+        """Test events() yields events written after subscription."""
+        path = tmp_path / "events.jsonl"
+
+        async def consume():
+            stream = FileStreamReader(path, poll_interval_seconds=0.01).events()
+            append_line(path, "a")
+            append_line(path, "b")
+            received = [await stream.__anext__(), await stream.__anext__()]
+            await stream.aclose()
+            return [e["event_type"] for e in received]
+
+        assert asyncio.run(consume()) == ["a", "b"]
+
+
+@pytest.fixture
+def fake_redis():
+    if fakeredis is None:
+        pytest.skip("fakeredis not installed")
+    return fakeredis.FakeRedis()
+
+
+class TestRedisStreamReader:
+    """Tests for the consumer-group reader against fakeredis."""
+
+    def emit(self, client, count):
+        broadcaster = RedisStreamBroadcaster(client, stream_key="events")
+        for i in range(count):
+            broadcaster.emit("test_event", {"n": i})
+
+    def make_reader(self, client, consumer, **kwargs):
+        return RedisStreamReader(
+            client, group="dashboard", consumer=consumer, stream_key="events",
+            start_id="0", block_ms=0, **kwargs,
+        )
+
+    def test_group_splits_and_acks(self, fake_redis):
+        """Test each entry goes to one consumer and is acked once processed."""
+        self.emit(fake_redis, 6)
+        first = self.make_reader(fake_redis, "c1", count=4)
+        second = self.make_reader(fake_redis, "c2", count=4)
+
+        a = first.read()
+        b = second.read()
+
+        assert sorted(e["payload"]["n"] for e in a + b) == list(range(6))
+        assert first.ack(*(e["id"] for e in a)) == len(a)
+        assert first.read() == []
+
+    def test_restarted_consumer_recovers_own_pending(self, fake_redis):
+        """Test a consumer re-reads entries it received but never acked."""
+        self.emit(fake_redis, 3)
+        self.make_reader(fake_redis, "c1").read()
+
+        restarted = self.make_reader(fake_redis, "c1")
+        assert [e["payload"]["n"] for e in restarted.read()] == [0, 1, 2]
+
+    def test_idle_pending_entries_are_reclaimed(self, fake_redis):
+        """Test entries stuck on a dead consumer are claimed by another."""
+        self.emit(fake_redis, 2)
+        self.make_reader(fake_redis, "dead").read()
+
+        survivor = self.make_reader(fake_redis, "alive", min_idle_ms=0)
+        claimed = survivor.read()
+
+        assert [e["payload"]["n"] for e in claimed] == [0, 1]
+        survivor.ack(*(e["id"] for e in claimed))
+        assert fake_redis.xpending("events", "dashboard")["pending"] == 0
+
+    def test_async_generator_auto_acks(self, fake_redis):
+        """Test events() acks each event once the consumer asks for the next one."""
+        self.emit(fake_redis, 2)
+        reader = self.make_reader(fake_redis, "c1")
+
+        async def consume():
+            stream = reader.events()
+            received = [await stream.__anext__(), await stream.__anext__()]
+            await stream.aclose()
+            return received
+
+        assert len(asyncio.run(consume())) == 2
+        # The last event was never followed by another __anext__, so it stays pending
+        assert fake_redis.xpending("events", "dashboard")["pending"] == 1
+
+    def test_reader_for_broadcaster_follows_new_entries(self, fake_redis):
+        """Test a per-connection group sees only entries added after it was built."""
+        self.emit(fake_redis, 1)
+        broadcaster = RedisStreamBroadcaster(fake_redis, stream_key="events")
+        reader = reader_for_broadcaster(broadcaster, group="monitor-1", consumer="c1")
+        reader.block_ms = 0
+        reader.ensure_group()
+        broadcaster.emit("test_event", {"n": 1})
+
+        assert [e["payload"]["n"] for e in reader.read()] == [1]
+        reader.destroy_group()
+        assert fake_redis.xinfo_groups("events") == []
+
+
+class TestEventMonitor:
+    """Tests for reader_for_broadcaster() and /ws/monitor."""
+
+    @pytest.fixture
+    def file_broadcaster(self, tmp_path):
+        previous = get_broadcaster()
+        broadcaster = FileStreamBroadcaster(tmp_path / "events.jsonl", buffered=False)
+        set_broadcaster(broadcaster)
+        yield broadcaster
+        set_broadcaster(previous)
+        broadcaster.close()
+
+    @pytest.fixture
+    def client(self, file_broadcaster, monkeypatch):
+        monkeypatch.setattr(server, "EVENT_MONITOR_ENABLED", True)
+        set_jwt_config(JWTConfig(secret_key="test-secret-key-that-is-long-enough-for-hs256"))
+        yield TestClient(server.app)
+        set_jwt_config(None)
+
+    def test_file_reader_starts_at_end_of_log(self, file_broadcaster):
+        """Test the reader skips events written before it was built."""
+        file_broadcaster.emit("before", {})
+        reader = reader_for_broadcaster(file_broadcaster, group="monitor", consumer="c1")
+        file_broadcaster.emit("after", {})
+
+        assert [e["event_type"] for e in reader.read()] == ["after"]
+        reader.close()
+
+    def test_monitor_streams_events_emitted_after_connect(self, client, file_broadcaster):
+        """Test an authenticated monitor is pushed new broadcaster events."""
+        file_broadcaster.emit("before_connect", {})
+        token = create_token("viewer-1", "VIEWER")
+
+        with client.websocket_connect(f"/ws/monitor?token={token}") as websocket:
+            file_broadcaster.emit("uow_completed", {"uow_id": "u-1"})
+            message = websocket.receive_json()
+
+        assert message["type"] == "event"
+        assert message["data"]["event_type"] == "uow_completed"
+        assert message["data"]["payload"] == {"uow_id": "u-1"}
+
+    def test_monitor_requires_token_and_config(self, client, monkeypatch):
+        """Test the monitor refuses anonymous clients and is off unless enabled."""
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/ws/monitor"):
+                pass
+
+        monkeypatch.setattr(server, "EVENT_MONITOR_ENABLED", False)
+        token = create_token("viewer-1", "VIEWER")
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect(f"/ws/monitor?token={token}"):
+                pass